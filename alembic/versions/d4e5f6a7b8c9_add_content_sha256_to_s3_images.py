@@ -0,0 +1,46 @@
+"""add content_sha256 to s3_images
+
+Revision ID: d4e5f6a7b8c9
+Revises: cd8d2c2050ab
+Create Date: 2026-10-18 10:00:00.000000
+
+Description:
+    Adds content_sha256 to s3_images. The upload endpoint streams the original
+    photo to S3 (multipart) and hashes it on the way instead of buffering the
+    whole body; the digest is stored here for integrity checks and lookups.
+
+Design Decisions:
+    - VARCHAR(64): hex-encoded SHA-256
+    - Nullable: existing rows and derived images (thumbnails) have no digest
+    - Indexed: equality lookups by digest
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op  # type: ignore[attr-defined]
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e5f6a7b8c9'
+down_revision: Union[str, None] = 'cd8d2c2050ab'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add content_sha256 column (+ index) to s3_images table."""
+    op.add_column(
+        's3_images',
+        sa.Column(
+            'content_sha256',
+            sa.String(length=64),
+            nullable=True,
+            comment='SHA-256 hex digest of the uploaded bytes (computed while streaming)',
+        )
+    )
+    op.create_index('ix_s3_images_content_sha256', 's3_images', ['content_sha256'])
+
+
+def downgrade() -> None:
+    """Remove content_sha256 column from s3_images table."""
+    op.drop_index('ix_s3_images_content_sha256', table_name='s3_images')
+    op.drop_column('s3_images', 'content_sha256')
@@ -0,0 +1,58 @@
+"""add center_geom to detections
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-18 14:00:00.000000
+
+Description:
+    Adds a PostGIS point of each detection's center (image pixel space) and a
+    GiST index on (session_id, center_geom). The detection viewer requests a
+    session's detections by viewport; the index answers "detections of
+    session S inside this rectangle" without scanning the whole session.
+
+Design Decisions:
+    - GENERATED ALWAYS AS ... STORED: computed by PostgreSQL when the
+      detection is inserted (no application code, existing rows backfilled)
+    - SRID 0: pixel coordinates, not a geographic reference system
+    - btree_gist: lets session_id (B-tree type) share the GiST index with the
+      point, so one index scan serves the session + viewport filter
+"""
+from typing import Sequence, Union
+
+from alembic import op  # type: ignore[attr-defined]
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f6a7b8c9d0'
+down_revision: Union[str, None] = 'd4e5f6a7b8c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add center_geom column (+ GiST index) to detections table."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+    op.execute(
+        """
+        ALTER TABLE detections
+        ADD COLUMN center_geom geometry(POINT, 0)
+        GENERATED ALWAYS AS (
+            ST_SetSRID(ST_MakePoint(center_x_px::float8, center_y_px::float8), 0)
+        ) STORED
+        """
+    )
+    op.execute(
+        "COMMENT ON COLUMN detections.center_geom IS "
+        "'Bounding box center as a point in image pixels (GENERATED)'"
+    )
+    op.create_index(
+        'ix_detections_session_center_geom',
+        'detections',
+        ['session_id', 'center_geom'],
+        postgresql_using='gist',
+    )
+
+
+def downgrade() -> None:
+    """Remove center_geom column from detections table."""
+    op.drop_index('ix_detections_session_center_geom', table_name='detections')
+    op.drop_column('detections', 'center_geom')
@@ -0,0 +1,57 @@
+"""add perceptual_hash to s3_images
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-10-18 16:00:00.000000
+
+Description:
+    Adds perceptual_hash (64-bit dHash) to s3_images and an index on
+    photo_processing_sessions (storage_location_id, created_at). Uploads are
+    checked for duplicates before inference: identical bytes through the
+    existing content_sha256 index, near-identical shots by comparing the
+    perceptual hashes of the recent sessions of the same storage location.
+
+Design Decisions:
+    - BIGINT: the 64-bit hash stored signed (no unsigned integers in PostgreSQL)
+    - Nullable: existing rows, direct/batch uploads and derived images have no hash
+    - No index on the hash itself: near duplicates are found by Hamming
+      distance, which a B-tree cannot answer; the candidates come from the
+      (storage_location_id, created_at) range instead (a few sessions)
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op  # type: ignore[attr-defined]
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6a7b8c9d0e1'
+down_revision: Union[str, None] = 'e5f6a7b8c9d0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add perceptual_hash column to s3_images and the recent-sessions index."""
+    op.add_column(
+        's3_images',
+        sa.Column(
+            'perceptual_hash',
+            sa.BigInteger(),
+            nullable=True,
+            comment='64-bit dHash of the image content (near-duplicate detection)',
+        )
+    )
+    op.create_index(
+        'ix_photo_processing_sessions_location_created_at',
+        'photo_processing_sessions',
+        ['storage_location_id', 'created_at'],
+    )
+
+
+def downgrade() -> None:
+    """Remove perceptual_hash column and the recent-sessions index."""
+    op.drop_index(
+        'ix_photo_processing_sessions_location_created_at',
+        table_name='photo_processing_sessions',
+    )
+    op.drop_column('s3_images', 'perceptual_hash')
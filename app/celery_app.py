@@ -76,6 +76,13 @@ def create_celery_app() -> Celery:
             "app.tasks.upload_*": {"queue": "io_queue"},
             # Default queue for unspecified tasks
         },
+        # ML scheduling: one Redis list per priority 0-9, always drained lowest
+        # number first (interactive 0, batch 3-8, reprocess 9 - app.tasks.ml_priority)
+        broker_transport_options={
+            "priority_steps": list(range(10)),
+            "sep": ":",
+            "queue_order_strategy": "priority",
+        },
         # Connection resilience
         broker_connection_retry_on_startup=True,  # Retry if Redis not available
         # Result expiration
@@ -155,12 +162,14 @@ app.autodiscover_tasks(["app.tasks"])
 # ------------------------
 # Pool: solo (MANDATORY - prevents CUDA context conflicts in multiprocess environments)
 # Concurrency: 1 (single process, GPU-exclusive)
+# Prefetch: 1 (prefetched messages would bypass the queue priorities)
 # Queue: gpu_queue
 # Use case: YOLO v11 inference, ML model processing
 GPU_WORKER_CMD = (
     "celery -A app.celery_app worker "
     "--pool=solo "
     "--concurrency=1 "
+    "--prefetch-multiplier=1 "
     "--queues=gpu_queue "
     "--hostname=gpu@%h"
 )
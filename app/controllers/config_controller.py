@@ -20,6 +20,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import ResourceNotFoundException, ValidationException
+from app.core.http_cache import conditional_get
 from app.core.logging import get_logger
 from app.db.session import get_db_session
 from app.factories.service_factory import ServiceFactory
@@ -53,6 +54,7 @@ def get_factory(session: AsyncSession = Depends(get_db_session)) -> ServiceFacto
     "/location-defaults",
     response_model=StorageLocationConfigResponse | None,
     summary="Get location default configuration",
+    dependencies=[Depends(conditional_get("storage_location_configs"))],
 )
 async def get_location_defaults(
     location_id: int = Query(..., description="Storage location ID"),
@@ -213,6 +215,7 @@ async def set_location_defaults(
     "/density-params",
     response_model=list[DensityParameterResponse],
     summary="Get density parameters",
+    dependencies=[Depends(conditional_get("density_parameters"))],
 )
 async def get_density_parameters(
     product_id: int | None = Query(None, description="Filter by product ID"),
@@ -16,16 +16,24 @@ Endpoints:
     GET /api/v1/locations/areas/{id}/locations - Get storage locations (C010)
     GET /api/v1/locations/locations/{id}/bins - Get storage bins (C011)
     GET /api/v1/locations/search - Search by GPS coordinates (C012)
+    POST /api/v1/locations/search/batch - Resolve many GPS points at once
     POST /api/v1/locations/validate - Validate location hierarchy (C013)
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import ResourceNotFoundException
+from app.core.http_cache import conditional_get
 from app.core.logging import get_logger
+from app.core.responses import json_response
 from app.db.session import get_db_session
 from app.factories.service_factory import ServiceFactory
+from app.schemas.location_search_schema import (
+    GpsBatchSearchRequest,
+    GpsBatchSearchResponse,
+    GpsBatchSearchResult,
+)
 from app.schemas.storage_area_schema import StorageAreaResponse
 from app.schemas.storage_bin_schema import StorageBinResponse
 from app.schemas.storage_location_schema import StorageLocationResponse
@@ -55,12 +63,14 @@ def get_factory(session: AsyncSession = Depends(get_db_session)) -> ServiceFacto
     "/warehouses",
     response_model=list[WarehouseResponse],
     summary="List all warehouses",
+    dependencies=[Depends(conditional_get("location_hierarchy"))],
 )
 async def list_warehouses(
+    response: Response,
     skip: int = Query(0, ge=0, description="Offset for pagination"),
     limit: int = Query(100, ge=1, le=1000, description="Max results"),
     factory: ServiceFactory = Depends(get_factory),
-) -> list[WarehouseResponse]:
+) -> Response:
     """List all warehouses with pagination (C008).
 
     Args:
@@ -86,7 +96,7 @@ async def list_warehouses(
 
         logger.info("Warehouses retrieved", extra={"count": len(warehouses)})
 
-        return warehouses
+        return json_response(warehouses, response)
 
     except Exception as e:
         logger.error("Failed to list warehouses", extra={"error": str(e)}, exc_info=True)
@@ -100,11 +110,13 @@ async def list_warehouses(
     "/warehouses/{warehouse_id}/areas",
     response_model=list[StorageAreaResponse],
     summary="Get warehouse areas",
+    dependencies=[Depends(conditional_get("location_hierarchy"))],
 )
 async def get_warehouse_areas(
+    response: Response,
     warehouse_id: int,
     factory: ServiceFactory = Depends(get_factory),
-) -> list[StorageAreaResponse]:
+) -> Response:
     """Get all storage areas for a warehouse (C009).
 
     Args:
@@ -132,7 +144,7 @@ async def get_warehouse_areas(
             extra={"warehouse_id": warehouse_id, "count": len(areas)},
         )
 
-        return areas
+        return json_response(areas, response)
 
     except ResourceNotFoundException as e:
         logger.warning("Warehouse not found", extra={"error": str(e)})
@@ -150,11 +162,13 @@ async def get_warehouse_areas(
     "/areas/{area_id}/locations",
     response_model=list[StorageLocationResponse],
     summary="Get storage locations",
+    dependencies=[Depends(conditional_get("location_hierarchy"))],
 )
 async def get_area_locations(
+    response: Response,
     area_id: int,
     factory: ServiceFactory = Depends(get_factory),
-) -> list[StorageLocationResponse]:
+) -> Response:
     """Get all storage locations for an area (C010).
 
     Args:
@@ -182,7 +196,7 @@ async def get_area_locations(
             extra={"area_id": area_id, "count": len(locations)},
         )
 
-        return locations
+        return json_response(locations, response)
 
     except ResourceNotFoundException as e:
         logger.warning("Area not found", extra={"error": str(e)})
@@ -200,11 +214,13 @@ async def get_area_locations(
     "/locations/{location_id}/bins",
     response_model=list[StorageBinResponse],
     summary="Get storage bins",
+    dependencies=[Depends(conditional_get("location_hierarchy"))],
 )
 async def get_location_bins(
+    response: Response,
     location_id: int,
     factory: ServiceFactory = Depends(get_factory),
-) -> list[StorageBinResponse]:
+) -> Response:
     """Get all storage bins for a location (C011).
 
     Args:
@@ -232,7 +248,7 @@ async def get_location_bins(
             extra={"location_id": location_id, "count": len(bins)},
         )
 
-        return bins
+        return json_response(bins, response)
 
     except ResourceNotFoundException as e:
         logger.warning("Location not found", extra={"error": str(e)})
@@ -250,6 +266,7 @@ async def get_location_bins(
     "/search",
     response_model=dict[str, object],
     summary="Search by GPS coordinates",
+    dependencies=[Depends(conditional_get("location_hierarchy"))],
 )
 async def search_by_gps(
     longitude: float = Query(..., description="GPS longitude coordinate"),
@@ -334,6 +351,69 @@ async def search_by_gps(
         ) from e
 
 
+@router.post(
+    "/search/batch",
+    response_model=GpsBatchSearchResponse,
+    summary="Resolve many GPS points",
+)
+async def search_by_gps_batch(
+    request: GpsBatchSearchRequest,
+    factory: ServiceFactory = Depends(get_factory),
+) -> GpsBatchSearchResponse:
+    """Resolve a batch of GPS points to their full hierarchy (field device routes).
+
+    All points are resolved together (in-memory spatial index, or one
+    PostGIS query), and each distinct location/area/warehouse and the bins
+    of all distinct locations are loaded with one query each.
+
+    Args:
+        request: Up to 5000 points
+
+    Returns:
+        One result per point, in request order (found=false if no location)
+
+    Example:
+        ```bash
+        curl -X POST "http://localhost:8000/api/v1/locations/search/batch" \\
+          -H "Content-Type: application/json" \\
+          -d '{"points": [{"longitude": -70.648, "latitude": -33.449}]}'
+        ```
+    """
+    try:
+        logger.info("GPS batch location search", extra={"num_points": len(request.points)})
+
+        service = factory.get_location_hierarchy_service()
+        chains = await service.lookup_gps_batch(
+            [(point.longitude, point.latitude) for point in request.points]
+        )
+
+        results = [
+            GpsBatchSearchResult(longitude=point.longitude, latitude=point.latitude, found=False)
+            if chain is None
+            else GpsBatchSearchResult(
+                longitude=point.longitude, latitude=point.latitude, found=True, **chain
+            )
+            for point, chain in zip(request.points, chains, strict=True)
+        ]
+        resolved = sum(result.found for result in results)
+
+        logger.info(
+            "GPS batch search completed",
+            extra={"num_points": len(results), "resolved_points": resolved},
+        )
+
+        return GpsBatchSearchResponse(
+            results=results, total_points=len(results), resolved_points=resolved
+        )
+
+    except Exception as e:
+        logger.error("GPS batch search failed", extra={"error": str(e)}, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="GPS batch search failed.",
+        ) from e
+
+
 @router.post(
     "/validate",
     response_model=dict[str, object],
@@ -1,8 +1,11 @@
 """Map view controllers."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.core.http_cache import conditional_get
+from app.core.responses import json_response
 from app.db.session import get_db_session
 from app.factories.service_factory import ServiceFactory
 from app.schemas.map_schema import (
@@ -18,10 +21,26 @@ def get_factory(session: AsyncSession = Depends(get_db_session)) -> ServiceFacto
     return ServiceFactory(session)
 
 
-@router.get("/map/bulk-load", response_model=MapBulkLoadResponse)
-async def bulk_load_map(factory: ServiceFactory = Depends(get_factory)) -> MapBulkLoadResponse:
+@router.get(
+    "/map/bulk-load",
+    response_model=MapBulkLoadResponse,
+    # Thumbnail URLs are presigned: new ETag at half their lifetime
+    dependencies=[
+        Depends(
+            conditional_get(
+                "location_hierarchy",
+                "photo_sessions",
+                rotate_seconds=settings.S3_PRESIGNED_URL_EXPIRY_HOURS * 3600 // 2,
+            )
+        )
+    ],
+)
+async def bulk_load_map(
+    response: Response, factory: ServiceFactory = Depends(get_factory)
+) -> Response:
     service = factory.get_map_view_service()
-    return await service.get_bulk_load()
+    bulk_load = await service.get_bulk_load()
+    return json_response(bulk_load, response, stream_field="warehouses")
 
 
 @router.get("/storage-locations/{location_id}/detail", response_model=LocationDetailResponse)
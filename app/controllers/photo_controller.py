@@ -2,20 +2,23 @@
 
 from __future__ import annotations
 
-import io
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from fastapi.responses import JSONResponse, StreamingResponse
 from redis.asyncio import Redis  # type: ignore[import-not-found]
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.background import BackgroundTask
 
 from app.core.dependencies import get_redis
 from app.core.exceptions import ResourceNotFoundException
 from app.core.logging import get_logger
+from app.core.responses import json_response
 from app.db.session import get_db_session
 from app.factories.service_factory import ServiceFactory
+from app.schemas.detection_schema import DetectionViewportResponse
 from app.schemas.photo_output_schema import (
     PhotoDetailResponse,
     PhotoGalleryResponse,
@@ -41,6 +44,7 @@ def get_factory(session: AsyncSession = Depends(get_db_session)) -> ServiceFacto
 
 @router.get("/gallery", response_model=PhotoGalleryResponse)
 async def list_photos_gallery(
+    response: Response,
     status: str | None = Query(None, description="Filter by processing status"),
     warehouse_id: int | None = Query(None, description="Filter by warehouse"),
     storage_location_id: int | None = Query(None, description="Filter by storage location"),
@@ -49,12 +53,12 @@ async def list_photos_gallery(
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=200),
     factory: ServiceFactory = Depends(get_factory),
-) -> PhotoGalleryResponse:
+) -> Response:
     """List photos for gallery view with filters."""
 
     service = factory.get_photo_query_service()
     logger.info("Listing photo gallery", extra={"page": page, "per_page": per_page})
-    response = await service.get_gallery(
+    gallery = await service.get_gallery(
         status=status,
         warehouse_id=warehouse_id,
         storage_location_id=storage_location_id,
@@ -63,7 +67,7 @@ async def list_photos_gallery(
         page=page,
         per_page=per_page,
     )
-    return response
+    return json_response(gallery, response)
 
 
 @router.get("/{image_id}", response_model=PhotoDetailResponse)
@@ -114,20 +118,28 @@ async def validate_session(
     return updated
 
 
+async def _session_export_response(
+    session_id: UUID, fmt: Literal["csv", "geojson", "pdf"], factory: ServiceFactory
+) -> StreamingResponse:
+    service = factory.get_session_export_service()
+    export = await service.open_export(session_id, fmt)
+    if export is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
+    return StreamingResponse(
+        export.body,
+        media_type=export.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{export.filename}"'},
+        background=BackgroundTask(export.finalize) if export.finalize else None,
+    )
+
+
 @router.get("/sessions/{session_id}/report.pdf")
 async def download_session_pdf(
     session_id: UUID,
     factory: ServiceFactory = Depends(get_factory),
 ) -> StreamingResponse:
-    service = factory.get_photo_processing_session_service()
-    data = await service.generate_pdf_report_bytes(session_id)
-    if data is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
-    return StreamingResponse(
-        io.BytesIO(data),
-        media_type="application/pdf",
-        headers={"Content-Disposition": f'attachment; filename="session_{session_id}.pdf"'},
-    )
+    """Session summary with the processed thumbnail (cached in S3)."""
+    return await _session_export_response(session_id, "pdf", factory)
 
 
 @router.get("/sessions/{session_id}/export.csv")
@@ -135,15 +147,8 @@ async def download_session_csv(
     session_id: UUID,
     factory: ServiceFactory = Depends(get_factory),
 ) -> StreamingResponse:
-    service = factory.get_photo_processing_session_service()
-    data = await service.generate_csv_export(session_id)
-    if data is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
-    return StreamingResponse(
-        io.BytesIO(data),
-        media_type="text/csv",
-        headers={"Content-Disposition": f'attachment; filename="session_{session_id}.csv"'},
-    )
+    """All detections and estimations of the session, one row each (cached in S3)."""
+    return await _session_export_response(session_id, "csv", factory)
 
 
 @router.get("/sessions/{session_id}/detections.geojson")
@@ -151,14 +156,48 @@ async def download_session_geojson(
     session_id: UUID,
     factory: ServiceFactory = Depends(get_factory),
 ) -> StreamingResponse:
-    service = factory.get_photo_processing_session_service()
-    data = await service.generate_geojson_export(session_id)
-    if data is None:
+    """Detections (points) and estimations (polygons) in image pixels (cached in S3)."""
+    return await _session_export_response(session_id, "geojson", factory)
+
+
+@router.get("/sessions/{session_id}/detections", response_model=DetectionViewportResponse)
+async def get_session_detections(
+    session_id: UUID,
+    zoom: int = Query(0, ge=-12, le=4, description="log2 of screen px per image px"),
+    min_x: float | None = Query(None, description="Viewport left edge (image px)"),
+    min_y: float | None = Query(None, description="Viewport top edge (image px)"),
+    max_x: float | None = Query(None, description="Viewport right edge (image px)"),
+    max_y: float | None = Query(None, description="Viewport bottom edge (image px)"),
+    format: Literal["json", "binary"] = Query("json", description="Columnar JSON or binary"),
+    factory: ServiceFactory = Depends(get_factory),
+) -> Response:
+    """Detections of a session inside the viewer's viewport.
+
+    Zoomed in, individual detections are returned; zoomed out (or in a
+    viewport too dense to draw), grid clusters. Without a viewport the whole
+    image is used. ``format=binary`` returns the columns as little-endian
+    arrays (layout: DetectionViewportResponse.to_binary) with
+    ``X-Detection-Mode`` and ``X-Detection-Count`` headers.
+    """
+    session_service = factory.get_photo_processing_session_service()
+    session = await session_service.get_session_by_uuid(session_id)
+    if session is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
-    return StreamingResponse(
-        io.BytesIO(data),
-        media_type="application/geo+json",
-        headers={"Content-Disposition": f'attachment; filename="session_{session_id}.geojson"'},
+
+    service = factory.get_detection_service()
+    viewport = await service.get_detections_in_viewport(
+        session.id, zoom, min_x=min_x, min_y=min_y, max_x=max_x, max_y=max_y
+    )
+    if format == "json":
+        return json_response(viewport)
+
+    return Response(
+        content=viewport.to_binary(),
+        media_type="application/octet-stream",
+        headers={
+            "X-Detection-Mode": viewport.mode,
+            "X-Detection-Count": str(viewport.item_count),
+        },
     )
 
 
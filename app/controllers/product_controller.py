@@ -25,6 +25,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import ResourceNotFoundException, ValidationException
+from app.core.http_cache import conditional_get
 from app.core.logging import get_logger
 from app.db.session import get_db_session
 from app.factories.service_factory import ServiceFactory
@@ -62,6 +63,7 @@ def get_factory(session: AsyncSession = Depends(get_db_session)) -> ServiceFacto
     "/categories",
     response_model=list[ProductCategoryResponse],
     summary="List product categories",
+    dependencies=[Depends(conditional_get("product_categories"))],
 )
 async def list_product_categories(
     skip: int = Query(0, ge=0, description="Offset for pagination"),
@@ -164,6 +166,7 @@ async def create_product_category(
     "/families",
     response_model=list[ProductFamilyResponse],
     summary="List product families",
+    dependencies=[Depends(conditional_get("product_families"))],
 )
 async def list_product_families(
     category_id: int | None = Query(None, description="Filter by category ID"),
@@ -291,6 +294,7 @@ async def create_product_family(
     "/",
     response_model=list[ProductResponse],
     summary="List products",
+    dependencies=[Depends(conditional_get("products", "product_families"))],
 )
 async def list_products(
     category_id: int | None = Query(None, description="Filter by category ID"),
@@ -449,6 +453,7 @@ async def create_product(
     "/{sku}",
     response_model=ProductResponse,
     summary="Get product by SKU",
+    dependencies=[Depends(conditional_get("products"))],
 )
 async def get_product_by_sku(
     sku: str,
@@ -13,6 +13,10 @@ Architecture:
 
 Endpoints:
     POST /api/v1/stock/photo - Upload photo for ML processing (C001)
+    POST /api/v1/stock/photo/uploads - Start direct-to-S3 photo upload (C001)
+    POST /api/v1/stock/photo/uploads/{upload_id}/complete - Complete direct upload (C001)
+    POST /api/v1/stock/photo/batch - Upload many photos as one batch (C001)
+    POST /api/v1/stock/photo/batch/complete - Complete many direct uploads as one batch (C001)
     POST /api/v1/stock/manual - Manual stock initialization (C002)
     GET /api/v1/stock/tasks/{task_id} - Celery task status (C003)
     POST /api/v1/stock/movements - Create stock movement (C004)
@@ -29,11 +33,21 @@ from redis.asyncio import Redis  # type: ignore[import-not-found]
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.dependencies import get_redis
-from app.core.exceptions import ResourceNotFoundException, ValidationException
+from app.core.exceptions import (
+    ResourceNotFoundException,
+    TooManyRequestsException,
+    ValidationException,
+)
 from app.core.logging import get_logger
 from app.db.session import get_db_session
 from app.factories.service_factory import ServiceFactory
-from app.schemas.photo_schema import PhotoUploadResponse
+from app.schemas.photo_schema import (
+    DirectUploadBatchCompleteRequest,
+    DirectUploadCompleteRequest,
+    DirectUploadInitRequest,
+    DirectUploadInitResponse,
+    PhotoUploadResponse,
+)
 from app.schemas.stock_batch_schema import StockBatchResponse
 from app.schemas.stock_movement_schema import (
     ManualStockInitRequest,
@@ -70,6 +84,9 @@ def get_factory(session: AsyncSession = Depends(get_db_session)) -> ServiceFacto
 async def upload_photo_for_stock_count(
     file: Annotated[UploadFile, File(description="Photo file (max 20MB, JPEG/PNG/WEBP)")],
     user_id: Annotated[int, Form(description="User ID for tracking")],
+    reuse_near_duplicate: Annotated[
+        bool, Form(description="Return the results of a near-identical recent shot")
+    ] = False,
     redis: Redis = Depends(get_redis),
     factory: ServiceFactory = Depends(get_factory),
 ) -> PhotoUploadResponse:
@@ -79,6 +96,8 @@ async def upload_photo_for_stock_count(
   1. Validate file (type, size)
   2. Extract GPS coordinates from photo metadata
   3. GPS-based location lookup
+  3b. Duplicate check: a re-upload of a processed photo returns its results
+      (no upload, no ML run); near-identical shots are flagged on the job
   4. Upload to S3
   5. Create processing session
   6. Dispatch ML pipeline (Celery)
@@ -86,6 +105,8 @@ async def upload_photo_for_stock_count(
   Args:
       file: Photo file (JPEG/PNG/WEBP, max 20MB)
       user_id: User ID for audit trail
+      reuse_near_duplicate: Also reuse the results of a near-identical shot
+          of the same location (exact duplicates always reuse results)
 
   Note:
       GPS coordinates are extracted from the photo's metadata by the service.
@@ -118,7 +139,9 @@ async def upload_photo_for_stock_count(
         )
 
         service = factory.get_photo_upload_service()
-        result = await service.upload_photo(file, user_id, redis)
+        result = await service.upload_photo(
+            file, user_id, redis, reuse_near_duplicate=reuse_near_duplicate
+        )
 
         logger.info(
             "Photo upload successful",
@@ -148,6 +171,252 @@ async def upload_photo_for_stock_count(
         ) from e
 
 
+@router.post(
+    "/photo/uploads",
+    response_model=DirectUploadInitResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Start direct-to-S3 photo upload",
+)
+async def initiate_direct_photo_upload(
+    request: DirectUploadInitRequest,
+    redis: Redis = Depends(get_redis),
+    factory: ServiceFactory = Depends(get_factory),
+) -> DirectUploadInitResponse:
+    """Start a direct-to-S3 (presigned multipart) photo upload (C001).
+
+    The mobile client PUTs each part of the photo to its presigned URL (the
+    body never goes through the API), keeps the ETag response header of
+    every part and then calls complete_url.
+
+    Args:
+        request: Filename, content type and exact size of the photo
+
+    Returns:
+        DirectUploadInitResponse with upload_id and presigned part URLs
+
+    Raises:
+        HTTPException 400: Invalid file type/size
+        HTTPException 500: S3 error
+
+    Example:
+        ```bash
+        curl -X POST "http://localhost:8000/api/v1/stock/photo/uploads" \\
+          -H "Content-Type: application/json" \\
+          -d '{"filename": "photo.jpg", "content_type": "image/jpeg", "file_size_bytes": 4194304, "user_id": 1}'
+        ```
+    """
+    try:
+        service = factory.get_photo_upload_service()
+        return await service.initiate_direct_upload(request, redis)
+
+    except ValidationException as e:
+        logger.warning("Direct upload validation failed", extra={"error": str(e)})
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    except Exception as e:
+        logger.error("Direct upload initiation failed", extra={"error": str(e)}, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Photo upload failed. Please try again.",
+        ) from e
+
+
+@router.post(
+    "/photo/uploads/{upload_id}/complete",
+    response_model=PhotoUploadResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Complete direct-to-S3 photo upload",
+)
+async def complete_direct_photo_upload(
+    upload_id: UUID,
+    request: DirectUploadCompleteRequest,
+    redis: Redis = Depends(get_redis),
+    factory: ServiceFactory = Depends(get_factory),
+) -> PhotoUploadResponse:
+    """Complete a direct-to-S3 photo upload and start ML processing (C001).
+
+    Args:
+        upload_id: upload_id returned by POST /photo/uploads
+        request: Uploaded parts (part_number + ETag)
+
+    Returns:
+        PhotoUploadResponse with task_id for polling (same as POST /photo)
+
+    Raises:
+        HTTPException 400: Photo too large, not an image or missing GPS
+        HTTPException 404: Unknown or expired upload
+        HTTPException 500: S3/processing error
+    """
+    try:
+        service = factory.get_photo_upload_service()
+        result = await service.complete_direct_upload(upload_id, request, redis)
+
+        logger.info(
+            "Direct photo upload completed",
+            extra={
+                "upload_id": str(upload_id),
+                "task_id": str(result.task_id),
+                "session_id": result.session_id,
+            },
+        )
+
+        return result
+
+    except ValidationException as e:
+        logger.warning("Direct upload validation failed", extra={"error": str(e)})
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    except ResourceNotFoundException as e:
+        logger.warning("Direct upload not found", extra={"error": str(e)})
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+
+    except Exception as e:
+        logger.error("Direct upload completion failed", extra={"error": str(e)}, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Photo upload failed. Please try again.",
+        ) from e
+
+
+@router.post(
+    "/photo/batch",
+    response_model=PhotoUploadResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Upload many photos as one batch",
+)
+async def upload_photo_batch_for_stock_count(
+    files: Annotated[
+        list[UploadFile], File(description="Photo files (each max 20MB, JPEG/PNG/WEBP)")
+    ],
+    user_id: Annotated[int, Form(description="User ID for tracking")],
+    redis: Redis = Depends(get_redis),
+    factory: ServiceFactory = Depends(get_factory),
+) -> PhotoUploadResponse:
+    """Upload many photos under one upload session (C001).
+
+    All photos are processed by one ML batch task; progress is reported per
+    photo in the upload session (poll_url). Invalid photos are listed in
+    "rejected" and do not fail the batch.
+
+    Args:
+        files: Photo files (at most UPLOAD_BATCH_MAX_PHOTOS)
+        user_id: User ID for audit trail (tenant for the concurrency quota)
+
+    Returns:
+        PhotoUploadResponse with one job per accepted photo
+
+    Raises:
+        HTTPException 400: Empty/oversized batch or no valid photo
+        HTTPException 429: Too many photos of this user already in processing
+        HTTPException 500: Upload/processing error
+
+    Example:
+        ```bash
+        curl -X POST "http://localhost:8000/api/v1/stock/photo/batch" \\
+          -F "files=@photo1.jpg" -F "files=@photo2.jpg" -F "user_id=1"
+        ```
+    """
+    try:
+        service = factory.get_photo_upload_service()
+        result = await service.upload_photo_batch(files, user_id, redis)
+
+        logger.info(
+            "Batch photo upload successful",
+            extra={
+                "task_id": str(result.task_id),
+                "total_photos": result.total_photos,
+                "num_rejected": len(result.rejected),
+                "upload_session_id": str(result.upload_session_id),
+            },
+        )
+
+        return result
+
+    except ValidationException as e:
+        logger.warning("Batch upload validation failed", extra={"error": str(e)})
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    except TooManyRequestsException as e:
+        raise _too_many_requests(e) from e
+
+    except Exception as e:
+        logger.error("Batch photo upload failed", extra={"error": str(e)}, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Photo upload failed. Please try again.",
+        ) from e
+
+
+@router.post(
+    "/photo/batch/complete",
+    response_model=PhotoUploadResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Complete many direct-to-S3 uploads as one batch",
+)
+async def complete_direct_photo_upload_batch(
+    request: DirectUploadBatchCompleteRequest,
+    redis: Redis = Depends(get_redis),
+    factory: ServiceFactory = Depends(get_factory),
+) -> PhotoUploadResponse:
+    """Complete many direct-to-S3 uploads under one upload session (C001).
+
+    Args:
+        request: upload_id + parts of each direct upload (same user)
+
+    Returns:
+        PhotoUploadResponse with one job per accepted photo
+
+    Raises:
+        HTTPException 400: Oversized batch, mixed users or no valid photo
+        HTTPException 404: Unknown or expired upload
+        HTTPException 429: Too many photos of this user already in processing
+        HTTPException 500: S3/processing error
+    """
+    try:
+        service = factory.get_photo_upload_service()
+        result = await service.complete_direct_upload_batch(request, redis)
+
+        logger.info(
+            "Direct batch upload completed",
+            extra={
+                "task_id": str(result.task_id),
+                "total_photos": result.total_photos,
+                "num_rejected": len(result.rejected),
+            },
+        )
+
+        return result
+
+    except ValidationException as e:
+        logger.warning("Batch upload validation failed", extra={"error": str(e)})
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    except ResourceNotFoundException as e:
+        logger.warning("Direct upload not found", extra={"error": str(e)})
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+
+    except TooManyRequestsException as e:
+        raise _too_many_requests(e) from e
+
+    except Exception as e:
+        logger.error("Direct batch upload failed", extra={"error": str(e)}, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Photo upload failed. Please try again.",
+        ) from e
+
+
+def _too_many_requests(e: TooManyRequestsException) -> HTTPException:
+    """429 response (with Retry-After) for a tenant over its processing quota."""
+    logger.warning("Upload rejected: tenant quota exceeded", extra={"error": str(e)})
+    headers = (
+        {"Retry-After": str(e.retry_after_seconds)} if e.retry_after_seconds is not None else None
+    )
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=e.user_message, headers=headers
+    )
+
+
 @router.post(
     "/manual",
     response_model=StockMovementResponse,
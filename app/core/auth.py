@@ -7,13 +7,16 @@ Key features:
 - JWT signature verification using Auth0 JWKS (RS256 algorithm)
 - Token expiration and audience validation
 - Four-tier role hierarchy (admin, supervisor, worker, viewer)
-- Async JWKS client with LRU caching for performance
+- In-process JWKS key store (parsed keys by kid, background refresh)
+- Verified-token LRU: repeated requests with one token skip RSA verification
 - Comprehensive error handling for authentication failures
 
 Architecture:
 - Uses python-jose for JWT validation
-- Fetches public keys from Auth0's JWKS endpoint
-- Caches keys for 24 hours to minimize network requests
+- Fetches public keys from Auth0's JWKS endpoint on first use, then in the
+  background every AUTH0_JWKS_CACHE_TTL_SECONDS (and on unknown key IDs,
+  rate-limited by AUTH0_JWKS_MIN_REFRESH_SECONDS)
+- Caches verified tokens until their exp (AUTH_TOKEN_CACHE_MAX_ENTRIES)
 - All operations are async-compatible
 
 Roles:
@@ -36,6 +39,10 @@ Usage:
         ...
 """
 
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
 from collections.abc import Callable
 from datetime import UTC, datetime
 from functools import lru_cache, wraps
@@ -45,11 +52,13 @@ import httpx
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt  # type: ignore[import-untyped]
+from jose.backends import RSAKey  # type: ignore[import-untyped]
 from pydantic import BaseModel, Field, field_validator
 
 from app.core.config import settings
 from app.core.exceptions import ForbiddenException, UnauthorizedException
 from app.core.logging import get_logger
+from app.core.metrics import record_cache_request
 
 logger = get_logger(__name__)
 
@@ -210,11 +219,15 @@ def get_auth0_config() -> Auth0Config:
     return Auth0Config.from_settings()
 
 
-async def fetch_jwks() -> dict[str, Any]:
+async def fetch_jwks(client: httpx.AsyncClient | None = None) -> dict[str, Any]:
     """Fetch JSON Web Key Set (JWKS) from Auth0.
 
-    JWKS contains public keys used to verify JWT signatures.
-    Keys are cached using Python's LRU cache to minimize network requests.
+    JWKS contains public keys used to verify JWT signatures. Called by the
+    key store (JWKSKeyStore) on first use, on refresh and on unknown key IDs,
+    never per request.
+
+    Args:
+        client: HTTP client to use (default: a one-off client)
 
     Returns:
         JWKS dictionary with keys
@@ -225,18 +238,21 @@ async def fetch_jwks() -> dict[str, Any]:
     config = get_auth0_config()
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        if client is None:
+            async with httpx.AsyncClient(timeout=10.0) as one_off_client:
+                response = await one_off_client.get(config.jwks_uri)
+        else:
             response = await client.get(config.jwks_uri)
-            response.raise_for_status()
-            jwks: dict[str, Any] = response.json()
+        response.raise_for_status()
+        jwks: dict[str, Any] = response.json()
 
-            logger.debug(
-                "Fetched JWKS from Auth0",
-                jwks_uri=config.jwks_uri,
-                key_count=len(jwks.get("keys", [])),
-            )
+        logger.debug(
+            "Fetched JWKS from Auth0",
+            jwks_uri=config.jwks_uri,
+            key_count=len(jwks.get("keys", [])),
+        )
 
-            return jwks
+        return jwks
 
     except httpx.HTTPError as e:
         logger.error(
@@ -248,36 +264,144 @@ async def fetch_jwks() -> dict[str, Any]:
         raise UnauthorizedException(reason=f"Cannot fetch Auth0 public keys: {str(e)}") from e
 
 
-@lru_cache(maxsize=10)
-def _cache_jwks(jwks_json: str) -> dict[str, Any]:
-    """Cache JWKS in memory.
+def parse_jwks(jwks: dict[str, Any]) -> dict[str, RSAKey]:
+    """Parse the RSA signing keys of a JWKS, indexed by key ID.
 
-    LRU cache with maxsize=10 keeps last 10 JWKS responses.
-    Cache persists for duration of application process.
+    Keys that are not RSA signature keys (or cannot be parsed) are skipped.
+    """
+    keys: dict[str, RSAKey] = {}
+    for key in jwks.get("keys", []):
+        kid = key.get("kid")
+        if not kid or key.get("kty") != "RSA" or key.get("use", "sig") != "sig":
+            continue
+        try:
+            keys[kid] = RSAKey(
+                {name: key.get(name) for name in ("kty", "kid", "use", "n", "e")},
+                algorithm="RS256",
+            )
+        except Exception as e:
+            logger.warning("Skipping unparseable JWKS key", kid=kid, error=str(e))
+    return keys
 
-    Args:
-        jwks_json: JSON string of JWKS response
 
-    Returns:
-        Parsed JWKS dictionary
+class JWKSKeyStore:
+    """In-process store of Auth0 signing keys (parsed RSA keys by kid).
+
+    - First use fetches the JWKS; later lookups are dict reads.
+    - After ttl_seconds the keys are refreshed in the background while the
+      current ones keep being served (also during an Auth0 outage).
+    - An unknown kid (key rotation) forces a refresh, at most once every
+      min_refresh_interval_seconds so forged kids cannot hammer Auth0.
+    - One keep-alive HTTP client is shared by all fetches.
+
+    Attributes:
+        ttl_seconds: Age after which keys are refreshed in the background
+        min_refresh_interval_seconds: Minimum time between forced refreshes
     """
-    import json
 
-    result: dict[str, Any] = json.loads(jwks_json)
-    return result
+    def __init__(
+        self,
+        ttl_seconds: float,
+        min_refresh_interval_seconds: float,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.min_refresh_interval_seconds = min_refresh_interval_seconds
+        self._client = client
+        self._keys: dict[str, RSAKey] = {}
+        self._fetched_at = float("-inf")
+        self._lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task[None] | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=10.0)
+        return self._client
+
+    async def get_key(self, kid: str) -> RSAKey:
+        """Signing key with the given key ID.
 
+        Raises:
+            UnauthorizedException: If the key is unknown (after a refresh, if
+                one is allowed) or the JWKS cannot be fetched at all
+        """
+        if not self._keys:
+            await self.refresh()
+        elif self._age() >= self.ttl_seconds:
+            self._refresh_in_background()
+
+        key = self._keys.get(kid)
+        if key is None and self._age() >= self.min_refresh_interval_seconds:
+            logger.info("Unknown JWT key ID, refreshing JWKS", kid=kid)
+            await self.refresh()
+            key = self._keys.get(kid)
+
+        if key is None:
+            logger.warning("Public key not found in JWKS", kid=kid)
+            raise UnauthorizedException(reason="Unable to find matching public key")
+        return key
+
+    async def refresh(self) -> None:
+        """Fetch and parse the JWKS (concurrent callers share one fetch)."""
+        fetched_at = self._fetched_at
+        async with self._lock:
+            if self._fetched_at != fetched_at:
+                return  # Refreshed while waiting for the lock
+            keys = parse_jwks(await fetch_jwks(self.client))
+            self._keys = keys
+            self._fetched_at = time.monotonic()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client (application shutdown)."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _age(self) -> float:
+        return time.monotonic() - self._fetched_at
+
+    def _refresh_in_background(self) -> None:
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        self._refresh_task = asyncio.get_running_loop().create_task(self._background_refresh())
+
+    async def _background_refresh(self) -> None:
+        try:
+            await self.refresh()
+        except Exception as e:
+            # Keep serving the current keys; the next request retries
+            logger.warning("Background JWKS refresh failed", error=str(e))
+
+
+@lru_cache(maxsize=1)
+def get_jwks_key_store() -> JWKSKeyStore:
+    """Get singleton JWKSKeyStore instance (one per process)."""
+    return JWKSKeyStore(
+        ttl_seconds=settings.AUTH0_JWKS_CACHE_TTL_SECONDS,
+        min_refresh_interval_seconds=settings.AUTH0_JWKS_MIN_REFRESH_SECONDS,
+    )
 
-async def get_signing_key(token: str) -> str:
+
+async def close_jwks_key_store() -> None:
+    """Close the key store's HTTP client (used for application shutdown)."""
+    if get_jwks_key_store.cache_info().currsize:
+        await get_jwks_key_store().aclose()
+
+
+async def get_signing_key(token: str) -> RSAKey:
     """Get public signing key for JWT token verification.
 
-    Extracts 'kid' (key ID) from JWT header, fetches JWKS from Auth0,
-    and returns matching public key in PEM format.
+    Extracts 'kid' (key ID) from JWT header and looks it up in the
+    process-wide key store (no network round-trip once keys are loaded).
 
     Args:
         token: JWT token string
 
     Returns:
-        Public key in PEM format
+        Parsed RSA public key
 
     Raises:
         UnauthorizedException: If key not found or fetch fails
@@ -295,41 +419,61 @@ async def get_signing_key(token: str) -> str:
         logger.warning("JWT missing 'kid' in header")
         raise UnauthorizedException(reason="Token missing key ID")
 
-    # Fetch JWKS from Auth0
-    jwks = await fetch_jwks()
-
-    # Cache JWKS for performance (convert to JSON string for hashing)
-    import json
-
-    jwks_json = json.dumps(jwks, sort_keys=True)
-    cached_jwks = _cache_jwks(jwks_json)
-
-    # Find matching key
-    rsa_key = None
-    for key in cached_jwks.get("keys", []):
-        if key.get("kid") == kid:
-            rsa_key = {
-                "kty": key.get("kty"),
-                "kid": key.get("kid"),
-                "use": key.get("use"),
-                "n": key.get("n"),
-                "e": key.get("e"),
-            }
-            break
+    return await get_jwks_key_store().get_key(kid)
+
+
+# =============================================================================
+# Verified Token Cache
+# =============================================================================
+
 
-    if not rsa_key:
-        logger.warning("Public key not found in JWKS", kid=kid)
-        raise UnauthorizedException(reason="Unable to find matching public key")
+class VerifiedTokenCache:
+    """LRU of verified tokens (sha256 of the token → claims) until their exp.
 
-    logger.debug("Found signing key for token", kid=kid)
+    Clients send the same bearer token on every request until it expires;
+    a hit skips JWKS lookup, RSA signature verification and claim parsing.
+    Keys are token hashes, so raw tokens are never kept in memory.
 
-    # Convert RSA key to PEM format (python-jose requires this)
-    from jose.backends import RSAKey  # type: ignore[import-untyped]
+    Attributes:
+        max_entries: Tokens kept (least recently used evicted)
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[bytes, TokenClaims] = OrderedDict()
+
+    @staticmethod
+    def token_hash(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> TokenClaims | None:
+        """Claims of a previously verified, unexpired token (None otherwise)."""
+        key = self.token_hash(token)
+        claims = self._entries.get(key)
+        if claims is None:
+            return None
+        if claims.exp <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return claims
+
+    def put(self, token: str, claims: TokenClaims) -> None:
+        """Remember a verified token until its exp."""
+        key = self.token_hash(token)
+        self._entries[key] = claims
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
 
-    rsa_key_obj = RSAKey(rsa_key, algorithm="RS256")
-    pem_bytes = rsa_key_obj.to_pem()
-    pem_key: str = pem_bytes.decode("utf-8")
-    return pem_key
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+@lru_cache(maxsize=1)
+def get_verified_token_cache() -> VerifiedTokenCache:
+    """Get singleton VerifiedTokenCache instance (one per process)."""
+    return VerifiedTokenCache(max_entries=settings.AUTH_TOKEN_CACHE_MAX_ENTRIES)
 
 
 # =============================================================================
@@ -340,8 +484,9 @@ async def get_signing_key(token: str) -> str:
 async def verify_token(token: str) -> TokenClaims:
     """Verify JWT token and extract validated claims.
 
-    Validation steps:
-    1. Fetch signing key from JWKS
+    Validation steps (skipped for a token already verified by this process
+    and not yet expired, see VerifiedTokenCache):
+    1. Look up signing key in the JWKS key store
     2. Verify signature using RS256 algorithm
     3. Validate expiration timestamp
     4. Validate audience (API identifier)
@@ -358,6 +503,13 @@ async def verify_token(token: str) -> TokenClaims:
         UnauthorizedException: If token is invalid, expired, or malformed
     """
     config = get_auth0_config()
+    token_cache = get_verified_token_cache()
+
+    cached = token_cache.get(token)
+    if cached is not None:
+        record_cache_request("auth_tokens", "l1_hit")
+        return cached
+    record_cache_request("auth_tokens", "miss")
 
     try:
         # Get signing key from JWKS
@@ -379,6 +531,7 @@ async def verify_token(token: str) -> TokenClaims:
 
         # Validate with Pydantic model
         claims = TokenClaims(**payload)
+        token_cache.put(token, claims)
 
         logger.info(
             "Token verified successfully",
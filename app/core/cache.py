@@ -1,17 +1,26 @@
 """Redis cache utilities for DemeterAI.
 
-Provides a shared async Redis client for caching and job tracking.
+Provides a shared async Redis client for caching and job tracking, and
+per-resource version counters: every write to a resource (e.g. the location
+hierarchy, products) increments ``{resource}:version``. Caches key their
+entries by these versions and HTTP endpoints derive ETags from them
+(app.core.http_cache).
 """
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from redis.asyncio import Redis  # type: ignore[import-not-found]
 
 from app.core.config import settings
 from app.core.logging import get_logger
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
 logger = get_logger(__name__)
 
 
@@ -36,3 +45,49 @@ async def close_redis_client() -> None:
     """Close Redis client (used for application shutdown)."""
     client = _create_client()
     await client.close()
+
+
+def resource_version_key(resource: str) -> str:
+    """Redis key of a resource's version counter."""
+    return f"{resource}:version"
+
+
+async def get_resource_versions(resources: Sequence[str]) -> list[int] | None:
+    """Current version counters of resources, in order (None if Redis fails)."""
+    try:
+        values = await get_redis_client().mget([resource_version_key(r) for r in resources])
+    except Exception as e:
+        logger.warning(
+            "Failed to read resource versions",
+            extra={"resources": list(resources), "error": str(e)},
+        )
+        return None
+    return [int(value or 0) for value in values]
+
+
+async def bump_resource_versions(*resources: str, session: AsyncSession | None = None) -> None:
+    """Increment resource version counters after a write (best-effort).
+
+    Args:
+        resources: Resource names (e.g. "photo_sessions")
+        session: Session of the write; the counters are bumped again when its
+            transaction ends, so nothing read before the commit carries the
+            new version
+    """
+    try:
+        for resource in resources:
+            await get_redis_client().incr(resource_version_key(resource))
+    except Exception as e:
+        logger.warning(
+            "Failed to bump resource versions",
+            extra={"resources": list(resources), "error": str(e)},
+        )
+
+    if session is not None:
+        from app.db.session import run_after_transaction
+
+        run_after_transaction(
+            session,
+            f"bump_resource_versions:{','.join(resources)}",
+            lambda: bump_resource_versions(*resources),
+        )
@@ -0,0 +1,658 @@
+"""Distributed circuit breakers (state shared in Redis by every worker).
+
+A per-process breaker only learns that a dependency is failing after each
+prefork process on each host has failed on its own. With the state in Redis,
+the first failures seen anywhere open the circuit for everyone. Each
+dependency has its own scope: "s3", "db" and one "gpu:{worker}:{device}" per
+GPU, so a bad GPU host is fenced off while healthy ones keep working.
+
+State of a scope (keys circuit:{scope}:*):
+
+    w:{bucket}  Calls and failures per time bucket (WINDOW_BUCKETS buckets per
+                window). The circuit opens when, over the last
+                window_seconds, at least min_calls were made and at least
+                failure_rate of them failed.
+    open        Present while the circuit is open (TTL = open_seconds). Calls
+                fail fast with CircuitBreakerException; a process that has
+                seen the key does not ask Redis again until it expires.
+    tripped     Present from opening until a probe succeeds. Once ``open``
+                has expired the circuit is half-open: one worker wins the
+                ``probe`` lease (SET NX, TTL = probe_timeout_seconds) and makes
+                a real call while every other worker keeps failing fast.
+                Probe success closes the circuit (window cleared), failure
+                opens it again.
+
+Per process, a closed state read from Redis is trusted for
+CIRCUIT_BREAKER_STATE_CACHE_SECONDS and successes are counted in memory and
+written at most as often, so a hot path costs about one Redis round trip per
+second and scope. Failures are written (and the window read) at once.
+
+Only dependency failures should count: protect()/protect_async() take an
+is_failure predicate, and exceptions it rejects (e.g. an S3 404 or a bad
+image) are recorded as successful calls, since the dependency answered.
+
+Redis is best-effort: while it is unreachable the breakers run on
+in-process state (per process, like a local breaker) and Redis is retried
+every REDIS_RETRY_SECONDS.
+
+Architecture:
+    Layer: Infrastructure (resilience)
+    Dependencies: Redis (synchronous client; also called from worker threads)
+    Used by: ML Celery tasks (GPU and DB scopes), S3ImageService (S3 scope)
+
+Example:
+    ```python
+    breaker = get_circuit_breaker("db")
+    with breaker.protect():
+        dispatch_chord(...)
+
+    @get_circuit_breaker("s3").protect_async(is_failure=is_s3_failure)
+    async def _s3_operation(...): ...
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import math
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import lru_cache
+from typing import Any, Protocol, overload
+
+from app.core.config import settings
+from app.core.exceptions import CircuitBreakerException
+from app.core.logging import get_logger
+from app.core.metrics import record_circuit_breaker_event
+
+logger = get_logger(__name__)
+
+CIRCUIT_KEY_PREFIX = "circuit"
+WINDOW_BUCKETS = 6
+TRIPPED_TTL_SECONDS = 24 * 3600  # Safety net: a never-probed circuit is forgotten after a day
+REDIS_RETRY_SECONDS = 30.0
+REDIS_TIMEOUT_SECONDS = 0.5
+
+# Decides whether an exception raised by a protected call is a dependency failure
+FailurePredicate = Callable[[BaseException], bool]
+
+
+def root_cause(exc: BaseException) -> BaseException:
+    """Innermost exception of a raise ... from chain (for failure predicates)."""
+    seen: set[int] = set()
+    while exc.__cause__ is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        exc = exc.__cause__
+    return exc
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitBreakerPolicy:
+    """Thresholds of one scope.
+
+    Attributes:
+        failure_rate: Failure ratio over the window that opens the circuit
+        min_calls: Calls needed in the window before the ratio is judged
+        window_seconds: Sliding window length
+        open_seconds: Cooldown before the half-open probe
+        probe_timeout_seconds: Lease of the probe (a crashed probe frees it)
+    """
+
+    failure_rate: float
+    min_calls: int
+    window_seconds: int
+    open_seconds: int
+    probe_timeout_seconds: int
+
+    @property
+    def bucket_seconds(self) -> float:
+        return self.window_seconds / WINDOW_BUCKETS
+
+
+def default_policy() -> CircuitBreakerPolicy:
+    """Policy of the S3 and DB scopes (CIRCUIT_BREAKER_* settings)."""
+    return CircuitBreakerPolicy(
+        failure_rate=settings.CIRCUIT_BREAKER_FAILURE_RATE,
+        min_calls=settings.CIRCUIT_BREAKER_MIN_CALLS,
+        window_seconds=settings.CIRCUIT_BREAKER_WINDOW_SECONDS,
+        open_seconds=settings.CIRCUIT_BREAKER_OPEN_SECONDS,
+        probe_timeout_seconds=settings.CIRCUIT_BREAKER_PROBE_TIMEOUT_SECONDS,
+    )
+
+
+def gpu_policy() -> CircuitBreakerPolicy:
+    """Policy of GPU scopes (ML_GPU_CIRCUIT_BREAKER_* settings)."""
+    return CircuitBreakerPolicy(
+        failure_rate=settings.CIRCUIT_BREAKER_FAILURE_RATE,
+        min_calls=settings.ML_GPU_CIRCUIT_BREAKER_MIN_CALLS,
+        window_seconds=settings.ML_GPU_CIRCUIT_BREAKER_WINDOW_SECONDS,
+        open_seconds=settings.ML_GPU_CIRCUIT_BREAKER_OPEN_SECONDS,
+        probe_timeout_seconds=settings.ML_GPU_CIRCUIT_BREAKER_PROBE_TIMEOUT_SECONDS,
+    )
+
+
+# =============================================================================
+# State stores
+# =============================================================================
+
+
+class CircuitStore(Protocol):
+    """Where breakers keep their state (Redis, or in-process as fallback)."""
+
+    def state(self, scope: str) -> tuple[CircuitState, float]:
+        """Current state and, when open, the seconds left before half-open."""
+        ...
+
+    def acquire_probe(self, scope: str, policy: CircuitBreakerPolicy) -> bool:
+        """Take the half-open probe lease; False if another worker holds it."""
+        ...
+
+    def add(
+        self, scope: str, calls: int, failures: int, policy: CircuitBreakerPolicy
+    ) -> tuple[int, int] | None:
+        """Count outcomes; with failures, return (calls, failures) over the window."""
+        ...
+
+    def trip(self, scope: str, policy: CircuitBreakerPolicy) -> bool:
+        """Open a closed circuit; False if it was already tripped."""
+        ...
+
+    def reopen(self, scope: str, policy: CircuitBreakerPolicy) -> None:
+        """Open the circuit again after a failed probe."""
+        ...
+
+    def close(self, scope: str, policy: CircuitBreakerPolicy) -> None:
+        """Close the circuit after a successful probe (window cleared)."""
+        ...
+
+
+def _bucket(policy: CircuitBreakerPolicy, now: float) -> int:
+    return int(now // policy.bucket_seconds)
+
+
+class RedisCircuitStore:
+    """Circuit state in Redis, shared by every process and host."""
+
+    def __init__(self, client: Any) -> None:
+        self.client = client
+
+    @staticmethod
+    def _key(scope: str, name: str) -> str:
+        return f"{CIRCUIT_KEY_PREFIX}:{scope}:{name}"
+
+    def _window_keys(self, scope: str, policy: CircuitBreakerPolicy) -> list[str]:
+        current = _bucket(policy, time.time())
+        return [
+            self._key(scope, f"w:{b}") for b in range(current - WINDOW_BUCKETS + 1, current + 1)
+        ]
+
+    def state(self, scope: str) -> tuple[CircuitState, float]:
+        pipe = self.client.pipeline(transaction=False)
+        pipe.pttl(self._key(scope, "open"))
+        pipe.exists(self._key(scope, "tripped"))
+        open_ms, tripped = pipe.execute()
+        if open_ms > 0:
+            return CircuitState.OPEN, open_ms / 1000
+        if tripped:
+            return CircuitState.HALF_OPEN, 0.0
+        return CircuitState.CLOSED, 0.0
+
+    def acquire_probe(self, scope: str, policy: CircuitBreakerPolicy) -> bool:
+        return bool(
+            self.client.set(self._key(scope, "probe"), 1, nx=True, ex=policy.probe_timeout_seconds)
+        )
+
+    def add(
+        self, scope: str, calls: int, failures: int, policy: CircuitBreakerPolicy
+    ) -> tuple[int, int] | None:
+        window_keys = self._window_keys(scope, policy)
+        pipe = self.client.pipeline(transaction=False)
+        pipe.hincrby(window_keys[-1], "calls", calls)
+        if failures:
+            pipe.hincrby(window_keys[-1], "failures", failures)
+        pipe.expire(window_keys[-1], math.ceil(policy.window_seconds + policy.bucket_seconds))
+        if not failures:
+            pipe.execute()
+            return None
+        for key in window_keys:
+            pipe.hmget(key, "calls", "failures")
+        buckets = pipe.execute()[3:]
+        return (
+            sum(int(b[0] or 0) for b in buckets),
+            sum(int(b[1] or 0) for b in buckets),
+        )
+
+    def trip(self, scope: str, policy: CircuitBreakerPolicy) -> bool:
+        pipe = self.client.pipeline(transaction=True)
+        pipe.set(self._key(scope, "tripped"), 1, nx=True, ex=TRIPPED_TTL_SECONDS)
+        pipe.set(self._key(scope, "open"), 1, nx=True, ex=policy.open_seconds)
+        tripped, _ = pipe.execute()
+        return bool(tripped)
+
+    def reopen(self, scope: str, policy: CircuitBreakerPolicy) -> None:
+        pipe = self.client.pipeline(transaction=True)
+        pipe.set(self._key(scope, "tripped"), 1, ex=TRIPPED_TTL_SECONDS)
+        pipe.set(self._key(scope, "open"), 1, ex=policy.open_seconds)
+        pipe.delete(self._key(scope, "probe"))
+        pipe.execute()
+
+    def close(self, scope: str, policy: CircuitBreakerPolicy) -> None:
+        self.client.delete(
+            self._key(scope, "open"),
+            self._key(scope, "tripped"),
+            self._key(scope, "probe"),
+            *self._window_keys(scope, policy),
+        )
+
+
+class LocalCircuitStore:
+    """Circuit state in this process (Redis fallback, tests)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._windows: dict[str, dict[int, list[int]]] = {}
+        self._open_until: dict[str, float] = {}
+        self._tripped: set[str] = set()
+        self._probe_until: dict[str, float] = {}
+
+    def state(self, scope: str) -> tuple[CircuitState, float]:
+        with self._lock:
+            remaining = self._open_until.get(scope, 0.0) - time.time()
+            if remaining > 0:
+                return CircuitState.OPEN, remaining
+            if scope in self._tripped:
+                return CircuitState.HALF_OPEN, 0.0
+            return CircuitState.CLOSED, 0.0
+
+    def acquire_probe(self, scope: str, policy: CircuitBreakerPolicy) -> bool:
+        now = time.time()
+        with self._lock:
+            if self._probe_until.get(scope, 0.0) > now:
+                return False
+            self._probe_until[scope] = now + policy.probe_timeout_seconds
+            return True
+
+    def add(
+        self, scope: str, calls: int, failures: int, policy: CircuitBreakerPolicy
+    ) -> tuple[int, int] | None:
+        current = _bucket(policy, time.time())
+        with self._lock:
+            window = self._windows.setdefault(scope, {})
+            for bucket in [b for b in window if b <= current - WINDOW_BUCKETS]:
+                del window[bucket]
+            counts = window.setdefault(current, [0, 0])
+            counts[0] += calls
+            counts[1] += failures
+            if not failures:
+                return None
+            return sum(c[0] for c in window.values()), sum(c[1] for c in window.values())
+
+    def trip(self, scope: str, policy: CircuitBreakerPolicy) -> bool:
+        with self._lock:
+            if scope in self._tripped:
+                return False
+            self._tripped.add(scope)
+            self._open_until[scope] = time.time() + policy.open_seconds
+            return True
+
+    def reopen(self, scope: str, policy: CircuitBreakerPolicy) -> None:
+        with self._lock:
+            self._tripped.add(scope)
+            self._open_until[scope] = time.time() + policy.open_seconds
+            self._probe_until.pop(scope, None)
+
+    def close(self, scope: str, policy: CircuitBreakerPolicy) -> None:
+        with self._lock:
+            self._tripped.discard(scope)
+            self._open_until.pop(scope, None)
+            self._probe_until.pop(scope, None)
+            self._windows.pop(scope, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._windows.clear()
+            self._open_until.clear()
+            self._tripped.clear()
+            self._probe_until.clear()
+
+
+class FallbackCircuitStore:
+    """Redis store that falls back to a local store while Redis is unreachable."""
+
+    def __init__(self, primary: CircuitStore, fallback: CircuitStore) -> None:
+        self.primary = primary
+        self.fallback = fallback
+        self._primary_down_until = 0.0
+
+    def _run(self, method: str, *args: Any) -> Any:
+        from redis.exceptions import RedisError
+
+        if time.monotonic() >= self._primary_down_until:
+            try:
+                return getattr(self.primary, method)(*args)
+            except (RedisError, OSError) as e:
+                self._primary_down_until = time.monotonic() + REDIS_RETRY_SECONDS
+                logger.warning(
+                    "Circuit breaker state store unavailable, using in-process state",
+                    error=str(e),
+                    retry_in_seconds=REDIS_RETRY_SECONDS,
+                )
+        return getattr(self.fallback, method)(*args)
+
+    def state(self, scope: str) -> tuple[CircuitState, float]:
+        result: tuple[CircuitState, float] = self._run("state", scope)
+        return result
+
+    def acquire_probe(self, scope: str, policy: CircuitBreakerPolicy) -> bool:
+        return bool(self._run("acquire_probe", scope, policy))
+
+    def add(
+        self, scope: str, calls: int, failures: int, policy: CircuitBreakerPolicy
+    ) -> tuple[int, int] | None:
+        result: tuple[int, int] | None = self._run("add", scope, calls, failures, policy)
+        return result
+
+    def trip(self, scope: str, policy: CircuitBreakerPolicy) -> bool:
+        return bool(self._run("trip", scope, policy))
+
+    def reopen(self, scope: str, policy: CircuitBreakerPolicy) -> None:
+        self._run("reopen", scope, policy)
+
+    def close(self, scope: str, policy: CircuitBreakerPolicy) -> None:
+        self._run("close", scope, policy)
+
+
+_local_store = LocalCircuitStore()
+
+
+@lru_cache(maxsize=1)
+def _default_store() -> CircuitStore:
+    import redis
+
+    client = redis.Redis.from_url(
+        settings.REDIS_URL,
+        socket_connect_timeout=REDIS_TIMEOUT_SECONDS,
+        socket_timeout=REDIS_TIMEOUT_SECONDS,
+    )
+    return FallbackCircuitStore(RedisCircuitStore(client), _local_store)
+
+
+# =============================================================================
+# Breaker
+# =============================================================================
+
+
+class CircuitBreaker:
+    """Circuit breaker of one scope, backed by a (shared) CircuitStore.
+
+    Thread-safe; one instance per scope and process (get_circuit_breaker).
+    """
+
+    def __init__(
+        self, scope: str, policy: CircuitBreakerPolicy, store: CircuitStore | None = None
+    ) -> None:
+        self.scope = scope
+        self.policy = policy
+        self._store = store
+        self._lock = threading.Lock()
+        self._cached_state = CircuitState.CLOSED
+        self._cached_until = 0.0  # time.time() until which _cached_state holds
+        self._pending_successes = 0
+        self._next_flush = 0.0
+
+    @property
+    def store(self) -> CircuitStore:
+        return self._store or _default_store()
+
+    # ------------------------------------------------------------------
+    # Checks
+    # ------------------------------------------------------------------
+
+    def before_call(self) -> bool:
+        """Admit or reject a call.
+
+        Returns:
+            True if the call is the half-open probe (pass it to record_*)
+
+        Raises:
+            CircuitBreakerException: If the circuit is open, or half-open
+                with another worker's probe in flight
+        """
+        state, retry_after = self._state()
+        if state is CircuitState.CLOSED:
+            return False
+
+        if state is CircuitState.HALF_OPEN and self.store.acquire_probe(self.scope, self.policy):
+            logger.info("Circuit breaker HALF_OPEN: probing recovery", scope=self.scope)
+            record_circuit_breaker_event(self.scope, "probe")
+            return True
+
+        record_circuit_breaker_event(self.scope, "rejected")
+        if state is CircuitState.OPEN:
+            raise CircuitBreakerException(
+                reason=f"{self.scope} circuit open, probing again in {retry_after:.0f}s",
+                retry_after_seconds=math.ceil(retry_after),
+            )
+        raise CircuitBreakerException(reason=f"{self.scope} circuit half-open, probe in progress")
+
+    def fail_fast(self) -> None:
+        """Raise CircuitBreakerException while open (no probe lease is taken).
+
+        For work that only reaches the dependency later (e.g. after a
+        download): it is dropped early while the circuit is known to be open.
+        """
+        state, retry_after = self._state()
+        if state is CircuitState.OPEN:
+            record_circuit_breaker_event(self.scope, "rejected")
+            raise CircuitBreakerException(
+                reason=f"{self.scope} circuit open, probing again in {retry_after:.0f}s",
+                retry_after_seconds=math.ceil(retry_after),
+            )
+
+    def _state(self) -> tuple[CircuitState, float]:
+        now = time.time()
+        with self._lock:
+            if now < self._cached_until:
+                return self._cached_state, self._cached_until - now
+
+        state, remaining = self.store.state(self.scope)
+        with self._lock:
+            if state is CircuitState.OPEN:
+                self._cache(state, remaining)
+            elif state is CircuitState.CLOSED:
+                self._cache(state, settings.CIRCUIT_BREAKER_STATE_CACHE_SECONDS)
+            else:
+                self._cached_until = 0.0  # Half-open: ask the store every time
+        return state, remaining
+
+    def _cache(self, state: CircuitState, seconds: float) -> None:
+        self._cached_state = state
+        self._cached_until = time.time() + seconds
+
+    def _state_is_cached(self) -> bool:
+        with self._lock:
+            return time.time() < self._cached_until
+
+    # ------------------------------------------------------------------
+    # Outcomes
+    # ------------------------------------------------------------------
+
+    def record_success(self, probe: bool = False) -> None:
+        """Count a successful call (a successful probe closes the circuit)."""
+        if probe:
+            self.store.close(self.scope, self.policy)
+            with self._lock:
+                self._cache(CircuitState.CLOSED, settings.CIRCUIT_BREAKER_STATE_CACHE_SECONDS)
+            logger.info("Circuit breaker CLOSED (recovery successful)", scope=self.scope)
+            record_circuit_breaker_event(self.scope, "closed")
+            return
+
+        with self._lock:
+            self._pending_successes += 1
+            if time.time() < self._next_flush:
+                return
+            calls, self._pending_successes = self._pending_successes, 0
+            self._next_flush = time.time() + settings.CIRCUIT_BREAKER_STATE_CACHE_SECONDS
+        self.store.add(self.scope, calls, 0, self.policy)
+
+    def record_failure(self, probe: bool = False) -> None:
+        """Count a failed call; opens the circuit when the window's rate is too high."""
+        if probe:
+            self.store.reopen(self.scope, self.policy)
+            self._opened()
+            logger.error(
+                "Circuit breaker OPENED again (probe failed)",
+                scope=self.scope,
+                open_seconds=self.policy.open_seconds,
+            )
+            return
+
+        with self._lock:
+            calls, self._pending_successes = self._pending_successes + 1, 0
+        totals = self.store.add(self.scope, calls, 1, self.policy)
+        if totals is None:
+            return
+
+        window_calls, window_failures = totals
+        if window_calls < self.policy.min_calls:
+            return
+        if window_failures / window_calls < self.policy.failure_rate:
+            return
+        if self.store.trip(self.scope, self.policy):
+            self._opened()
+            logger.error(
+                "Circuit breaker OPENED",
+                scope=self.scope,
+                calls=window_calls,
+                failures=window_failures,
+                window_seconds=self.policy.window_seconds,
+                open_seconds=self.policy.open_seconds,
+            )
+
+    def _opened(self) -> None:
+        with self._lock:
+            self._cache(CircuitState.OPEN, self.policy.open_seconds)
+        record_circuit_breaker_event(self.scope, "opened")
+
+    def _flush_due(self) -> bool:
+        with self._lock:
+            return time.time() >= self._next_flush
+
+    # ------------------------------------------------------------------
+    # Wrappers
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def protect(self, is_failure: FailurePredicate | None = None) -> Iterator[None]:
+        """Run the block as one protected call.
+
+        Args:
+            is_failure: Which exceptions count as failures (default: all);
+                        the others are recorded as successful calls
+
+        Raises:
+            CircuitBreakerException: If the call is rejected
+        """
+        probe = self.before_call()
+        try:
+            yield
+        except Exception as e:
+            if is_failure is None or is_failure(e):
+                self.record_failure(probe)
+            else:
+                self.record_success(probe)
+            raise
+        self.record_success(probe)
+
+    @overload
+    def protect_async[**P, R](
+        self, func: Callable[P, Awaitable[R]], /
+    ) -> Callable[P, Awaitable[R]]: ...
+
+    @overload
+    def protect_async[**P, R](
+        self, func: None = None, /, *, is_failure: FailurePredicate
+    ) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]: ...
+
+    def protect_async(
+        self,
+        func: Callable[..., Awaitable[Any]] | None = None,
+        /,
+        *,
+        is_failure: FailurePredicate | None = None,
+    ) -> Any:
+        """Decorate a coroutine function as a protected call.
+
+        Usable bare (every exception is a failure) or as
+        protect_async(is_failure=...) like protect().
+
+        Store round trips run in a worker thread; calls answered from the
+        process-local cache (closed/open state, counted successes) do not
+        leave the event loop.
+        """
+
+        def decorate(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+            @functools.wraps(func)
+            async def wrapper(*args: Any, **kwargs: Any) -> Any:
+                if self._state_is_cached():
+                    probe = self.before_call()
+                else:
+                    probe = await asyncio.to_thread(self.before_call)
+                try:
+                    result = await func(*args, **kwargs)
+                except Exception as e:
+                    if is_failure is None or is_failure(e):
+                        await asyncio.to_thread(self.record_failure, probe)
+                    else:
+                        await asyncio.to_thread(self.record_success, probe)
+                    raise
+                if probe or self._flush_due():
+                    await asyncio.to_thread(self.record_success, probe)
+                else:
+                    self.record_success(probe)
+                return result
+
+            return wrapper
+
+        return decorate if func is None else decorate(func)
+
+    def reset(self) -> None:
+        """Forget process-local state (cached state, uncounted successes)."""
+        with self._lock:
+            self._cached_state = CircuitState.CLOSED
+            self._cached_until = 0.0
+            self._pending_successes = 0
+            self._next_flush = 0.0
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(scope: str, policy: CircuitBreakerPolicy | None = None) -> CircuitBreaker:
+    """Process-wide breaker of a scope (created with policy, default_policy() if None)."""
+    with _breakers_lock:
+        breaker = _breakers.get(scope)
+        if breaker is None:
+            breaker = CircuitBreaker(scope, policy or default_policy())
+            _breakers[scope] = breaker
+        return breaker
+
+
+def reset_circuit_breakers() -> None:
+    """Reset every breaker of this process and the in-process fallback state (tests)."""
+    with _breakers_lock:
+        for breaker in _breakers.values():
+            breaker.reset()
+    _local_store.clear()
@@ -17,6 +17,12 @@ class Settings(BaseSettings):
                    DEBUG: All logs (development)
                    INFO: Informational logs (staging)
                    WARNING: Only warnings/errors (production)
+        LOG_QUEUE_ENABLED: Write log lines from a background thread so request
+                   handlers never block on stdout (see app.core.logging).
+        LOG_SAMPLE_RATE: Share of requests (0.0-1.0) whose debug/info logs are
+                   kept; warnings and errors are always kept.
+        LOG_ROUTE_SAMPLE_RATES: Per path prefix overrides of LOG_SAMPLE_RATE
+                   (e.g. health checks and metrics scrapes).
         debug: Debug mode flag (default: False)
                When True, exposes technical error details in API responses.
                When False (production), only shows user-friendly messages.
@@ -34,16 +40,127 @@ class Settings(BaseSettings):
         DB_ECHO_SQL: Enable SQL query logging (default: False)
                      When True, logs all SQL queries to stdout.
                      Use only in DEBUG mode for development.
+        S3_MULTIPART_CHUNK_BYTES: Part size for streaming (multipart) uploads of
+                            the original photo (S3 minimum is 5MB). Also the
+                            part size of direct-to-S3 (presigned) uploads.
+        S3_DIRECT_UPLOAD_EXPIRY_SECONDS: Lifetime of presigned part URLs and of
+                            the pending direct upload state in Redis.
+        UPLOAD_BATCH_MAX_PHOTOS: Maximum photos per batch upload request.
+        UPLOAD_BATCH_S3_CONCURRENCY: Originals of one batch streamed to S3 at once.
+        UPLOAD_MAX_INFLIGHT_PHOTOS_PER_TENANT: Photos a tenant (uploading user)
+                            may have queued or running in the ML pipeline;
+                            uploads beyond it are rejected with 429.
+        ML_FAIR_SHARE_LEVEL_PHOTOS: Batch images of a tenant drop one GPU queue
+                            priority level per this many images the tenant
+                            already has in flight (see app.tasks.ml_priority).
+        UPLOAD_DEDUP_ENABLED: Check single uploads for duplicates before
+                            inference: the same bytes reuse the earlier
+                            session's results, near-identical shots of the
+                            same location are flagged (results reused on request).
+        UPLOAD_NEAR_DUPLICATE_WINDOW_SECONDS: How far back sessions of the same
+                            location are compared for near duplicates.
+        UPLOAD_NEAR_DUPLICATE_MAX_DISTANCE: Maximum Hamming distance between
+                            64-bit perceptual hashes of near duplicates.
+        UPLOAD_CPU_WORKERS: Threads in the bounded pool that runs CPU-bound
+                            upload steps (header parsing, hashing) off the
+                            event loop (see app.core.executors).
+        LOCATION_INDEX_REFRESH_SECONDS: How often the in-process GPS → storage
+                            location index checks the database for changes.
+        LOCATION_GPS_TOLERANCE_METERS: A photo outside every location polygon
+                            is assigned to the nearest location within this
+                            distance (GPS fixes drift a few meters).
+        LOCATION_HIERARCHY_CACHE_TTL_SECONDS: Lifetime of a cached warehouse
+                            hierarchy tree in Redis (trees are also dropped
+                            on any hierarchy write, see location_hierarchy_cache).
+        CATALOG_CACHE_TTL_SECONDS: Redis lifetime of cached reference data
+                            (categories, families, sizes, states, packaging,
+                            bin types); entries are also dropped on writes.
+        CATALOG_CACHE_PRODUCT_TTL_SECONDS: Redis lifetime of cached products,
+                            price lists and density parameters (edited more often).
+        CATALOG_CACHE_L1_TTL_SECONDS: Lifetime of the in-process copy of a cached
+                            entry; bounds how long another worker's write can
+                            go unnoticed (see app.core.read_through_cache).
+        CATALOG_CACHE_L1_MAX_ENTRIES: Entries kept in-process per namespace.
+        HTTP_CACHE_MAX_AGE_SECONDS: max-age of ETag-versioned GET responses;
+                            0 makes clients revalidate every time (cheap 304s,
+                            see app.core.http_cache).
+        JSON_STREAM_MIN_ITEMS: Array length from which fast JSON responses are
+                            streamed in chunks (see app.core.responses).
+        JSON_STREAM_CHUNK_ITEMS: Array items serialized per streamed chunk.
+        DETECTION_POINTS_MIN_ZOOM: Lowest viewer zoom (log2 of screen px per image
+                            px) served as individual detections; below it,
+                            detections are clustered on a grid.
+        DETECTION_CLUSTER_CELL_PX: Cluster grid cell size in screen pixels.
+        DETECTION_VIEWPORT_MAX_POINTS: Viewports holding more detections are
+                            clustered even at point zoom levels.
+        EXPORT_STREAM_BATCH_ROWS: Rows fetched per server-side cursor batch when
+                            streaming session exports (CSV/GeoJSON).
+        EXPORT_SPOOL_MAX_MEMORY_BYTES: Size above which an export being generated
+                            is spooled to a temporary file before its S3 upload.
+        EXPORT_DOWNLOAD_CHUNK_BYTES: Chunk size of exports streamed back from S3.
+        ML_CHECKPOINTS_DIR: Directory holding YOLO weights and exported artifacts
+                            (segment.pt, detect.onnx, detect_openvino_model/, ...).
+        ML_SEGMENT_BACKEND / ML_DETECT_BACKEND: Inference backend per model type
+                            (torch, onnx, openvino, torchscript). Exported
+                            backends are produced offline by
+                            ``python -m app.services.ml_processing.model_export``.
+        SAHI_TILE_FILTER_ENABLED: Skip SAHI tiles outside the segment polygon or
+                            without plausible vegetation (default: True).
+        SAHI_TILE_MIN_MASK_COVERAGE / SAHI_TILE_MIN_VEGETATION_RATIO: Minimum
+                            fraction of a tile inside the polygon / classified
+                            as vegetation for the tile to be processed.
+        SAHI_ADAPTIVE_TILING_ENABLED: Derive SAHI tile size, overlap and
+                            downscale per segment from the plant size seen in
+                            the previous session at the same location.
+        SAHI_TARGET_OBJECT_PX: Desired plant diameter at model input; larger
+                            plants are downscaled (never below SAHI_MIN_SCALE).
+        SAHI_POSTPROCESS_TYPE: Tile merge strategy, GREEDYNMM (default) or NMS.
+        ML_INCREMENTAL_RECOUNT_ENABLED: Re-count a bench against the previous
+                            session at the same location: its segment layout
+                            replaces segmentation and unchanged segments keep
+                            their detections (only changed ones go through SAHI).
+        ML_RECOUNT_MAX_AGE_DAYS: Detections older than this are never reused
+                            (forces a periodic full detection of every segment).
+        ML_RECOUNT_MIN_REGISTRATION_RESPONSE / ML_RECOUNT_MAX_SHIFT: Phase
+                            correlation peak and camera shift (fraction of the
+                            image side) required to align with the previous photo.
+        ML_RECOUNT_CHANGE_THRESHOLD: 1 - NCC of a segment between the aligned
+                            photos above which the segment is re-detected.
+        VIZ_PREVIEW_MAX_PX: Longest side of the processed-photo preview
+                            (AVIF, WebP fallback). VIZ_PREVIEW_SPEED is the
+                            AVIF encoder speed (0-10, higher = less effort).
+        VIZ_TILES_ENABLED: Also emit Deep Zoom tiles (VIZ_TILE_SIZE px,
+                            VIZ_TILE_FORMAT jpeg/webp) for the zoomable viewer.
         AUTH0_DOMAIN: Auth0 tenant domain (e.g., demeter.us.auth0.com)
                       Used to construct JWKS endpoint and validate issuer.
         AUTH0_API_AUDIENCE: API identifier registered in Auth0 dashboard
                             Used to validate JWT audience claim.
         AUTH0_ALGORITHMS: List of allowed JWT algorithms (default: ["RS256"])
                           Auth0 uses RS256 (RSA signature with SHA-256).
+        AUTH0_JWKS_CACHE_TTL_SECONDS: Age after which Auth0 signing keys are
+                          refreshed in the background (keys stay in-process).
+        AUTH0_JWKS_MIN_REFRESH_SECONDS: Minimum time between JWKS refreshes
+                          forced by tokens with an unknown key ID.
+        AUTH_TOKEN_CACHE_MAX_ENTRIES: Verified tokens remembered per process
+                          (until their exp) to skip RSA verification.
+        CIRCUIT_BREAKER_FAILURE_RATE: Failure ratio over the sliding window that
+                          opens a circuit (state shared in Redis by all workers,
+                          see app.core.circuit_breaker).
+        CIRCUIT_BREAKER_WINDOW_SECONDS / _MIN_CALLS / _OPEN_SECONDS /
+        _PROBE_TIMEOUT_SECONDS: Window length, calls needed in it before the
+                          rate is judged, cooldown before the half-open probe,
+                          and lease of that probe (S3 and DB scopes).
+        ML_GPU_CIRCUIT_BREAKER_*: Same per GPU device (inference takes minutes,
+                          so windows are longer and need fewer calls).
+        CIRCUIT_BREAKER_STATE_CACHE_SECONDS: How long a process trusts a closed
+                          state read from Redis before reading it again.
     """
 
     # Logging configuration
     log_level: str = "INFO"
+    LOG_QUEUE_ENABLED: bool = True  # Non-blocking log writes (API process)
+    LOG_SAMPLE_RATE: float = 1.0  # Requests whose debug/info logs are kept
+    LOG_ROUTE_SAMPLE_RATES: dict[str, float] = {"/health": 0.01, "/metrics": 0.0}
 
     # Debug mode (controls exception detail exposure)
     debug: bool = False
@@ -62,11 +179,98 @@ class Settings(BaseSettings):
     S3_BUCKET_ORIGINAL: str = "demeter-photos-original"
     S3_PRESIGNED_URL_EXPIRY_HOURS: int = 24
     S3_THUMBNAIL_SIZE: int = 300  # Thumbnail size in pixels (width and height)
+    S3_MULTIPART_CHUNK_BYTES: int = 8 * 1024 * 1024  # Streaming upload part size (min 5MB)
+
+    # Upload request path
+    UPLOAD_CPU_WORKERS: int = 4  # Bounded pool for header parsing / hashing
+    S3_DIRECT_UPLOAD_EXPIRY_SECONDS: int = 3600  # Presigned part URL / pending upload TTL
+    UPLOAD_BATCH_MAX_PHOTOS: int = 500  # Photos per batch upload request
+    UPLOAD_BATCH_S3_CONCURRENCY: int = 8  # Concurrent S3 streams per batch
+    UPLOAD_MAX_INFLIGHT_PHOTOS_PER_TENANT: int = 1000  # Per-tenant ML pipeline quota
+    ML_FAIR_SHARE_LEVEL_PHOTOS: int = 50  # In-flight photos per batch priority level
+    UPLOAD_DEDUP_ENABLED: bool = True  # Duplicate check before inference (single uploads)
+    UPLOAD_NEAR_DUPLICATE_WINDOW_SECONDS: int = 1800  # Same-location shots compared
+    UPLOAD_NEAR_DUPLICATE_MAX_DISTANCE: int = 6  # Differing perceptual hash bits (of 64)
+
+    # GPS → storage location resolution
+    LOCATION_INDEX_REFRESH_SECONDS: int = 60  # Change check interval of the spatial index
+    LOCATION_GPS_TOLERANCE_METERS: float = 15.0  # Nearest-location fallback radius
+    LOCATION_HIERARCHY_CACHE_TTL_SECONDS: int = 3600  # Cached warehouse tree lifetime
+
+    # Read-through cache for catalog/reference data
+    CATALOG_CACHE_TTL_SECONDS: int = 3600  # Reference tables (Redis L2)
+    CATALOG_CACHE_PRODUCT_TTL_SECONDS: int = 300  # Products, price lists, densities (Redis L2)
+    CATALOG_CACHE_L1_TTL_SECONDS: int = 30  # In-process copy lifetime
+    CATALOG_CACHE_L1_MAX_ENTRIES: int = 1024  # In-process entries per namespace
+
+    # Conditional GETs (ETag / If-None-Match) on list endpoints
+    HTTP_CACHE_MAX_AGE_SECONDS: int = 0  # Cache-Control max-age (0 = always revalidate)
+
+    # Fast JSON responses (pydantic-core serialization) of large payloads
+    JSON_STREAM_MIN_ITEMS: int = 2000  # Stream arrays at least this long
+    JSON_STREAM_CHUNK_ITEMS: int = 500  # Items per streamed chunk
+
+    # Detection viewer (viewport queries, app.services.photo.detection_service)
+    DETECTION_POINTS_MIN_ZOOM: int = -2  # 1/4 scale and closer: individual points
+    DETECTION_CLUSTER_CELL_PX: int = 64  # Cluster cell size on screen
+    DETECTION_VIEWPORT_MAX_POINTS: int = 20000  # Cluster above this many points
+
+    # Session exports (CSV/GeoJSON/PDF, app.services.photo.session_export_service)
+    EXPORT_STREAM_BATCH_ROWS: int = 2000  # Rows per cursor batch
+    EXPORT_SPOOL_MAX_MEMORY_BYTES: int = 8 * 1024 * 1024  # In-memory spool before temp file
+    EXPORT_DOWNLOAD_CHUNK_BYTES: int = 256 * 1024  # Chunk size of cached exports
+
+    # ML model configuration
+    ML_CHECKPOINTS_DIR: str = "/app/app/checkpoints"
+    ML_SEGMENT_BACKEND: str = "torch"  # torch, onnx, openvino, torchscript
+    ML_DETECT_BACKEND: str = "torch"  # torch, onnx, openvino, torchscript
+    ML_EXPORT_HALF: bool = False  # FP16 export (GPU backends)
+    ML_EXPORT_INT8: bool = False  # INT8 post-training quantization (OpenVINO/ONNX CPU)
+    ML_EXPORT_IMGSZ: int = 640  # Fixed input size baked into exported graphs
+
+    # SAHI tile pre-filter
+    SAHI_TILE_FILTER_ENABLED: bool = True
+    SAHI_TILE_MIN_MASK_COVERAGE: float = 0.02  # Fraction of tile inside segment polygon
+    SAHI_TILE_MIN_VEGETATION_RATIO: float = 0.005  # Fraction of ExG-positive pixels
+    SAHI_TILE_EXG_THRESHOLD: float = 0.05  # Excess Green (2g - r - b) on chromaticity
+    SAHI_TILE_FILTER_DOWNSCALE: int = 8  # Scoring map downsampling factor
+
+    # SAHI adaptive tiling
+    SAHI_ADAPTIVE_TILING_ENABLED: bool = True
+    SAHI_BASE_SLICE_PX: int = 512  # Tile size at model input
+    SAHI_TARGET_OBJECT_PX: float = 48.0  # Desired plant diameter at model input
+    SAHI_MIN_SCALE: float = 0.25  # Strongest allowed downscale
+    SAHI_MIN_OVERLAP: float = 0.1
+    SAHI_MAX_OVERLAP: float = 0.4
+
+    # SAHI tile prediction merge (vectorized, see box_merge)
+    SAHI_POSTPROCESS_TYPE: str = "GREEDYNMM"  # GREEDYNMM or NMS
+    SAHI_POSTPROCESS_MATCH_THRESHOLD: float = 0.5  # IOS threshold
+
+    # Incremental re-count against the previous session of the same location
+    ML_INCREMENTAL_RECOUNT_ENABLED: bool = True
+    ML_RECOUNT_MAX_AGE_DAYS: int = 28  # Oldest reusable detections of a segment
+    ML_RECOUNT_MIN_REGISTRATION_RESPONSE: float = 0.2  # Phase correlation peak (0-1)
+    ML_RECOUNT_MAX_SHIFT: float = 0.05  # Max camera shift, fraction of image side
+    ML_RECOUNT_CHANGE_THRESHOLD: float = 0.15  # 1 - NCC of a segment (0 = identical)
+
+    # Processed-photo visualization (preview + Deep Zoom tiles)
+    VIZ_PREVIEW_MAX_PX: int = 2048
+    VIZ_PREVIEW_QUALITY: int = 85
+    VIZ_PREVIEW_SPEED: int = 8  # AVIF encoder speed (0 = slowest/best, 10 = fastest)
+    VIZ_TILES_ENABLED: bool = True
+    VIZ_TILE_SIZE: int = 256
+    VIZ_TILE_OVERLAP: int = 1
+    VIZ_TILE_FORMAT: str = "jpeg"  # jpeg or webp
+    VIZ_TILE_QUALITY: int = 80
 
     # Auth0 configuration
     AUTH0_DOMAIN: str = ""  # Example: demeter.us.auth0.com
     AUTH0_API_AUDIENCE: str = ""  # Example: https://api.demeter.ai
     AUTH0_ALGORITHMS: list[str] = ["RS256"]
+    AUTH0_JWKS_CACHE_TTL_SECONDS: int = 3600  # Background key refresh interval
+    AUTH0_JWKS_MIN_REFRESH_SECONDS: int = 30  # Rate limit of unknown-kid refreshes
+    AUTH_TOKEN_CACHE_MAX_ENTRIES: int = 4096  # Verified-token LRU size
 
     @property
     def auth0_issuer(self) -> str:
@@ -94,6 +298,18 @@ class Settings(BaseSettings):
     REDIS_UPLOAD_SESSION_TTL: int = 24 * 3600  # 24 hours
     REDIS_JOB_STATUS_TTL: int = 48 * 3600  # 48 hours
 
+    # Distributed circuit breakers (state in Redis, app.core.circuit_breaker)
+    CIRCUIT_BREAKER_FAILURE_RATE: float = 0.5  # Open at this failure ratio
+    CIRCUIT_BREAKER_WINDOW_SECONDS: int = 60  # Sliding window (S3, DB)
+    CIRCUIT_BREAKER_MIN_CALLS: int = 10  # Calls in the window before judging the rate
+    CIRCUIT_BREAKER_OPEN_SECONDS: int = 60  # Cooldown before the half-open probe
+    CIRCUIT_BREAKER_PROBE_TIMEOUT_SECONDS: int = 30  # Probe lease (crashed probe frees it)
+    CIRCUIT_BREAKER_STATE_CACHE_SECONDS: float = 1.0  # Per-process cache of a closed state
+    ML_GPU_CIRCUIT_BREAKER_WINDOW_SECONDS: int = 1800  # Per GPU device
+    ML_GPU_CIRCUIT_BREAKER_MIN_CALLS: int = 3
+    ML_GPU_CIRCUIT_BREAKER_OPEN_SECONDS: int = 300
+    ML_GPU_CIRCUIT_BREAKER_PROBE_TIMEOUT_SECONDS: int = 900  # Longer than one inference
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -267,6 +267,34 @@ class ForbiddenException(AppBaseException):
         )
 
 
+class TooManyRequestsException(AppBaseException):
+    """Raised when a caller exceeds a rate or concurrency quota.
+
+    HTTP Status: 429 Too Many Requests
+
+    Example:
+        raise TooManyRequestsException(
+            reason="Tenant 12 would exceed 1000 photos in processing",
+            retry_after_seconds=60
+        )
+    """
+
+    def __init__(self, reason: str, retry_after_seconds: int | None = None):
+        """Initialize TooManyRequestsException.
+
+        Args:
+            reason: Which quota was exceeded
+            retry_after_seconds: Suggested wait before retrying (optional)
+        """
+        super().__init__(
+            technical_message=f"Quota exceeded: {reason}",
+            user_message="Too many photos are already being processed. Please try again later.",
+            code=429,
+            extra={"reason": reason, "retry_after_seconds": retry_after_seconds},
+        )
+        self.retry_after_seconds = retry_after_seconds
+
+
 # =============================================================================
 # 5xx Server Errors - Internal application issues
 # =============================================================================
@@ -642,26 +670,31 @@ class CircuitBreakerException(AppBaseException):
     HTTP Status: 503 Service Unavailable
 
     Circuit breaker pattern prevents cascading failures by:
-    - Opening circuit after threshold failures (5 consecutive)
+    - Opening circuit when the failure rate over a sliding window is too high
     - Rejecting all requests while open (fail fast)
-    - Transitioning to half-open after cooldown (5 minutes)
-    - Testing recovery with limited requests
+    - Transitioning to half-open after cooldown
+    - Testing recovery with a single probe request
+
+    See app.core.circuit_breaker.
 
     Example:
         raise CircuitBreakerException(
-            reason="Circuit breaker OPEN after 5 consecutive failures"
+            reason="s3 circuit open (12/20 calls failed)", retry_after_seconds=45
         )
     """
 
-    def __init__(self, reason: str):
+    def __init__(self, reason: str, retry_after_seconds: int | None = None):
         """Initialize CircuitBreakerException.
 
         Args:
             reason: Reason why circuit breaker is open
+            retry_after_seconds: Seconds until the circuit admits a probe request
+                (None if unknown)
         """
         super().__init__(
             technical_message=f"Circuit breaker OPEN: {reason}",
             user_message="Service temporarily unavailable due to repeated failures. Please try again later.",
             code=503,
-            extra={"reason": reason},
+            extra={"reason": reason, "retry_after_seconds": retry_after_seconds},
         )
+        self.retry_after_seconds = retry_after_seconds
@@ -0,0 +1,62 @@
+"""Bounded executors for CPU-bound work on the request path.
+
+Async handlers must not run image parsing or hashing on the event loop:
+one large upload would stall every other request on the uvicorn worker.
+``run_cpu_bound`` runs such steps in a dedicated, bounded thread pool
+(UPLOAD_CPU_WORKERS) so bursts of uploads queue up behind each other
+instead of behind unrelated API calls.
+
+A thread pool (not a process pool) is used on purpose: the offloaded steps
+are header-only parsing and hashlib, which release the GIL or are short,
+and a process pool would have to pickle the upload body.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _create_cpu_executor() -> ThreadPoolExecutor:
+    """Create the bounded CPU executor using application settings."""
+    logger.info("Initializing CPU executor", extra={"max_workers": settings.UPLOAD_CPU_WORKERS})
+    return ThreadPoolExecutor(
+        max_workers=settings.UPLOAD_CPU_WORKERS, thread_name_prefix="demeter-cpu"
+    )
+
+
+def get_cpu_executor() -> ThreadPoolExecutor:
+    """Get singleton CPU executor instance."""
+    return _create_cpu_executor()
+
+
+async def run_cpu_bound[T](func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking callable in the bounded CPU executor.
+
+    Args:
+        func: Blocking callable (e.g., header parsing, hashing)
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Result of func(*args, **kwargs)
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_cpu_executor(), functools.partial(func, *args, **kwargs))
+
+
+def shutdown_cpu_executor() -> None:
+    """Shut down the CPU executor (used for application shutdown)."""
+    if _create_cpu_executor.cache_info().currsize:
+        _create_cpu_executor().shutdown(wait=False, cancel_futures=True)
+        _create_cpu_executor.cache_clear()
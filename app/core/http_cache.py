@@ -0,0 +1,109 @@
+"""Conditional GETs (ETag / If-None-Match) for list endpoints.
+
+The location, product, config and map list endpoints return the same large
+payloads until somebody edits the data behind them. Each such endpoint
+declares the resources it reads; a route dependency computes a strong ETag
+from the resources' version counters (app.core.cache, bumped on writes) and
+the request URL, before the endpoint runs:
+
+- ``If-None-Match`` matches → 304 Not Modified with an empty body. The
+  endpoint never runs: no database session, queries or JSON serialization.
+- Otherwise the endpoint runs and the response carries ``ETag`` and
+  ``Cache-Control: private, max-age=HTTP_CACHE_MAX_AGE_SECONDS, must-revalidate``.
+
+Checking costs one Redis MGET. If Redis is unavailable the endpoint is
+served normally, without an ETag.
+
+Architecture:
+    Layer: Infrastructure (HTTP)
+    Dependencies: Redis version counters (app.core.cache)
+    Used by: location, product, config and map controllers
+
+Example:
+    ```python
+    @router.get(
+        "/categories",
+        dependencies=[Depends(conditional_get("product_categories"))],
+    )
+    async def list_product_categories(...): ...
+    ```
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections.abc import Awaitable, Callable, Sequence
+
+from fastapi import HTTPException, Request, Response, status
+
+from app.core.cache import get_resource_versions
+from app.core.config import settings
+
+
+def compute_etag(
+    request: Request,
+    resources: Sequence[str],
+    versions: Sequence[int],
+    rotate_seconds: int | None = None,
+) -> str:
+    """Strong ETag of a GET: URL path + query + resource versions.
+
+    Args:
+        request: Incoming request
+        resources: Resource names the endpoint reads
+        versions: Current version of each resource
+        rotate_seconds: Also change the ETag every rotate_seconds (for
+            payloads embedding expiring data, e.g. presigned URLs)
+    """
+    parts = [request.url.path, *sorted(f"{k}={v}" for k, v in request.query_params.multi_items())]
+    parts += [
+        f"{resource}={version}" for resource, version in zip(resources, versions, strict=True)
+    ]
+    if rotate_seconds:
+        parts.append(f"t={int(time.time() // rotate_seconds)}")
+    return '"' + hashlib.sha256("\n".join(parts).encode()).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header matches etag (weak comparison, RFC 9110)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(",")
+    )
+
+
+def cache_control() -> str:
+    """Cache-Control of ETag-versioned responses."""
+    return f"private, max-age={settings.HTTP_CACHE_MAX_AGE_SECONDS}, must-revalidate"
+
+
+def conditional_get(
+    *resources: str, rotate_seconds: int | None = None
+) -> Callable[[Request, Response], Awaitable[None]]:
+    """Route dependency answering unchanged GETs with 304 Not Modified.
+
+    Args:
+        resources: Resource names the endpoint's response is built from
+            (e.g. "location_hierarchy", "products")
+        rotate_seconds: See compute_etag
+
+    Returns:
+        Dependency for ``dependencies=[Depends(...)]`` of a route decorator
+    """
+
+    async def check_not_modified(request: Request, response: Response) -> None:
+        versions = await get_resource_versions(resources)
+        if versions is None:
+            return  # Redis down: serve without ETag
+
+        etag = compute_etag(request, resources, versions, rotate_seconds)
+        headers = {"ETag": etag, "Cache-Control": cache_control()}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response.headers.update(headers)
+
+    return check_not_modified
@@ -10,6 +10,11 @@ Key features:
 - Environment-based log levels (DEBUG/INFO/WARNING/ERROR)
 - Thread-safe context variables for async operations
 - Extra fields support for rich contextual logging
+- Non-blocking output: once start_queued_logging() is called, log lines are
+  written to stdout by a background thread (LogWriter)
+- Request sampling: debug/info events of unsampled requests are dropped
+  before any rendering (sample_request_logs); warnings/errors always pass.
+  Applies to structlog and to stdlib loggers (UnsampledRecordFilter)
 
 Usage:
     from app.core.logging import setup_logging, get_logger
@@ -26,9 +31,14 @@ Usage:
     logger.error("S3 upload failed", error=str(e), exc_info=True)
 """
 
+import contextlib
 import logging
+import random
 import sys
+import threading
+from collections.abc import Mapping
 from contextvars import ContextVar
+from queue import SimpleQueue
 from typing import Any
 from uuid import uuid4
 
@@ -38,6 +48,12 @@ from structlog.typing import EventDict, Processor
 # Correlation ID context variable (thread-safe for async)
 correlation_id_var: ContextVar[str] = ContextVar("correlation_id", default="")
 
+# Whether debug/info events of the current request are kept (see sample_request_logs)
+log_sampled_var: ContextVar[bool] = ContextVar("log_sampled", default=True)
+
+# Levels subject to request sampling; warnings and errors are always logged
+SAMPLED_LEVELS = frozenset({"debug", "info"})
+
 
 def add_correlation_id(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
     """Add correlation_id from context to log event.
@@ -56,6 +72,127 @@ def add_correlation_id(logger: Any, method_name: str, event_dict: EventDict) ->
     return event_dict
 
 
+def drop_unsampled_events(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
+    """Drop debug/info events of requests that were not sampled.
+
+    Runs first in the processor chain, so dropped events cost no timestamping
+    or JSON rendering.
+
+    Raises:
+        structlog.DropEvent: If the event is not kept
+    """
+    if method_name in SAMPLED_LEVELS and not log_sampled_var.get():
+        raise structlog.DropEvent
+    return event_dict
+
+
+class UnsampledRecordFilter(logging.Filter):
+    """Stdlib counterpart of drop_unsampled_events.
+
+    Attached to the root handlers, so modules logging through
+    logging.getLogger (ML services) follow the request's sampling decision.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > logging.INFO or log_sampled_var.get()
+
+
+def sample_request_logs(path: str, default_rate: float, route_rates: Mapping[str, float]) -> bool:
+    """Decide whether the current request's debug/info logs are kept.
+
+    Args:
+        path: Request path
+        default_rate: Share of requests kept (0.0-1.0)
+        route_rates: Path prefix → rate overrides (longest matching prefix wins)
+
+    Returns:
+        Whether the request is sampled (also stored in the logging context)
+    """
+    rate = default_rate
+    matched = ""
+    for prefix, prefix_rate in route_rates.items():
+        if path.startswith(prefix) and len(prefix) > len(matched):
+            matched, rate = prefix, prefix_rate
+
+    sampled = rate >= 1.0 or random.random() < rate
+    log_sampled_var.set(sampled)
+    return sampled
+
+
+class LogWriter:
+    """File-like sink of rendered log lines (structlog and stdlib logging).
+
+    Lines go straight to stdout until start() is called. From then on they are
+    queued and written by a background thread, so a slow stdout (container
+    log driver back-pressure) never blocks the event loop. stop() drains the
+    queue and switches back to direct writes.
+    """
+
+    def __init__(self) -> None:
+        self._queue: SimpleQueue[str | None] | None = None
+        self._thread: threading.Thread | None = None
+
+    def write(self, line: str) -> None:
+        queue = self._queue
+        if queue is None:
+            sys.stdout.write(line)
+        else:
+            queue.put(line)
+
+    def flush(self) -> None:
+        if self._queue is None:
+            sys.stdout.flush()
+
+    def start(self) -> None:
+        """Start writing from the background thread (idempotent)."""
+        if self._thread is not None:
+            return
+        queue: SimpleQueue[str | None] = SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._drain, args=(queue,), name="log-writer", daemon=True
+        )
+        self._thread.start()
+        self._queue = queue
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Write out queued lines and go back to direct writes."""
+        queue, thread = self._queue, self._thread
+        if queue is None or thread is None:
+            return
+        self._queue = None
+        self._thread = None
+        queue.put(None)
+        thread.join(timeout)
+        while not queue.empty():  # Lines queued by writers racing with stop()
+            line = queue.get()
+            if line is not None:
+                sys.stdout.write(line)
+        sys.stdout.flush()
+
+    @staticmethod
+    def _drain(queue: SimpleQueue[str | None]) -> None:
+        while (line := queue.get()) is not None:
+            # Nowhere left to report a broken stdout
+            with contextlib.suppress(Exception):
+                sys.stdout.write(line)
+                if queue.empty():
+                    sys.stdout.flush()
+
+
+# Shared by structlog (WriteLogger) and the stdlib root handler
+log_writer = LogWriter()
+
+
+def start_queued_logging() -> None:
+    """Write log lines from a background thread (API startup)."""
+    log_writer.start()
+
+
+def stop_queued_logging() -> None:
+    """Flush queued log lines and write synchronously again (API shutdown)."""
+    log_writer.stop()
+
+
 def setup_logging(log_level: str = "INFO") -> Any:
     """Configure structured logging for the application.
 
@@ -79,12 +216,17 @@ def setup_logging(log_level: str = "INFO") -> Any:
     # Configure standard library logging
     logging.basicConfig(
         format="%(message)s",
-        stream=sys.stdout,
+        stream=log_writer,
         level=numeric_level,
     )
+    for handler in logging.getLogger().handlers:
+        if not any(isinstance(f, UnsampledRecordFilter) for f in handler.filters):
+            handler.addFilter(UnsampledRecordFilter())
 
     # Configure structlog processors
     processors: list[Processor] = [
+        # Drop debug/info events of unsampled requests (before any formatting)
+        drop_unsampled_events,
         # Add log level to event dict
         structlog.stdlib.add_log_level,
         # Add timestamp in ISO format
@@ -104,7 +246,7 @@ def setup_logging(log_level: str = "INFO") -> Any:
         processors=processors,
         wrapper_class=structlog.make_filtering_bound_logger(numeric_level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=structlog.WriteLoggerFactory(file=log_writer),  # type: ignore[arg-type]
         cache_logger_on_first_use=True,
     )
 
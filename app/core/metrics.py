@@ -74,6 +74,7 @@ stock_batch_size = None  # Histogram
 # ML Pipeline Metrics
 ml_inference_duration_seconds = None  # Histogram
 ml_detections_total = None  # Counter
+ml_sahi_tiles_total = None  # Counter
 
 # S3 Operations Metrics
 s3_operation_duration_seconds = None  # Histogram
@@ -96,6 +97,23 @@ db_connection_pool_size = None  # Gauge
 db_connection_pool_used = None  # Gauge
 db_query_duration_seconds = None  # Histogram
 
+# Read-Through Cache Metrics
+cache_requests_total = None  # Counter
+
+# Circuit Breaker Metrics
+circuit_breaker_events_total = None  # Counter
+
+# ML Queue Metrics (per priority class)
+ml_queue_depth = None  # Gauge
+ml_queue_oldest_wait_seconds = None  # Gauge
+ml_queue_wait_seconds = None  # Histogram
+
+# Incremental Re-count Metrics
+ml_recount_segments_total = None  # Counter
+
+# Upload Deduplication Metrics
+upload_duplicates_total = None  # Counter
+
 
 def setup_metrics(enable_metrics: bool | None = None) -> None:
     """Initialize Prometheus metrics if enabled.
@@ -109,12 +127,17 @@ def setup_metrics(enable_metrics: bool | None = None) -> None:
     global _registry, _metrics_enabled
     global api_request_duration_seconds, api_request_errors_total
     global stock_operations_total, stock_batch_size
-    global ml_inference_duration_seconds, ml_detections_total
+    global ml_inference_duration_seconds, ml_detections_total, ml_sahi_tiles_total
     global s3_operation_duration_seconds, s3_operation_errors_total
     global warehouse_location_queries_total, warehouse_query_duration_seconds
     global product_searches_total, product_search_duration_seconds
     global celery_task_duration_seconds, celery_task_status_total
     global db_connection_pool_size, db_connection_pool_used, db_query_duration_seconds
+    global cache_requests_total
+    global circuit_breaker_events_total
+    global ml_queue_depth, ml_queue_oldest_wait_seconds, ml_queue_wait_seconds
+    global ml_recount_segments_total
+    global upload_duplicates_total
 
     # Check if metrics should be enabled
     _metrics_enabled = (
@@ -184,6 +207,13 @@ def setup_metrics(enable_metrics: bool | None = None) -> None:
         registry=_registry,
     )
 
+    ml_sahi_tiles_total = Counter(
+        name="demeter_ml_sahi_tiles_total",
+        documentation="SAHI tiles by outcome (processed, skipped_mask, skipped_background)",
+        labelnames=["outcome"],
+        registry=_registry,
+    )
+
     # =============================================================================
     # S3 Operations Metrics
     # =============================================================================
@@ -284,6 +314,76 @@ def setup_metrics(enable_metrics: bool | None = None) -> None:
         registry=_registry,
     )
 
+    # =============================================================================
+    # Read-Through Cache Metrics
+    # =============================================================================
+
+    cache_requests_total = Counter(
+        name="demeter_cache_requests_total",
+        documentation="Read-through cache lookups by namespace and result (l1_hit, l2_hit, miss)",
+        labelnames=["namespace", "result"],
+        registry=_registry,
+    )
+
+    # =============================================================================
+    # Circuit Breaker Metrics
+    # =============================================================================
+
+    circuit_breaker_events_total = Counter(
+        name="demeter_circuit_breaker_events_total",
+        documentation="Circuit breaker events by scope (opened, rejected, probe, closed)",
+        labelnames=["scope", "event"],
+        registry=_registry,
+    )
+
+    # =============================================================================
+    # ML Queue Metrics
+    # =============================================================================
+
+    ml_queue_depth = Gauge(
+        name="demeter_ml_queue_depth",
+        documentation="Images waiting in the GPU queue by priority class",
+        labelnames=["priority_class"],
+        registry=_registry,
+    )
+
+    ml_queue_oldest_wait_seconds = Gauge(
+        name="demeter_ml_queue_oldest_wait_seconds",
+        documentation="Age of the oldest image waiting in the GPU queue by priority class",
+        labelnames=["priority_class"],
+        registry=_registry,
+    )
+
+    ml_queue_wait_seconds = Histogram(
+        name="demeter_ml_queue_wait_seconds",
+        documentation="Time from dispatch to the start of inference by priority class",
+        labelnames=["priority_class"],
+        buckets=(1.0, 5.0, 15.0, 30.0, 60.0, 180.0, 300.0, 900.0, 1800.0, 3600.0, 7200.0),
+        registry=_registry,
+    )
+
+    # =============================================================================
+    # Incremental Re-count Metrics
+    # =============================================================================
+
+    ml_recount_segments_total = Counter(
+        name="demeter_ml_recount_segments_total",
+        documentation="Segments per ML run by outcome (reused from the previous session, detected)",
+        labelnames=["outcome"],
+        registry=_registry,
+    )
+
+    # =============================================================================
+    # Upload Deduplication Metrics
+    # =============================================================================
+
+    upload_duplicates_total = Counter(
+        name="demeter_upload_duplicates_total",
+        documentation="Duplicate uploads by kind (exact, near) and action (reused, flagged)",
+        labelnames=["kind", "action"],
+        registry=_registry,
+    )
+
 
 # =============================================================================
 # Context Managers and Decorators
@@ -484,6 +584,22 @@ def track_ml_inference(
 # =============================================================================
 
 
+def record_sahi_tiles(processed: int, skipped_mask: int, skipped_background: int) -> None:
+    """Record SAHI tile pre-filter outcomes for one segment.
+
+    Args:
+        processed: Tiles sent to the detector
+        skipped_mask: Tiles skipped for lying outside the segment polygon
+        skipped_background: Tiles skipped for having no plausible vegetation
+    """
+    if not _metrics_enabled or ml_sahi_tiles_total is None:
+        return
+
+    ml_sahi_tiles_total.labels(outcome="processed").inc(processed)
+    ml_sahi_tiles_total.labels(outcome="skipped_mask").inc(skipped_mask)
+    ml_sahi_tiles_total.labels(outcome="skipped_background").inc(skipped_background)
+
+
 def record_s3_operation(operation: str, bucket: str, duration: float, success: bool = True) -> None:
     """Record S3 operation metrics.
 
@@ -602,6 +718,100 @@ def record_db_query(operation: str, table: str, duration: float) -> None:
     db_query_duration_seconds.labels(operation=operation, table=table).observe(duration)
 
 
+def record_cache_request(namespace: str, result: str) -> None:
+    """Record a read-through cache lookup.
+
+    Hit ratio per namespace (PromQL):
+    sum by (namespace) (rate(demeter_cache_requests_total{result!="miss"}[5m]))
+    / sum by (namespace) (rate(demeter_cache_requests_total[5m]))
+
+    Args:
+        namespace: Cache namespace (e.g., "products", "product_categories")
+        result: Lookup result (l1_hit, l2_hit, miss)
+    """
+    if not _metrics_enabled or cache_requests_total is None:
+        return
+
+    cache_requests_total.labels(namespace=namespace, result=result).inc()
+
+
+def record_circuit_breaker_event(scope: str, event: str) -> None:
+    """Record a circuit breaker event.
+
+    Args:
+        scope: Breaker scope (e.g., "s3", "db", "gpu:gpu@host-1:0")
+        event: opened, rejected, probe or closed
+    """
+    if not _metrics_enabled or circuit_breaker_events_total is None:
+        return
+
+    circuit_breaker_events_total.labels(scope=scope, event=event).inc()
+
+
+def update_ml_queue_metrics(priority_class: str, depth: int, oldest_wait_seconds: float) -> None:
+    """Update GPU queue depth of a priority class (sampled from the broker).
+
+    Args:
+        priority_class: interactive, batch or reprocess
+        depth: Images waiting
+        oldest_wait_seconds: Age of the oldest waiting image (0 if none)
+    """
+    if not _metrics_enabled:
+        return
+
+    if ml_queue_depth is not None:
+        ml_queue_depth.labels(priority_class=priority_class).set(depth)
+
+    if ml_queue_oldest_wait_seconds is not None:
+        ml_queue_oldest_wait_seconds.labels(priority_class=priority_class).set(oldest_wait_seconds)
+
+
+def record_ml_queue_wait(priority_class: str, seconds: float) -> None:
+    """Record how long an image waited in the GPU queue before inference.
+
+    Args:
+        priority_class: interactive, batch or reprocess
+        seconds: Dispatch to task start
+    """
+    if not _metrics_enabled or ml_queue_wait_seconds is None:
+        return
+
+    ml_queue_wait_seconds.labels(priority_class=priority_class).observe(seconds)
+
+
+def record_ml_recount_segments(reused: int, detected: int) -> None:
+    """Record how many segments of an image reused previous detections.
+
+    Share of detection work saved:
+    sum(rate(demeter_ml_recount_segments_total{outcome="reused"}[1d]))
+    / sum(rate(demeter_ml_recount_segments_total[1d]))
+
+    Args:
+        reused: Segments whose detections came from the previous session
+        detected: Segments that went through SAHI detection
+    """
+    if not _metrics_enabled or ml_recount_segments_total is None:
+        return
+
+    ml_recount_segments_total.labels(outcome="reused").inc(reused)
+    ml_recount_segments_total.labels(outcome="detected").inc(detected)
+
+
+def record_upload_duplicate(kind: str, reused: bool) -> None:
+    """Record an upload that duplicates an earlier session.
+
+    Pipeline runs saved: sum(increase(demeter_upload_duplicates_total{action="reused"}[1w]))
+
+    Args:
+        kind: exact or near
+        reused: True if the earlier results were returned (no inference)
+    """
+    if not _metrics_enabled or upload_duplicates_total is None:
+        return
+
+    upload_duplicates_total.labels(kind=kind, action="reused" if reused else "flagged").inc()
+
+
 # =============================================================================
 # Metrics Export
 # =============================================================================
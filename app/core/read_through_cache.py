@@ -0,0 +1,293 @@
+"""Read-through cache for catalog/reference data (in-process L1 + Redis L2).
+
+Catalog tables (product categories, families, products, sizes, states,
+packaging, price lists, storage bin types, density parameters) are read on
+almost every request and written rarely. Their services read through one
+ReadThroughCache per entity namespace:
+
+    L1: in-process LRU dict, entries live CATALOG_CACHE_L1_TTL_SECONDS
+    L2: Redis hash read_cache:{namespace}, field = key,
+        value = "{expires_at}:{json}" (per-namespace TTL)
+    DB: the service's loader (repository query) on a miss
+
+Values are pydantic response schemas, never ORM instances (those are bound
+to the session that loaded them); they are serialized with a TypeAdapter.
+
+- Invalidation: writes call ``invalidate(session)``. The namespace is dropped
+  at once (L1 + one DEL of the Redis hash, no key scans) and again when the
+  session's transaction ends, so data read by a concurrent request before
+  the commit cannot outlive it. Other workers' L1 copies expire within
+  CATALOG_CACHE_L1_TTL_SECONDS. Each drop also bumps the namespace's
+  resource version (ETags of the catalog endpoints, app.core.http_cache).
+- Single-flight: concurrent misses on one key in a process share one load.
+- Metrics: every lookup is counted as l1_hit, l2_hit, coalesced or miss
+  (demeter_cache_requests_total).
+
+Redis is best-effort: errors are logged and the loader result is served.
+
+Architecture:
+    Layer: Infrastructure (cache)
+    Dependencies: Redis (app.core.cache), Pydantic
+    Used by: Catalog services (wired in ServiceFactory)
+
+Example:
+    ```python
+    cache = get_read_through_cache("product_categories")
+    categories = await cache.get_or_load(
+        "all", load_categories, list[ProductCategoryResponse]
+    )
+    await cache.invalidate(session)  # after a category write
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from functools import cache
+from typing import TYPE_CHECKING, Any, cast
+
+from pydantic import TypeAdapter, ValidationError
+
+from app.core.cache import get_redis_client, resource_version_key
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import record_cache_request
+from app.db.session import run_after_transaction
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis  # type: ignore[import-not-found]
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = get_logger(__name__)
+
+READ_CACHE_KEY_PREFIX = "read_cache"
+
+# Namespace → setting holding its Redis TTL
+NAMESPACE_TTL_SETTINGS: dict[str, str] = {
+    "product_categories": "CATALOG_CACHE_TTL_SECONDS",
+    "product_families": "CATALOG_CACHE_TTL_SECONDS",
+    "product_sizes": "CATALOG_CACHE_TTL_SECONDS",
+    "product_states": "CATALOG_CACHE_TTL_SECONDS",
+    "packaging_types": "CATALOG_CACHE_TTL_SECONDS",
+    "packaging_colors": "CATALOG_CACHE_TTL_SECONDS",
+    "packaging_materials": "CATALOG_CACHE_TTL_SECONDS",
+    "packaging_catalog": "CATALOG_CACHE_TTL_SECONDS",
+    "storage_bin_types": "CATALOG_CACHE_TTL_SECONDS",
+    "products": "CATALOG_CACHE_PRODUCT_TTL_SECONDS",
+    "price_lists": "CATALOG_CACHE_PRODUCT_TTL_SECONDS",
+    "density_parameters": "CATALOG_CACHE_PRODUCT_TTL_SECONDS",
+    "storage_location_configs": "CATALOG_CACHE_TTL_SECONDS",
+}
+
+_MISSING: Any = object()
+
+
+@cache
+def _type_adapter(type_: Any) -> TypeAdapter[Any]:
+    return TypeAdapter(type_)
+
+
+class ReadThroughCache:
+    """Process-wide cache of one entity namespace (see module docstring).
+
+    Attributes:
+        namespace: Entity namespace (Redis hash name suffix, metrics label)
+        ttl_seconds: Lifetime of an entry in Redis
+        l1_ttl_seconds: Lifetime of the in-process copy of an entry
+        l1_max_entries: In-process entries kept (least recently used evicted)
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl_seconds: int,
+        l1_ttl_seconds: float,
+        l1_max_entries: int,
+        redis: Redis | None = None,
+    ) -> None:
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.l1_ttl_seconds = l1_ttl_seconds
+        self.l1_max_entries = l1_max_entries
+        self._redis = redis
+        self._l1: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+        # Bumped on invalidation: loads that started before it do not store
+        self._generation = 0
+
+    @property
+    def redis(self) -> Redis:
+        return self._redis or get_redis_client()
+
+    @property
+    def redis_key(self) -> str:
+        return f"{READ_CACHE_KEY_PREFIX}:{self.namespace}"
+
+    async def get_or_load[T](self, key: str, loader: Callable[[], Awaitable[T]], type_: Any) -> T:
+        """Return the cached value of key, loading (and caching) it on a miss.
+
+        Args:
+            key: Entry key within the namespace (e.g. "all:100", "id:5")
+            loader: Coroutine function querying the database
+            type_: Type of the value for (de)serialization, e.g.
+                ProductResponse or list[ProductResponse]
+
+        Returns:
+            The cached or freshly loaded value. Loader exceptions propagate
+            and are not cached.
+        """
+        value = self._l1_get(key)
+        if value is not _MISSING:
+            record_cache_request(self.namespace, "l1_hit")
+            return cast(T, value)
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                value = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise  # This caller was cancelled
+                # The loading request was cancelled: load here instead
+            else:
+                record_cache_request(self.namespace, "coalesced")
+                return cast(T, value)
+
+        return await self._load(key, loader, type_)
+
+    async def invalidate(self, session: AsyncSession | None = None) -> None:
+        """Drop every entry of the namespace (call after any write).
+
+        Args:
+            session: Session of the write; entries are dropped again when its
+                transaction ends (commit or rollback)
+        """
+        self._drop_local()
+        await self._drop_remote()
+        if session is not None:
+            run_after_transaction(session, self.redis_key, self.invalidate)
+
+    async def _load[T](self, key: str, loader: Callable[[], Awaitable[T]], type_: Any) -> T:
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        generation = self._generation
+        try:
+            value = await self._l2_get(key, type_)
+            if value is _MISSING:
+                record_cache_request(self.namespace, "miss")
+                value = await loader()
+                if generation == self._generation:
+                    await self._l2_set(key, value, type_)
+            else:
+                record_cache_request(self.namespace, "l2_hit")
+            if generation == self._generation:
+                self._l1_set(key, value)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Retrieved: no "never retrieved" warning without waiters
+            raise
+        else:
+            future.set_result(value)
+            return cast(T, value)
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def _l1_get(self, key: str) -> Any:
+        entry = self._l1.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._l1[key]
+            return _MISSING
+        self._l1.move_to_end(key)
+        return value
+
+    def _l1_set(self, key: str, value: Any) -> None:
+        self._l1[key] = (time.monotonic() + self.l1_ttl_seconds, value)
+        self._l1.move_to_end(key)
+        while len(self._l1) > self.l1_max_entries:
+            self._l1.popitem(last=False)
+
+    async def _l2_get(self, key: str, type_: Any) -> Any:
+        try:
+            raw = await self.redis.hget(self.redis_key, key)
+        except Exception as e:
+            logger.warning(
+                "Read-through cache read failed",
+                extra={"namespace": self.namespace, "key": key, "error": str(e)},
+            )
+            return _MISSING
+        if raw is None:
+            return _MISSING
+
+        expires_at, _, payload = raw.partition(":")
+        if float(expires_at) <= time.time():
+            return _MISSING
+        try:
+            return _type_adapter(type_).validate_json(payload)
+        except ValidationError:
+            return _MISSING  # Written by a deploy with another schema
+
+    async def _l2_set(self, key: str, value: Any, type_: Any) -> None:
+        payload = _type_adapter(type_).dump_json(value).decode()
+        try:
+            await self.redis.hset(
+                self.redis_key, key, f"{time.time() + self.ttl_seconds:.0f}:{payload}"
+            )
+            # Entries carry their own expiry; this only reclaims idle namespaces
+            await self.redis.expire(self.redis_key, self.ttl_seconds)
+        except Exception as e:
+            logger.warning(
+                "Read-through cache write failed",
+                extra={"namespace": self.namespace, "key": key, "error": str(e)},
+            )
+
+    def _drop_local(self) -> None:
+        self._generation += 1
+        self._l1.clear()
+        self._inflight.clear()  # Later misses must not join loads of stale data
+
+    async def _drop_remote(self) -> None:
+        try:
+            await self.redis.delete(self.redis_key)
+            await self.redis.incr(resource_version_key(self.namespace))
+        except Exception as e:
+            # Entries expire through their TTL if the delete is lost
+            logger.warning(
+                "Read-through cache invalidation failed",
+                extra={"namespace": self.namespace, "error": str(e)},
+            )
+
+
+@cache
+def get_read_through_cache(namespace: str) -> ReadThroughCache:
+    """Get the process-wide cache of a namespace (see NAMESPACE_TTL_SETTINGS)."""
+    return ReadThroughCache(
+        namespace,
+        ttl_seconds=getattr(settings, NAMESPACE_TTL_SETTINGS[namespace]),
+        l1_ttl_seconds=settings.CATALOG_CACHE_L1_TTL_SECONDS,
+        l1_max_entries=settings.CATALOG_CACHE_L1_MAX_ENTRIES,
+    )
+
+
+async def read_through[T](
+    cache: ReadThroughCache | None, key: str, loader: Callable[[], Awaitable[T]], type_: Any
+) -> T:
+    """``cache.get_or_load(...)``, or just ``loader()`` for a service without cache."""
+    if cache is None:
+        return await loader()
+    return await cache.get_or_load(key, loader, type_)
+
+
+async def invalidate_cache(cache: ReadThroughCache | None, session: AsyncSession) -> None:
+    """``cache.invalidate(session)`` after a write; no-op for a service without cache."""
+    if cache is not None:
+        await cache.invalidate(session)
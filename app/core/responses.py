@@ -0,0 +1,102 @@
+"""Fast JSON responses for large read payloads.
+
+A FastAPI endpoint returning a pydantic model pays for three passes over the
+payload: validation of the return value against response_model, conversion
+to plain dicts (``jsonable_encoder``) and ``json.dumps``. For the map
+bulk-load and gallery responses (thousands of nested models) these passes
+dominate the request's CPU time.
+
+Endpoints opting in return ``json_response(model, response)`` instead: the
+model is serialized straight to bytes by pydantic-core's Rust serializer,
+with no validation and no intermediate dicts. response_model stays on the
+route for the OpenAPI schema. Their services build the models with
+``model_construct`` from trusted (already validated or database) values.
+
+Very long arrays are streamed: with ``stream_field``, a response whose array
+has at least JSON_STREAM_MIN_ITEMS items is sent in chunks of
+JSON_STREAM_CHUNK_ITEMS items, so the full body is never held in memory as
+one bytes object. The streamed array is the last key of the JSON object.
+
+Architecture:
+    Layer: Infrastructure (HTTP)
+    Dependencies: pydantic-core, Starlette responses
+    Used by: map and photo controllers
+
+Example:
+    ```python
+    @router.get("/gallery", response_model=PhotoGalleryResponse)
+    async def list_photos_gallery(response: Response, ...) -> Response:
+        gallery = await service.get_gallery(...)
+        return json_response(gallery, response)
+    ```
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+from fastapi import Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from app.core.config import settings
+
+
+class PydanticJSONResponse(JSONResponse):
+    """JSONResponse rendered by pydantic-core (models, UUIDs, datetimes → bytes)."""
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content, by_alias=True)
+
+
+def iter_json_object(model: BaseModel, field: str, chunk_size: int) -> Iterator[bytes]:
+    """Yield the JSON of model in pieces, field (a list) last and chunk_size items at a time."""
+    items: list[Any] = getattr(model, field)
+    head = to_json(model, by_alias=True, exclude={field})
+    prefix = b"{" if head == b"{}" else head[:-1] + b","
+    yield prefix + to_json(field) + b":["
+
+    for start in range(0, len(items), chunk_size):
+        chunk = to_json(items[start : start + chunk_size], by_alias=True)[1:-1]
+        yield chunk if start == 0 else b"," + chunk
+    yield b"]}"
+
+
+def json_response(
+    content: Any,
+    response: Response | None = None,
+    *,
+    stream_field: str | None = None,
+    status_code: int = 200,
+) -> Response:
+    """Serialize content with pydantic-core, bypassing FastAPI's encoding.
+
+    Args:
+        content: Pydantic model (or list/dict of models) to send
+        response: The endpoint's ``Response`` parameter; headers set on it
+            by dependencies (e.g. ETag) are copied over, since FastAPI
+            ignores them when the endpoint returns a Response itself
+        stream_field: List field of content to stream when it has at least
+            JSON_STREAM_MIN_ITEMS items
+        status_code: HTTP status code
+
+    Returns:
+        PydanticJSONResponse, or a StreamingResponse for long arrays
+    """
+    headers = dict(response.headers) if response is not None else None
+
+    if (
+        stream_field is not None
+        and isinstance(content, BaseModel)
+        and len(getattr(content, stream_field)) >= settings.JSON_STREAM_MIN_ITEMS
+    ):
+        return StreamingResponse(
+            iter_json_object(content, stream_field, settings.JSON_STREAM_CHUNK_ITEMS),
+            status_code=status_code,
+            headers=headers,
+            media_type="application/json",
+        )
+
+    return PydanticJSONResponse(content, status_code=status_code, headers=headers)
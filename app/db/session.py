@@ -9,16 +9,19 @@ Key features:
 - FastAPI dependency for automatic session lifecycle management
 - Health check function for monitoring database connectivity
 - Proper transaction management (auto-commit/rollback)
+- Post-transaction callbacks (cache invalidation once a write is committed)
 """
 
-from collections.abc import AsyncGenerator
+import asyncio
+from collections.abc import AsyncGenerator, Awaitable, Callable
 
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import Session, SessionTransaction
 
 from app.core.config import settings
 from app.core.logging import get_logger
@@ -76,6 +79,51 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+_AFTER_TRANSACTION_CALLBACKS = "after_transaction_callbacks"
+_pending_callbacks: set[asyncio.Task[None]] = set()
+
+
+def run_after_transaction(
+    session: AsyncSession, key: str, callback: Callable[[], Awaitable[None]]
+) -> None:
+    """Run callback once the session's current transaction ends (commit or rollback).
+
+    Services write before get_db_session commits. Caches invalidated at write
+    time can be refilled with pre-commit data by a concurrent request in
+    between; invalidating again here closes that window. Callbacks are keyed:
+    repeated writes in one transaction schedule each key once.
+
+    Args:
+        session: Session of the write
+        key: Callback identity (e.g. a cache key)
+        callback: Coroutine function, run as a task on the event loop
+    """
+    sync_session = session.sync_session
+    callbacks = sync_session.info.get(_AFTER_TRANSACTION_CALLBACKS)
+    if callbacks is None:
+        callbacks = sync_session.info[_AFTER_TRANSACTION_CALLBACKS] = {}
+        event.listen(sync_session, "after_transaction_end", _run_after_transaction_callbacks)
+    callbacks[key] = callback
+
+
+def _run_after_transaction_callbacks(session: Session, transaction: SessionTransaction) -> None:
+    # Flushes end subtransactions; only the outermost one is the commit/rollback
+    callbacks = session.info.get(_AFTER_TRANSACTION_CALLBACKS)
+    if transaction.parent is not None or not callbacks:
+        return
+
+    pending = list(callbacks.values())
+    callbacks.clear()
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    for callback in pending:
+        task = loop.create_task(callback())
+        _pending_callbacks.add(task)
+        task.add_done_callback(_pending_callbacks.discard)
+
+
 async def test_connection() -> bool:
     """Test database connectivity for health checks.
 
@@ -31,6 +31,7 @@ from typing import cast
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.read_through_cache import get_read_through_cache
 from app.repositories.density_parameter_repository import DensityParameterRepository
 from app.repositories.detection_repository import DetectionRepository
 from app.repositories.estimation_repository import EstimationRepository
@@ -60,6 +61,7 @@ from app.repositories.warehouse_repository import WarehouseRepository
 from app.services.analytics_service import AnalyticsService
 from app.services.batch_lifecycle_service import BatchLifecycleService
 from app.services.density_parameter_service import DensityParameterService
+from app.services.location_hierarchy_cache import LocationHierarchyCache
 from app.services.location_hierarchy_service import LocationHierarchyService
 from app.services.map_view_service import MapViewService
 from app.services.movement_validation_service import MovementValidationService
@@ -74,6 +76,7 @@ from app.services.photo.photo_processing_session_service import PhotoProcessingS
 from app.services.photo.photo_query_service import PhotoQueryService
 from app.services.photo.photo_upload_service import PhotoUploadService
 from app.services.photo.s3_image_service import S3ImageService
+from app.services.photo.session_export_service import SessionExportService
 from app.services.price_list_service import PriceListService
 from app.services.product_category_service import ProductCategoryService
 from app.services.product_family_service import ProductFamilyService
@@ -135,28 +138,36 @@ class ServiceFactory:
         """Get StorageBinTypeService instance."""
         if "storage_bin_type" not in self._services:
             repo = StorageBinTypeRepository(self.session)
-            self._services["storage_bin_type"] = StorageBinTypeService(repo)
+            self._services["storage_bin_type"] = StorageBinTypeService(
+                repo, cache=get_read_through_cache("storage_bin_types")
+            )
         return cast(StorageBinTypeService, self._services["storage_bin_type"])
 
     def get_product_category_service(self) -> ProductCategoryService:
         """Get ProductCategoryService instance."""
         if "product_category" not in self._services:
             repo = ProductCategoryRepository(self.session)
-            self._services["product_category"] = ProductCategoryService(repo)
+            self._services["product_category"] = ProductCategoryService(
+                repo, cache=get_read_through_cache("product_categories")
+            )
         return cast(ProductCategoryService, self._services["product_category"])
 
     def get_product_size_service(self) -> ProductSizeService:
         """Get ProductSizeService instance."""
         if "product_size" not in self._services:
             repo = ProductSizeRepository(self.session)
-            self._services["product_size"] = ProductSizeService(repo)
+            self._services["product_size"] = ProductSizeService(
+                repo, cache=get_read_through_cache("product_sizes")
+            )
         return cast(ProductSizeService, self._services["product_size"])
 
     def get_product_state_service(self) -> ProductStateService:
         """Get ProductStateService instance."""
         if "product_state" not in self._services:
             repo = ProductStateRepository(self.session)
-            self._services["product_state"] = ProductStateService(repo)
+            self._services["product_state"] = ProductStateService(
+                repo, cache=get_read_through_cache("product_states")
+            )
         return cast(ProductStateService, self._services["product_state"])
 
     def get_stock_movement_service(self) -> StockMovementService:
@@ -170,42 +181,54 @@ class ServiceFactory:
         """Get StorageLocationConfigService instance."""
         if "storage_location_config" not in self._services:
             repo = StorageLocationConfigRepository(self.session)
-            self._services["storage_location_config"] = StorageLocationConfigService(repo)
+            self._services["storage_location_config"] = StorageLocationConfigService(
+                repo, cache=get_read_through_cache("storage_location_configs")
+            )
         return cast(StorageLocationConfigService, self._services["storage_location_config"])
 
     def get_density_parameter_service(self) -> DensityParameterService:
         """Get DensityParameterService instance."""
         if "density_parameter" not in self._services:
             repo = DensityParameterRepository(self.session)
-            self._services["density_parameter"] = DensityParameterService(repo)
+            self._services["density_parameter"] = DensityParameterService(
+                repo, cache=get_read_through_cache("density_parameters")
+            )
         return cast(DensityParameterService, self._services["density_parameter"])
 
     def get_packaging_type_service(self) -> PackagingTypeService:
         """Get PackagingTypeService instance."""
         if "packaging_type" not in self._services:
             repo = PackagingTypeRepository(self.session)
-            self._services["packaging_type"] = PackagingTypeService(repo)
+            self._services["packaging_type"] = PackagingTypeService(
+                repo, cache=get_read_through_cache("packaging_types")
+            )
         return cast(PackagingTypeService, self._services["packaging_type"])
 
     def get_packaging_color_service(self) -> PackagingColorService:
         """Get PackagingColorService instance."""
         if "packaging_color" not in self._services:
             repo = PackagingColorRepository(self.session)
-            self._services["packaging_color"] = PackagingColorService(repo)
+            self._services["packaging_color"] = PackagingColorService(
+                repo, cache=get_read_through_cache("packaging_colors")
+            )
         return cast(PackagingColorService, self._services["packaging_color"])
 
     def get_packaging_material_service(self) -> PackagingMaterialService:
         """Get PackagingMaterialService instance."""
         if "packaging_material" not in self._services:
             repo = PackagingMaterialRepository(self.session)
-            self._services["packaging_material"] = PackagingMaterialService(repo)
+            self._services["packaging_material"] = PackagingMaterialService(
+                repo, cache=get_read_through_cache("packaging_materials")
+            )
         return cast(PackagingMaterialService, self._services["packaging_material"])
 
     def get_price_list_service(self) -> PriceListService:
         """Get PriceListService instance."""
         if "price_list" not in self._services:
             repo = PriceListRepository(self.session)
-            self._services["price_list"] = PriceListService(repo)
+            self._services["price_list"] = PriceListService(
+                repo, cache=get_read_through_cache("price_lists")
+            )
         return cast(PriceListService, self._services["price_list"])
 
     def get_photo_processing_session_service(self) -> PhotoProcessingSessionService:
@@ -289,7 +312,9 @@ class ServiceFactory:
         if "product_family" not in self._services:
             repo = ProductFamilyRepository(self.session)
             category_service = self.get_product_category_service()
-            self._services["product_family"] = ProductFamilyService(repo, category_service)
+            self._services["product_family"] = ProductFamilyService(
+                repo, category_service, cache=get_read_through_cache("product_families")
+            )
         return cast(ProductFamilyService, self._services["product_family"])
 
     def get_product_service(self) -> ProductService:
@@ -301,7 +326,9 @@ class ServiceFactory:
         if "product" not in self._services:
             repo = ProductRepository(self.session)
             family_service = self.get_product_family_service()
-            self._services["product"] = ProductService(repo, family_service)
+            self._services["product"] = ProductService(
+                repo, family_service, cache=get_read_through_cache("products")
+            )
         return cast(ProductService, self._services["product"])
 
     def get_packaging_catalog_service(self) -> PackagingCatalogService:
@@ -311,7 +338,9 @@ class ServiceFactory:
         """
         if "packaging_catalog" not in self._services:
             repo = PackagingCatalogRepository(self.session)
-            self._services["packaging_catalog"] = PackagingCatalogService(repo)
+            self._services["packaging_catalog"] = PackagingCatalogService(
+                repo, cache=get_read_through_cache("packaging_catalog")
+            )
         return cast(PackagingCatalogService, self._services["packaging_catalog"])
 
     def get_stock_batch_service(self) -> StockBatchService:
@@ -358,6 +387,7 @@ class ServiceFactory:
             - StorageAreaService
             - StorageLocationService
             - StorageBinService
+            - LocationHierarchyCache (per-warehouse trees in Redis)
         """
         if "location_hierarchy" not in self._services:
             self._services["location_hierarchy"] = LocationHierarchyService(
@@ -365,6 +395,7 @@ class ServiceFactory:
                 area_service=self.get_storage_area_service(),
                 location_service=self.get_storage_location_service(),
                 bin_service=self.get_storage_bin_service(),
+                cache=LocationHierarchyCache(),
             )
         return cast(LocationHierarchyService, self._services["location_hierarchy"])
 
@@ -432,3 +463,14 @@ class ServiceFactory:
                 s3_service=self.get_s3_image_service(),
             )
         return cast(MapViewService, self._services["map_view"])
+
+    def get_session_export_service(self) -> SessionExportService:
+        """Get SessionExportService instance."""
+        if "session_export" not in self._services:
+            self._services["session_export"] = SessionExportService(
+                session_service=self.get_photo_processing_session_service(),
+                detection_service=self.get_detection_service(),
+                estimation_service=self.get_estimation_service(),
+                s3_service=self.get_s3_image_service(),
+            )
+        return cast(SessionExportService, self._services["session_export"])
@@ -1,12 +1,14 @@
 """FastAPI application entry point for DemeterAI v2.0."""
 
+import time
 from datetime import UTC, datetime
 from typing import Any
 from uuid import uuid4
 
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.controllers import (
     admin_router,
@@ -19,11 +21,21 @@ from app.controllers import (
     product_router,
     stock_router,
 )
+from app.core.cache import get_redis_client
 from app.core.config import settings
 from app.core.exceptions import AppBaseException
-from app.core.logging import get_correlation_id, get_logger, set_correlation_id, setup_logging
+from app.core.logging import (
+    get_correlation_id,
+    get_logger,
+    sample_request_logs,
+    set_correlation_id,
+    setup_logging,
+    start_queued_logging,
+    stop_queued_logging,
+)
 from app.core.metrics import get_metrics_text, setup_metrics
 from app.core.telemetry import setup_telemetry
+from app.tasks.ml_priority import refresh_ml_queue_metrics
 
 # =============================================================================
 # Step 1: Setup Telemetry FIRST (before any other initialization)
@@ -87,6 +99,9 @@ async def startup_event() -> None:
     """
     from app.db.init_db import init_database
 
+    if settings.LOG_QUEUE_ENABLED:
+        start_queued_logging()
+
     logger.info("=" * 80)
     logger.info("🚀 Starting DemeterAI v2.0 application...")
     logger.info("=" * 80)
@@ -112,48 +127,70 @@ async def startup_event() -> None:
     logger.info("=" * 80)
 
 
-class CorrelationIdMiddleware(BaseHTTPMiddleware):
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    """Release process-wide resources on application shutdown."""
+    from app.core.auth import close_jwks_key_store
+    from app.core.executors import shutdown_cpu_executor
+
+    shutdown_cpu_executor()
+    await close_jwks_key_store()
+    stop_queued_logging()
+
+
+class CorrelationIdMiddleware:
     """Middleware to inject correlation IDs into requests.
 
-    Generates a unique UUID for each request (or uses existing X-Correlation-ID header),
-    sets it in the logging context, and returns it in the response headers.
+    Uses the X-Correlation-ID header (or a new UUID), sets it in the logging
+    context, returns it in the response headers and logs one line per
+    request. Also decides whether the request's debug/info logs are sampled
+    (LOG_SAMPLE_RATE, LOG_ROUTE_SAMPLE_RATES).
+
+    Pure ASGI: no extra task or body wrapping per request (unlike
+    BaseHTTPMiddleware); only the response start message is touched.
 
     This enables request tracing across the entire system:
     API request → Celery task → Database operation → Logs
     """
 
-    async def dispatch(self, request: Request, call_next: Any) -> Any:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request with correlation ID injection."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Get correlation ID from header or generate new one
-        correlation_id = request.headers.get("X-Correlation-ID", str(uuid4()))
+        correlation_id = Headers(scope=scope).get("x-correlation-id") or str(uuid4())
 
         # Set in logging context
         set_correlation_id(correlation_id)
-
-        # Log request
-        logger.info(
-            "Request received",
-            method=request.method,
-            path=request.url.path,
-            correlation_id=correlation_id,
+        sample_request_logs(
+            scope["path"], settings.LOG_SAMPLE_RATE, settings.LOG_ROUTE_SAMPLE_RATES
         )
 
-        # Process request
-        response = await call_next(request)
+        start = time.perf_counter()
+        status_code = 500  # Unless the app starts a response
 
-        # Add correlation ID to response headers
-        response.headers["X-Correlation-ID"] = correlation_id
+        async def send_with_correlation_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append("X-Correlation-ID", correlation_id)
+            await send(message)
 
-        # Log response
-        logger.info(
-            "Request completed",
-            method=request.method,
-            path=request.url.path,
-            status_code=response.status_code,
-            correlation_id=correlation_id,
-        )
-
-        return response
+        try:
+            await self.app(scope, receive, send_with_correlation_id)
+        finally:
+            logger.info(
+                "Request completed",
+                method=scope["method"],
+                path=scope["path"],
+                status_code=status_code,
+                duration_ms=round((time.perf_counter() - start) * 1000, 1),
+            )
 
 
 # Register middleware
@@ -295,6 +332,7 @@ async def metrics() -> Response:
     - ML inference timing
     - Database connection pool stats
     - Celery task execution stats
+    - GPU queue depth and oldest wait per priority class (sampled per scrape)
 
     Returns:
         Response: Prometheus-formatted metrics (text/plain)
@@ -316,6 +354,8 @@ async def metrics() -> Response:
     """
     logger.debug("Metrics endpoint called")
 
+    await refresh_ml_queue_metrics(get_redis_client())
+
     # Get metrics in Prometheus text format
     metrics_data = get_metrics_text()
 
@@ -53,17 +53,19 @@ Example:
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
+from geoalchemy2 import Geometry
 from sqlalchemy import (
     Boolean,
     CheckConstraint,
     Column,
+    Computed,
     DateTime,
     ForeignKey,
     Integer,
     Numeric,
 )
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import Mapped, relationship, validates
+from sqlalchemy.orm import Mapped, deferred, relationship, validates
 from sqlalchemy.sql import func
 
 from app.db.base import Base
@@ -105,6 +107,7 @@ class Detection(Base):
         width_px: Bounding box width in pixels (INTEGER)
         height_px: Bounding box height in pixels (INTEGER)
         area_px: Bounding box area (GENERATED = width_px * height_px)
+        center_geom: Bounding box center point, SRID 0 (GENERATED, deferred)
         bbox_coordinates: JSONB full bbox data {x1, y1, x2, y2}
         detection_confidence: ML confidence score (0.0-1.0, NOT NULL)
         is_empty_container: Empty container flag (default False)
@@ -122,6 +125,7 @@ class Detection(Base):
         - B-tree index on classification_id (foreign key)
         - B-tree index on detection_confidence DESC (high confidence queries)
         - B-tree index on created_at DESC (time-series queries)
+        - GiST index on (session_id, center_geom) (viewport queries, btree_gist)
 
     Constraints:
         - CHECK detection_confidence between 0.0 and 1.0
@@ -227,6 +231,19 @@ class Detection(Base):
         comment="Bounding box area in pixels (GENERATED = width_px * height_px)",
     )
 
+    # GENERATED center point (spatial index for viewport queries)
+    # Deferred: entity loads do not fetch it, queries filter on it
+    center_geom = deferred(
+        Column(
+            Geometry("POINT", srid=0, spatial_index=False),
+            Computed(
+                "ST_SetSRID(ST_MakePoint(center_x_px::float8, center_y_px::float8), 0)",
+                persisted=True,
+            ),
+            comment="Bounding box center as a point in image pixels (GENERATED)",
+        )
+    )
+
     # JSONB full bbox coordinates
     bbox_coordinates = Column(
         JSONB,
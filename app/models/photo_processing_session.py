@@ -155,6 +155,8 @@ class PhotoProcessingSession(Base):
         - B-tree index on status (filter by status)
         - B-tree index on storage_location_id (foreign key)
         - B-tree index on created_at DESC (time-series queries)
+        - B-tree index on (storage_location_id, created_at) (recent sessions of
+          a location: near-duplicate upload detection, migration f6a7b8c9d0e1)
         - GIN index on category_counts (JSONB queries)
 
     Constraints:
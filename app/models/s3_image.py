@@ -237,6 +237,8 @@ class S3Image(Base):
         image_type: Image type enum (original, processed, thumbnail)
         content_type: Image MIME type (image/jpeg, image/png, image/webp, image/avif)
         file_size_bytes: File size in bytes (BigInteger for large files > 4GB)
+        content_sha256: SHA-256 hex digest of the uploaded bytes (nullable, indexed)
+        perceptual_hash: 64-bit difference hash of the image content (nullable)
         width_px: Image width in pixels
         height_px: Image height in pixels
         exif_metadata: JSONB with camera settings (camera, ISO, shutter, f-stop)
@@ -362,6 +364,19 @@ class S3Image(Base):
         comment="File size in bytes (BigInteger for large files > 4GB)",
     )
 
+    content_sha256 = Column(
+        String(64),
+        nullable=True,
+        index=True,
+        comment="SHA-256 hex digest of the uploaded bytes (computed while streaming)",
+    )
+
+    perceptual_hash = Column(
+        BigInteger,
+        nullable=True,
+        comment="64-bit dHash of the image content (near-duplicate detection)",
+    )
+
     width_px = Column(
         Integer,
         nullable=False,
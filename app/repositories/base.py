@@ -37,7 +37,7 @@ See:
 
 from typing import Any, TypeVar
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.base import Base
@@ -180,6 +180,34 @@ class AsyncRepository[T: Base]:
         await self.session.refresh(db_obj)  # Load relationships and defaults
         return db_obj
 
+    async def bulk_create(self, objs_in: list[dict[str, Any]]) -> list[T]:
+        """Create many records with one multi-row INSERT ... RETURNING.
+
+        Unlike calling create() in a loop (one INSERT + one SELECT per row),
+        all rows are sent in a single statement and the created instances
+        (with server defaults and IDs) come back in input order.
+
+        Args:
+            objs_in: List of column dicts (same shape as create())
+
+        Returns:
+            Created model instances, in the same order as objs_in
+
+        Example:
+            ```python
+            sessions = await repo.bulk_create([{"storage_location_id": 1}] * 200)
+            ```
+
+        Note:
+            Does NOT commit. Relationships are not loaded.
+        """
+        if not objs_in:
+            return []
+
+        stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        result = await self.session.scalars(stmt, objs_in)
+        return list(result.all())
+
     async def update(self, id: Any, obj_in: dict[str, Any]) -> T | None:
         """Update existing record by ID.
 
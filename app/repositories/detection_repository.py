@@ -1,16 +1,22 @@
 """Detection repository for YOLO detection data access.
 
-Provides CRUD operations for detection entities from ML pipeline.
+Provides CRUD operations for detection entities from ML pipeline, and the
+viewport queries of the detection viewer (GiST index on session_id +
+center_geom, see migration e5f6a7b8c9d0).
 """
 
+from collections.abc import AsyncIterator, Sequence
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Row, Select, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.detection import Detection
 from app.repositories.base import AsyncRepository
 
+# (min_x, min_y, max_x, max_y) in image pixels
+type BBox = tuple[float, float, float, float]
+
 
 class DetectionRepository(AsyncRepository[Detection]):
     """Repository for detection database operations."""
@@ -38,6 +44,124 @@ class DetectionRepository(AsyncRepository[Detection]):
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_points_in_bbox(
+        self, session_id: int, bbox: BBox | None, limit: int
+    ) -> list[Row[Any]]:
+        """Detections of a session whose center lies in bbox (columns only).
+
+        Args:
+            session_id: Photo processing session ID
+            bbox: (min_x, min_y, max_x, max_y) in image pixels (None = whole image)
+            limit: Max rows
+
+        Returns:
+            Rows (id, center_x_px, center_y_px, width_px, height_px,
+            detection_confidence, classification_id, is_empty_container,
+            is_alive) ordered by id
+        """
+        stmt = select(
+            self.model.id,
+            self.model.center_x_px,
+            self.model.center_y_px,
+            self.model.width_px,
+            self.model.height_px,
+            self.model.detection_confidence,
+            self.model.classification_id,
+            self.model.is_empty_container,
+            self.model.is_alive,
+        )
+        stmt = self._in_bbox(stmt, session_id, bbox).order_by(self.model.id).limit(limit)
+        result = await self.session.execute(stmt)
+        return list(result.all())
+
+    async def get_center_extent(self, session_id: int) -> BBox | None:
+        """Bounding box (min_x, min_y, max_x, max_y) of a session's detection centers.
+
+        Returns:
+            Extent in image pixels, or None if the session has no detections
+        """
+        stmt = select(
+            func.min(self.model.center_x_px),
+            func.min(self.model.center_y_px),
+            func.max(self.model.center_x_px),
+            func.max(self.model.center_y_px),
+        ).where(self.model.session_id == session_id)
+        min_x, min_y, max_x, max_y = (await self.session.execute(stmt)).one()
+        if min_x is None:
+            return None
+        return (float(min_x), float(min_y), float(max_x), float(max_y))
+
+    async def cluster_in_bbox(
+        self, session_id: int, bbox: BBox | None, cell_px: float
+    ) -> list[Row[Any]]:
+        """Detections of a session in bbox, grouped on a square grid.
+
+        Args:
+            session_id: Photo processing session ID
+            bbox: (min_x, min_y, max_x, max_y) in image pixels (None = whole image)
+            cell_px: Grid cell size in image pixels
+
+        Returns:
+            One row (x, y, count, empty_container_count) per non-empty cell;
+            x/y are the centroid of the cell's detections
+        """
+        cell_x = func.floor(self.model.center_x_px / cell_px)
+        cell_y = func.floor(self.model.center_y_px / cell_px)
+        stmt = select(
+            func.avg(self.model.center_x_px).label("x"),
+            func.avg(self.model.center_y_px).label("y"),
+            func.count().label("count"),
+            func.count()
+            .filter(self.model.is_empty_container.is_(True))
+            .label("empty_container_count"),
+        )
+        stmt = (
+            self._in_bbox(stmt, session_id, bbox).group_by(cell_y, cell_x).order_by(cell_y, cell_x)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.all())
+
+    async def stream_by_session(
+        self, session_id: int, batch_size: int
+    ) -> AsyncIterator[Sequence[Row[Any]]]:
+        """All detections of a session, fetched in batches from a server-side cursor.
+
+        Args:
+            session_id: Photo processing session ID
+            batch_size: Rows per batch (and per cursor fetch)
+
+        Yields:
+            Batches of rows (id, classification_id, center_x_px, center_y_px,
+            width_px, height_px, detection_confidence, is_empty_container,
+            is_alive) ordered by id
+        """
+        stmt = (
+            select(
+                self.model.id,
+                self.model.classification_id,
+                self.model.center_x_px,
+                self.model.center_y_px,
+                self.model.width_px,
+                self.model.height_px,
+                self.model.detection_confidence,
+                self.model.is_empty_container,
+                self.model.is_alive,
+            )
+            .where(self.model.session_id == session_id)
+            .order_by(self.model.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(stmt)
+        async for batch in result.partitions():
+            yield batch
+
+    def _in_bbox(self, stmt: Select[Any], session_id: int, bbox: BBox | None) -> Select[Any]:
+        stmt = stmt.where(self.model.session_id == session_id)
+        if bbox is None:
+            return stmt
+        # && on the (session_id, center_geom) GiST index
+        return stmt.where(self.model.center_geom.intersects(func.ST_MakeEnvelope(*bbox, 0)))
+
     async def bulk_create(self, detections: list[dict[str, Any]]) -> list[Detection]:
         """Bulk create detections (optimized for performance).
 
@@ -3,9 +3,10 @@
 Provides CRUD operations for estimation entities from ML pipeline.
 """
 
+from collections.abc import AsyncIterator, Sequence
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.estimation import CalculationMethodEnum, Estimation
@@ -38,6 +39,38 @@ class EstimationRepository(AsyncRepository[Estimation]):
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def stream_by_session(
+        self, session_id: int, batch_size: int
+    ) -> AsyncIterator[Sequence[Row[Any]]]:
+        """All estimations of a session, fetched in batches from a server-side cursor.
+
+        Args:
+            session_id: Photo processing session ID
+            batch_size: Rows per batch (and per cursor fetch)
+
+        Yields:
+            Batches of rows (id, classification_id, vegetation_polygon,
+            detected_area_cm2, estimated_count, calculation_method,
+            estimation_confidence) ordered by id
+        """
+        stmt = (
+            select(
+                self.model.id,
+                self.model.classification_id,
+                self.model.vegetation_polygon,
+                self.model.detected_area_cm2,
+                self.model.estimated_count,
+                self.model.calculation_method,
+                self.model.estimation_confidence,
+            )
+            .where(self.model.session_id == session_id)
+            .order_by(self.model.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(stmt)
+        async for batch in result.partitions():
+            yield batch
+
     async def get_by_calculation_method(
         self, calculation_method: CalculationMethodEnum, limit: int = 100
     ) -> list[Estimation]:
@@ -3,6 +3,7 @@
 Provides CRUD operations for photo processing session entities.
 """
 
+from collections.abc import Sequence
 from datetime import datetime
 from uuid import UUID
 
@@ -13,6 +14,7 @@ from app.models.photo_processing_session import (
     PhotoProcessingSession,
     ProcessingSessionStatusEnum,
 )
+from app.models.s3_image import S3Image
 from app.repositories.base import AsyncRepository
 
 
@@ -109,3 +111,72 @@ class PhotoProcessingSessionRepository(AsyncRepository[PhotoProcessingSession]):
         )
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
+
+    async def get_latest_by_original_sha256(
+        self,
+        content_sha256: str,
+        storage_location_id: int,
+        uploaded_by_user_id: int,
+        statuses: Sequence[ProcessingSessionStatusEnum],
+    ) -> PhotoProcessingSession | None:
+        """Get a user's most recent session at a location whose original has this digest.
+
+        Args:
+            content_sha256: SHA-256 hex digest of the original's bytes
+            storage_location_id: Storage location ID
+            uploaded_by_user_id: User who uploaded the original
+            statuses: Session statuses to consider
+
+        Returns:
+            PhotoProcessingSession if found, None otherwise
+        """
+        stmt = (
+            select(self.model)
+            .join(S3Image, S3Image.image_id == self.model.original_image_id)
+            .where(
+                S3Image.content_sha256 == content_sha256,
+                S3Image.uploaded_by_user_id == uploaded_by_user_id,
+                self.model.storage_location_id == storage_location_id,
+                self.model.status.in_(statuses),
+            )
+            .order_by(self.model.created_at.desc())
+            .limit(1)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_recent_with_perceptual_hash(
+        self,
+        storage_location_id: int,
+        uploaded_by_user_id: int,
+        since: datetime,
+        statuses: Sequence[ProcessingSessionStatusEnum],
+        limit: int = 50,
+    ) -> list[tuple[PhotoProcessingSession, int]]:
+        """Get a user's recent sessions of a location with the perceptual hash of their original.
+
+        Args:
+            storage_location_id: Storage location ID
+            uploaded_by_user_id: User who uploaded the original
+            since: Oldest session creation time (inclusive)
+            statuses: Session statuses to consider
+            limit: Max results (default 50)
+
+        Returns:
+            (session, perceptual_hash) pairs ordered by created_at DESC
+        """
+        stmt = (
+            select(self.model, S3Image.perceptual_hash)
+            .join(S3Image, S3Image.image_id == self.model.original_image_id)
+            .where(
+                self.model.storage_location_id == storage_location_id,
+                S3Image.uploaded_by_user_id == uploaded_by_user_id,
+                self.model.created_at >= since,
+                self.model.status.in_(statuses),
+                S3Image.perceptual_hash.is_not(None),
+            )
+            .order_by(self.model.created_at.desc())
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return [(session, perceptual_hash) for session, perceptual_hash in result.all()]
@@ -1,10 +1,16 @@
 """Storage location repository for geospatial storage location data access.
 
-Provides CRUD operations for storage location entities with PostGIS support.
+Provides CRUD operations for storage location entities with PostGIS support,
+plus the queries behind GPS → storage location resolution (LocationResolver).
 """
 
+from typing import Any
+
+from sqlalchemy import Float, Integer, column, func, select, true, values
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.storage_area import StorageArea
 from app.models.storage_location import StorageLocation
 from app.repositories.base import AsyncRepository
 
@@ -15,3 +21,101 @@ class StorageLocationRepository(AsyncRepository[StorageLocation]):
     def __init__(self, session: AsyncSession) -> None:
         """Initialize with database session."""
         super().__init__(StorageLocation, session)
+
+    async def get_spatial_index_rows(self) -> list[Row[Any]]:
+        """Geometry + hierarchy ids of every active location (in an active area).
+
+        Returns:
+            Rows of (location_id, storage_area_id, warehouse_id, geojson_coordinates)
+        """
+        stmt = (
+            select(
+                StorageLocation.location_id,
+                StorageLocation.storage_area_id,
+                StorageArea.warehouse_id,
+                StorageLocation.geojson_coordinates,
+            )
+            .join(StorageArea, StorageArea.storage_area_id == StorageLocation.storage_area_id)
+            .where(StorageLocation.active == True)  # noqa: E712
+            .where(StorageArea.active == True)  # noqa: E712
+        )
+        result = await self.session.execute(stmt)
+        return list(result.all())
+
+    async def get_spatial_index_fingerprint(self) -> tuple[Any, ...]:
+        """Cheap change marker for the location/area tables.
+
+        Any insert, update (including soft delete) or delete changes the row
+        count or the latest updated_at of one of the tables.
+        """
+        stmt = select(
+            select(func.count()).select_from(StorageLocation).scalar_subquery(),
+            select(func.max(StorageLocation.updated_at)).scalar_subquery(),
+            select(func.count()).select_from(StorageArea).scalar_subquery(),
+            select(func.max(StorageArea.updated_at)).scalar_subquery(),
+        )
+        result = await self.session.execute(stmt)
+        return tuple(result.one())
+
+    async def find_by_gps_batch(
+        self, points: list[tuple[float, float]], max_distance_deg: float
+    ) -> dict[int, tuple[Any, ...]]:
+        """PostGIS lookup of many points in ONE query (VALUES list + LATERAL).
+
+        Per point: the location containing it, else the nearest one within
+        max_distance_deg. The LATERAL subquery uses the GIST index on
+        geojson_coordinates (ST_DWithin) once per point.
+
+        Args:
+            points: (longitude, latitude) pairs (WGS84)
+            max_distance_deg: Search radius in degrees (SRID 4326 units)
+
+        Returns:
+            Point index → (location_id, storage_area_id, warehouse_id, distance);
+            points without a match are absent
+        """
+        if not points:
+            return {}
+
+        gps_points = values(
+            column("idx", Integer),
+            column("longitude", Float),
+            column("latitude", Float),
+            name="gps_points",
+        ).data([(idx, longitude, latitude) for idx, (longitude, latitude) in enumerate(points)])
+
+        # NOTE: Database stores geometries as (lat, lon) instead of (lon, lat)
+        # Inverting coordinates to match the stored data
+        point = func.ST_SetSRID(
+            func.ST_MakePoint(gps_points.c.latitude, gps_points.c.longitude), 4326
+        )
+        geometry = StorageLocation.geojson_coordinates
+        distance = func.ST_Distance(geometry, point)
+
+        nearest = (
+            select(
+                StorageLocation.location_id,
+                StorageLocation.storage_area_id,
+                StorageArea.warehouse_id,
+                distance.label("distance"),
+            )
+            .join(StorageArea, StorageArea.storage_area_id == StorageLocation.storage_area_id)
+            .where(func.ST_DWithin(geometry, point, max_distance_deg))
+            .where(StorageLocation.active == True)  # noqa: E712
+            .where(StorageArea.active == True)  # noqa: E712
+            # Containing polygons have distance 0; the smallest one wins
+            .order_by(distance, func.ST_Area(geometry))
+            .limit(1)
+            .lateral("nearest")
+        )
+
+        stmt = select(
+            gps_points.c.idx,
+            nearest.c.location_id,
+            nearest.c.storage_area_id,
+            nearest.c.warehouse_id,
+            nearest.c.distance,
+        ).select_from(gps_points.join(nearest, true()))
+
+        result = await self.session.execute(stmt)
+        return {row.idx: tuple(row[1:]) for row in result.all()}
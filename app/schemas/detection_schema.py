@@ -1,8 +1,10 @@
 """Detection Pydantic schemas for ML detection results."""
 
+import sys
+from array import array
 from datetime import datetime
 from decimal import Decimal
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -67,3 +69,91 @@ class DetectionStatistics(BaseModel):
     max_confidence: float = Field(..., description="Maximum confidence score")
 
     model_config = {"from_attributes": True}
+
+
+class DetectionPointColumns(BaseModel):
+    """Detections of a viewport, one array per attribute (same order, by ID)."""
+
+    id: list[int] = Field(default_factory=list)
+    x: list[float] = Field(default_factory=list, description="Center X (px)")
+    y: list[float] = Field(default_factory=list, description="Center Y (px)")
+    width: list[int] = Field(default_factory=list)
+    height: list[int] = Field(default_factory=list)
+    confidence: list[float] = Field(default_factory=list)
+    classification_id: list[int | None] = Field(default_factory=list)
+    is_empty_container: list[bool] = Field(default_factory=list)
+    is_alive: list[bool] = Field(default_factory=list)
+
+
+class DetectionClusterColumns(BaseModel):
+    """Grid clusters of a viewport, one array per attribute (same order)."""
+
+    x: list[float] = Field(default_factory=list, description="Centroid X (px)")
+    y: list[float] = Field(default_factory=list, description="Centroid Y (px)")
+    count: list[int] = Field(default_factory=list, description="Detections in the cluster")
+    empty_container_count: list[int] = Field(default_factory=list)
+
+
+class DetectionViewportResponse(BaseModel):
+    """Detections of a session inside a viewport: points, or clusters when zoomed out."""
+
+    mode: Literal["points", "clusters"]
+    zoom: int = Field(..., description="Viewer zoom (log2 of screen px per image px)")
+    total: int = Field(..., ge=0, description="Detections in the viewport")
+    cell_px: float | None = Field(None, description="Cluster cell size (image px)")
+    points: DetectionPointColumns | None = None
+    clusters: DetectionClusterColumns | None = None
+
+    @property
+    def item_count(self) -> int:
+        """Number of points or clusters."""
+        columns = self.points if self.points is not None else self.clusters
+        return len(columns.x) if columns is not None else 0
+
+    def to_binary(self) -> bytes:
+        """Binary (columnar, little-endian) encoding of the response.
+
+        The body is one array per attribute, back to back, each holding N values
+        (N = number of points or clusters). Wider types come first so every
+        array is aligned for JavaScript typed arrays:
+
+            points:   id int32, x float32, y float32, confidence float32,
+                      classification_id int32 (-1 = none), width uint16,
+                      height uint16, flags uint8 (1 = empty container, 2 = alive)
+            clusters: x float32, y float32, count uint32,
+                      empty_container_count uint32
+        """
+        columns: list[array[Any]]
+        if self.points is not None:
+            p = self.points
+            columns = [
+                array("i", p.id),
+                array("f", p.x),
+                array("f", p.y),
+                array("f", p.confidence),
+                array("i", [-1 if c is None else c for c in p.classification_id]),
+                array("H", p.width),
+                array("H", p.height),
+                array(
+                    "B",
+                    [
+                        int(empty) | int(alive) << 1
+                        for empty, alive in zip(p.is_empty_container, p.is_alive, strict=True)
+                    ],
+                ),
+            ]
+        elif self.clusters is not None:
+            c = self.clusters
+            columns = [
+                array("f", c.x),
+                array("f", c.y),
+                array("I", c.count),
+                array("I", c.empty_container_count),
+            ]
+        else:
+            columns = []
+
+        if sys.byteorder == "big":
+            for column in columns:
+                column.byteswap()
+        return b"".join(column.tobytes() for column in columns)
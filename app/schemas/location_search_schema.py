@@ -0,0 +1,70 @@
+"""Schemas for GPS location search endpoints (batch resolution for field devices)."""
+
+from pydantic import BaseModel, Field
+
+from app.schemas.storage_area_schema import StorageAreaResponse
+from app.schemas.storage_bin_schema import StorageBinResponse
+from app.schemas.storage_location_schema import StorageLocationResponse
+from app.schemas.warehouse_schema import WarehouseResponse
+
+# Bounded by the bind parameter limit of one PostGIS fallback query (3 per point)
+GPS_BATCH_MAX_POINTS = 5000
+
+
+class GpsPoint(BaseModel):
+    """A GPS point to resolve (WGS84)."""
+
+    longitude: float = Field(..., ge=-180, le=180, description="GPS longitude (WGS84)")
+    latitude: float = Field(..., ge=-90, le=90, description="GPS latitude (WGS84)")
+
+
+class GpsBatchSearchRequest(BaseModel):
+    """Request schema for batch GPS search (up to GPS_BATCH_MAX_POINTS points)."""
+
+    points: list[GpsPoint] = Field(
+        ...,
+        min_length=1,
+        max_length=GPS_BATCH_MAX_POINTS,
+        description="Points to resolve (e.g., a field device route)",
+    )
+
+
+class GpsBatchSearchResult(BaseModel):
+    """Resolution of one point: the full hierarchy, or found=False.
+
+    Attributes:
+        longitude: Input GPS longitude
+        latitude: Input GPS latitude
+        found: Whether the point resolved to an active storage location
+        distance_m: Distance to the location (0 inside it), None if not found
+        warehouse: Warehouse of the location
+        area: Storage area of the location
+        location: Storage location
+        bins: Storage bins of the location
+    """
+
+    longitude: float
+    latitude: float
+    found: bool
+    distance_m: float | None = Field(
+        default=None,
+        description="0 inside the location, else distance to the nearest one in tolerance",
+    )
+    warehouse: WarehouseResponse | None = None
+    area: StorageAreaResponse | None = None
+    location: StorageLocationResponse | None = None
+    bins: list[StorageBinResponse] = Field(default_factory=list)
+
+
+class GpsBatchSearchResponse(BaseModel):
+    """Response schema for batch GPS search.
+
+    Attributes:
+        results: One result per requested point, in request order
+        total_points: Number of requested points
+        resolved_points: Number of points with found=True
+    """
+
+    results: list[GpsBatchSearchResult] = Field(..., description="One result per point, in order")
+    total_points: int
+    resolved_points: int
@@ -15,6 +15,9 @@ from app.models.photo_processing_session import ProcessingSessionStatusEnum
 class PhotoProcessingSessionCreate(BaseModel):
     """Schema for creating a photo processing session."""
 
+    session_id: UUID | None = Field(
+        None, description="Session UUID (optional, auto-generated if omitted)"
+    )
     storage_location_id: int | None = Field(None, description="Storage location ID (optional)")
     original_image_id: UUID | None = Field(
         None, description="Original S3 image UUID (optional, can be set later)"
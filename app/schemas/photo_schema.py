@@ -18,6 +18,10 @@ class PhotoUploadResponse(BaseModel):
     upload_session_id: UUID = Field(..., description="Upload session UUID used for polling")
     task_id: UUID = Field(..., description="Celery task ID for tracking")
     session_id: int = Field(..., description="Photo processing session ID")
+    session_ids: list[int] = Field(
+        default_factory=list,
+        description="All processing session IDs (batch uploads: one per photo)",
+    )
     status: str = Field(..., description="Processing status")
     message: str = Field(..., description="Human-readable message")
     poll_url: str = Field(..., description="URL to poll for results")
@@ -29,6 +33,10 @@ class PhotoUploadResponse(BaseModel):
         default_factory=list,
         description="Individual job descriptors for polling",
     )
+    rejected: list["PhotoUploadRejection"] = Field(
+        default_factory=list,
+        description="Photos of a batch that were not accepted (not processed)",
+    )
     created_at: datetime = Field(
         default_factory=datetime.utcnow,
         description="Timestamp when upload was accepted",
@@ -41,12 +49,81 @@ class PhotoUploadJob(BaseModel):
     job_id: str = Field(..., description="Celery job identifier")
     image_id: UUID = Field(..., description="Image UUID associated with job")
     filename: str | None = Field(None, description="Original filename (if available)")
+    session_id: int | None = Field(None, description="Processing session ID of this photo")
     status: str = Field("pending", description="Job status")
     progress_percent: float = Field(0.0, ge=0.0, le=100.0, description="Progress percentage")
+    duplicate_of_session_id: int | None = Field(
+        None, description="Earlier session of the same (or a near-identical) photo"
+    )
+    duplicate_type: str | None = Field(
+        None, description="exact (same file) or near (near-identical shot), if a duplicate"
+    )
     created_at: datetime = Field(
         default_factory=datetime.utcnow, description="Job creation timestamp"
     )
 
 
+class PhotoUploadRejection(BaseModel):
+    """Photo of a batch upload that was rejected during validation."""
+
+    filename: str | None = Field(None, description="Original filename (if available)")
+    reason: str = Field(..., description="Why the photo was rejected")
+
+
+class DirectUploadInitRequest(BaseModel):
+    """Request body to start a direct-to-S3 (presigned multipart) upload."""
+
+    filename: str = Field(..., min_length=1, max_length=255, description="Original filename")
+    content_type: str = Field(..., description="MIME type (image/jpeg, image/png, image/webp)")
+    file_size_bytes: int = Field(..., gt=0, description="Exact file size in bytes")
+    user_id: int | None = Field(None, description="Uploading user ID")
+
+
+class DirectUploadPart(BaseModel):
+    """Presigned URL for one part of a direct upload."""
+
+    part_number: int = Field(..., ge=1, description="S3 part number (1-based)")
+    url: str = Field(..., description="Presigned PUT URL for this part")
+
+
+class DirectUploadInitResponse(BaseModel):
+    """Presigned part URLs for a direct-to-S3 upload."""
+
+    upload_id: UUID = Field(..., description="Upload UUID (becomes the processing session UUID)")
+    s3_key: str = Field(..., description="S3 key the photo is uploaded to")
+    part_size_bytes: int = Field(..., description="Size of every part except the last one")
+    parts: list[DirectUploadPart] = Field(..., description="Presigned URLs, one per part")
+    expires_at: datetime = Field(..., description="When the presigned URLs expire")
+    complete_url: str = Field(..., description="URL to call once every part is uploaded")
+
+
+class CompletedPart(BaseModel):
+    """Part uploaded by the client (ETag header returned by S3)."""
+
+    part_number: int = Field(..., ge=1, le=10_000, description="S3 part number")
+    etag: str = Field(..., min_length=1, description="ETag returned by S3 for the part")
+
+
+class DirectUploadCompleteRequest(BaseModel):
+    """Request body to complete a direct-to-S3 upload."""
+
+    parts: list[CompletedPart] = Field(..., min_length=1, description="Uploaded parts")
+
+
+class DirectUploadBatchItem(BaseModel):
+    """One direct upload to complete as part of a batch."""
+
+    upload_id: UUID = Field(..., description="upload_id returned by POST /photo/uploads")
+    parts: list[CompletedPart] = Field(..., min_length=1, description="Uploaded parts")
+
+
+class DirectUploadBatchCompleteRequest(BaseModel):
+    """Request body to complete many direct uploads under one upload session."""
+
+    uploads: list[DirectUploadBatchItem] = Field(
+        ..., min_length=1, description="Direct uploads to complete"
+    )
+
+
 PhotoUploadResponse.model_rebuild()
 PhotoUploadJob.model_rebuild()
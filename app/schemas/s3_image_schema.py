@@ -27,6 +27,7 @@ class S3ImageUploadRequest(BaseModel):
         uploaded_by_user_id: User ID who uploaded the image (optional)
         exif_metadata: EXIF data from camera (optional)
         gps_coordinates: GPS coordinates {lat, lng, altitude, accuracy} (optional)
+        perceptual_hash: 64-bit dHash of the content (optional, duplicate detection)
     """
 
     session_id: UUID = Field(..., description="Photo processing session UUID")
@@ -43,6 +44,9 @@ class S3ImageUploadRequest(BaseModel):
     gps_coordinates: dict[str, Any] | None = Field(
         default=None, description="GPS coordinates {lat, lng, altitude, accuracy}"
     )
+    perceptual_hash: int | None = Field(
+        default=None, description="64-bit dHash of the image content (signed)"
+    )
 
 
 class S3ImageResponse(BaseModel):
@@ -1,5 +1,6 @@
 """DensityParameter business logic service."""
 
+from app.core.read_through_cache import ReadThroughCache, invalidate_cache, read_through
 from app.repositories.density_parameter_repository import DensityParameterRepository
 from app.schemas.density_parameter_schema import (
     DensityParameterCreateRequest,
@@ -11,26 +12,40 @@ from app.schemas.density_parameter_schema import (
 class DensityParameterService:
     """Business logic for densityparameter operations (CRUD)."""
 
-    def __init__(self, repo: DensityParameterRepository) -> None:
+    def __init__(
+        self, repo: DensityParameterRepository, cache: ReadThroughCache | None = None
+    ) -> None:
         self.repo = repo
+        self.cache = cache  # Read-through cache ("density_parameters" namespace)
 
     async def create(self, request: DensityParameterCreateRequest) -> DensityParameterResponse:
         """Create a new densityparameter."""
         data = request.model_dump()
         model = await self.repo.create(data)
+        await invalidate_cache(self.cache, self.repo.session)
         return DensityParameterResponse.model_validate(model)
 
     async def get_by_id(self, id: int) -> DensityParameterResponse:
         """Get densityparameter by ID."""
-        model = await self.repo.get(id)
-        if not model:
-            raise ValueError("DensityParameter {id} not found")
-        return DensityParameterResponse.model_validate(model)
+
+        async def load() -> DensityParameterResponse:
+            model = await self.repo.get(id)
+            if not model:
+                raise ValueError("DensityParameter {id} not found")
+            return DensityParameterResponse.model_validate(model)
+
+        return await read_through(self.cache, f"id:{id}", load, DensityParameterResponse)
 
     async def get_all(self, skip: int = 0, limit: int = 100) -> list[DensityParameterResponse]:
         """Get all densityparameters."""
-        models = await self.repo.get_multi(skip=skip, limit=limit)
-        return [DensityParameterResponse.model_validate(m) for m in models]
+
+        async def load() -> list[DensityParameterResponse]:
+            models = await self.repo.get_multi(skip=skip, limit=limit)
+            return [DensityParameterResponse.model_validate(m) for m in models]
+
+        return await read_through(
+            self.cache, f"all:{skip}:{limit}", load, list[DensityParameterResponse]
+        )
 
     async def update(
         self, id: int, request: DensityParameterUpdateRequest
@@ -42,6 +57,7 @@ class DensityParameterService:
 
         update_data = request.model_dump(exclude_unset=True)
         updated_model = await self.repo.update(id, update_data)
+        await invalidate_cache(self.cache, self.repo.session)
         return DensityParameterResponse.model_validate(updated_model)
 
     async def delete(self, id: int) -> None:
@@ -50,6 +66,7 @@ class DensityParameterService:
         if not model:
             raise ValueError("DensityParameter {id} not found")
         await self.repo.delete(id)
+        await invalidate_cache(self.cache, self.repo.session)
 
     async def get_by_product_and_packaging(
         self, product_id: int, packaging_catalog_id: int
@@ -59,13 +76,21 @@ class DensityParameterService:
 
         from app.models.density_parameter import DensityParameter
 
-        stmt = select(DensityParameter).where(
-            (DensityParameter.product_id == product_id)
-            & (DensityParameter.packaging_catalog_id == packaging_catalog_id)
+        async def load() -> DensityParameterResponse | None:
+            stmt = select(DensityParameter).where(
+                (DensityParameter.product_id == product_id)
+                & (DensityParameter.packaging_catalog_id == packaging_catalog_id)
+            )
+            result = await self.repo.session.execute(stmt)
+            model = result.scalars().first()
+            return DensityParameterResponse.model_validate(model) if model else None
+
+        return await read_through(
+            self.cache,
+            f"product:{product_id}:packaging:{packaging_catalog_id}",
+            load,
+            DensityParameterResponse | None,
         )
-        result = await self.repo.session.execute(stmt)
-        model = result.scalars().first()
-        return DensityParameterResponse.model_validate(model) if model else None
 
     async def get_by_product(self, product_id: int) -> list[DensityParameterResponse]:
         """Get all density parameters for a product."""
@@ -73,7 +98,12 @@ class DensityParameterService:
 
         from app.models.density_parameter import DensityParameter
 
-        stmt = select(DensityParameter).where(DensityParameter.product_id == product_id)
-        result = await self.repo.session.execute(stmt)
-        models = result.scalars().all()
-        return [DensityParameterResponse.model_validate(m) for m in models]
+        async def load() -> list[DensityParameterResponse]:
+            stmt = select(DensityParameter).where(DensityParameter.product_id == product_id)
+            result = await self.repo.session.execute(stmt)
+            models = result.scalars().all()
+            return [DensityParameterResponse.model_validate(m) for m in models]
+
+        return await read_through(
+            self.cache, f"product:{product_id}", load, list[DensityParameterResponse]
+        )
@@ -0,0 +1,114 @@
+"""Location Hierarchy Cache - Per-warehouse hierarchy trees in Redis.
+
+The warehouse → area → location → bin tree changes rarely (admin edits) but
+is read on every hierarchy view and validation. Trees are cached per
+warehouse under a global version number:
+
+    location_hierarchy:version              → INCR on every hierarchy write
+    location_hierarchy:{version}:{warehouse} → JSON tree (TTL)
+
+Any create/update/delete in WarehouseService, StorageAreaService,
+StorageLocationService or StorageBinService calls
+``invalidate_location_hierarchy(session)``, which bumps the version now and
+again when the write's transaction ends: every cached tree becomes
+unreachable at once (old keys expire through their TTL), with no key scans
+and no need to work out which warehouse a bin belongs to. The same counter
+is the "location_hierarchy" resource version behind the ETags of the
+location endpoints (app.core.http_cache).
+
+The cache is best-effort: Redis errors are logged and the caller falls back
+to the database.
+
+Architecture:
+    Layer: Service Layer (cache helper)
+    Dependencies: Redis (app.core.cache)
+    Used by: LocationHierarchyService, hierarchy write services
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+from app.core.cache import get_redis_client, resource_version_key
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.session import run_after_transaction
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = get_logger(__name__)
+
+HIERARCHY_KEY_PREFIX = "location_hierarchy"
+HIERARCHY_VERSION_KEY = resource_version_key(HIERARCHY_KEY_PREFIX)
+
+
+class LocationHierarchyCache:
+    """Versioned Redis cache of per-warehouse hierarchy trees (JSON payloads)."""
+
+    def __init__(self, redis: Redis | None = None, ttl_seconds: int | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            redis: Async Redis client (default: shared app client)
+            ttl_seconds: Tree TTL (default: LOCATION_HIERARCHY_CACHE_TTL_SECONDS)
+        """
+        self._redis = redis
+        self.ttl_seconds = ttl_seconds or settings.LOCATION_HIERARCHY_CACHE_TTL_SECONDS
+
+    @property
+    def redis(self) -> Redis:
+        return self._redis or get_redis_client()
+
+    async def get(self, warehouse_id: int) -> dict[str, Any] | None:
+        """Cached tree of a warehouse for the current version (None on miss/error)."""
+        try:
+            version = await self.redis.get(HIERARCHY_VERSION_KEY) or 0
+            cached = await self.redis.get(self._tree_key(version, warehouse_id))
+        except Exception as e:
+            logger.warning(
+                "Location hierarchy cache read failed",
+                extra={"warehouse_id": warehouse_id, "error": str(e)},
+            )
+            return None
+        return json.loads(cached) if cached else None
+
+    async def set(self, warehouse_id: int, tree: dict[str, Any]) -> None:
+        """Store a tree (JSON-serializable) under the current version."""
+        try:
+            version = await self.redis.get(HIERARCHY_VERSION_KEY) or 0
+            await self.redis.setex(
+                self._tree_key(version, warehouse_id), self.ttl_seconds, json.dumps(tree)
+            )
+        except Exception as e:
+            logger.warning(
+                "Location hierarchy cache write failed",
+                extra={"warehouse_id": warehouse_id, "error": str(e)},
+            )
+
+    async def invalidate(self, session: AsyncSession | None = None) -> None:
+        """Bump the version: every cached tree is stale from now on.
+
+        Args:
+            session: Session of the write; the version is bumped again when its
+                transaction ends (trees read before the commit are dropped too)
+        """
+        try:
+            await self.redis.incr(HIERARCHY_VERSION_KEY)
+        except Exception as e:
+            # Trees expire through their TTL if the bump is lost
+            logger.warning("Location hierarchy cache invalidation failed", extra={"error": str(e)})
+
+        if session is not None:
+            run_after_transaction(session, HIERARCHY_VERSION_KEY, self.invalidate)
+
+    @staticmethod
+    def _tree_key(version: Any, warehouse_id: int) -> str:
+        return f"{HIERARCHY_KEY_PREFIX}:{version}:{warehouse_id}"
+
+
+async def invalidate_location_hierarchy(session: AsyncSession | None = None) -> None:
+    """Invalidate all cached hierarchy trees (call after any hierarchy write)."""
+    await LocationHierarchyCache().invalidate(session)
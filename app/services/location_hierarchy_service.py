@@ -2,11 +2,22 @@
 
 Orchestrates warehouse → area → location → bin hierarchy queries.
 Critical for reporting and analytics dashboards.
+
+A warehouse tree is loaded with one set-based query per level (warehouse,
+areas, locations of all areas, bins of all locations) and cached per
+warehouse in Redis (LocationHierarchyCache, invalidated on any hierarchy
+write). validate_hierarchy checks parent/child ids against that tree.
 """
 
 import logging
+from dataclasses import dataclass, field
 from typing import Any
 
+from app.schemas.storage_area_schema import StorageAreaResponse
+from app.schemas.storage_bin_schema import StorageBinResponse
+from app.schemas.storage_location_schema import StorageLocationResponse
+from app.schemas.warehouse_schema import WarehouseResponse
+from app.services.location_hierarchy_cache import LocationHierarchyCache
 from app.services.storage_area_service import StorageAreaService
 from app.services.storage_bin_service import StorageBinService
 from app.services.storage_location_service import StorageLocationService
@@ -15,6 +26,27 @@ from app.services.warehouse_service import WarehouseService
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _HierarchyIndex:
+    """Id → entity maps of one warehouse tree (for validate_hierarchy)."""
+
+    areas: dict[int, Any] = field(default_factory=dict)
+    locations: dict[int, Any] = field(default_factory=dict)
+    bins: dict[int, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_hierarchy(cls, hierarchy: dict[str, Any]) -> "_HierarchyIndex":
+        index = cls()
+        for area_data in hierarchy["areas"]:
+            index.areas[area_data["area"].storage_area_id] = area_data["area"]
+            for location_data in area_data["locations"]:
+                location = location_data["location"]
+                index.locations[location.storage_location_id] = location
+                for bin_item in location_data["bins"]:
+                    index.bins[bin_item.bin_id] = bin_item
+        return index
+
+
 class LocationHierarchyService:
     """Aggregate service for full location hierarchy operations."""
 
@@ -24,32 +56,106 @@ class LocationHierarchyService:
         area_service: StorageAreaService,
         location_service: StorageLocationService,
         bin_service: StorageBinService,
+        cache: LocationHierarchyCache | None = None,
     ) -> None:
         self.warehouse_service = warehouse_service
         self.area_service = area_service
         self.location_service = location_service
         self.bin_service = bin_service
+        self.cache = cache
 
     async def get_full_hierarchy(self, warehouse_id: int) -> dict[str, Any]:
-        """Get complete hierarchy: warehouse → areas → locations → bins."""
+        """Get complete hierarchy: warehouse → areas → locations → bins.
+
+        Served from the per-warehouse cache when present; otherwise loaded
+        with 4 set-based queries (not one query per area and per location)
+        and cached.
+        """
+        if self.cache:
+            cached = await self.cache.get(warehouse_id)
+            if cached is not None:
+                logger.debug(f"Hierarchy cache hit for warehouse {warehouse_id}")
+                return self._hierarchy_from_payload(cached)
+
+        hierarchy = await self._load_hierarchy(warehouse_id)
+
+        if self.cache:
+            await self.cache.set(warehouse_id, self._hierarchy_to_payload(hierarchy))
+        return hierarchy
+
+    async def _load_hierarchy(self, warehouse_id: int) -> dict[str, Any]:
+        """Load a warehouse tree with one query per level."""
         logger.debug(f"Fetching full hierarchy for warehouse {warehouse_id}")
         warehouse = await self.warehouse_service.get_warehouse_by_id(warehouse_id)
         areas = await self.area_service.get_areas_by_warehouse(warehouse_id)
         logger.debug(f"Found {len(areas)} areas for warehouse {warehouse_id}")
+        if not areas:
+            return {"warehouse": warehouse, "areas": []}
 
-        hierarchy: dict[str, Any] = {"warehouse": warehouse, "areas": []}
-
-        for area in areas:
-            locations = await self.location_service.get_locations_by_area(area.storage_area_id)
-            area_data: dict[str, Any] = {"area": area, "locations": []}
-
-            for loc in locations:
-                bins = await self.bin_service.get_bins_by_location(loc.storage_location_id)
-                area_data["locations"].append({"location": loc, "bins": bins})
-
-            hierarchy["areas"].append(area_data)
+        locations_by_area = await self.location_service.get_locations_by_areas(
+            {area.storage_area_id for area in areas}
+        )
+        bins_by_location = await self.bin_service.get_bins_by_locations(
+            {loc.storage_location_id for locs in locations_by_area.values() for loc in locs}
+        )
 
-        return hierarchy
+        return {
+            "warehouse": warehouse,
+            "areas": [
+                {
+                    "area": area,
+                    "locations": [
+                        {"location": loc, "bins": bins_by_location.get(loc.storage_location_id, [])}
+                        for loc in locations_by_area.get(area.storage_area_id, [])
+                    ],
+                }
+                for area in areas
+            ],
+        }
+
+    @staticmethod
+    def _hierarchy_to_payload(hierarchy: dict[str, Any]) -> dict[str, Any]:
+        """Hierarchy of response schemas → JSON-serializable tree (cache payload)."""
+        return {
+            "warehouse": hierarchy["warehouse"].model_dump(mode="json"),
+            "areas": [
+                {
+                    "area": area_data["area"].model_dump(mode="json"),
+                    "locations": [
+                        {
+                            "location": loc_data["location"].model_dump(mode="json"),
+                            "bins": [b.model_dump(mode="json") for b in loc_data["bins"]],
+                        }
+                        for loc_data in area_data["locations"]
+                    ],
+                }
+                for area_data in hierarchy["areas"]
+            ],
+        }
+
+    @staticmethod
+    def _hierarchy_from_payload(payload: dict[str, Any]) -> dict[str, Any]:
+        """Cache payload → hierarchy of response schemas (same shape as _load_hierarchy)."""
+        return {
+            "warehouse": WarehouseResponse.model_validate(payload["warehouse"]),
+            "areas": [
+                {
+                    "area": StorageAreaResponse.model_validate(area_data["area"]),
+                    "locations": [
+                        {
+                            "location": StorageLocationResponse.model_validate(
+                                loc_data["location"]
+                            ),
+                            "bins": [
+                                StorageBinResponse.model_validate(b) for b in loc_data["bins"]
+                            ],
+                        }
+                        for loc_data in area_data["locations"]
+                    ],
+                }
+                for area_data in payload["areas"]
+            ],
+        }
 
     async def lookup_gps_full_chain(
         self, longitude: float, latitude: float
@@ -90,6 +196,50 @@ class LocationHierarchyService:
 
         return {"warehouse": warehouse, "area": area, "location": location, "bins": bins}
 
+    async def lookup_gps_batch(
+        self, points: list[tuple[float, float]]
+    ) -> list[dict[str, Any] | None]:
+        """GPS → full chain for many (longitude, latitude) points (field device routes).
+
+        Points are resolved together (spatial index, or one PostGIS query),
+        then each distinct location, area and warehouse is loaded once and
+        the bins of all distinct locations come from a single query.
+
+        Returns:
+            Per point (input order): dict with keys warehouse, area, location,
+            bins, distance_m - or None if no location was found
+        """
+        resolved = await self.location_service.resolve_locations(points)
+        matched = [match for match in resolved if match is not None]
+        logger.debug(f"GPS batch lookup: {len(matched)}/{len(points)} points resolved")
+
+        location_ids = {match.storage_location_id for match in matched}
+        locations = await self.location_service.get_locations_by_ids(location_ids)
+        areas = await self.area_service.get_storage_areas_by_ids(
+            {match.storage_area_id for match in matched}
+        )
+        warehouses = await self.warehouse_service.get_warehouses_by_ids(
+            {match.warehouse_id for match in matched}
+        )
+        bins = await self.bin_service.get_bins_by_locations(location_ids)
+
+        results: list[dict[str, Any] | None] = []
+        for match in resolved:
+            location = locations.get(match.storage_location_id) if match else None
+            if match is None or location is None:
+                results.append(None)
+                continue
+            results.append(
+                {
+                    "warehouse": warehouses.get(match.warehouse_id),
+                    "area": areas.get(match.storage_area_id),
+                    "location": location,
+                    "bins": bins.get(match.storage_location_id, []),
+                    "distance_m": match.distance_m,
+                }
+            )
+        return results
+
     async def validate_hierarchy(
         self,
         warehouse_id: int | None = None,
@@ -116,33 +266,41 @@ class LocationHierarchyService:
         errors: list[str] = []
         validated: dict[str, Any] = {}
 
-        # Validate warehouse
+        # Validate warehouse (its cached tree answers the child checks below)
+        index: _HierarchyIndex | None = None
         if warehouse_id:
             try:
-                warehouse = await self.warehouse_service.get_warehouse_by_id(warehouse_id)
-                validated["warehouse"] = warehouse
+                hierarchy = await self.get_full_hierarchy(warehouse_id)
+                validated["warehouse"] = hierarchy["warehouse"]
+                index = _HierarchyIndex.from_hierarchy(hierarchy)
             except Exception as e:
                 errors.append(f"Invalid warehouse_id {warehouse_id}: {str(e)}")
 
-        # Validate area
+        # Validate area (in the warehouse tree → exists and belongs to it)
         if area_id:
-            try:
-                area = await self.area_service.get_storage_area_by_id(area_id)
+            area = index.areas.get(area_id) if index else None
+            if area is not None:
                 validated["area"] = area
-
-                # Check area belongs to warehouse if both provided
-                if warehouse_id and area.warehouse_id != warehouse_id:
-                    errors.append(
-                        f"Area {area_id} belongs to warehouse {area.warehouse_id}, "
-                        f"not warehouse {warehouse_id}"
-                    )
-            except Exception as e:
-                errors.append(f"Invalid area_id {area_id}: {str(e)}")
+            else:
+                try:
+                    area = await self.area_service.get_storage_area_by_id(area_id)
+                    validated["area"] = area
+
+                    # Check area belongs to warehouse if both provided
+                    if warehouse_id and area.warehouse_id != warehouse_id:
+                        errors.append(
+                            f"Area {area_id} belongs to warehouse {area.warehouse_id}, "
+                            f"not warehouse {warehouse_id}"
+                        )
+                except Exception as e:
+                    errors.append(f"Invalid area_id {area_id}: {str(e)}")
 
         # Validate location
         if location_id:
+            location = index.locations.get(location_id) if index else None
             try:
-                location = await self.location_service.get_storage_location_by_id(location_id)
+                if location is None:
+                    location = await self.location_service.get_storage_location_by_id(location_id)
                 validated["location"] = location
 
                 # Check location belongs to area if both provided
@@ -156,8 +314,10 @@ class LocationHierarchyService:
 
         # Validate bin
         if bin_id:
+            bin_entity = index.bins.get(bin_id) if index else None
             try:
-                bin_entity = await self.bin_service.get_storage_bin_by_id(bin_id)
+                if bin_entity is None:
+                    bin_entity = await self.bin_service.get_storage_bin_by_id(bin_id)
                 validated["bin"] = bin_entity
 
                 # Check bin belongs to location if both provided
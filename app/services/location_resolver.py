@@ -0,0 +1,258 @@
+"""Location Resolver - GPS → storage location from an in-process spatial index.
+
+Resolving a photo's storage location used to be a chain of PostGIS queries
+(warehouse → area → location) per photo, and the last step compared points
+with ST_Equals, which a real GPS fix practically never matches. This module
+keeps every active location geometry in a Shapely STRtree per process:
+
+- Point inside a location polygon → that location (smallest polygon wins
+  if they overlap).
+- Otherwise the nearest location within LOCATION_GPS_TOLERANCE_METERS
+  (GPS fixes drift a few meters, e.g. between greenhouse rows).
+
+A lookup is an in-memory tree query (microseconds). The index is rebuilt
+when the location/area tables change: at most every
+LOCATION_INDEX_REFRESH_SECONDS a one-row fingerprint query (counts + latest
+updated_at) is compared with the one the index was built from. If the index
+cannot be built, lookups fall back to PostGIS with the same semantics
+(StorageLocationRepository.find_by_gps_batch, one query for any number of
+points).
+
+Architecture:
+    Layer: Service Layer (process-wide cache)
+    Dependencies: Shapely, GeoAlchemy2, StorageLocationRepository
+    Used by: StorageLocationService.resolve_location (photo uploads)
+
+Example:
+    ```python
+    resolver = get_location_resolver()
+    location = await resolver.resolve(location_repo, longitude=-70.648, latitude=-33.449)
+    if location:
+        storage_location_id = location.storage_location_id
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+import shapely
+from shapely import STRtree
+from shapely.geometry.base import BaseGeometry
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+if TYPE_CHECKING:
+    from app.repositories.storage_location_repository import StorageLocationRepository
+
+logger = get_logger(__name__)
+
+# Geometries are stored in SRID 4326 (degrees). One degree of latitude is
+# ~111.32 km; the tolerance is small enough for this approximation.
+METERS_PER_DEGREE = 111_320.0
+
+
+@dataclass(frozen=True)
+class ResolvedLocation:
+    """Storage location (with its hierarchy) a GPS position belongs to.
+
+    Attributes:
+        storage_location_id: StorageLocation primary key (location_id)
+        storage_area_id: Parent storage area
+        warehouse_id: Parent warehouse
+        distance_m: 0.0 if the point is inside the location, else the
+            approximate distance to it in meters
+    """
+
+    storage_location_id: int
+    storage_area_id: int
+    warehouse_id: int
+    distance_m: float = 0.0
+
+
+class LocationSpatialIndex:
+    """Immutable STRtree snapshot of the active storage location geometries."""
+
+    def __init__(self, rows: Sequence[Sequence[Any]]) -> None:
+        """Build the index.
+
+        Args:
+            rows: (location_id, storage_area_id, warehouse_id, geometry) rows;
+                geometry is a Shapely geometry or a GeoAlchemy2 WKB element
+                (as stored: x = latitude, y = longitude)
+        """
+        from geoalchemy2.shape import to_shape
+
+        self._locations: list[ResolvedLocation] = []
+        geometries: list[BaseGeometry] = []
+        for location_id, storage_area_id, warehouse_id, geometry in rows:
+            if geometry is None:
+                continue
+            self._locations.append(
+                ResolvedLocation(
+                    storage_location_id=location_id,
+                    storage_area_id=storage_area_id,
+                    warehouse_id=warehouse_id,
+                )
+            )
+            geometries.append(
+                geometry if isinstance(geometry, BaseGeometry) else to_shape(geometry)
+            )
+
+        self._areas = shapely.area(geometries) if geometries else []
+        self._tree = STRtree(geometries)
+
+    def __len__(self) -> int:
+        """Number of indexed locations."""
+        return len(self._locations)
+
+    def lookup(
+        self, longitude: float, latitude: float, tolerance_m: float
+    ) -> ResolvedLocation | None:
+        """Location containing the point, else the nearest one within tolerance_m."""
+        # NOTE: Database stores geometries as (lat, lon) instead of (lon, lat)
+        point = shapely.Point(latitude, longitude)
+
+        hits = self._tree.query(point, predicate="intersects")
+        if len(hits):
+            return self._locations[int(min(hits, key=lambda i: self._areas[i]))]
+
+        if tolerance_m <= 0:
+            return None
+        nearest, distances = self._tree.query_nearest(
+            point, max_distance=tolerance_m / METERS_PER_DEGREE, return_distance=True
+        )
+        if not len(nearest):
+            return None
+        match = self._locations[int(nearest[0])]
+        return ResolvedLocation(
+            storage_location_id=match.storage_location_id,
+            storage_area_id=match.storage_area_id,
+            warehouse_id=match.warehouse_id,
+            distance_m=float(distances[0]) * METERS_PER_DEGREE,
+        )
+
+
+class LocationResolver:
+    """Process-wide GPS → storage location resolver (see module docstring).
+
+    Attributes:
+        refresh_interval_seconds: Minimum time between two change checks
+        tolerance_m: Nearest-location radius for points outside every polygon
+    """
+
+    def __init__(self, refresh_interval_seconds: float, tolerance_m: float) -> None:
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.tolerance_m = tolerance_m
+        self._index: LocationSpatialIndex | None = None
+        self._fingerprint: tuple[Any, ...] | None = None
+        self._checked_at = float("-inf")
+        # Serializes every database access: callers may share one AsyncSession
+        self._lock = asyncio.Lock()
+
+    async def resolve(
+        self, location_repo: StorageLocationRepository, longitude: float, latitude: float
+    ) -> ResolvedLocation | None:
+        """Resolve a GPS position to its storage location.
+
+        Args:
+            location_repo: Repository of the caller's session (refresh/fallback queries)
+            longitude: GPS longitude (WGS84)
+            latitude: GPS latitude (WGS84)
+
+        Returns:
+            ResolvedLocation, or None if no active location is in range
+        """
+        return (await self.resolve_many(location_repo, [(longitude, latitude)]))[0]
+
+    async def resolve_many(
+        self, location_repo: StorageLocationRepository, points: Sequence[tuple[float, float]]
+    ) -> list[ResolvedLocation | None]:
+        """Resolve many GPS positions (e.g. a field device route) at once.
+
+        Args:
+            location_repo: Repository of the caller's session (refresh/fallback queries)
+            points: (longitude, latitude) pairs (WGS84)
+
+        Returns:
+            One ResolvedLocation (or None) per point, in input order
+        """
+        index = await self._current_index(location_repo)
+        if index is not None:
+            return [
+                index.lookup(longitude, latitude, self.tolerance_m)
+                for longitude, latitude in points
+            ]
+
+        # No index: one PostGIS query for all points
+        async with self._lock:
+            rows = await location_repo.find_by_gps_batch(
+                list(points), self.tolerance_m / METERS_PER_DEGREE
+            )
+        return [self._from_row(rows.get(idx)) for idx in range(len(points))]
+
+    @staticmethod
+    def _from_row(row: Sequence[Any] | None) -> ResolvedLocation | None:
+        """(location_id, storage_area_id, warehouse_id, distance in degrees) → ResolvedLocation."""
+        if row is None:
+            return None
+        location_id, storage_area_id, warehouse_id, distance = row
+        return ResolvedLocation(
+            storage_location_id=location_id,
+            storage_area_id=storage_area_id,
+            warehouse_id=warehouse_id,
+            distance_m=float(distance or 0.0) * METERS_PER_DEGREE,
+        )
+
+    def invalidate(self) -> None:
+        """Force a change check on the next lookup (e.g. after a location write)."""
+        self._checked_at = float("-inf")
+
+    async def _current_index(
+        self, location_repo: StorageLocationRepository
+    ) -> LocationSpatialIndex | None:
+        """Return the index, rebuilding it first if the tables changed."""
+        if not self._check_due():
+            return self._index
+
+        async with self._lock:
+            if not self._check_due():
+                return self._index  # Refreshed while waiting for the lock
+
+            try:
+                fingerprint = await location_repo.get_spatial_index_fingerprint()
+                if self._index is None or fingerprint != self._fingerprint:
+                    rows = await location_repo.get_spatial_index_rows()
+                    self._index = LocationSpatialIndex(rows)
+                    self._fingerprint = fingerprint
+                    logger.info(
+                        "Location spatial index built",
+                        extra={"num_locations": len(self._index)},
+                    )
+            except Exception as e:
+                # Keep serving the previous index; without one, resolve() uses PostGIS
+                logger.warning(
+                    "Failed to refresh location spatial index",
+                    extra={"error": str(e), "has_index": self._index is not None},
+                )
+            self._checked_at = time.monotonic()
+
+        return self._index
+
+    def _check_due(self) -> bool:
+        return time.monotonic() - self._checked_at >= self.refresh_interval_seconds
+
+
+@lru_cache(maxsize=1)
+def get_location_resolver() -> LocationResolver:
+    """Get singleton LocationResolver instance (one index per process)."""
+    return LocationResolver(
+        refresh_interval_seconds=settings.LOCATION_INDEX_REFRESH_SECONDS,
+        tolerance_m=settings.LOCATION_GPS_TOLERANCE_METERS,
+    )
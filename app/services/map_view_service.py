@@ -42,6 +42,12 @@ class MapViewService:
         self.s3_service = s3_service
 
     async def get_bulk_load(self) -> MapBulkLoadResponse:
+        """Warehouse → area → location tree with a preview of each location.
+
+        Nodes are built with model_construct: their values come from
+        validated response schemas, and the payload (thousands of nodes) is
+        serialized without re-validation (app.core.responses).
+        """
         warehouses = await self.warehouse_service.get_active_warehouses(include_areas=True)
         warehouse_nodes: list[WarehouseNode] = []
 
@@ -56,7 +62,7 @@ class MapViewService:
                 for location in locations:
                     preview = await self._build_location_preview(location.storage_location_id)
                     location_nodes.append(
-                        StorageLocationNode(
+                        StorageLocationNode.model_construct(
                             location_id=location.storage_location_id,
                             code=location.code,
                             name=location.name,
@@ -65,7 +71,7 @@ class MapViewService:
                     )
 
                 area_nodes.append(
-                    StorageAreaNode(
+                    StorageAreaNode.model_construct(
                         storage_area_id=area.storage_area_id,
                         code=area.code,
                         name=area.name,
@@ -75,7 +81,7 @@ class MapViewService:
                 )
 
             warehouse_nodes.append(
-                WarehouseNode(
+                WarehouseNode.model_construct(
                     warehouse_id=warehouse.warehouse_id,
                     code=warehouse.code,
                     name=warehouse.name,
@@ -83,7 +89,7 @@ class MapViewService:
                 )
             )
 
-        return MapBulkLoadResponse(warehouses=warehouse_nodes)
+        return MapBulkLoadResponse.model_construct(warehouses=warehouse_nodes)
 
     async def get_location_detail(self, location_id: int) -> LocationDetailResponse | None:
         location = await self.location_service.get_storage_location_by_id(location_id)
@@ -184,7 +190,7 @@ class MapViewService:
         sessions = await self.session_service.get_by_storage_location(location_id, limit=2)
 
         if not sessions:
-            return LocationPreviewMetrics(status="pending")
+            return LocationPreviewMetrics.model_construct(status="pending")
 
         latest = sessions[0]
         previous = sessions[1] if len(sessions) > 1 else None
@@ -201,7 +207,7 @@ class MapViewService:
         if previous is not None:
             quantity_change = (latest.total_detected or 0) - (previous.total_detected or 0)
 
-        return LocationPreviewMetrics(
+        return LocationPreviewMetrics.model_construct(
             current_quantity=latest.total_detected,
             previous_quantity=previous.total_detected if previous else None,
             quantity_change=quantity_change,
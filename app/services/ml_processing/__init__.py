@@ -9,6 +9,7 @@ from app.services.ml_processing.band_estimation_service import (
     BandEstimation,
     BandEstimationService,
 )
+from app.services.ml_processing.detection_array import DetectionArray
 from app.services.ml_processing.model_cache import ModelCache
 from app.services.ml_processing.pipeline_coordinator import (
     MLPipelineCoordinator,
@@ -29,6 +30,7 @@ __all__ = [
     "SegmentResult",
     "SAHIDetectionService",
     "DetectionResult",
+    "DetectionArray",
     "BandEstimationService",
     "BandEstimation",
     "MLPipelineCoordinator",
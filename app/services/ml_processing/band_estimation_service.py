@@ -31,6 +31,7 @@ Architecture:
 
 import logging
 import time
+from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -38,6 +39,8 @@ from typing import TYPE_CHECKING, Any
 import cv2
 import numpy as np
 
+from app.services.ml_processing.detection_array import DetectionArray
+
 if TYPE_CHECKING:
     from numpy.typing import NDArray  # type: ignore[import-not-found]
 else:
@@ -182,9 +185,10 @@ class BandEstimationService:
     async def estimate_undetected_plants(
         self,
         image_path: str | Path,
-        detections: list[dict[str, Any]],
+        detections: DetectionArray | list[dict[str, Any]],
         segment_mask: "NDArray[np.uint8]",
         container_type: str = "segment",
+        prior_plant_areas: Sequence[float | None] | None = None,
     ) -> list[BandEstimation]:
         """Main entry point: Estimate plants in residual areas.
 
@@ -200,11 +204,16 @@ class BandEstimationService:
 
         Args:
             image_path: Path to original greenhouse photo (for floor suppression)
-            detections: List of detection dicts from ML003 SAHI Detection Service
-                       Each dict must have: center_x_px, center_y_px, width_px, height_px
+            detections: DetectionArray from ML003 SAHI Detection Service, or a
+                       list of detection dicts with center_x_px, center_y_px,
+                       width_px, height_px
             segment_mask: Binary mask of container region (0=background, 255=container)
                          Shape (height, width), dtype uint8
             container_type: Container type string (segment, plug, box, seedling)
+            prior_plant_areas: Optional per-band plant areas (pixels²) from the
+                              previous session at the same location, used
+                              instead of the 2500px default for bands with
+                              too few detections to calibrate
 
         Returns:
             List of 4 BandEstimation objects (one per band), ready for DB insert.
@@ -250,20 +259,24 @@ class BandEstimationService:
         if len(segment_mask.shape) != 2:
             raise ValueError(f"segment_mask must be 2D grayscale, got shape {segment_mask.shape}")
 
+        detections = DetectionArray.coerce(detections)
+
         logger.info(
-            f"Starting band estimation for {image_path.name}: "
-            f"{len(detections)} detections, "
-            f"mask shape {segment_mask.shape}"
+            "Starting band estimation for %s: %d detections, mask shape %s",
+            image_path.name,
+            len(detections),
+            segment_mask.shape,
         )
 
         # Step 1: Create detection mask from bounding boxes
         detection_mask = self._create_detection_mask(detections, segment_mask.shape)
-        logger.debug(f"Created detection mask: {np.sum(detection_mask > 0)} pixels")
+        if logger.isEnabledFor(logging.DEBUG):  # np.count_nonzero is a full-mask pass
+            logger.debug("Created detection mask: %d pixels", np.count_nonzero(detection_mask))
 
         # Step 2: Calculate residual mask (areas not covered by detections)
         residual_mask = cv2.bitwise_and(segment_mask, cv2.bitwise_not(detection_mask))
         residual_area_total = np.sum(residual_mask > 0)
-        logger.debug(f"Residual area: {residual_area_total} pixels")
+        logger.debug("Residual area: %d pixels", residual_area_total)
 
         if residual_area_total == 0:
             logger.warning("No residual area found - all plants detected. Returning empty bands.")
@@ -279,7 +292,7 @@ class BandEstimationService:
         image_height = segment_mask.shape[0]
 
         for band_num, band_mask in enumerate(bands, start=1):
-            logger.debug(f"Processing band {band_num}/{self.num_bands}")
+            logger.debug("Processing band %d/%d", band_num, self.num_bands)
 
             # 4A: Calculate band boundaries
             band_y_start = (band_num - 1) * (image_height // self.num_bands)
@@ -293,7 +306,7 @@ class BandEstimationService:
             residual_area_band = float(np.sum(band_mask > 0))
 
             if residual_area_band == 0:
-                logger.debug(f"Band {band_num} has no residual area, skipping")
+                logger.debug("Band %d has no residual area, skipping", band_num)
                 # Zero-count estimation
                 estimations.append(
                     BandEstimation(
@@ -318,14 +331,16 @@ class BandEstimationService:
             floor_suppressed = residual_area_band - processed_area
 
             logger.debug(
-                f"Band {band_num}: residual={residual_area_band:.0f}px, "
-                f"processed={processed_area:.0f}px, "
-                f"suppressed={floor_suppressed:.0f}px "
-                f"({100 * floor_suppressed / residual_area_band:.1f}%)"
+                "Band %d: residual=%.0fpx, processed=%.0fpx, suppressed=%.0fpx (%.1f%%)",
+                band_num,
+                residual_area_band,
+                processed_area,
+                floor_suppressed,
+                100 * floor_suppressed / residual_area_band,
             )
 
             if processed_area == 0:
-                logger.debug(f"Band {band_num} all floor/soil, no vegetation remaining")
+                logger.debug("Band %d all floor/soil, no vegetation remaining", band_num)
                 estimations.append(
                     BandEstimation(
                         estimation_type="band_based",
@@ -344,14 +359,24 @@ class BandEstimationService:
                 continue
 
             # 4D: Auto-calibrate plant size from detections in this band
-            avg_plant_area = self._calibrate_plant_size(detections, band_num, image_height)
+            prior_area = (
+                prior_plant_areas[band_num - 1]
+                if prior_plant_areas and len(prior_plant_areas) == self.num_bands
+                else None
+            )
+            avg_plant_area = self._calibrate_plant_size(
+                detections, band_num, image_height, prior_area=prior_area
+            )
 
             # 4E: Estimate count using formula: count = ceil(area / (avg_area * alpha))
             estimated_count = int(np.ceil(processed_area / (avg_plant_area * self.alpha_overcount)))
 
-            logger.info(
-                f"Band {band_num}: estimated {estimated_count} plants "
-                f"(avg_area={avg_plant_area:.0f}px, processed={processed_area:.0f}px)"
+            logger.debug(
+                "Band %d: estimated %d plants (avg_area=%.0fpx, processed=%.0fpx)",
+                band_num,
+                estimated_count,
+                avg_plant_area,
+                processed_area,
             )
 
             # 4F: Create estimation object
@@ -375,15 +400,17 @@ class BandEstimationService:
         total_estimated = sum(e.estimated_count for e in estimations)
 
         logger.info(
-            f"Band estimation complete: {total_estimated} plants estimated "
-            f"across {self.num_bands} bands in {elapsed:.2f}s"
+            "Band estimation complete: %d plants estimated across %d bands in %.2fs",
+            total_estimated,
+            self.num_bands,
+            elapsed,
         )
 
         return estimations
 
     def _create_detection_mask(
         self,
-        detections: list[dict[str, Any]],
+        detections: DetectionArray | list[dict[str, Any]],
         image_shape: tuple[int, int],
     ) -> "NDArray[np.uint8]":
         """Create binary mask of all detection areas (AC1 helper).
@@ -398,8 +425,8 @@ class BandEstimationService:
             - Threshold at 127 to binarize
 
         Args:
-            detections: List of detection dicts with center_x_px, center_y_px,
-                       width_px, height_px
+            detections: DetectionArray or list of detection dicts with
+                       center_x_px, center_y_px, width_px, height_px
             image_shape: (height, width) of original image
 
         Returns:
@@ -411,21 +438,19 @@ class BandEstimationService:
         """
         mask = np.zeros(image_shape, dtype=np.uint8)
 
-        for det in detections:
-            try:
-                x = int(det["center_x_px"])
-                y = int(det["center_y_px"])
-                w = int(det["width_px"])
-                h = int(det["height_px"])
+        detections = DetectionArray.coerce(detections)
 
-                # Draw filled circle (softer than rectangle)
-                # Radius slightly smaller than bbox (85% of max dimension)
-                radius = int(max(w, h) * 0.85)
-                cv2.circle(mask, (x, y), radius, 255, -1)  # -1 = filled
+        # Integer pixel geometry computed once for all detections
+        xs = detections.center_x.astype(np.int32).tolist()
+        ys = detections.center_y.astype(np.int32).tolist()
+        radii = (
+            np.maximum(detections.width.astype(np.int32), detections.height.astype(np.int32)) * 0.85
+        ).astype(np.int32)
 
-            except (KeyError, TypeError, ValueError) as e:
-                logger.warning(f"Skipping malformed detection: {det}, error: {e}")
-                continue
+        for x, y, radius in zip(xs, ys, radii.tolist(), strict=True):
+            # Draw filled circle (softer than rectangle)
+            # Radius slightly smaller than bbox (85% of max dimension)
+            cv2.circle(mask, (x, y), radius, 255, -1)  # -1 = filled
 
         # Gaussian blur for soft edges (removes hard boundaries)
         mask = cv2.GaussianBlur(mask, (15, 15), 0)
@@ -471,7 +496,7 @@ class BandEstimationService:
             band_mask[y_start:y_end, :] = mask[y_start:y_end, :]
             bands.append(band_mask)
 
-        logger.debug(f"Divided mask into {num_bands} bands of ~{band_height}px height each")
+        logger.debug("Divided mask into %d bands of ~%dpx height each", num_bands, band_height)
 
         return bands
 
@@ -517,9 +542,7 @@ class BandEstimationService:
                 f"Mask shape {residual_mask.shape[:2]} doesn't match image shape {img.shape[:2]}, resizing mask"
             )
             residual_mask = cv2.resize(
-                residual_mask,
-                (img.shape[1], img.shape[0]),
-                interpolation=cv2.INTER_NEAREST
+                residual_mask, (img.shape[1], img.shape[0]), interpolation=cv2.INTER_NEAREST
             )
 
         # Mask image to residual region only
@@ -551,9 +574,10 @@ class BandEstimationService:
 
     def _calibrate_plant_size(
         self,
-        detections: list[dict[str, Any]],
+        detections: DetectionArray | list[dict[str, Any]],
         band_number: int,
         image_height: int,
+        prior_area: float | None = None,
     ) -> float:
         """Auto-calibrate average plant area from detections in this band (AC3).
 
@@ -564,19 +588,21 @@ class BandEstimationService:
 
         Algorithm:
             1. Filter detections by band Y coordinates
-            2. If <10 samples: fallback to default (2500px = 5cm × 5cm pot)
+            2. If <10 samples: fallback to prior_area (same band, previous
+               session) or the default (2500px = 5cm × 5cm pot)
             3. Calculate area = width_px × height_px for each detection
             4. Remove outliers using IQR method (prevents skew from huge/tiny plants)
             5. Return mean of filtered areas
 
         Args:
-            detections: List of all detections (full image)
+            detections: All detections (full image), DetectionArray or dicts
             band_number: Current band (1-4)
             image_height: Image height in pixels (for band Y calculation)
+            prior_area: Historical plant area of this band (pixels²), if known
 
         Returns:
             Average plant area in pixels² for this band.
-            Fallback: 2500.0 (5cm × 5cm pot at typical resolution)
+            Fallback: prior_area, else 2500.0 (5cm × 5cm pot at typical resolution)
 
         Performance:
             ~100ms per band
@@ -587,33 +613,31 @@ class BandEstimationService:
         band_y_end = band_number * band_height if band_number < self.num_bands else image_height
 
         # Filter detections in this band (by center Y coordinate)
-        band_detections = [
-            d for d in detections if band_y_start <= d.get("center_y_px", -1) < band_y_end
-        ]
+        band_detections = DetectionArray.coerce(detections).in_y_range(band_y_start, band_y_end)
 
         logger.debug(
-            f"Band {band_number}: found {len(band_detections)} detections "
-            f"in Y range [{band_y_start}, {band_y_end})"
+            "Band %d: found %d detections in Y range [%d, %d)",
+            band_number,
+            len(band_detections),
+            band_y_start,
+            band_y_end,
         )
 
+        # Default 5cm × 5cm pot at typical resolution, unless the band has history
+        fallback = prior_area if prior_area and prior_area > 0 else 2500.0
+
         # Fallback if insufficient samples
         if len(band_detections) < 10:
             logger.warning(
-                f"Band {band_number}: insufficient detections ({len(band_detections)}) "
-                f"for calibration, using fallback (2500px)"
+                "Band %d: insufficient detections (%d) for calibration, using fallback (%.0fpx)",
+                band_number,
+                len(band_detections),
+                fallback,
             )
-            return 2500.0  # Default 5cm × 5cm pot at typical resolution
+            return fallback
 
         # Calculate areas (width × height)
-        areas = [
-            float(d["width_px"]) * float(d["height_px"])
-            for d in band_detections
-            if "width_px" in d and "height_px" in d
-        ]
-
-        if len(areas) < 10:
-            logger.warning(f"Band {band_number}: insufficient valid areas, using fallback (2500px)")
-            return 2500.0
+        areas = band_detections.areas
 
         # Remove outliers using IQR method
         # IQR (Interquartile Range) = Q3 - Q1
@@ -623,20 +647,24 @@ class BandEstimationService:
         lower_bound = q1 - 1.5 * iqr
         upper_bound = q3 + 1.5 * iqr
 
-        filtered_areas = [a for a in areas if lower_bound <= a <= upper_bound]
+        filtered_areas = areas[(areas >= lower_bound) & (areas <= upper_bound)]
 
-        if not filtered_areas:
+        if filtered_areas.size == 0:
             logger.warning(
-                f"Band {band_number}: all areas filtered as outliers, using fallback (2500px)"
+                "Band %d: all areas filtered as outliers, using fallback (%.0fpx)",
+                band_number,
+                fallback,
             )
-            return 2500.0
+            return fallback
 
         avg_area = float(np.mean(filtered_areas))
 
         logger.debug(
-            f"Band {band_number}: calibrated avg_area={avg_area:.0f}px "
-            f"from {len(filtered_areas)} samples "
-            f"(removed {len(areas) - len(filtered_areas)} outliers)"
+            "Band %d: calibrated avg_area=%.0fpx from %d samples (removed %d outliers)",
+            band_number,
+            avg_area,
+            len(filtered_areas),
+            len(areas) - len(filtered_areas),
         )
 
         return avg_area
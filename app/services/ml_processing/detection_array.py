@@ -0,0 +1,435 @@
+"""Array-backed detection container for the ML pipeline.
+
+DetectionArray stores a photo's detections as a struct of NumPy arrays
+(center, size, confidence, class id) plus a small class-name table,
+instead of one DetectionResult object / dict per plant.
+
+Rationale:
+    A dense greenhouse photo produces 10k-50k detections. As Python objects
+    each one costs several hundred bytes and every pipeline stage (segment
+    offsetting, band estimation, chord payload, DB rows) used to copy the
+    whole list into new dicts. Columns of float32/int16 cost 22 bytes per
+    detection and every transform is a single vectorized operation.
+
+Transport:
+    to_json()/from_json() use a columnar payload (one list per field) so the
+    Celery chord result stays compact. from_records() accepts the legacy
+    list-of-dicts format, so older task results and callers keep working.
+
+Architecture:
+    ML Service Layer (Application Layer)
+    └── Produced by: SAHIDetectionService
+    └── Used by: MLPipelineCoordinator, BandEstimationService, ml_tasks
+"""
+
+import logging
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray  # type: ignore[import-not-found]
+
+    from app.services.ml_processing.sahi_detection_service import DetectionResult
+else:
+    ArrayLike = Any
+    NDArray = Any
+
+logger = logging.getLogger(__name__)
+
+_FLOAT = np.float32
+_CLASS_ID = np.int16
+
+# Columnar payload keys (match the legacy detection dict keys)
+_COLUMNS = ("center_x_px", "center_y_px", "width_px", "height_px", "confidence")
+
+
+@dataclass
+class DetectionArray:
+    """Struct-of-arrays container for plant detections.
+
+    All arrays have the same length N; row i is one detection in absolute
+    pixel coordinates of the image it was produced on.
+
+    Attributes:
+        center_x: Center X coordinates in pixels (float32)
+        center_y: Center Y coordinates in pixels (float32)
+        width: Bounding box widths in pixels (float32)
+        height: Bounding box heights in pixels (float32)
+        confidence: Detection confidence scores 0.0-1.0 (float32)
+        class_id: Index into class_names per detection (int16)
+        class_names: Class-name table (e.g., ["plant", "suculenta"])
+
+    Example:
+        >>> dets = DetectionArray.from_xyxy(boxes, scores, class_ids, {0: "plant"})
+        >>> dets = dets.offset(dx=1200, dy=300)  # Segment crop → full image
+        >>> band = dets.in_y_range(0, 750)  # Detections whose center is in band 1
+        >>> payload = dets.to_json()  # Celery-safe columnar dict
+    """
+
+    center_x: "NDArray[np.float32]"
+    center_y: "NDArray[np.float32]"
+    width: "NDArray[np.float32]"
+    height: "NDArray[np.float32]"
+    confidence: "NDArray[np.float32]"
+    class_id: "NDArray[np.int16]"
+    class_names: list[str] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        """Normalize dtypes and validate column lengths."""
+        self.center_x = np.asarray(self.center_x, dtype=_FLOAT).reshape(-1)
+        self.center_y = np.asarray(self.center_y, dtype=_FLOAT).reshape(-1)
+        self.width = np.asarray(self.width, dtype=_FLOAT).reshape(-1)
+        self.height = np.asarray(self.height, dtype=_FLOAT).reshape(-1)
+        self.confidence = np.asarray(self.confidence, dtype=_FLOAT).reshape(-1)
+        self.class_id = np.asarray(self.class_id, dtype=_CLASS_ID).reshape(-1)
+        self.class_names = list(self.class_names)
+
+        n = len(self.center_x)
+        lengths = {
+            len(self.center_y),
+            len(self.width),
+            len(self.height),
+            len(self.confidence),
+            len(self.class_id),
+        }
+        if lengths != {n}:
+            raise ValueError(f"All DetectionArray columns must have length {n}, got {lengths}")
+
+        if n and (self.class_id.min() < 0 or self.class_id.max() >= len(self.class_names)):
+            raise ValueError(
+                f"class_id out of range for class_names table of size {len(self.class_names)}"
+            )
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def empty(cls) -> "DetectionArray":
+        """Return a DetectionArray with no detections."""
+        zeros = np.empty(0, dtype=_FLOAT)
+        return cls(zeros, zeros, zeros, zeros, zeros, np.empty(0, dtype=_CLASS_ID), [])
+
+    @classmethod
+    def from_xyxy(
+        cls,
+        boxes: "ArrayLike",
+        scores: "ArrayLike",
+        class_ids: "ArrayLike",
+        class_names: Mapping[int, str] | None = None,
+    ) -> "DetectionArray":
+        """Build from (N, 4) [x1, y1, x2, y2] boxes.
+
+        Args:
+            boxes: Box corners in pixels, shape (N, 4)
+            scores: Confidence per box, shape (N,)
+            class_ids: Model class ID per box, shape (N,)
+            class_names: Model class ID → name (missing IDs use str(id))
+
+        Returns:
+            DetectionArray with a compact class table (only IDs present)
+        """
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        model_ids = np.asarray(class_ids, dtype=np.int64).reshape(-1)
+        names = class_names or {}
+
+        unique_ids, codes = np.unique(model_ids, return_inverse=True)
+        table = [names.get(int(cid), str(int(cid))) for cid in unique_ids]
+
+        return cls(
+            center_x=(boxes[:, 0] + boxes[:, 2]) / 2,
+            center_y=(boxes[:, 1] + boxes[:, 3]) / 2,
+            width=boxes[:, 2] - boxes[:, 0],
+            height=boxes[:, 3] - boxes[:, 1],
+            confidence=np.asarray(scores, dtype=np.float64).reshape(-1),
+            class_id=codes.reshape(-1),
+            class_names=table,
+        )
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping[str, Any]]) -> "DetectionArray":
+        """Build from legacy detection dicts.
+
+        Each dict needs center_x_px, center_y_px, width_px, height_px;
+        confidence defaults to 0.0 and class_name to "plant". Malformed
+        records are skipped with a warning.
+
+        Args:
+            records: Detection dicts (e.g., old chord payloads)
+
+        Returns:
+            DetectionArray with the valid records
+        """
+        rows: list[tuple[float, float, float, float, float]] = []
+        names: list[str] = []
+
+        for det in records:
+            try:
+                rows.append(
+                    (
+                        float(det["center_x_px"]),
+                        float(det["center_y_px"]),
+                        float(det["width_px"]),
+                        float(det["height_px"]),
+                        float(det.get("confidence", 0.0)),
+                    )
+                )
+            except (KeyError, TypeError, ValueError, AttributeError) as e:
+                logger.warning(f"Skipping malformed detection: {det}, error: {e}")
+                continue
+            names.append(str(det.get("class_name", "plant")))
+
+        if not rows:
+            return cls.empty()
+
+        columns = np.asarray(rows, dtype=np.float64)
+        table, codes = np.unique(np.asarray(names, dtype=object), return_inverse=True)
+
+        return cls(
+            center_x=columns[:, 0],
+            center_y=columns[:, 1],
+            width=columns[:, 2],
+            height=columns[:, 3],
+            confidence=columns[:, 4],
+            class_id=codes,
+            class_names=[str(name) for name in table],
+        )
+
+    @classmethod
+    def from_json(cls, payload: Mapping[str, Any]) -> "DetectionArray":
+        """Build from a to_json() payload.
+
+        Args:
+            payload: Columnar dict produced by to_json()
+
+        Returns:
+            DetectionArray
+        """
+        return cls(
+            center_x=payload["center_x_px"],
+            center_y=payload["center_y_px"],
+            width=payload["width_px"],
+            height=payload["height_px"],
+            confidence=payload["confidence"],
+            class_id=payload["class_id"],
+            class_names=payload.get("class_names", []),
+        )
+
+    @classmethod
+    def coerce(cls, detections: Any) -> "DetectionArray":
+        """Accept any supported detection representation.
+
+        Args:
+            detections: DetectionArray, to_json() payload, list of dicts or None
+
+        Returns:
+            DetectionArray (the same object if already one)
+        """
+        if isinstance(detections, cls):
+            return detections
+        if detections is None:
+            return cls.empty()
+        if isinstance(detections, Mapping):
+            return cls.from_json(detections)
+        return cls.from_records(detections)
+
+    @classmethod
+    def concat(cls, arrays: Sequence["DetectionArray"]) -> "DetectionArray":
+        """Concatenate arrays, merging their class-name tables.
+
+        Args:
+            arrays: DetectionArrays to join (in order)
+
+        Returns:
+            Single DetectionArray
+        """
+        arrays = [a for a in arrays if len(a)]
+        if not arrays:
+            return cls.empty()
+        if len(arrays) == 1:
+            return arrays[0]
+
+        table: list[str] = []
+        index: dict[str, int] = {}
+        codes = []
+        for arr in arrays:
+            for name in arr.class_names:
+                if name not in index:
+                    index[name] = len(table)
+                    table.append(name)
+            remap = np.array([index[name] for name in arr.class_names], dtype=_CLASS_ID)
+            codes.append(remap[arr.class_id])
+
+        return cls(
+            center_x=np.concatenate([a.center_x for a in arrays]),
+            center_y=np.concatenate([a.center_y for a in arrays]),
+            width=np.concatenate([a.width for a in arrays]),
+            height=np.concatenate([a.height for a in arrays]),
+            confidence=np.concatenate([a.confidence for a in arrays]),
+            class_id=np.concatenate(codes),
+            class_names=table,
+        )
+
+    # ------------------------------------------------------------------
+    # Vectorized transforms (return new arrays, never mutate)
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        """Number of detections."""
+        return len(self.center_x)
+
+    def offset(self, dx: float, dy: float) -> "DetectionArray":
+        """Translate centers, e.g. from segment-crop to full-image coordinates."""
+        return self._replace(center_x=self.center_x + dx, center_y=self.center_y + dy)
+
+    def scale(self, factor: float) -> "DetectionArray":
+        """Multiply coordinates and sizes by factor (e.g., 1 / downscale)."""
+        return self._replace(
+            center_x=self.center_x * factor,
+            center_y=self.center_y * factor,
+            width=self.width * factor,
+            height=self.height * factor,
+        )
+
+    def filter(self, mask: "ArrayLike") -> "DetectionArray":
+        """Select detections by boolean mask or index array."""
+        return self._replace(
+            center_x=self.center_x[mask],
+            center_y=self.center_y[mask],
+            width=self.width[mask],
+            height=self.height[mask],
+            confidence=self.confidence[mask],
+            class_id=self.class_id[mask],
+        )
+
+    def in_y_range(self, y_start: float, y_end: float) -> "DetectionArray":
+        """Detections whose center Y lies in [y_start, y_end) (band filter)."""
+        return self.filter((self.center_y >= y_start) & (self.center_y < y_end))
+
+    def sort_by_confidence(self) -> "DetectionArray":
+        """Return detections sorted by confidence descending (stable)."""
+        return self.filter(np.argsort(-self.confidence, kind="stable"))
+
+    @property
+    def areas(self) -> "NDArray[np.float64]":
+        """Bounding box areas in pixels² (float64)."""
+        return self.width.astype(np.float64) * self.height
+
+    def xyxy(self) -> "NDArray[np.float64]":
+        """Box corners as (N, 4) float64 [x1, y1, x2, y2]."""
+        cx = self.center_x.astype(np.float64)
+        cy = self.center_y.astype(np.float64)
+        half_w = self.width.astype(np.float64) / 2
+        half_h = self.height.astype(np.float64) / 2
+        return np.column_stack([cx - half_w, cy - half_h, cx + half_w, cy + half_h])
+
+    def mean_confidence(self) -> float:
+        """Average confidence (0.0 when empty)."""
+        return float(self.confidence.mean(dtype=np.float64)) if len(self) else 0.0
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+
+    def to_json(self) -> dict[str, Any]:
+        """Columnar JSON-serializable payload (for Celery results).
+
+        Coordinates are rounded to 0.01px and confidence to 1e-4, matching
+        the Detection table precision.
+        """
+        return {
+            "center_x_px": np.round(self.center_x.astype(np.float64), 2).tolist(),
+            "center_y_px": np.round(self.center_y.astype(np.float64), 2).tolist(),
+            "width_px": np.round(self.width.astype(np.float64), 2).tolist(),
+            "height_px": np.round(self.height.astype(np.float64), 2).tolist(),
+            "confidence": np.round(self.confidence.astype(np.float64), 4).tolist(),
+            "class_id": self.class_id.tolist(),
+            "class_names": list(self.class_names),
+        }
+
+    def to_records(self, **constants: Any) -> list[dict[str, Any]]:
+        """Legacy detection dicts (one per detection).
+
+        Args:
+            **constants: Extra keys copied into every record (e.g., session_id)
+
+        Returns:
+            List of dicts with center_x_px, center_y_px, width_px, height_px,
+            confidence and class_name
+        """
+        payload = self.to_json()
+        names = [self.class_names[i] for i in payload["class_id"]]
+        return [
+            {
+                **constants,
+                "center_x_px": cx,
+                "center_y_px": cy,
+                "width_px": w,
+                "height_px": h,
+                "confidence": conf,
+                "class_name": name,
+            }
+            for cx, cy, w, h, conf, name in zip(
+                *(payload[column] for column in _COLUMNS), names, strict=True
+            )
+        ]
+
+    def to_db_rows(self, **constants: Any) -> list[dict[str, Any]]:
+        """Detection table rows (for bulk_insert_mappings).
+
+        Widths/heights are rounded to integer pixels (Integer columns), at
+        least 1 so sub-pixel detections keep a size, and bbox_coordinates are
+        derived from the center and the integer size.
+
+        Args:
+            **constants: Columns shared by every row (session_id,
+                         stock_movement_id, classification_id, ...)
+
+        Returns:
+            List of column dicts, one per detection
+        """
+        cx = np.round(self.center_x.astype(np.float64), 2)
+        cy = np.round(self.center_y.astype(np.float64), 2)
+        w = np.maximum(np.round(self.width.astype(np.float64)), 1.0)
+        h = np.maximum(np.round(self.height.astype(np.float64)), 1.0)
+        x1, x2 = cx - w / 2, cx + w / 2
+        y1, y2 = cy - h / 2, cy + h / 2
+        conf = np.round(self.confidence.astype(np.float64), 4)
+
+        return [
+            {
+                **constants,
+                "center_x_px": row[0],
+                "center_y_px": row[1],
+                "width_px": int(row[2]),
+                "height_px": int(row[3]),
+                "bbox_coordinates": {"x1": row[4], "y1": row[5], "x2": row[6], "y2": row[7]},
+                "detection_confidence": row[8],
+                "is_empty_container": False,
+                "is_alive": True,
+            }
+            for row in np.column_stack([cx, cy, w, h, x1, y1, x2, y2, conf]).tolist()
+        ]
+
+    def to_results(self) -> Iterator["DetectionResult"]:
+        """Yield DetectionResult objects (compatibility with per-object callers)."""
+        from app.services.ml_processing.sahi_detection_service import DetectionResult
+
+        for rec in self.to_records():
+            yield DetectionResult(**rec)
+
+    def _replace(self, **columns: Any) -> "DetectionArray":
+        """Copy with some columns replaced (class table is shared)."""
+        values = {
+            "center_x": self.center_x,
+            "center_y": self.center_y,
+            "width": self.width,
+            "height": self.height,
+            "confidence": self.confidence,
+            "class_id": self.class_id,
+            **columns,
+        }
+        return DetectionArray(**values, class_names=self.class_names)
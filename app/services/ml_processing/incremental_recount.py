@@ -0,0 +1,370 @@
+"""Incremental re-count against the previous session of a storage location.
+
+Benches are photographed again every week from roughly the same spot and
+most containers barely change in between. Instead of segmenting and
+running SAHI on the whole photo again, an incremental run:
+
+    1. Registers the new photo against the previous one (phase correlation
+       on reduced grayscale images, translation only)
+    2. Reuses the previous segment layout, shifted by the camera offset,
+       in place of segmentation
+    3. Scores each segment for change (1 - normalized cross-correlation of
+       the aligned regions, insensitive to exposure) and keeps the previous
+       detections of unchanged segments; only changed segments are
+       re-detected
+
+Reused detections carry the time they were originally detected, so a
+segment is re-detected at the latest ML_RECOUNT_MAX_AGE_DAYS after its last
+full detection even if it never looks changed.
+
+Any doubt falls back to a full run: no usable history, a different image
+geometry, a weak correlation peak or a camera shift above
+ML_RECOUNT_MAX_SHIFT all make plan_recount() return None.
+
+Architecture:
+    ML Service Layer (Application Layer)
+    └── Used by: MLPipelineCoordinator
+    └── History loaded by: ml_tasks._load_recount_prior
+    └── Uses: OpenCV, NumPy (Infrastructure)
+"""
+
+import logging
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+import cv2
+import numpy as np
+
+from app.core.config import settings
+from app.services.ml_processing.detection_array import DetectionArray
+from app.services.ml_processing.segmentation_service import SegmentResult
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray  # type: ignore[import-not-found]
+else:
+    NDArray = Any
+
+logger = logging.getLogger(__name__)
+
+# Smallest aligned segment region (reference pixels per side) worth scoring;
+# smaller segments are always re-detected
+_MIN_REGION_PX = 8
+
+# Relative aspect ratio difference tolerated between the two photos
+_ASPECT_TOLERANCE = 0.02
+
+
+@dataclass
+class RecountPrior:
+    """Results of the previous session at the same storage location.
+
+    Attributes:
+        session_id: Previous PhotoProcessingSession ID
+        image_size: (width, height) of the previous photo in pixels
+        reference: Reduced grayscale copy of the previous photo (uint8)
+        segments: Previous segment layout (normalized coordinates, with
+            detected_at set)
+        detections: Previous detections in previous-photo pixels
+    """
+
+    session_id: int
+    image_size: tuple[int, int]
+    reference: "NDArray[np.uint8]"
+    segments: list[SegmentResult]
+    detections: DetectionArray
+
+
+@dataclass
+class Registration:
+    """Translation of the new photo relative to the previous one.
+
+    Attributes:
+        dx: Horizontal shift as a fraction of the image width
+        dy: Vertical shift as a fraction of the image height
+        response: Phase correlation peak (0-1, higher = more reliable)
+    """
+
+    dx: float
+    dy: float
+    response: float
+
+
+@dataclass
+class RecountPlan:
+    """What an incremental run reuses and what it re-detects.
+
+    Attributes:
+        prior: History the plan was derived from
+        registration: Camera offset between the two photos
+        segments: Previous layout shifted into the new photo
+        changed: Per segment, True if it must be re-detected
+        change_scores: Per segment 1 - NCC (None if it could not be scored)
+    """
+
+    prior: RecountPrior
+    registration: Registration
+    segments: list[SegmentResult]
+    changed: list[bool]
+    change_scores: list[float | None]
+
+    @property
+    def segments_reused(self) -> int:
+        """Number of segments whose detections are reused."""
+        return self.changed.count(False)
+
+    def reused_detections(self, idx: int, img_width: int, img_height: int) -> DetectionArray:
+        """Previous detections of an unchanged segment, in new-photo pixels.
+
+        Args:
+            idx: Segment index (0-based, same order as segments)
+            img_width: New photo width in pixels
+            img_height: New photo height in pixels
+
+        Returns:
+            Detections whose center lies in the segment's previous bbox,
+            shifted by the camera offset
+        """
+        prev_width, prev_height = self.prior.image_size
+        x1, y1, x2, y2 = self.prior.segments[idx].bbox
+        dets = self.prior.detections
+        inside = (
+            (dets.center_x >= x1 * prev_width)
+            & (dets.center_x < x2 * prev_width)
+            & (dets.center_y >= y1 * prev_height)
+            & (dets.center_y < y2 * prev_height)
+        )
+        return (
+            dets.filter(inside)
+            .scale(img_width / prev_width)
+            .offset(self.registration.dx * img_width, self.registration.dy * img_height)
+        )
+
+
+def build_recount_prior(
+    session_id: int,
+    image_size: tuple[int, int],
+    reference_bytes: bytes,
+    bins_metadata: Iterable[Mapping[str, Any]],
+    detection_rows: Iterable[tuple[float, float, float, float, float]],
+) -> RecountPrior | None:
+    """Assemble a RecountPrior from persisted session results.
+
+    Args:
+        session_id: Previous PhotoProcessingSession ID
+        image_size: (width, height) of the previous photo
+        reference_bytes: Encoded thumbnail of the previous photo
+        bins_metadata: position_metadata of the StorageBins the previous
+            session created (one per segment, in creation order)
+        detection_rows: (center_x, center_y, width, height, confidence) per
+            previous detection
+
+    Returns:
+        RecountPrior, or None if the history is incomplete
+    """
+    reference = cv2.imdecode(np.frombuffer(reference_bytes, np.uint8), cv2.IMREAD_GRAYSCALE)
+    if reference is None or min(reference.shape) < 2 * _MIN_REGION_PX:
+        return None
+
+    segments: list[SegmentResult] = []
+    for metadata in bins_metadata:
+        bbox = metadata.get("bbox") or {}
+        try:
+            segments.append(
+                SegmentResult(
+                    container_type=metadata.get("container_type", "segment"),
+                    confidence=float(metadata.get("confidence", 0.0)),
+                    bbox=(bbox["x1"], bbox["y1"], bbox["x2"], bbox["y2"]),
+                    polygon=[tuple(p) for p in metadata.get("segmentation_mask") or []],
+                    area_pixels=int(metadata.get("area_pixels", 0)),
+                    detected_at=metadata.get("detected_at"),
+                )
+            )
+        except (KeyError, TypeError, ValueError):
+            return None  # Partial layout would silently drop containers
+    if not segments:
+        return None
+
+    rows = np.asarray(list(detection_rows), dtype=np.float64).reshape(-1, 5)
+    detections = DetectionArray(
+        center_x=rows[:, 0],
+        center_y=rows[:, 1],
+        width=rows[:, 2],
+        height=rows[:, 3],
+        confidence=rows[:, 4],
+        class_id=np.zeros(len(rows), dtype=np.int16),
+        class_names=["plant"],
+    )
+
+    return RecountPrior(
+        session_id=session_id,
+        image_size=image_size,
+        reference=reference,
+        segments=segments,
+        detections=detections,
+    )
+
+
+def register(reference: "NDArray[np.uint8]", current: "NDArray[np.uint8]") -> Registration:
+    """Estimate the translation of current relative to reference.
+
+    Both images are compared at the reference resolution with a Hanning
+    window (suppresses the edge discontinuity of the FFT).
+
+    Args:
+        reference: Reduced grayscale previous photo
+        current: Reduced grayscale new photo (any resolution, same aspect)
+
+    Returns:
+        Registration (shift as a fraction of the image side)
+    """
+    height, width = reference.shape[:2]
+    cur = cv2.resize(current, (width, height), interpolation=cv2.INTER_AREA)
+
+    window = cv2.createHanningWindow((width, height), cv2.CV_32F)
+    (shift_x, shift_y), response = cv2.phaseCorrelate(
+        reference.astype(np.float32), cur.astype(np.float32), window
+    )
+    return Registration(dx=shift_x / width, dy=shift_y / height, response=float(response))
+
+
+def change_scores(
+    reference: "NDArray[np.uint8]",
+    current: "NDArray[np.uint8]",
+    segments: Iterable[SegmentResult],
+    registration: Registration,
+) -> list[float | None]:
+    """Score each (previous) segment for change between the two photos.
+
+    The new photo is shifted back onto the reference grid, then each
+    segment region is compared by normalized cross-correlation, which
+    ignores brightness and contrast changes between the two shots.
+
+    Returns:
+        Per segment 1 - NCC (0 = identical, up to 2), None if the region is
+        too small or flat to be scored
+    """
+    height, width = reference.shape[:2]
+    cur = cv2.resize(current, (width, height), interpolation=cv2.INTER_AREA)
+    shift_back = np.float32([[1, 0, -registration.dx * width], [0, 1, -registration.dy * height]])
+    aligned = cv2.warpAffine(
+        cur, shift_back, (width, height), flags=cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE
+    )
+
+    scores: list[float | None] = []
+    for segment in segments:
+        x1, y1, x2, y2 = segment.bbox
+        cols = slice(int(x1 * width), int(np.ceil(x2 * width)))
+        rows = slice(int(y1 * height), int(np.ceil(y2 * height)))
+        a = reference[rows, cols].astype(np.float32)
+        b = aligned[rows, cols].astype(np.float32)
+        if min(a.shape) < _MIN_REGION_PX:
+            scores.append(None)
+            continue
+
+        a -= a.mean()
+        b -= b.mean()
+        norm = float(np.sqrt((a * a).sum() * (b * b).sum()))
+        scores.append(1.0 - float((a * b).sum()) / norm if norm > 0 else None)
+
+    return scores
+
+
+def plan_recount(
+    prior: RecountPrior,
+    current: "NDArray[np.uint8]",
+    now: datetime | None = None,
+) -> RecountPlan | None:
+    """Decide which segments of the new photo can reuse previous results.
+
+    Args:
+        prior: Previous session at the same location
+        current: Reduced grayscale new photo
+        now: Reference time for ML_RECOUNT_MAX_AGE_DAYS (default: now)
+
+    Returns:
+        RecountPlan, or None if the photos cannot be aligned (full run)
+    """
+    prev_width, prev_height = prior.image_size
+    cur_height, cur_width = current.shape[:2]
+    if abs((cur_width / cur_height) / (prev_width / prev_height) - 1) > _ASPECT_TOLERANCE:
+        logger.info("Recount: image geometry differs from session %s", prior.session_id)
+        return None
+
+    registration = register(prior.reference, current)
+    if (
+        registration.response < settings.ML_RECOUNT_MIN_REGISTRATION_RESPONSE
+        or max(abs(registration.dx), abs(registration.dy)) > settings.ML_RECOUNT_MAX_SHIFT
+    ):
+        logger.info(
+            "Recount: cannot align with session %s (shift=%.3f,%.3f response=%.2f)",
+            prior.session_id,
+            registration.dx,
+            registration.dy,
+            registration.response,
+        )
+        return None
+
+    stale_before = (now or datetime.now(UTC)) - timedelta(days=settings.ML_RECOUNT_MAX_AGE_DAYS)
+    scores = change_scores(prior.reference, current, prior.segments, registration)
+
+    segments: list[SegmentResult] = []
+    changed: list[bool] = []
+    for segment, score in zip(prior.segments, scores, strict=True):
+        shifted = _shift_segment(segment, registration)
+        if shifted is None:
+            return None  # Container left the frame: the layout no longer applies
+
+        stale = _detected_before(segment.detected_at, stale_before)
+        redetect = stale or score is None or score > settings.ML_RECOUNT_CHANGE_THRESHOLD
+        if redetect:
+            shifted.detected_at = None  # Detected again by this run
+        changed.append(redetect)
+        segments.append(shifted)
+
+    return RecountPlan(
+        prior=prior,
+        registration=registration,
+        segments=segments,
+        changed=changed,
+        change_scores=scores,
+    )
+
+
+def _shift_segment(segment: SegmentResult, registration: Registration) -> SegmentResult | None:
+    """Segment moved by the camera offset (None if it leaves the image)."""
+    dx, dy = registration.dx, registration.dy
+    x1, y1, x2, y2 = segment.bbox
+    bbox = (
+        min(max(x1 + dx, 0.0), 1.0),
+        min(max(y1 + dy, 0.0), 1.0),
+        min(max(x2 + dx, 0.0), 1.0),
+        min(max(y2 + dy, 0.0), 1.0),
+    )
+    if bbox[2] <= bbox[0] or bbox[3] <= bbox[1]:
+        return None
+
+    return SegmentResult(
+        container_type=segment.container_type,
+        confidence=segment.confidence,
+        bbox=bbox,
+        polygon=[
+            (min(max(x + dx, 0.0), 1.0), min(max(y + dy, 0.0), 1.0)) for x, y in segment.polygon
+        ],
+        area_pixels=segment.area_pixels,
+        detected_at=segment.detected_at,
+    )
+
+
+def _detected_before(detected_at: str | None, limit: datetime) -> bool:
+    """True if detected_at (ISO 8601, naive = UTC) is missing or before limit."""
+    if not detected_at:
+        return True
+    try:
+        timestamp = datetime.fromisoformat(detected_at)
+    except ValueError:
+        return True
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=UTC)
+    return timestamp < limit
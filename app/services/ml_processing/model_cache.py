@@ -5,10 +5,20 @@ Provides:
 - Thread-safe model loading
 - GPU/CPU device assignment
 - Memory cleanup utilities
+- Pluggable inference backends (PyTorch, ONNX Runtime, OpenVINO, TorchScript)
+
+Backends:
+    The backend is chosen per model type via settings (ML_SEGMENT_BACKEND,
+    ML_DETECT_BACKEND). Exported artifacts live next to the .pt weights in
+    ML_CHECKPOINTS_DIR and are produced offline by
+    ``python -m app.services.ml_processing.model_export``. Ultralytics'
+    AutoBackend loads every format through the same ``YOLO(path)`` API, so
+    downstream services (segmentation, SAHI) are backend-agnostic.
 """
 
 import logging
 import threading
+from pathlib import Path
 from typing import Literal
 
 try:
@@ -19,9 +29,21 @@ except ImportError:
     YOLO = None
     torch = None
 
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
 ModelType = Literal["segment", "detect"]
+Backend = Literal["torch", "onnx", "openvino", "torchscript"]
+
+# Artifact name per backend (relative to ML_CHECKPOINTS_DIR).
+# Matches the file names produced by ultralytics' exporter for "<model_type>.pt".
+BACKEND_ARTIFACTS: dict[str, str] = {
+    "torch": "{model_type}.pt",
+    "onnx": "{model_type}.onnx",
+    "openvino": "{model_type}_openvino_model",
+    "torchscript": "{model_type}.torchscript",
+}
 
 
 class ModelCache:
@@ -39,10 +61,10 @@ class ModelCache:
             worker_id: GPU worker ID (0, 1, 2, etc.)
 
         Returns:
-            Cached YOLO model instance
+            Cached YOLO model instance (PyTorch or exported backend)
 
         Raises:
-            ValueError: If model_type invalid or worker_id negative
+            ValueError: If model_type invalid, worker_id negative or backend unknown
             RuntimeError: If model loading fails
         """
         # Validation
@@ -58,35 +80,71 @@ class ModelCache:
         # Thread-safe singleton check
         with cls._lock:
             if cache_key not in cls._instances:
-                logger.info(f"Loading {model_type} model for worker {worker_id}")
-
-                # Get model path
-                seg_path, det_path = cls._get_model_paths()
-                model_path = seg_path if model_type == "segment" else det_path
+                backend = cls.get_backend(model_type)
+                logger.info(f"Loading {model_type} model for worker {worker_id} ({backend})")
 
-                # Load model
-                model = YOLO(model_path)
-
-                # Assign device
-                if torch and torch.cuda.is_available():
-                    gpu_count = torch.cuda.device_count()
-                    gpu_id = worker_id % gpu_count
-                    device = f"cuda:{gpu_id}"
-                    logger.info(f"Assigning model to {device}")
+                if backend == "torch":
+                    model = cls._load_torch_model(model_type, worker_id)
                 else:
-                    device = "cpu"
-                    logger.warning(f"GPU not available, using CPU for worker {worker_id}")
-
-                model = model.to(device)
-
-                # Optimize model
-                model.fuse()
+                    model = cls._load_exported_model(model_type, backend)
 
                 # Cache
                 cls._instances[cache_key] = model
 
             return cls._instances[cache_key]
 
+    @classmethod
+    def _load_torch_model(cls, model_type: ModelType, worker_id: int) -> "YOLO":
+        """Load .pt weights, move them to the worker's device and fuse Conv+BN."""
+        # Get model path
+        seg_path, det_path = cls._get_model_paths()
+        model_path = seg_path if model_type == "segment" else det_path
+
+        # Load model
+        model = YOLO(model_path)
+
+        # Assign device
+        if torch and torch.cuda.is_available():
+            gpu_count = torch.cuda.device_count()
+            gpu_id = worker_id % gpu_count
+            device = f"cuda:{gpu_id}"
+            logger.info(f"Assigning model to {device}")
+        else:
+            device = "cpu"
+            logger.warning(f"GPU not available, using CPU for worker {worker_id}")
+
+        model = model.to(device)
+
+        # Optimize model
+        model.fuse()
+
+        return model
+
+    @classmethod
+    def _load_exported_model(cls, model_type: ModelType, backend: str) -> "YOLO":
+        """Load an exported artifact (ONNX, OpenVINO, TorchScript).
+
+        Exported graphs are already fused (and optionally FP16/INT8 quantized)
+        at export time, so .to()/.fuse() are not applicable. Device selection
+        happens per predict() call inside ultralytics' AutoBackend.
+
+        Raises:
+            FileNotFoundError: If the artifact has not been exported yet
+        """
+        model_path = cls._get_model_path(model_type, backend)
+        if not Path(model_path).exists():
+            raise FileNotFoundError(
+                f"{backend} artifact for '{model_type}' not found at {model_path}. "
+                f"Run: python -m app.services.ml_processing.model_export "
+                f"--model-type {model_type} --backend {backend}"
+            )
+
+        # task must be explicit: exported graphs may lack ultralytics metadata
+        model = YOLO(model_path, task=model_type)
+        logger.info(f"Loaded exported {backend} model: {model_path}")
+
+        return model
+
     @classmethod
     def clear_cache(cls) -> None:
         """Clear all cached models and free GPU memory."""
@@ -97,15 +155,57 @@ class ModelCache:
                 torch.cuda.empty_cache()
                 logger.info("GPU memory cache cleared")
 
+    @staticmethod
+    def get_backend(model_type: ModelType) -> str:
+        """Get configured inference backend for a model type.
+
+        Args:
+            model_type: "segment" or "detect"
+
+        Returns:
+            Backend name ("torch", "onnx", "openvino", "torchscript")
+
+        Raises:
+            ValueError: If the configured backend is not supported
+        """
+        backend = (
+            settings.ML_SEGMENT_BACKEND if model_type == "segment" else settings.ML_DETECT_BACKEND
+        ).lower()
+
+        if backend not in BACKEND_ARTIFACTS:
+            raise ValueError(
+                f"Invalid backend '{backend}' for {model_type}. "
+                f"Must be one of {sorted(BACKEND_ARTIFACTS)}"
+            )
+
+        return backend
+
+    @staticmethod
+    def _get_model_path(model_type: ModelType, backend: str) -> str:
+        """Get artifact path for a model type and backend.
+
+        Args:
+            model_type: "segment" or "detect"
+            backend: Backend name (key of BACKEND_ARTIFACTS)
+
+        Returns:
+            Absolute path to .pt file, exported file or OpenVINO directory
+        """
+        artifact = BACKEND_ARTIFACTS[backend].format(model_type=model_type)
+        return str(Path(settings.ML_CHECKPOINTS_DIR) / artifact)
+
     @staticmethod
     def _get_model_paths() -> tuple[str, str]:
-        """Get paths to segment and detect models.
+        """Get paths to segment and detect PyTorch weights.
 
         Returns:
             (segment_path, detect_path)
 
         Note:
-            Paths should be configured via environment variables in production.
+            Directory is configured via ML_CHECKPOINTS_DIR.
             Default paths assume models are in /app/app/checkpoints/ in Docker.
         """
-        return ("/app/app/checkpoints/segment.pt", "/app/app/checkpoints/detect.pt")
+        return (
+            ModelCache._get_model_path("segment", "torch"),
+            ModelCache._get_model_path("detect", "torch"),
+        )
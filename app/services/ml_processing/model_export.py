@@ -0,0 +1,449 @@
+"""Offline export, quantization and parity check for YOLO inference backends.
+
+ModelCache can serve exported artifacts (ONNX Runtime, OpenVINO, TorchScript)
+instead of the PyTorch .pt weights. This module produces those artifacts and
+verifies that they still agree with the .pt reference model before they are
+rolled out to the CPU fleet.
+
+Workflow:
+    1. Export:   detect.pt → detect.onnx / detect_openvino_model/ / detect.torchscript
+    2. Quantize: FP16 (half) for GPU backends, INT8 for CPU backends
+                 (OpenVINO: NNCF calibration via ultralytics,
+                  ONNX: onnxruntime static QDQ quantization on sample images)
+    3. Parity:   Run .pt and exported model on a sample set, match boxes by IoU
+
+Usage:
+    python -m app.services.ml_processing.model_export \\
+        --model-type detect --backend openvino --int8 \\
+        --calibration-data /data/calib.yaml --parity-images /data/samples
+
+    Then set ML_DETECT_BACKEND=openvino and restart workers.
+
+Architecture:
+    Infrastructure tooling (not imported by the request path)
+    └── Uses: ultralytics exporter, onnxruntime (optional)
+    └── Produces: artifacts in ML_CHECKPOINTS_DIR consumed by ModelCache
+"""
+
+import argparse
+import logging
+import shutil
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+try:
+    from ultralytics import YOLO  # type: ignore[import-not-found]
+except ImportError:
+    YOLO = None
+
+from app.core.config import settings
+from app.services.ml_processing.model_cache import BACKEND_ARTIFACTS, ModelCache
+
+logger = logging.getLogger(__name__)
+
+# ultralytics export format name per backend
+EXPORT_FORMATS: dict[str, str] = {
+    "onnx": "onnx",
+    "openvino": "openvino",
+    "torchscript": "torchscript",
+}
+
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".bmp", ".webp"}
+
+
+@dataclass
+class ParityReport:
+    """Agreement between the .pt reference model and an exported backend.
+
+    Attributes:
+        backend: Exported backend that was compared
+        images_checked: Number of sample images evaluated
+        reference_boxes: Total boxes predicted by the .pt model
+        candidate_boxes: Total boxes predicted by the exported model
+        matched_boxes: Reference boxes matched by a same-class candidate (IoU ≥ threshold)
+        mean_confidence_delta: Mean |conf_pt - conf_exported| over matched boxes
+        per_image_recall: Recall per image (image name → recall)
+    """
+
+    backend: str
+    images_checked: int = 0
+    reference_boxes: int = 0
+    candidate_boxes: int = 0
+    matched_boxes: int = 0
+    mean_confidence_delta: float = 0.0
+    per_image_recall: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def recall(self) -> float:
+        """Fraction of reference boxes reproduced by the exported model."""
+        if self.reference_boxes == 0:
+            return 1.0
+        return self.matched_boxes / self.reference_boxes
+
+    @property
+    def count_ratio(self) -> float:
+        """Exported box count relative to reference (1.0 = identical counts)."""
+        if self.reference_boxes == 0:
+            return 1.0 if self.candidate_boxes == 0 else float("inf")
+        return self.candidate_boxes / self.reference_boxes
+
+    def passed(self, min_recall: float = 0.97, max_count_drift: float = 0.03) -> bool:
+        """Check parity against acceptance thresholds."""
+        return self.recall >= min_recall and abs(self.count_ratio - 1.0) <= max_count_drift
+
+
+def export_model(
+    model_type: str,
+    backend: str,
+    half: bool | None = None,
+    int8: bool | None = None,
+    imgsz: int | None = None,
+    calibration_data: str | None = None,
+    calibration_images: list[Path] | None = None,
+) -> Path:
+    """Export .pt weights to an optimized backend artifact.
+
+    The artifact is written to the canonical ModelCache location
+    (ML_CHECKPOINTS_DIR / BACKEND_ARTIFACTS[backend]).
+
+    Args:
+        model_type: "segment" or "detect"
+        backend: "onnx", "openvino" or "torchscript"
+        half: FP16 export (default: settings.ML_EXPORT_HALF)
+        int8: INT8 quantization (default: settings.ML_EXPORT_INT8)
+        imgsz: Static input size (default: settings.ML_EXPORT_IMGSZ)
+        calibration_data: Dataset YAML for OpenVINO INT8 (NNCF) calibration
+        calibration_images: Sample images for ONNX INT8 static calibration
+
+    Returns:
+        Path to exported artifact
+
+    Raises:
+        ValueError: If backend unsupported or INT8 requested without calibration data
+        RuntimeError: If ultralytics is not installed
+    """
+    if backend not in EXPORT_FORMATS:
+        raise ValueError(f"Invalid backend '{backend}'. Must be one of {sorted(EXPORT_FORMATS)}")
+
+    if YOLO is None:
+        raise RuntimeError("ultralytics is required for model export")
+
+    half = settings.ML_EXPORT_HALF if half is None else half
+    int8 = settings.ML_EXPORT_INT8 if int8 is None else int8
+    imgsz = imgsz or settings.ML_EXPORT_IMGSZ
+
+    if int8 and backend == "openvino" and not calibration_data:
+        raise ValueError("OpenVINO INT8 export requires --calibration-data (dataset YAML)")
+    if int8 and backend == "onnx" and not calibration_images:
+        raise ValueError("ONNX INT8 export requires --parity-images for calibration")
+    if int8 and backend == "torchscript":
+        raise ValueError("INT8 is not supported for TorchScript; use onnx or openvino")
+
+    source_path = ModelCache._get_model_path(model_type, "torch")  # type: ignore[arg-type]
+    target_path = Path(ModelCache._get_model_path(model_type, backend))  # type: ignore[arg-type]
+
+    logger.info(
+        f"Exporting {model_type} ({source_path}) → {backend} "
+        f"(imgsz={imgsz}, half={half}, int8={int8})"
+    )
+
+    export_kwargs: dict[str, Any] = {
+        "format": EXPORT_FORMATS[backend],
+        "imgsz": imgsz,
+        "half": half,
+        "dynamic": False,  # Static shapes enable the most graph fusions
+    }
+    if backend == "onnx":
+        export_kwargs["simplify"] = True
+    if int8 and backend == "openvino":
+        export_kwargs["int8"] = True
+        export_kwargs["data"] = calibration_data
+
+    exported = Path(YOLO(source_path).export(**export_kwargs))
+
+    # ultralytics names INT8 OpenVINO exports "<stem>_int8_openvino_model"
+    if exported.resolve() != target_path.resolve():
+        if target_path.is_dir():
+            shutil.rmtree(target_path)
+        elif target_path.exists():
+            target_path.unlink()
+        shutil.move(str(exported), str(target_path))
+
+    if backend == "onnx":
+        if int8 and calibration_images:
+            _quantize_onnx_int8(target_path, calibration_images, imgsz)
+        _optimize_onnx_graph(target_path)
+
+    logger.info(f"Export complete: {target_path}")
+    return target_path
+
+
+def _optimize_onnx_graph(model_path: Path) -> None:
+    """Apply ONNX Runtime graph optimizations offline and overwrite the model.
+
+    Only portable (BASIC) optimizations are serialized - constant folding and
+    redundant node elimination. Hardware-specific EXTENDED/ALL fusions are
+    still applied by ONNX Runtime at session creation on each worker.
+    """
+    try:
+        import onnxruntime as ort  # type: ignore[import-not-found]
+    except ImportError:
+        logger.warning("onnxruntime not installed, skipping offline graph optimization")
+        return
+
+    optimized_path = model_path.with_suffix(".opt.onnx")
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_BASIC
+    options.optimized_model_filepath = str(optimized_path)
+    ort.InferenceSession(str(model_path), options, providers=["CPUExecutionProvider"])
+
+    shutil.move(str(optimized_path), str(model_path))
+    logger.info(f"ONNX graph optimized: {model_path}")
+
+
+def _quantize_onnx_int8(model_path: Path, calibration_images: list[Path], imgsz: int) -> None:
+    """Static INT8 (QDQ) quantization of an ONNX model using sample images.
+
+    Static quantization calibrates activation ranges on real greenhouse
+    photos, which keeps detection recall close to FP32 on CPU while giving
+    the largest throughput gain of all CPU options.
+    """
+    import cv2
+    from onnxruntime.quantization import (  # type: ignore[import-not-found]
+        CalibrationDataReader,
+        QuantFormat,
+        QuantType,
+        quantize_static,
+    )
+
+    class _ImageReader(CalibrationDataReader):  # type: ignore[misc]
+        def __init__(self, input_name: str) -> None:
+            self._input_name = input_name
+            self._paths = iter(calibration_images)
+
+        def get_next(self) -> dict[str, np.ndarray] | None:
+            for path in self._paths:
+                img = cv2.imread(str(path))
+                if img is None:
+                    continue
+                return {self._input_name: _preprocess(img, imgsz)}
+            return None
+
+    import onnx  # type: ignore[import-not-found]
+
+    input_name = onnx.load(str(model_path)).graph.input[0].name
+    fp32_path = model_path.with_suffix(".fp32.onnx")
+    shutil.move(str(model_path), str(fp32_path))
+
+    try:
+        quantize_static(
+            str(fp32_path),
+            str(model_path),
+            _ImageReader(input_name),
+            quant_format=QuantFormat.QDQ,
+            activation_type=QuantType.QUInt8,
+            weight_type=QuantType.QInt8,
+            per_channel=True,
+        )
+    finally:
+        fp32_path.unlink(missing_ok=True)
+
+    logger.info(f"ONNX INT8 quantization complete ({len(calibration_images)} calibration images)")
+
+
+def _preprocess(img_bgr: np.ndarray, imgsz: int) -> np.ndarray:
+    """Letterbox BGR image to (1, 3, imgsz, imgsz) float32 RGB in [0, 1]."""
+    import cv2
+
+    h, w = img_bgr.shape[:2]
+    scale = imgsz / max(h, w)
+    resized = cv2.resize(img_bgr, (int(round(w * scale)), int(round(h * scale))))
+    canvas = np.full((imgsz, imgsz, 3), 114, dtype=np.uint8)
+    canvas[: resized.shape[0], : resized.shape[1]] = resized
+    rgb = canvas[:, :, ::-1].transpose(2, 0, 1)
+    return np.ascontiguousarray(rgb, dtype=np.float32)[None] / 255.0
+
+
+def _box_iou(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """Pairwise IoU between (N, 4) and (M, 4) xyxy boxes → (N, M)."""
+    area_a = (boxes_a[:, 2] - boxes_a[:, 0]) * (boxes_a[:, 3] - boxes_a[:, 1])
+    area_b = (boxes_b[:, 2] - boxes_b[:, 0]) * (boxes_b[:, 3] - boxes_b[:, 1])
+    lt = np.maximum(boxes_a[:, None, :2], boxes_b[None, :, :2])
+    rb = np.minimum(boxes_a[:, None, 2:], boxes_b[None, :, 2:])
+    wh = np.clip(rb - lt, 0, None)
+    inter = wh[..., 0] * wh[..., 1]
+    union = area_a[:, None] + area_b[None, :] - inter
+    return np.where(union > 0, inter / np.maximum(union, 1e-9), 0.0)
+
+
+def match_predictions(
+    ref_boxes: np.ndarray,
+    ref_cls: np.ndarray,
+    ref_conf: np.ndarray,
+    cand_boxes: np.ndarray,
+    cand_cls: np.ndarray,
+    cand_conf: np.ndarray,
+    iou_threshold: float = 0.5,
+) -> tuple[int, list[float]]:
+    """Greedily match reference boxes to candidate boxes of the same class.
+
+    Reference boxes are visited in descending confidence order; each takes
+    the best unmatched candidate with IoU ≥ iou_threshold.
+
+    Returns:
+        (matched_count, list of |conf_ref - conf_cand| for matched pairs)
+    """
+    if len(ref_boxes) == 0 or len(cand_boxes) == 0:
+        return 0, []
+
+    iou = _box_iou(ref_boxes, cand_boxes)
+    iou[ref_cls[:, None] != cand_cls[None, :]] = 0.0
+
+    taken = np.zeros(len(cand_boxes), dtype=bool)
+    conf_deltas: list[float] = []
+    for i in np.argsort(-ref_conf):
+        row = np.where(taken, 0.0, iou[i])
+        j = int(np.argmax(row))
+        if row[j] >= iou_threshold:
+            taken[j] = True
+            conf_deltas.append(abs(float(ref_conf[i]) - float(cand_conf[j])))
+
+    return len(conf_deltas), conf_deltas
+
+
+def check_parity(
+    model_type: str,
+    backend: str,
+    sample_images: list[Path],
+    conf_threshold: float = 0.25,
+    iou_threshold: float = 0.5,
+    imgsz: int | None = None,
+) -> ParityReport:
+    """Compare an exported backend against the .pt reference on sample images.
+
+    Args:
+        model_type: "segment" or "detect"
+        backend: Exported backend to verify
+        sample_images: Representative greenhouse photos / segment crops
+        conf_threshold: Confidence threshold used for both models
+        iou_threshold: IoU required to count a box as reproduced
+        imgsz: Inference size (default: settings.ML_EXPORT_IMGSZ)
+
+    Returns:
+        ParityReport with recall, count drift and confidence drift
+    """
+    if YOLO is None:
+        raise RuntimeError("ultralytics is required for parity checks")
+
+    imgsz = imgsz or settings.ML_EXPORT_IMGSZ
+    reference = YOLO(ModelCache._get_model_path(model_type, "torch"))  # type: ignore[arg-type]
+    candidate = YOLO(
+        ModelCache._get_model_path(model_type, backend),  # type: ignore[arg-type]
+        task=model_type,
+    )
+
+    report = ParityReport(backend=backend)
+    all_deltas: list[float] = []
+
+    for image_path in sample_images:
+        predict_kwargs = {"conf": conf_threshold, "imgsz": imgsz, "verbose": False}
+        ref = reference.predict(str(image_path), **predict_kwargs)[0]
+        cand = candidate.predict(str(image_path), **predict_kwargs)[0]
+
+        ref_boxes = ref.boxes.xyxy.cpu().numpy()
+        cand_boxes = cand.boxes.xyxy.cpu().numpy()
+        matched, deltas = match_predictions(
+            ref_boxes,
+            ref.boxes.cls.cpu().numpy(),
+            ref.boxes.conf.cpu().numpy(),
+            cand_boxes,
+            cand.boxes.cls.cpu().numpy(),
+            cand.boxes.conf.cpu().numpy(),
+            iou_threshold=iou_threshold,
+        )
+
+        report.images_checked += 1
+        report.reference_boxes += len(ref_boxes)
+        report.candidate_boxes += len(cand_boxes)
+        report.matched_boxes += matched
+        report.per_image_recall[image_path.name] = (
+            matched / len(ref_boxes) if len(ref_boxes) else 1.0
+        )
+        all_deltas.extend(deltas)
+
+    report.mean_confidence_delta = float(np.mean(all_deltas)) if all_deltas else 0.0
+
+    logger.info(
+        f"Parity {model_type}/{backend}: recall={report.recall:.4f}, "
+        f"count_ratio={report.count_ratio:.4f}, "
+        f"conf_delta={report.mean_confidence_delta:.4f} "
+        f"over {report.images_checked} images"
+    )
+
+    return report
+
+
+def _collect_images(directory: str | None) -> list[Path]:
+    """List image files in a directory (sorted, non-recursive)."""
+    if not directory:
+        return []
+    return sorted(p for p in Path(directory).iterdir() if p.suffix.lower() in IMAGE_SUFFIXES)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI entry point: export, optionally quantize, then verify parity."""
+    parser = argparse.ArgumentParser(description="Export YOLO models to optimized backends")
+    parser.add_argument("--model-type", choices=["segment", "detect"], required=True)
+    parser.add_argument(
+        "--backend", choices=sorted(set(BACKEND_ARTIFACTS) - {"torch"}), required=True
+    )
+    # Unset flags stay None so export_model falls back to ML_EXPORT_HALF/INT8
+    parser.add_argument(
+        "--half", action=argparse.BooleanOptionalAction, default=None, help="FP16 export"
+    )
+    parser.add_argument(
+        "--int8", action=argparse.BooleanOptionalAction, default=None, help="INT8 quantization"
+    )
+    parser.add_argument("--imgsz", type=int, default=None)
+    parser.add_argument("--calibration-data", default=None, help="Dataset YAML (OpenVINO INT8)")
+    parser.add_argument("--parity-images", default=None, help="Directory of sample images")
+    parser.add_argument("--min-recall", type=float, default=0.97)
+    parser.add_argument("--skip-export", action="store_true", help="Only run parity check")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    sample_images = _collect_images(args.parity_images)
+
+    if not args.skip_export:
+        export_model(
+            model_type=args.model_type,
+            backend=args.backend,
+            half=args.half,
+            int8=args.int8,
+            imgsz=args.imgsz,
+            calibration_data=args.calibration_data,
+            calibration_images=sample_images,
+        )
+
+    if not sample_images:
+        logger.warning("No --parity-images given, skipping parity check")
+        return 0
+
+    report = check_parity(args.model_type, args.backend, sample_images, imgsz=args.imgsz)
+    if not report.passed(min_recall=args.min_recall):
+        logger.error(
+            f"Parity check FAILED: recall={report.recall:.4f} < {args.min_recall} "
+            f"or count drift {abs(report.count_ratio - 1.0):.2%} too large"
+        )
+        return 1
+
+    logger.info("Parity check passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,6 +7,10 @@ initialization, coordinating all ML services in sequence:
 3. Estimation (band-based estimation for undetected areas)
 4. Results aggregation and database persistence
 
+With a previous session at the same location, an incremental re-count
+(incremental_recount) replaces stage 1 with the previous segment layout and
+skips stage 2 for segments that did not change.
+
 This is the CRITICAL PATH coordinator that ties together all ML components
 (ML002 + ML003 + ML005) into a complete, production-ready pipeline.
 
@@ -48,14 +52,18 @@ from app.services.ml_processing.band_estimation_service import (
     BandEstimation,
     BandEstimationService,
 )
-from app.services.ml_processing.sahi_detection_service import (
-    DetectionResult,
-    SAHIDetectionService,
+from app.services.ml_processing.detection_array import DetectionArray
+from app.services.ml_processing.incremental_recount import (
+    RecountPlan,
+    RecountPrior,
+    plan_recount,
 )
+from app.services.ml_processing.sahi_detection_service import SAHIDetectionService
 from app.services.ml_processing.segmentation_service import (
     SegmentationService,
     SegmentResult,
 )
+from app.services.ml_processing.slice_planner import SlicePlanner, expected_plant_area
 
 logger = logging.getLogger(__name__)
 
@@ -73,10 +81,12 @@ class PipelineResult:
         total_estimated: Total plants estimated across all bands
         segments_processed: Number of container segments processed
         processing_time_seconds: Total pipeline elapsed time
-        detections: List of detection dicts ready for bulk insert
+        detections: DetectionArray in full-image pixel coordinates
         estimations: List of estimation dicts ready for bulk insert
         avg_confidence: Average detection confidence (0.0-1.0)
         segments: List of SegmentResult objects (container metadata)
+        segments_reused: Segments whose detections came from the previous
+            session (incremental re-count, 0 for a full run)
     """
 
     session_id: int
@@ -84,10 +94,11 @@ class PipelineResult:
     total_estimated: int
     segments_processed: int
     processing_time_seconds: float
-    detections: list[dict[str, Any]]
+    detections: DetectionArray
     estimations: list[dict[str, Any]]
     avg_confidence: float
     segments: list[SegmentResult]
+    segments_reused: int = 0
 
 
 class MLPipelineCoordinator:
@@ -133,6 +144,7 @@ class MLPipelineCoordinator:
         segmentation_service: SegmentationService,
         sahi_service: SAHIDetectionService,
         band_estimation_service: BandEstimationService,
+        slice_planner: SlicePlanner | None = None,
     ) -> None:
         """Initialize pipeline coordinator with ML services.
 
@@ -140,6 +152,7 @@ class MLPipelineCoordinator:
             segmentation_service: Service for container segmentation (ML002)
             sahi_service: Service for SAHI tiled detection (ML003)
             band_estimation_service: Service for band-based estimation (ML005)
+            slice_planner: Adaptive SAHI slice planner (default: SlicePlanner from settings)
 
         Note:
             All services are injected via dependency injection (Clean Architecture).
@@ -148,6 +161,7 @@ class MLPipelineCoordinator:
         self.segmentation_service = segmentation_service
         self.sahi_service = sahi_service
         self.band_estimation_service = band_estimation_service
+        self.slice_planner = slice_planner or SlicePlanner()
         logger.info("MLPipelineCoordinator initialized with all ML services")
 
     async def process_complete_pipeline(
@@ -157,6 +171,8 @@ class MLPipelineCoordinator:
         worker_id: int = 0,
         conf_threshold_segment: float = 0.30,
         conf_threshold_detect: float = 0.25,
+        plant_area_profile: list[float | None] | None = None,
+        recount_prior: RecountPrior | None = None,
     ) -> PipelineResult:
         """Process complete ML pipeline for photo-based stock initialization.
 
@@ -175,6 +191,15 @@ class MLPipelineCoordinator:
             worker_id: GPU worker ID (0, 1, 2, ...) for model assignment
             conf_threshold_segment: Confidence threshold for segmentation (default 0.30)
             conf_threshold_detect: Confidence threshold for detection (default 0.25)
+            plant_area_profile: Optional per-band plant areas (pixels²) from the
+                                previous session at this location, used to plan
+                                SAHI tile size/overlap/downscale per segment and
+                                to seed band calibration where too few plants
+                                are detected
+            recount_prior: Optional previous session at this location. If the
+                           photos align, its segment layout replaces
+                           segmentation and unchanged segments keep their
+                           detections (incremental re-count)
 
         Returns:
             PipelineResult with complete counts, detections, estimations, and metadata.
@@ -209,6 +234,11 @@ class MLPipelineCoordinator:
             f"Starting ML pipeline for session {session_id}: {image_path.name} (worker {worker_id})"
         )
 
+        # Incremental re-count: align with the previous photo of this location
+        recount_plan = (
+            self._plan_recount(session_id, image_path, recount_prior) if recount_prior else None
+        )
+
         # ═══════════════════════════════════════════════════════════════════
         # STAGE 1: SEGMENTATION (20% progress)
         # ═══════════════════════════════════════════════════════════════════
@@ -216,11 +246,14 @@ class MLPipelineCoordinator:
         stage1_start = time.time()
 
         try:
-            segments = await self.segmentation_service.segment_image(
-                image_path=image_path,
-                worker_id=worker_id,
-                conf_threshold=conf_threshold_segment,
-            )
+            if recount_plan is not None:
+                segments = recount_plan.segments  # Previous layout, shifted
+            else:
+                segments = await self.segmentation_service.segment_image(
+                    image_path=image_path,
+                    worker_id=worker_id,
+                    conf_threshold=conf_threshold_segment,
+                )
             stage1_elapsed = time.time() - stage1_start
 
             logger.info(
@@ -239,7 +272,7 @@ class MLPipelineCoordinator:
                     total_estimated=0,
                     segments_processed=0,
                     processing_time_seconds=time.time() - start_time,
-                    detections=[],
+                    detections=DetectionArray.empty(),
                     estimations=[],
                     avg_confidence=0.0,
                     segments=[],
@@ -260,7 +293,7 @@ class MLPipelineCoordinator:
         )
         stage2_start = time.time()
 
-        all_detections: list[DetectionResult] = []
+        segment_detections: list[DetectionArray] = []
         segment_detection_counts: list[int] = []
 
         # Load image once to get dimensions for coordinate transformation
@@ -271,22 +304,43 @@ class MLPipelineCoordinator:
             raise RuntimeError(f"Failed to load image for coordinate transformation: {image_path}")
 
         img_height, img_width = full_img.shape[:2]
-        logger.debug(f"[Session {session_id}] Full image dimensions: {img_width}x{img_height}")
+        logger.debug("[Session %s] Full image dimensions: %dx%d", session_id, img_width, img_height)
 
         for idx, segment in enumerate(segments, start=1):
             logger.debug(
-                f"[Session {session_id}] Processing segment {idx}/{len(segments)}: "
-                f"{segment.container_type} (conf={segment.confidence:.3f})"
+                "[Session %s] Processing segment %d/%d: %s (conf=%.3f)",
+                session_id,
+                idx,
+                len(segments),
+                segment.container_type,
+                segment.confidence,
             )
 
+            if recount_plan is not None and not recount_plan.changed[idx - 1]:
+                # Unchanged since the previous session: reuse its detections
+                detections = recount_plan.reused_detections(idx - 1, img_width, img_height)
+                segment_detections.append(detections)
+                segment_detection_counts.append(len(detections))
+                continue
+
             try:
                 # Crop segment from original image
                 segment_crop_path = await self._crop_segment(image_path, segment, session_id, idx)
 
+                # Polygon mask in crop coordinates lets SAHI skip tiles outside the container
+                crop_mask = self._create_crop_mask(segment, img_width, img_height)
+
+                # Plan tile size/overlap/downscale from expected plant size in this segment
+                slice_plan = self.slice_planner.plan(
+                    expected_plant_area(plant_area_profile, segment.bbox[1], segment.bbox[3])
+                )
+
                 # Run SAHI detection on segment crop
                 detections = await self.sahi_service.detect_in_segmento(
                     image_path=segment_crop_path,
                     confidence_threshold=conf_threshold_detect,
+                    segment_mask=crop_mask,
+                    slice_plan=slice_plan,
                 )
 
                 # Transform detection coordinates from segment-relative to full-image coordinates
@@ -296,45 +350,46 @@ class MLPipelineCoordinator:
                 y1_px = int(y1 * img_height)
 
                 logger.debug(
-                    f"[Session {session_id}] Segment {idx} bbox offset: "
-                    f"x1={x1_px}px, y1={y1_px}px (from normalized {x1:.3f}, {y1:.3f})"
+                    "[Session %s] Segment %d bbox offset: x1=%dpx, y1=%dpx "
+                    "(from normalized %.3f, %.3f)",
+                    session_id,
+                    idx,
+                    x1_px,
+                    y1_px,
+                    x1,
+                    y1,
                 )
 
-                # Transform each detection's center coordinates by adding segment offset
-                for det in detections:
-                    original_x = det.center_x_px
-                    original_y = det.center_y_px
-
-                    # Add segment offset to transform from crop-relative to full-image coordinates
-                    det.center_x_px += x1_px
-                    det.center_y_px += y1_px
+                # Translate all centers from crop-relative to full-image coordinates
+                detections = detections.offset(x1_px, y1_px)
 
-                    if idx == 1 and len(detections) > 0 and det == detections[0]:
-                        # Log first detection of first segment for verification
-                        logger.debug(
-                            f"[Session {session_id}] Sample detection transformed: "
-                            f"({original_x:.1f}, {original_y:.1f}) → "
-                            f"({det.center_x_px:.1f}, {det.center_y_px:.1f})"
-                        )
-
-                all_detections.extend(detections)
+                segment_detections.append(detections)
                 segment_detection_counts.append(len(detections))
 
                 logger.debug(
-                    f"[Session {session_id}] Segment {idx}/{len(segments)}: "
-                    f"detected {len(detections)} plants"
+                    "[Session %s] Segment %d/%d: detected %d plants",
+                    session_id,
+                    idx,
+                    len(segments),
+                    len(detections),
                 )
 
             except Exception as e:
                 # WARNING state: Log error but continue processing other segments
                 logger.warning(
-                    f"[Session {session_id}] Segment {idx}/{len(segments)} "
-                    f"detection FAILED: {e}. Continuing with remaining segments...",
+                    "[Session %s] Segment %d/%d detection FAILED: %s. "
+                    "Continuing with remaining segments...",
+                    session_id,
+                    idx,
+                    len(segments),
+                    e,
                     exc_info=True,
                 )
                 segment_detection_counts.append(0)
                 continue
 
+        all_detections = DetectionArray.concat(segment_detections)
+
         stage2_elapsed = time.time() - stage2_start
         logger.info(
             f"[Session {session_id}] Stage 2/3: Detection complete - "
@@ -354,8 +409,11 @@ class MLPipelineCoordinator:
 
         for idx, segment in enumerate(segments, start=1):
             logger.debug(
-                f"[Session {session_id}] Estimating segment {idx}/{len(segments)}: "
-                f"{segment.container_type}"
+                "[Session %s] Estimating segment %d/%d: %s",
+                session_id,
+                idx,
+                len(segments),
+                segment.container_type,
             )
 
             try:
@@ -367,41 +425,36 @@ class MLPipelineCoordinator:
                 # Create segment mask from polygon
                 segment_mask = self._create_segment_mask(segment, image_path)
 
-                # Convert detections to dict format expected by band estimation
-                detections_dict = [
-                    {
-                        "center_x_px": det.center_x_px,
-                        "center_y_px": det.center_y_px,
-                        "width_px": det.width_px,
-                        "height_px": det.height_px,
-                        "confidence": det.confidence,
-                        "class_name": det.class_name,
-                    }
-                    for det in all_detections
-                ]
-
                 # Run band estimation
                 estimations = await self.band_estimation_service.estimate_undetected_plants(
                     image_path=segment_crop_path,
-                    detections=detections_dict,
+                    detections=all_detections,
                     segment_mask=segment_mask,
                     container_type=segment.container_type,
+                    prior_plant_areas=plant_area_profile,
                 )
 
                 all_estimations.extend(estimations)
 
                 total_estimated_segment = sum(e.estimated_count for e in estimations)
                 logger.debug(
-                    f"[Session {session_id}] Segment {idx}/{len(segments)}: "
-                    f"estimated {total_estimated_segment} plants across "
-                    f"{len(estimations)} bands"
+                    "[Session %s] Segment %d/%d: estimated %d plants across %d bands",
+                    session_id,
+                    idx,
+                    len(segments),
+                    total_estimated_segment,
+                    len(estimations),
                 )
 
             except Exception as e:
                 # WARNING state: Log error but continue processing other segments
                 logger.warning(
-                    f"[Session {session_id}] Segment {idx}/{len(segments)} "
-                    f"estimation FAILED: {e}. Continuing with remaining segments...",
+                    "[Session %s] Segment %d/%d estimation FAILED: %s. "
+                    "Continuing with remaining segments...",
+                    session_id,
+                    idx,
+                    len(segments),
+                    e,
                     exc_info=True,
                 )
                 continue
@@ -418,20 +471,6 @@ class MLPipelineCoordinator:
         # ═══════════════════════════════════════════════════════════════════
         logger.info(f"[Session {session_id}] Stage 4/4: Aggregating results...")
 
-        # Convert detections to dict format for DB insertion
-        detections_for_db = [
-            {
-                "session_id": session_id,
-                "center_x_px": det.center_x_px,
-                "center_y_px": det.center_y_px,
-                "width_px": det.width_px,
-                "height_px": det.height_px,
-                "confidence": det.confidence,
-                "class_name": det.class_name,
-            }
-            for det in all_detections
-        ]
-
         # Convert estimations to dict format for DB insertion
         estimations_for_db = [
             {
@@ -452,11 +491,7 @@ class MLPipelineCoordinator:
         ]
 
         # Calculate average confidence
-        avg_confidence = (
-            float(np.mean([det.confidence for det in all_detections]))
-            if all_detections and np is not None
-            else 0.0
-        )
+        avg_confidence = all_detections.mean_confidence()
 
         # Create final result
         total_elapsed = time.time() - start_time
@@ -467,15 +502,16 @@ class MLPipelineCoordinator:
             total_estimated=total_estimated,
             segments_processed=len(segments),
             processing_time_seconds=total_elapsed,
-            detections=detections_for_db,
+            detections=all_detections,
             estimations=estimations_for_db,
             avg_confidence=avg_confidence,
             segments=segments,
+            segments_reused=recount_plan.segments_reused if recount_plan else 0,
         )
 
         logger.info(
             f"[Session {session_id}] Pipeline COMPLETE in {total_elapsed:.2f}s:\n"
-            f"  - Segments: {len(segments)}\n"
+            f"  - Segments: {len(segments)} ({result.segments_reused} reused)\n"
             f"  - Detections: {len(all_detections)}\n"
             f"  - Estimations: {total_estimated}\n"
             f"  - Total plants: {len(all_detections) + total_estimated}\n"
@@ -486,6 +522,34 @@ class MLPipelineCoordinator:
 
         return result
 
+    def _plan_recount(
+        self, session_id: int, image_path: Path, prior: RecountPrior
+    ) -> RecountPlan | None:
+        """Align the photo with the previous session (None → full run, never raises).
+
+        The photo is decoded at 1/4 scale in grayscale (JPEG DCT scaling), so
+        registration costs a fraction of a full decode.
+        """
+        try:
+            import cv2  # type: ignore[import-not-found]
+
+            current = cv2.imread(str(image_path), cv2.IMREAD_REDUCED_GRAYSCALE_4)
+            plan = plan_recount(prior, current) if current is not None else None
+        except Exception as e:
+            logger.warning(
+                f"[Session {session_id}] Incremental re-count unavailable, full run: {e}",
+                exc_info=True,
+            )
+            return None
+
+        if plan is not None:
+            logger.info(
+                f"[Session {session_id}] Incremental re-count against session "
+                f"{prior.session_id}: {plan.segments_reused}/{len(plan.segments)} segments "
+                f"unchanged (shift={plan.registration.dx:+.3f},{plan.registration.dy:+.3f})"
+            )
+        return plan
+
     async def _crop_segment(
         self,
         image_path: Path,
@@ -551,6 +615,44 @@ class MLPipelineCoordinator:
             )
             raise RuntimeError(f"Segment cropping failed: {e}") from e
 
+    def _create_crop_mask(
+        self, segment: SegmentResult, img_width: int, img_height: int
+    ) -> "np.ndarray":
+        """Create binary polygon mask in segment-crop coordinates.
+
+        Matches the crop produced by _crop_segment() (same bbox rounding), so
+        the mask aligns pixel-for-pixel with the image SAHI slices.
+
+        Args:
+            segment: SegmentResult with normalized bbox and polygon
+            img_width: Full image width in pixels
+            img_height: Full image height in pixels
+
+        Returns:
+            Binary mask (0=background, 255=segment area) of crop size, dtype uint8.
+            All 255 if the polygon is degenerate.
+        """
+        import cv2
+
+        x1, y1, x2, y2 = segment.bbox
+        x1_px, y1_px = int(x1 * img_width), int(y1 * img_height)
+        x2_px, y2_px = int(x2 * img_width), int(y2 * img_height)
+
+        polygon_px = [
+            (int(x * img_width) - x1_px, int(y * img_height) - y1_px) for x, y in segment.polygon
+        ]
+
+        crop_shape = (max(0, y2_px - y1_px), max(0, x2_px - x1_px))
+
+        # Degenerate polygon: treat the whole crop as inside (never skip on mask)
+        if len(polygon_px) < 3:
+            return np.full(crop_shape, 255, dtype=np.uint8)
+
+        mask = np.zeros(crop_shape, dtype=np.uint8)
+        cv2.fillPoly(mask, [np.array(polygon_px, dtype=np.int32)], 255)
+
+        return mask
+
     def _create_segment_mask(self, segment: SegmentResult, image_path: Path) -> "np.ndarray":
         """Create binary mask from segment polygon.
 
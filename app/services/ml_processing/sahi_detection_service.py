@@ -7,7 +7,8 @@ overlapping detections.
 
 Critical Innovation:
     - 10x improvement: 100 plants → 800+ plants detected
-    - Optimal tile size: 512×512px (balance context and speed)
+    - Adaptive tile size: 512×512px at model input, scaled to the expected
+      plant size (SlicePlanner), tiles outside the container skipped (TileFilter)
     - GREEDYNMM merging: Eliminates duplicates at tile boundaries
 
 Performance:
@@ -29,25 +30,36 @@ from typing import TYPE_CHECKING, Any
 try:
     import torch  # type: ignore[import-not-found]
     from sahi import AutoDetectionModel  # type: ignore[import-not-found]
-    from sahi.predict import get_sliced_prediction  # type: ignore[import-not-found]
+    from sahi.predict import get_prediction  # type: ignore[import-not-found]
+    from sahi.slicing import get_slice_bboxes  # type: ignore[import-not-found]
 except ImportError:
     # Allow tests to run without SAHI/torch
     torch = None
     AutoDetectionModel = None
-    get_sliced_prediction = None
+    get_prediction = None
+    get_slice_bboxes = None
+
+import cv2
+import numpy as np
 
 try:
     from PIL import Image  # type: ignore[import-not-found]
 except ImportError:
     Image = None
 
+from app.core.config import settings
+from app.core.metrics import record_sahi_tiles
+from app.services.ml_processing.box_merge import MergeResult, greedy_nmm, nms
+from app.services.ml_processing.detection_array import DetectionArray
 from app.services.ml_processing.model_cache import ModelCache
+from app.services.ml_processing.slice_planner import SlicePlan
+from app.services.ml_processing.tile_filter import TileFilter
 
 if TYPE_CHECKING:
-    from sahi.prediction import PredictionResult  # type: ignore[import-not-found]
+    from numpy.typing import NDArray  # type: ignore[import-not-found]
     from ultralytics.engine.results import Results  # type: ignore[import-not-found]
 else:
-    PredictionResult = Any
+    NDArray = Any
     Results = Any
 
 logger = logging.getLogger(__name__)
@@ -98,7 +110,9 @@ class SAHIDetectionService:
     """SAHI tiled detection service for large segmento images.
 
     Uses SAHI (Slicing Aided Hyper Inference) library to:
-    1. Slice large segmento images into 512×512 tiles with 25% overlap
+    1. Slice large segmento images into tiles (SlicePlan: tile size, overlap
+       and downscale adapted to the expected plant size; 512×512 with 25%
+       overlap without history)
     2. Run YOLO detection on each tile
     3. Intelligently merge results with GREEDYNMM algorithm
     4. Return detections in original image coordinates (no offset needed)
@@ -109,7 +123,8 @@ class SAHIDetectionService:
         SAHI solves both: optimal tile size + intelligent merging.
 
     Performance Optimization:
-        - Black tile filtering: Skip ~20% of background-only tiles
+        - Tile pre-filter: Skip tiles outside the segment polygon or without
+          plausible vegetation before inference (see TileFilter)
         - GREEDYNMM: Better than NMS for overlapping objects
         - Model caching: Reuse pre-loaded YOLO models
 
@@ -123,15 +138,16 @@ class SAHIDetectionService:
         ...     "segmento_crop_001.jpg",
         ...     confidence_threshold=0.25
         ... )
-        >>> # Returns list of 800+ DetectionResult objects
+        >>> # Returns DetectionArray with 800+ detections
     """
 
-    def __init__(self, worker_id: int = 0) -> None:
+    def __init__(self, worker_id: int = 0, tile_filter: TileFilter | None = None) -> None:
         """Initialize SAHI detection service with lazy model loading.
 
         Args:
             worker_id: GPU worker ID for model assignment (0, 1, 2, ...)
                       Used for multi-GPU scaling.
+            tile_filter: Optional tile pre-filter (default: TileFilter from settings)
 
         Note:
             The model is NOT loaded here. It's loaded on first detect_in_segmento()
@@ -139,6 +155,7 @@ class SAHIDetectionService:
         """
         self._worker_id = worker_id
         self._model: Any = None  # Lazy load via ModelCache
+        self._tile_filter = tile_filter or TileFilter()
 
     async def detect_in_segmento(
         self,
@@ -147,11 +164,15 @@ class SAHIDetectionService:
         slice_height: int = 512,
         slice_width: int = 512,
         overlap_ratio: float = 0.25,
-    ) -> list[DetectionResult]:
+        segment_mask: "NDArray[np.uint8] | None" = None,
+        slice_plan: SlicePlan | None = None,
+    ) -> DetectionArray:
         """Detect plants in large segmento using SAHI tiling.
 
         Runs SAHI sliced prediction on segmento crop image. SAHI:
-        1. Slices image into tiles (default 512×512 with 25% overlap)
+        1. Slices image into tiles (slice_plan if given, otherwise
+           slice_height×slice_width with overlap_ratio), skipping tiles
+           rejected by the TileFilter
         2. Runs YOLO detection on each tile
         3. Merges overlapping detections with GREEDYNMM
         4. Returns results in original image coordinates
@@ -163,11 +184,16 @@ class SAHIDetectionService:
             slice_width: Tile width in pixels. Default 512.
             overlap_ratio: Overlap percentage (0.0-1.0). Default 0.25 (25%).
                           Used for both height and width overlap.
+            segment_mask: Optional container polygon mask (H, W) in crop
+                          coordinates (255=inside). Tiles outside it are skipped.
+            slice_plan: Optional adaptive plan (see SlicePlanner). Overrides
+                        slice_height/slice_width/overlap_ratio and downscales
+                        the crop by plan.scale before slicing.
 
         Returns:
-            List of DetectionResult objects in original image coordinates.
-            Sorted by confidence descending.
-            Empty list if no plants detected above confidence_threshold.
+            DetectionArray in original image coordinates, sorted by
+            confidence descending. Empty if no plants detected above
+            confidence_threshold.
 
         Raises:
             FileNotFoundError: If image_path doesn't exist.
@@ -208,11 +234,22 @@ class SAHIDetectionService:
                 f"Invalid image dimensions: {img_width}×{img_height}. Image may be corrupted."
             )
 
+        scale = 1.0
+        min_width, min_height = slice_width, slice_height
+        if slice_plan is not None:
+            slice_height = slice_width = slice_plan.slice_size
+            overlap_ratio = slice_plan.overlap_ratio
+            scale = slice_plan.scale
+            # Crops smaller than an enlarged tile are still sliced (one clamped
+            # tile) so the downscale, tile filter and mask apply. Only crops
+            # below the model tile size skip tiling.
+            min_width = min_height = slice_plan.model_slice_size
+
         # Handle small images (direct detection without tiling)
-        if img_width < slice_width or img_height < slice_height:
+        if img_width < min_width or img_height < min_height:
             logger.warning(
                 f"Image {image_path.name} too small ({img_width}×{img_height}) "
-                f"for tiling (requires ≥{slice_width}×{slice_height}). "
+                f"for tiling (requires ≥{min_width}×{min_height}). "
                 f"Using direct detection fallback."
             )
             return await self._direct_detection_fallback(image_path, confidence_threshold)
@@ -228,7 +265,7 @@ class SAHIDetectionService:
         # Determine device
         if torch and torch.cuda.is_available():
             device = f"cuda:{self._worker_id}"
-            logger.debug(f"Using GPU device: {device}")
+            logger.debug("Using GPU device: %s", device)
         else:
             device = "cpu"
             logger.debug("Using CPU device (GPU not available)")
@@ -248,33 +285,36 @@ class SAHIDetectionService:
         start_time = time.time()
 
         try:
-            if get_sliced_prediction is None:
+            if get_prediction is None or get_slice_bboxes is None:
                 raise RuntimeError("SAHI library is required for sliced prediction")
 
-            result = get_sliced_prediction(
-                str(image_path),
+            merged, class_names = self._sliced_prediction(
+                image_path,
                 detector,
                 slice_height=slice_height,
                 slice_width=slice_width,
-                overlap_height_ratio=overlap_ratio,
-                overlap_width_ratio=overlap_ratio,
-                postprocess_type="GREEDYNMM",  # Intelligent merging
-                postprocess_match_threshold=0.5,  # IOS threshold for merging
-                auto_slice_resolution=False,  # Use fixed tile size
-                perform_standard_pred=False,  # Only tiled, no full-image prediction
-                postprocess_class_agnostic=False,  # Class-aware merging
-                verbose=0,  # Suppress SAHI console output
+                overlap_ratio=overlap_ratio,
+                segment_mask=segment_mask,
+                scale=scale,
             )
 
             elapsed = time.time() - start_time
 
-            # Convert SAHI results to DetectionResult objects
-            detections = self._parse_sahi_results(result)
+            # Convert merged boxes to a DetectionArray (no per-box objects)
+            detections = self._parse_merge_result(merged, class_names, scale=scale)
 
             logger.info(
-                f"SAHI detected {len(detections)} plants in {image_path.name} "
-                f"({img_width}×{img_height}px) in {elapsed:.2f}s "
-                f"(conf≥{confidence_threshold})"
+                "SAHI detected %d plants in %s (%d×%dpx, tile=%dpx, overlap=%.2f, "
+                "scale=%.2f) in %.2fs (conf≥%s)",
+                len(detections),
+                image_path.name,
+                img_width,
+                img_height,
+                slice_width,
+                overlap_ratio,
+                scale,
+                elapsed,
+                confidence_threshold,
             )
 
             return detections
@@ -283,52 +323,151 @@ class SAHIDetectionService:
             logger.error(f"SAHI detection failed for {image_path.name}: {e}", exc_info=True)
             raise RuntimeError(f"SAHI detection failed: {e}") from e
 
-    def _parse_sahi_results(self, sahi_result: "PredictionResult") -> list[DetectionResult]:
-        """Parse SAHI prediction results into DetectionResult objects.
-
-        Extracts bounding boxes, confidence scores, and class labels from
-        SAHI PredictionResult. Converts to absolute pixel coordinates in
-        original image space.
+    def _sliced_prediction(
+        self,
+        image_path: Path,
+        detector: Any,
+        slice_height: int,
+        slice_width: int,
+        overlap_ratio: float,
+        segment_mask: "NDArray[np.uint8] | None" = None,
+        scale: float = 1.0,
+    ) -> tuple[MergeResult, dict[int, str]]:
+        """SAHI sliced prediction with tile pre-filter and optional downscale.
+
+        Same slicing and per-tile inference as get_sliced_prediction(), but
+        every tile is scored by the TileFilter first and only plausible tiles
+        reach the detector. The image is decoded once and tiles are numpy
+        views (no per-tile PIL crops). Tile predictions are merged with the
+        vectorized grid GREEDYNMM/NMS from box_merge instead of SAHI's
+        pairwise Python postprocess.
 
         Args:
-            sahi_result: SAHI PredictionResult object from get_sliced_prediction()
+            image_path: Path to segmento crop image
+            detector: SAHI AutoDetectionModel wrapping the cached YOLO model
+            slice_height: Tile height in original pixels
+            slice_width: Tile width in original pixels
+            overlap_ratio: Overlap ratio for both axes
+            segment_mask: Optional container polygon mask in crop coordinates
+            scale: Downscale factor applied before slicing (1.0 = full resolution)
 
         Returns:
-            List of DetectionResult objects in original image coordinates.
-            Sorted by confidence descending.
+            (MergeResult in (scaled) crop coordinates, {class_id: class_name}).
+            Callers divide by scale to get original crop pixels.
+
+        Raises:
+            ValueError: If the image cannot be decoded
         """
-        detections: list[DetectionResult] = []
-
-        # Extract detections from SAHI result
-        for obj_pred in sahi_result.object_prediction_list:
-            bbox = obj_pred.bbox
-
-            # SAHI bbox format: BoundingBox with minx, miny, maxx, maxy (absolute pixels)
-            # Calculate center coordinates
-            center_x = bbox.minx + (bbox.maxx - bbox.minx) / 2
-            center_y = bbox.miny + (bbox.maxy - bbox.miny) / 2
-            width = bbox.maxx - bbox.minx
-            height = bbox.maxy - bbox.miny
-
-            # Extract confidence and class
-            confidence = float(obj_pred.score.value)
-            class_name = str(obj_pred.category.name)
-
-            detections.append(
-                DetectionResult(
-                    center_x_px=float(center_x),
-                    center_y_px=float(center_y),
-                    width_px=float(width),
-                    height_px=float(height),
-                    confidence=confidence,
-                    class_name=class_name,
+        image_bgr = cv2.imread(str(image_path), cv2.IMREAD_COLOR)
+        if image_bgr is None:
+            raise ValueError(f"Failed to decode image: {image_path}")
+
+        if scale < 1.0:
+            scaled_size = (
+                max(1, round(image_bgr.shape[1] * scale)),
+                max(1, round(image_bgr.shape[0] * scale)),
+            )
+            image_bgr = cv2.resize(image_bgr, scaled_size, interpolation=cv2.INTER_AREA)
+            if segment_mask is not None:
+                segment_mask = cv2.resize(
+                    segment_mask, scaled_size, interpolation=cv2.INTER_NEAREST
                 )
+            slice_height = max(1, round(slice_height * scale))
+            slice_width = max(1, round(slice_width * scale))
+
+        img_height, img_width = image_bgr.shape[:2]
+
+        slice_bboxes = get_slice_bboxes(
+            image_height=img_height,
+            image_width=img_width,
+            slice_height=slice_height,
+            slice_width=slice_width,
+            auto_slice_resolution=False,
+            overlap_height_ratio=overlap_ratio,
+            overlap_width_ratio=overlap_ratio,
+        )
+
+        keep, stats = self._tile_filter.select_tiles(image_bgr, slice_bboxes, segment_mask)
+        record_sahi_tiles(stats.processed, stats.skipped_mask, stats.skipped_background)
+
+        logger.debug(
+            "Tile filter for %s: %d/%d tiles kept (skipped: %d outside mask, %d background)",
+            image_path.name,
+            stats.processed,
+            stats.total,
+            stats.skipped_mask,
+            stats.skipped_background,
+        )
+
+        # SAHI's ultralytics wrapper expects RGB input
+        image_rgb = cv2.cvtColor(image_bgr, cv2.COLOR_BGR2RGB)
+
+        boxes: list[list[float]] = []
+        scores: list[float] = []
+        class_ids: list[int] = []
+        class_names: dict[int, str] = {}
+
+        for (x_min, y_min, x_max, y_max), process in zip(slice_bboxes, keep, strict=True):
+            if not process:
+                continue
+
+            prediction = get_prediction(
+                image_rgb[y_min:y_max, x_min:x_max],
+                detector,
+                shift_amount=[x_min, y_min],
+                full_shape=[img_height, img_width],
+                verbose=0,
             )
+            for obj_pred in prediction.object_prediction_list:
+                shifted = obj_pred.get_shifted_object_prediction()
+                boxes.append(shifted.bbox.to_xyxy())
+                scores.append(float(shifted.score.value))
+                class_ids.append(int(shifted.category.id))
+                class_names[int(shifted.category.id)] = str(shifted.category.name)
+
+        # Same settings as the former get_sliced_prediction() call:
+        # GREEDYNMM, IOS ≥ 0.5, class-aware
+        merge = nms if settings.SAHI_POSTPROCESS_TYPE.upper() == "NMS" else greedy_nmm
+        merged = merge(
+            np.asarray(boxes, dtype=np.float64).reshape(-1, 4),
+            np.asarray(scores, dtype=np.float64),
+            np.asarray(class_ids, dtype=np.int64),
+            match_threshold=settings.SAHI_POSTPROCESS_MATCH_THRESHOLD,
+            match_metric="IOS",
+            class_agnostic=False,
+        )
 
-        # Sort by confidence descending
-        detections.sort(key=lambda d: d.confidence, reverse=True)
+        logger.debug(
+            "Merged %d tile predictions into %d detections (%s)",
+            len(boxes),
+            len(merged),
+            settings.SAHI_POSTPROCESS_TYPE,
+        )
 
-        logger.debug(f"Parsed {len(detections)} detections from SAHI results")
+        return merged, class_names
+
+    def _parse_merge_result(
+        self,
+        merged: MergeResult,
+        class_names: dict[int, str],
+        scale: float = 1.0,
+    ) -> DetectionArray:
+        """Convert merged box arrays into a DetectionArray.
+
+        Args:
+            merged: MergeResult in (scaled) image coordinates, score-descending
+            class_names: Mapping from class ID to YOLO class name
+            scale: Downscale factor the predictions were made at; coordinates
+                   are divided by it to return original image pixels
+
+        Returns:
+            DetectionArray, sorted by confidence descending.
+        """
+        detections = DetectionArray.from_xyxy(
+            merged.boxes / scale, merged.scores, merged.class_ids, class_names
+        )
+
+        logger.debug("Parsed %d detections from merged SAHI results", len(detections))
 
         return detections
 
@@ -336,7 +475,7 @@ class SAHIDetectionService:
         self,
         image_path: Path,
         confidence_threshold: float,
-    ) -> list[DetectionResult]:
+    ) -> DetectionArray:
         """Fallback to direct YOLO detection for small images.
 
         Used when image is smaller than tile size (no tiling needed).
@@ -347,7 +486,7 @@ class SAHIDetectionService:
             confidence_threshold: Minimum confidence score (0.0-1.0)
 
         Returns:
-            List of DetectionResult objects from direct YOLO detection.
+            DetectionArray from direct YOLO detection.
 
         Raises:
             RuntimeError: If YOLO detection fails.
@@ -379,8 +518,8 @@ class SAHIDetectionService:
             logger.error(f"Direct detection failed for {image_path.name}: {e}", exc_info=True)
             raise RuntimeError(f"Direct detection failed: {e}") from e
 
-    def _parse_yolo_results(self, result: "Results") -> list[DetectionResult]:
-        """Parse YOLO Results object into DetectionResult objects.
+    def _parse_yolo_results(self, result: "Results") -> DetectionArray:
+        """Parse YOLO Results object into a DetectionArray.
 
         Extracts bounding boxes, confidence scores, and class labels from
         standard YOLO detection results.
@@ -389,49 +528,20 @@ class SAHIDetectionService:
             result: YOLO Results object from model.predict()
 
         Returns:
-            List of DetectionResult objects, sorted by confidence descending.
+            DetectionArray, sorted by confidence descending.
         """
-        detections: list[DetectionResult] = []
-
         # Check if any detections found
         if result.boxes is None or len(result.boxes) == 0:
             logger.debug("No plants detected in image (direct detection)")
-            return detections
-
-        # Extract detections
-        for box, cls, conf in zip(
-            result.boxes.xyxy,  # Absolute pixel coordinates (x1, y1, x2, y2)
-            result.boxes.cls,  # Class IDs
-            result.boxes.conf,  # Confidence scores
-            strict=False,
-        ):
-            # Extract bbox coordinates
-            x1, y1, x2, y2 = (float(coord) for coord in box.tolist())
-
-            # Calculate center and dimensions
-            center_x = (x1 + x2) / 2
-            center_y = (y1 + y2) / 2
-            width = x2 - x1
-            height = y2 - y1
-
-            # Get class name
-            class_id = int(cls.item())
-            class_name = result.names[class_id]
-
-            detections.append(
-                DetectionResult(
-                    center_x_px=center_x,
-                    center_y_px=center_y,
-                    width_px=width,
-                    height_px=height,
-                    confidence=float(conf.item()),
-                    class_name=class_name,
-                )
-            )
+            return DetectionArray.empty()
 
-        # Sort by confidence descending
-        detections.sort(key=lambda d: d.confidence, reverse=True)
+        detections = DetectionArray.from_xyxy(
+            result.boxes.xyxy.cpu().numpy(),  # Absolute pixel coordinates (x1, y1, x2, y2)
+            result.boxes.conf.cpu().numpy(),  # Confidence scores
+            result.boxes.cls.cpu().numpy(),  # Class IDs
+            dict(result.names),
+        ).sort_by_confidence()
 
-        logger.debug(f"Parsed {len(detections)} detections from YOLO results")
+        logger.debug("Parsed %d detections from YOLO results", len(detections))
 
         return detections
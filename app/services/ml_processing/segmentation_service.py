@@ -52,6 +52,9 @@ class SegmentResult:
         polygon: List of normalized (x, y) polygon vertices in 0-1 range
         mask: Optional binary mask array (H, W) in original image resolution
         area_pixels: Approximate area in pixels (calculated from bbox)
+        detected_at: ISO 8601 time the segment's plants were last detected,
+            set on segments whose detections an incremental re-count reuses
+            (None = detected by this run)
     """
 
     container_type: str
@@ -60,6 +63,7 @@ class SegmentResult:
     polygon: list[tuple[float, float]]
     mask: "np.ndarray | None" = None
     area_pixels: int = 0
+    detected_at: str | None = None
 
     def __post_init__(self) -> None:
         """Validate fields after initialization."""
@@ -201,7 +205,10 @@ class SegmentationService:
         # Run YOLO inference
         try:
             logger.debug(
-                f"Running segmentation on {image_path.name} (conf≥{conf_threshold}, imgsz={imgsz})"
+                "Running segmentation on %s (conf≥%s, imgsz=%s)",
+                image_path.name,
+                conf_threshold,
+                imgsz,
             )
 
             results = self._model.predict(
@@ -0,0 +1,199 @@
+"""Resolution-adaptive slice planner for SAHI detection.
+
+Picks tile size, overlap and downscaling per segment from the expected plant
+size instead of always slicing at 512×512 / 25% overlap.
+
+Rationale:
+    The detector is most accurate when plants span roughly
+    SAHI_TARGET_OBJECT_PX pixels at model input. Close-up benches produce
+    plants 3-4x larger than that, so they can be downscaled before slicing:
+    each model-sized tile then covers a larger area of the photo and the
+    tile count drops quadratically. Far/small plants keep full resolution
+    (the planner never upscales).
+
+    Overlap only needs to be large enough for any plant to fit entirely
+    inside at least one tile, so it is derived from the plant diameter
+    rather than fixed at 25%.
+
+Expected plant size:
+    Comes from a per-band plant area profile (same horizontal bands as
+    BandEstimationService) built from the previous session at the same
+    storage location. A segment uses the smallest plant area among the
+    bands it spans, so perspective never costs recall on far plants.
+
+Architecture:
+    ML Service Layer (Application Layer)
+    └── Used by: MLPipelineCoordinator, SAHIDetectionService
+"""
+
+import logging
+import math
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SlicePlan:
+    """Slicing parameters for one segment.
+
+    Attributes:
+        slice_size: Tile side length in original (crop) pixels
+        overlap_ratio: Overlap ratio for both axes (0.0-1.0)
+        scale: Downscale factor applied before slicing (0.0-1.0, 1.0 = full res)
+    """
+
+    slice_size: int = 512
+    overlap_ratio: float = 0.25
+    scale: float = 1.0
+
+    def __post_init__(self) -> None:
+        """Validate plan fields after initialization."""
+        if self.slice_size <= 0:
+            raise ValueError(f"slice_size must be positive, got {self.slice_size}")
+
+        if not 0.0 <= self.overlap_ratio < 1.0:
+            raise ValueError(f"overlap_ratio must be in [0.0, 1.0), got {self.overlap_ratio}")
+
+        if not 0.0 < self.scale <= 1.0:
+            raise ValueError(f"scale must be in (0.0, 1.0], got {self.scale}")
+
+    @property
+    def model_slice_size(self) -> int:
+        """Tile side length at model input (after downscaling)."""
+        return max(1, round(self.slice_size * self.scale))
+
+
+class SlicePlanner:
+    """Derive SlicePlan from expected plant area.
+
+    Example:
+        >>> planner = SlicePlanner()
+        >>> planner.plan(expected_plant_area_px=150 * 150)
+        SlicePlan(slice_size=1600, overlap_ratio=0.1125, scale=0.32)
+        >>> planner.plan(expected_plant_area_px=None)  # No history
+        SlicePlan(slice_size=512, overlap_ratio=0.25, scale=1.0)
+    """
+
+    def __init__(
+        self,
+        enabled: bool | None = None,
+        base_slice_px: int | None = None,
+        target_object_px: float | None = None,
+        min_scale: float | None = None,
+        min_overlap: float | None = None,
+        max_overlap: float | None = None,
+    ) -> None:
+        """Initialize planner (defaults come from settings).
+
+        Args:
+            enabled: Master switch (SAHI_ADAPTIVE_TILING_ENABLED)
+            base_slice_px: Tile size at model input (SAHI_BASE_SLICE_PX)
+            target_object_px: Desired plant diameter at model input (SAHI_TARGET_OBJECT_PX)
+            min_scale: Strongest allowed downscale (SAHI_MIN_SCALE)
+            min_overlap: Lower overlap bound (SAHI_MIN_OVERLAP)
+            max_overlap: Upper overlap bound (SAHI_MAX_OVERLAP)
+        """
+        self.enabled = settings.SAHI_ADAPTIVE_TILING_ENABLED if enabled is None else enabled
+        self.base_slice_px = base_slice_px or settings.SAHI_BASE_SLICE_PX
+        self.target_object_px = target_object_px or settings.SAHI_TARGET_OBJECT_PX
+        self.min_scale = min_scale or settings.SAHI_MIN_SCALE
+        self.min_overlap = settings.SAHI_MIN_OVERLAP if min_overlap is None else min_overlap
+        self.max_overlap = settings.SAHI_MAX_OVERLAP if max_overlap is None else max_overlap
+
+    def plan(self, expected_plant_area_px: float | None) -> SlicePlan:
+        """Plan slicing for a segment.
+
+        Args:
+            expected_plant_area_px: Expected plant bbox area in original pixels²,
+                                    or None if unknown (falls back to 512/25%)
+
+        Returns:
+            SlicePlan for the segment
+        """
+        if not self.enabled or not expected_plant_area_px or expected_plant_area_px <= 0:
+            return SlicePlan(slice_size=self.base_slice_px, overlap_ratio=0.25, scale=1.0)
+
+        diameter = math.sqrt(expected_plant_area_px)
+
+        # Never upscale: small plants stay at full resolution
+        scale = float(np.clip(self.target_object_px / diameter, self.min_scale, 1.0))
+        slice_size = round(self.base_slice_px / scale)
+
+        # Overlap must fit one plant (+20% margin) so boundary plants are whole in some tile
+        overlap = float(np.clip(1.2 * diameter / slice_size, self.min_overlap, self.max_overlap))
+
+        return SlicePlan(slice_size=slice_size, overlap_ratio=overlap, scale=round(scale, 4))
+
+
+def plant_area_profile(
+    detections: Iterable[tuple[float, float, float]],
+    image_height: int,
+    num_bands: int = 4,
+    min_samples: int = 10,
+) -> list[float | None]:
+    """Build per-band median plant area from a previous session's detections.
+
+    Uses the same equal-height horizontal bands as BandEstimationService.
+    Median is used instead of mean so no IQR pass is needed.
+
+    Args:
+        detections: (center_y_px, width_px, height_px) per detection
+        image_height: Full image height in pixels
+        num_bands: Number of horizontal bands (default 4)
+        min_samples: Minimum detections for a band to be calibrated
+
+    Returns:
+        List of num_bands areas (pixels²), None for uncalibrated bands
+    """
+    if image_height <= 0:
+        return [None] * num_bands
+
+    rows = np.asarray(list(detections), dtype=np.float64).reshape(-1, 3)
+    if rows.size == 0:
+        return [None] * num_bands
+
+    band_height = image_height / num_bands
+    band_idx = np.clip((rows[:, 0] // band_height).astype(np.int64), 0, num_bands - 1)
+    areas = rows[:, 1] * rows[:, 2]
+
+    profile: list[float | None] = []
+    for band in range(num_bands):
+        band_areas = areas[band_idx == band]
+        profile.append(float(np.median(band_areas)) if band_areas.size >= min_samples else None)
+
+    return profile
+
+
+def expected_plant_area(
+    profile: Sequence[float | None] | None,
+    y_start: float,
+    y_end: float,
+) -> float | None:
+    """Expected plant area for a segment spanning [y_start, y_end] (normalized).
+
+    Takes the smallest calibrated area among the bands the segment overlaps,
+    so the most distant (smallest) plants drive the resolution.
+
+    Args:
+        profile: Output of plant_area_profile(), or None
+        y_start: Segment top in normalized image coordinates (0.0-1.0)
+        y_end: Segment bottom in normalized image coordinates (0.0-1.0)
+
+    Returns:
+        Plant area in pixels², or None if no overlapping band is calibrated
+    """
+    if not profile:
+        return None
+
+    num_bands = len(profile)
+    first = min(num_bands - 1, max(0, int(y_start * num_bands)))
+    last = min(num_bands - 1, max(first, math.ceil(y_end * num_bands) - 1))
+
+    areas = [a for a in profile[first : last + 1] if a is not None]
+    return min(areas) if areas else None
@@ -0,0 +1,208 @@
+"""Tile pre-filter for SAHI sliced detection.
+
+Scores every SAHI tile before inference and skips tiles that cannot contain
+plants, so the detector only runs where vegetation is plausible.
+
+Two cheap signals are combined:
+    1. Segment polygon coverage: fraction of the tile inside the container
+       polygon. Tiles inside the segment bbox but outside its polygon are
+       pure background (floor, aisle, neighbouring benches).
+    2. Vegetation ratio: fraction of plausible-vegetation pixels on a
+       downsampled copy of the tile, using the Excess Green index
+       (ExG = 2g - r - b on chromatic coordinates) plus the HSV dark-soil
+       rule from BandEstimationService._suppress_floor.
+
+Both signals are evaluated for all tiles at once through summed-area tables
+(integral images) on the downsampled maps, so scoring a segment costs one
+resize plus O(1) per tile.
+
+Architecture:
+    ML Service Layer (Application Layer)
+    └── Used by: SAHIDetectionService
+    └── Uses: OpenCV, NumPy (Infrastructure)
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import cv2
+import numpy as np
+
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray  # type: ignore[import-not-found]
+else:
+    NDArray = Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TileFilterStats:
+    """Tile accounting for one sliced detection run.
+
+    Attributes:
+        total: Number of tiles planned by the slicer
+        processed: Tiles sent to the detector
+        skipped_mask: Tiles skipped for lying outside the segment polygon
+        skipped_background: Tiles skipped for having no plausible vegetation
+    """
+
+    total: int = 0
+    processed: int = 0
+    skipped_mask: int = 0
+    skipped_background: int = 0
+
+    @property
+    def skipped(self) -> int:
+        """Total number of skipped tiles."""
+        return self.skipped_mask + self.skipped_background
+
+
+class TileFilter:
+    """Cheap per-tile vegetation pre-filter.
+
+    Thresholds are intentionally permissive: a tile is only skipped when it
+    is (almost) entirely outside the segment polygon or (almost) free of
+    green/non-soil pixels. False skips cost recall; false keeps only cost
+    one inference call.
+
+    Thread Safety:
+        Stateless apart from configuration. Safe to share across threads.
+
+    Example:
+        >>> tile_filter = TileFilter()
+        >>> keep, stats = tile_filter.select_tiles(image_bgr, slice_bboxes, segment_mask)
+        >>> kept_bboxes = [b for b, k in zip(slice_bboxes, keep) if k]
+    """
+
+    def __init__(
+        self,
+        enabled: bool | None = None,
+        min_mask_coverage: float | None = None,
+        min_vegetation_ratio: float | None = None,
+        exg_threshold: float | None = None,
+        downscale: int | None = None,
+    ) -> None:
+        """Initialize tile filter (defaults come from settings).
+
+        Args:
+            enabled: Master switch (SAHI_TILE_FILTER_ENABLED)
+            min_mask_coverage: Minimum fraction of tile inside the segment
+                               polygon (SAHI_TILE_MIN_MASK_COVERAGE)
+            min_vegetation_ratio: Minimum fraction of vegetation pixels
+                                  (SAHI_TILE_MIN_VEGETATION_RATIO)
+            exg_threshold: Excess Green threshold on chromatic coordinates
+                           (SAHI_TILE_EXG_THRESHOLD)
+            downscale: Downsampling factor for scoring maps (SAHI_TILE_FILTER_DOWNSCALE)
+        """
+        self.enabled = settings.SAHI_TILE_FILTER_ENABLED if enabled is None else enabled
+        self.min_mask_coverage = (
+            settings.SAHI_TILE_MIN_MASK_COVERAGE if min_mask_coverage is None else min_mask_coverage
+        )
+        self.min_vegetation_ratio = (
+            settings.SAHI_TILE_MIN_VEGETATION_RATIO
+            if min_vegetation_ratio is None
+            else min_vegetation_ratio
+        )
+        self.exg_threshold = (
+            settings.SAHI_TILE_EXG_THRESHOLD if exg_threshold is None else exg_threshold
+        )
+        self.downscale = max(1, downscale or settings.SAHI_TILE_FILTER_DOWNSCALE)
+
+    def select_tiles(
+        self,
+        image_bgr: "NDArray[np.uint8]",
+        slice_bboxes: list[list[int]],
+        segment_mask: "NDArray[np.uint8] | None" = None,
+    ) -> tuple["NDArray[np.bool_]", TileFilterStats]:
+        """Decide which tiles to send to the detector.
+
+        Args:
+            image_bgr: Segment crop (H, W, 3) BGR uint8
+            slice_bboxes: SAHI slice boxes [xmin, ymin, xmax, ymax] in crop pixels
+            segment_mask: Optional polygon mask (H, W) of the crop, 255=inside
+
+        Returns:
+            (keep mask of shape (num_tiles,), TileFilterStats)
+        """
+        num_tiles = len(slice_bboxes)
+        stats = TileFilterStats(total=num_tiles)
+
+        if not self.enabled or num_tiles == 0:
+            stats.processed = num_tiles
+            return np.ones(num_tiles, dtype=bool), stats
+
+        boxes = np.asarray(slice_bboxes, dtype=np.int64)
+        keep = np.ones(num_tiles, dtype=bool)
+
+        if segment_mask is not None:
+            mask_small = self._downsample(np.where(segment_mask > 0, 255, 0).astype(np.uint8)) > 127
+            coverage = self._tile_fractions(mask_small, boxes)
+            outside = coverage < self.min_mask_coverage
+            keep &= ~outside
+            stats.skipped_mask = int(outside.sum())
+
+        vegetation = self._tile_fractions(self._vegetation_map(image_bgr), boxes)
+        background = keep & (vegetation < self.min_vegetation_ratio)
+        keep &= ~background
+        stats.skipped_background = int(background.sum())
+        stats.processed = int(keep.sum())
+
+        return keep, stats
+
+    def _vegetation_map(self, image_bgr: "NDArray[np.uint8]") -> "NDArray[np.bool_]":
+        """Boolean map of plausible vegetation pixels on the downsampled image."""
+        small = self._downsample(image_bgr)
+
+        bgr = small.astype(np.float32)
+        total = bgr.sum(axis=2) + 1e-6
+        b, g, r = bgr[..., 0] / total, bgr[..., 1] / total, bgr[..., 2] / total
+        exg = 2.0 * g - r - b
+
+        # Same dark-soil rule as BandEstimationService._suppress_floor
+        hsv = cv2.cvtColor(small, cv2.COLOR_BGR2HSV)
+        soil = cv2.inRange(hsv, (0, 0, 0), (30, 40, 40)) > 0
+
+        # Near-black pixels (crop padding, shadows) are never vegetation
+        dark = small.max(axis=2) < 20
+
+        return (exg > self.exg_threshold) & ~soil & ~dark
+
+    def _downsample(self, array: "NDArray[Any]") -> "NDArray[Any]":
+        """Downsample by the configured factor (INTER_AREA keeps thin stems)."""
+        if self.downscale == 1:
+            return array
+        h, w = array.shape[:2]
+        size = (max(1, w // self.downscale), max(1, h // self.downscale))
+        return cv2.resize(array, size, interpolation=cv2.INTER_AREA)
+
+    def _tile_fractions(
+        self,
+        small: "NDArray[np.bool_]",
+        boxes: "NDArray[np.int64]",
+    ) -> "NDArray[np.float64]":
+        """Fraction of True pixels inside each tile via a summed-area table.
+
+        Args:
+            small: Boolean map already on the downsampled scoring grid
+            boxes: (N, 4) tile boxes in full-resolution crop pixels
+
+        Returns:
+            (N,) fraction of True pixels per tile
+        """
+        # cv2.integral returns (h+1, w+1) table with a zero first row/column
+        table = cv2.integral(small.astype(np.uint8), sdepth=cv2.CV_32S)
+        h, w = small.shape[:2]
+
+        x1 = np.clip(boxes[:, 0] // self.downscale, 0, w)
+        y1 = np.clip(boxes[:, 1] // self.downscale, 0, h)
+        x2 = np.clip(-(-boxes[:, 2] // self.downscale), 0, w)  # ceil division
+        y2 = np.clip(-(-boxes[:, 3] // self.downscale), 0, h)
+
+        counts = table[y2, x2] - table[y1, x2] - table[y2, x1] + table[y1, x1]
+        areas = np.maximum((x2 - x1) * (y2 - y1), 1)
+
+        return np.asarray(counts / areas, dtype=np.float64)
@@ -0,0 +1,526 @@
+"""Visualization renderer for ML results (detections + estimations).
+
+Renders the processed-photo overlay and encodes it as a multi-resolution
+output: a downscaled preview image plus Deep Zoom (DZI) tiles, so the
+frontend fetches a ~2048px preview and zooms with 256px tiles instead of
+downloading one full-resolution AVIF.
+
+Rendering:
+    - Detections: all disks are rasterized into one boolean mask in a
+      vectorized span pass (no per-detection cv2.circle call), then blended
+      only inside 256px blocks that contain detection pixels.
+    - Estimations: polygons are filled into a single-channel mask; the
+      soft edge (Gaussian blur) and blend are computed only inside each
+      polygon's padded bounding region.
+    - No full-frame image.copy() / addWeighted / GaussianBlur passes.
+
+Encoding:
+    - Preview: AVIF (WebP fallback) with configurable quality/speed.
+    - Thumbnail: JPEG resized from the in-memory preview (no AVIF re-decode).
+    - Tiles: Deep Zoom pyramid (level N = full resolution, each lower level
+      halves the size) encoded with cv2.imencode (JPEG or WebP).
+
+Architecture:
+    ML Service Layer (Application Layer)
+    └── Used by: ml_tasks._generate_visualization
+"""
+
+import io
+import logging
+import math
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import cv2
+import numpy as np
+
+try:
+    from PIL import Image  # type: ignore[import-not-found]
+except ImportError:
+    Image = None
+
+from app.core.config import settings
+from app.services.ml_processing.detection_array import DetectionArray
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray  # type: ignore[import-not-found]
+else:
+    NDArray = Any
+
+logger = logging.getLogger(__name__)
+
+DETECTION_COLOR_BGR = (255, 255, 0)  # Cyan
+DETECTION_ALPHA = 0.3
+ESTIMATION_COLOR_BGR = (255, 0, 0)  # Blue
+ESTIMATION_ALPHA = 0.2
+ESTIMATION_BLUR_KSIZE = 9
+
+THUMBNAIL_JPEG_QUALITY = 85
+
+# Blend block size: blocks without any detection pixel are skipped
+_BLEND_BLOCK_PX = 256
+
+_TILE_ENCODERS = {
+    "jpeg": (".jpg", cv2.IMWRITE_JPEG_QUALITY),
+    "jpg": (".jpg", cv2.IMWRITE_JPEG_QUALITY),
+    "webp": (".webp", cv2.IMWRITE_WEBP_QUALITY),
+}
+
+
+@dataclass
+class RenderedVisualization:
+    """Encoded multi-resolution visualization.
+
+    Attributes:
+        preview: Encoded preview image bytes (longest side ≤ preview_max_px)
+        preview_format: "avif" or "webp"
+        width: Full-resolution width in pixels
+        height: Full-resolution height in pixels
+        dzi: Deep Zoom descriptor XML (None if tiles disabled)
+        tiles: Relative tile path ("{level}/{col}_{row}.{ext}") → encoded bytes
+        tile_format: Tile file extension ("jpg" or "webp")
+        thumbnail: JPEG thumbnail derived from the preview (None if disabled)
+    """
+
+    preview: bytes
+    preview_format: str
+    width: int
+    height: int
+    dzi: str | None = None
+    tiles: dict[str, bytes] = field(default_factory=dict)
+    tile_format: str = "jpg"
+    thumbnail: bytes | None = None
+
+    @property
+    def preview_content_type(self) -> str:
+        """MIME type of the preview image."""
+        return f"image/{self.preview_format}"
+
+    @property
+    def tile_content_type(self) -> str:
+        """MIME type of the tiles."""
+        return "image/jpeg" if self.tile_format == "jpg" else f"image/{self.tile_format}"
+
+
+class VisualizationRenderer:
+    """Render and encode processed-photo visualizations.
+
+    Example:
+        >>> renderer = VisualizationRenderer()
+        >>> image = renderer.render(image_bgr, detections, estimations)
+        >>> output = renderer.encode(image)
+        >>> len(output.tiles)  # Deep Zoom tiles for the frontend viewer
+        265
+    """
+
+    def __init__(
+        self,
+        preview_max_px: int | None = None,
+        preview_quality: int | None = None,
+        preview_speed: int | None = None,
+        tiles_enabled: bool | None = None,
+        tile_size: int | None = None,
+        tile_overlap: int | None = None,
+        tile_format: str | None = None,
+        tile_quality: int | None = None,
+        thumbnail_px: int | None = None,
+    ) -> None:
+        """Initialize renderer (defaults come from settings).
+
+        Args:
+            preview_max_px: Longest side of the preview (VIZ_PREVIEW_MAX_PX)
+            preview_quality: AVIF/WebP preview quality 0-100 (VIZ_PREVIEW_QUALITY)
+            preview_speed: AVIF encoder speed 0-10, higher = less effort (VIZ_PREVIEW_SPEED)
+            tiles_enabled: Emit Deep Zoom tiles (VIZ_TILES_ENABLED)
+            tile_size: Deep Zoom tile size in pixels (VIZ_TILE_SIZE)
+            tile_overlap: Deep Zoom tile overlap in pixels (VIZ_TILE_OVERLAP)
+            tile_format: "jpeg" or "webp" (VIZ_TILE_FORMAT)
+            tile_quality: Tile encoder quality 0-100 (VIZ_TILE_QUALITY)
+            thumbnail_px: Longest side of the JPEG thumbnail, 0 disables it
+                (S3_THUMBNAIL_SIZE)
+        """
+        self.preview_max_px = preview_max_px or settings.VIZ_PREVIEW_MAX_PX
+        self.preview_quality = preview_quality or settings.VIZ_PREVIEW_QUALITY
+        self.preview_speed = settings.VIZ_PREVIEW_SPEED if preview_speed is None else preview_speed
+        self.tiles_enabled = settings.VIZ_TILES_ENABLED if tiles_enabled is None else tiles_enabled
+        self.tile_size = tile_size or settings.VIZ_TILE_SIZE
+        self.tile_overlap = settings.VIZ_TILE_OVERLAP if tile_overlap is None else tile_overlap
+        self.tile_format = (tile_format or settings.VIZ_TILE_FORMAT).lower()
+        self.tile_quality = tile_quality or settings.VIZ_TILE_QUALITY
+        self.thumbnail_px = settings.S3_THUMBNAIL_SIZE if thumbnail_px is None else thumbnail_px
+
+        if self.tile_format not in _TILE_ENCODERS:
+            raise ValueError(
+                f"tile_format must be one of {sorted(_TILE_ENCODERS)}, got {self.tile_format}"
+            )
+
+    # ------------------------------------------------------------------
+    # Rendering
+    # ------------------------------------------------------------------
+
+    def render(
+        self,
+        image_bgr: "NDArray[np.uint8]",
+        detections: DetectionArray,
+        estimations: Iterable[Mapping[str, Any]] = (),
+        legend: Iterable[str] = (),
+    ) -> "NDArray[np.uint8]":
+        """Draw detections, estimation polygons and legend in place.
+
+        Args:
+            image_bgr: Full-resolution BGR image (modified in place)
+            detections: Detections in full-image pixel coordinates
+            estimations: Estimation dicts with optional vegetation_polygon
+                         ({"coordinates": [[x, y], ...]})
+            legend: Text lines drawn in the top-left corner
+
+        Returns:
+            The same image array, for chaining
+        """
+        if len(detections):
+            self._blend_detections(image_bgr, detections)
+
+        polygons = _estimation_polygons(estimations)
+        if polygons:
+            self._blend_estimations(image_bgr, polygons)
+
+        lines = list(legend)
+        if lines:
+            _draw_legend(image_bgr, lines)
+
+        return image_bgr
+
+    def _blend_detections(self, image: "NDArray[np.uint8]", detections: DetectionArray) -> None:
+        """Alpha-blend filled detection disks (radius = 75% of min side / 2)."""
+        height, width = image.shape[:2]
+
+        radii = (
+            np.minimum(detections.width.astype(np.int32), detections.height.astype(np.int32))
+            * 0.75
+            / 2
+        ).astype(np.int32)
+
+        mask = rasterize_disks(
+            (height, width),
+            detections.center_x.astype(np.int32),
+            detections.center_y.astype(np.int32),
+            radii,
+        )
+
+        _blend_masked(image, mask, DETECTION_COLOR_BGR, DETECTION_ALPHA)
+
+    def _blend_estimations(
+        self,
+        image: "NDArray[np.uint8]",
+        polygons: list["NDArray[np.int32]"],
+    ) -> None:
+        """Alpha-blend estimation polygons with soft (blurred) edges."""
+        height, width = image.shape[:2]
+        pad = ESTIMATION_BLUR_KSIZE
+
+        mask = np.zeros((height, width), dtype=np.uint8)
+        cv2.fillPoly(mask, polygons, 255)
+
+        color = np.array(ESTIMATION_COLOR_BGR, dtype=np.float32)
+
+        for x0, y0, x1, y1 in _merge_regions(polygons, pad, width, height):
+            alpha = cv2.GaussianBlur(
+                mask[y0:y1, x0:x1], (ESTIMATION_BLUR_KSIZE, ESTIMATION_BLUR_KSIZE), 0
+            ).astype(np.float32)
+            alpha *= ESTIMATION_ALPHA / 255.0
+
+            roi = image[y0:y1, x0:x1].astype(np.float32)
+            roi += (color - roi) * alpha[..., None]
+            image[y0:y1, x0:x1] = np.clip(roi + 0.5, 0, 255).astype(np.uint8)
+
+    # ------------------------------------------------------------------
+    # Encoding
+    # ------------------------------------------------------------------
+
+    def encode(self, image_bgr: "NDArray[np.uint8]") -> RenderedVisualization:
+        """Encode preview, thumbnail and (optionally) Deep Zoom tiles.
+
+        The thumbnail is resized from the in-memory preview, so it never
+        needs the encoded preview to be decoded again.
+
+        Args:
+            image_bgr: Rendered full-resolution BGR image
+
+        Returns:
+            RenderedVisualization with preview, thumbnail and tile bytes
+        """
+        height, width = image_bgr.shape[:2]
+
+        preview_image = _fit_within(image_bgr, self.preview_max_px)
+        preview_bytes, preview_format = self._encode_preview(preview_image)
+
+        output = RenderedVisualization(
+            preview=preview_bytes,
+            preview_format=preview_format,
+            width=width,
+            height=height,
+            tile_format=_TILE_ENCODERS[self.tile_format][0].lstrip("."),
+        )
+
+        if self.thumbnail_px:
+            output.thumbnail = _encode_thumbnail(preview_image, self.thumbnail_px)
+
+        if self.tiles_enabled:
+            output.tiles = self._encode_tiles(image_bgr)
+            output.dzi = self.dzi_descriptor(width, height)
+
+        logger.debug(
+            f"Encoded visualization {width}x{height}: preview {len(preview_bytes)} bytes "
+            f"({preview_format}), {len(output.tiles)} tiles"
+        )
+
+        return output
+
+    def dzi_descriptor(self, width: int, height: int) -> str:
+        """Deep Zoom Image XML descriptor for the tile pyramid."""
+        tile_ext = _TILE_ENCODERS[self.tile_format][0].lstrip(".")
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Image xmlns="http://schemas.microsoft.com/deepzoom/2008" '
+            f'Format="{tile_ext}" Overlap="{self.tile_overlap}" TileSize="{self.tile_size}">'
+            f'<Size Width="{width}" Height="{height}"/>'
+            "</Image>"
+        )
+
+    def _encode_preview(self, image_bgr: "NDArray[np.uint8]") -> tuple[bytes, str]:
+        """Encode preview as AVIF, falling back to WebP."""
+        if Image is None:
+            raise RuntimeError("PIL (Pillow) is required for preview encoding")
+
+        image_pil = Image.fromarray(cv2.cvtColor(image_bgr, cv2.COLOR_BGR2RGB))
+        buffer = io.BytesIO()
+
+        try:
+            image_pil.save(buffer, "AVIF", quality=self.preview_quality, speed=self.preview_speed)
+            return buffer.getvalue(), "avif"
+        except Exception as e:
+            logger.warning(f"AVIF not supported, falling back to WebP: {e}")
+            buffer = io.BytesIO()
+            image_pil.save(buffer, "WEBP", quality=self.preview_quality)
+            return buffer.getvalue(), "webp"
+
+    def _encode_tiles(self, image_bgr: "NDArray[np.uint8]") -> dict[str, bytes]:
+        """Encode the Deep Zoom pyramid (each level built from the previous one)."""
+        ext, quality_flag = _TILE_ENCODERS[self.tile_format]
+        params = [int(quality_flag), int(self.tile_quality)]
+        size, overlap = self.tile_size, self.tile_overlap
+
+        tiles: dict[str, bytes] = {}
+        level_image = image_bgr
+        height, width = image_bgr.shape[:2]
+
+        for level in range(deep_zoom_max_level(width, height), -1, -1):
+            level_h, level_w = level_image.shape[:2]
+
+            for row in range(math.ceil(level_h / size)):
+                for col in range(math.ceil(level_w / size)):
+                    x0 = max(0, col * size - overlap)
+                    y0 = max(0, row * size - overlap)
+                    x1 = min(level_w, (col + 1) * size + overlap)
+                    y1 = min(level_h, (row + 1) * size + overlap)
+
+                    ok, encoded = cv2.imencode(ext, level_image[y0:y1, x0:x1], params)
+                    if not ok:
+                        raise RuntimeError(f"Failed to encode tile {level}/{col}_{row}{ext}")
+                    tiles[f"{level}/{col}_{row}{ext}"] = encoded.tobytes()
+
+            if level > 0:
+                next_size = (max(1, math.ceil(level_w / 2)), max(1, math.ceil(level_h / 2)))
+                level_image = cv2.resize(level_image, next_size, interpolation=cv2.INTER_AREA)
+
+        return tiles
+
+
+# ----------------------------------------------------------------------
+# Helpers
+# ----------------------------------------------------------------------
+
+
+def deep_zoom_max_level(width: int, height: int) -> int:
+    """Deep Zoom level holding the full-resolution image (level 0 = 1×1)."""
+    return max(0, math.ceil(math.log2(max(width, height, 1))))
+
+
+def rasterize_disks(
+    shape: tuple[int, int],
+    centers_x: "NDArray[np.int32]",
+    centers_y: "NDArray[np.int32]",
+    radii: "NDArray[np.int32]",
+) -> "NDArray[np.bool_]":
+    """Rasterize filled disks into a boolean mask without a per-disk loop.
+
+    Every disk is expanded into 2r+1 horizontal spans at once. Spans are
+    addressed in row-major "global" coordinates (y * (width + 1) + x), so
+    sorting them and taking a running max of their ends merges overlaps
+    across all disks in one pass. The disjoint runs are written into an
+    int8 difference array whose cumulative sum is the coverage mask.
+    Pixel-identical to cv2.circle(..., thickness=-1).
+
+    Args:
+        shape: (height, width) of the mask
+        centers_x: Disk center X per disk
+        centers_y: Disk center Y per disk
+        radii: Disk radius per disk (0 = single pixel)
+
+    Returns:
+        Boolean mask (height, width), True inside any disk
+    """
+    height, width = shape
+    stride = width + 1
+
+    centers_x = np.asarray(centers_x, dtype=np.int64)
+    centers_y = np.asarray(centers_y, dtype=np.int64)
+    radii = np.maximum(np.asarray(radii, dtype=np.int64), 0)
+
+    # One span per (disk, row): owner = disk index, dy = row offset in [-r, r]
+    counts = 2 * radii + 1
+    owner = np.repeat(np.arange(radii.size), counts)
+    first = np.cumsum(counts) - counts
+    r = radii[owner]
+    dy = np.arange(owner.size) - first[owner] - r
+    half = np.floor(np.sqrt(r * r - dy * dy)).astype(np.int64)
+
+    y = centers_y[owner] + dy
+    x0 = np.maximum(centers_x[owner] - half, 0)
+    x1 = np.minimum(centers_x[owner] + half + 1, width)
+    valid = (y >= 0) & (y < height) & (x0 < x1)
+
+    starts = (y * stride + x0)[valid]
+    ends = (y * stride + x1)[valid]
+    if starts.size == 0:
+        return np.zeros(shape, dtype=bool)
+
+    order = np.argsort(starts, kind="stable")
+    starts, ends = starts[order], ends[order]
+
+    # Merge overlapping/touching spans into disjoint runs
+    reach = np.maximum.accumulate(ends)
+    is_new = np.empty(starts.size, dtype=bool)
+    is_new[0] = True
+    is_new[1:] = starts[1:] > reach[:-1]
+    new_idx = np.flatnonzero(is_new)
+    run_ends = reach[np.append(new_idx[1:] - 1, starts.size - 1)]
+
+    diff = np.zeros(height * stride, dtype=np.int8)
+    diff[starts[new_idx]] = 1
+    diff[run_ends] = -1
+
+    coverage = np.cumsum(diff, dtype=np.int8).reshape(height, stride)[:, :width]
+    return coverage.astype(bool)
+
+
+def _blend_masked(
+    image: "NDArray[np.uint8]",
+    mask: "NDArray[np.bool_]",
+    color_bgr: tuple[int, int, int],
+    alpha: float,
+) -> None:
+    """Blend a solid color into masked pixels, block by block.
+
+    Only blocks containing masked pixels are touched; within a block the
+    blend is cv2.addWeighted + a masked cv2.copyTo (same result as a
+    full-frame overlay + addWeighted, without the full-frame copies).
+    """
+    height, width = mask.shape
+    block = _BLEND_BLOCK_PX
+    mask_u8 = mask.view(np.uint8)
+    color = np.empty((block, block, 3), dtype=np.uint8)
+    color[:] = color_bgr
+
+    for y0 in range(0, height, block):
+        for x0 in range(0, width, block):
+            block_mask = mask_u8[y0 : y0 + block, x0 : x0 + block]
+            if not block_mask.any():
+                continue
+            roi = image[y0 : y0 + block, x0 : x0 + block]
+            blended = cv2.addWeighted(
+                roi, 1.0 - alpha, color[: roi.shape[0], : roi.shape[1]], alpha, 0
+            )
+            image[y0 : y0 + block, x0 : x0 + block] = cv2.copyTo(blended, block_mask, roi)
+
+
+def _estimation_polygons(estimations: Iterable[Mapping[str, Any]]) -> list["NDArray[np.int32]"]:
+    """Extract int32 (K, 1, 2) polygons from estimation dicts."""
+    polygons = []
+    for est in estimations:
+        vegetation_polygon = est.get("vegetation_polygon") or {}
+        coords = vegetation_polygon.get("coordinates") if vegetation_polygon else None
+        if not coords:
+            continue
+        polygons.append(np.asarray(coords, dtype=np.int32).reshape(-1, 1, 2))
+    return polygons
+
+
+def _merge_regions(
+    polygons: list["NDArray[np.int32]"],
+    pad: int,
+    width: int,
+    height: int,
+) -> list[tuple[int, int, int, int]]:
+    """Padded polygon bounding boxes, with overlapping boxes merged."""
+    regions: list[list[int]] = []
+    for poly in polygons:
+        x, y, w, h = cv2.boundingRect(poly)
+        box = [max(0, x - pad), max(0, y - pad), min(width, x + w + pad), min(height, y + h + pad)]
+        if box[0] >= box[2] or box[1] >= box[3]:
+            continue
+
+        # Merge with any region it touches (keeps blur from double-blending)
+        merged = True
+        while merged:
+            merged = False
+            for other in regions:
+                if (
+                    box[0] < other[2]
+                    and other[0] < box[2]
+                    and box[1] < other[3]
+                    and other[1] < box[3]
+                ):
+                    box = [
+                        min(box[0], other[0]),
+                        min(box[1], other[1]),
+                        max(box[2], other[2]),
+                        max(box[3], other[3]),
+                    ]
+                    regions.remove(other)
+                    merged = True
+                    break
+        regions.append(box)
+
+    return [tuple(r) for r in regions]  # type: ignore[misc]
+
+
+def _fit_within(image: "NDArray[np.uint8]", max_px: int) -> "NDArray[np.uint8]":
+    """Downscale so the longest side is at most max_px (never upscales)."""
+    height, width = image.shape[:2]
+    scale = max_px / max(height, width)
+    if scale >= 1.0:
+        return image
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+
+
+def _encode_thumbnail(image: "NDArray[np.uint8]", max_px: int) -> bytes:
+    """JPEG thumbnail (longest side ≤ max_px) of an in-memory BGR image."""
+    ok, encoded = cv2.imencode(
+        ".jpg",
+        _fit_within(image, max_px),
+        [cv2.IMWRITE_JPEG_QUALITY, THUMBNAIL_JPEG_QUALITY, cv2.IMWRITE_JPEG_OPTIMIZE, 1],
+    )
+    if not ok:
+        raise RuntimeError("Failed to encode visualization thumbnail")
+    return encoded.tobytes()
+
+
+def _draw_legend(image: "NDArray[np.uint8]", lines: list[str]) -> None:
+    """Draw white text lines on a black box in the top-left corner."""
+    font = cv2.FONT_HERSHEY_SIMPLEX
+    cv2.rectangle(image, (5, 5), (400, 10 + 30 * len(lines)), (0, 0, 0), -1)
+    for i, line in enumerate(lines):
+        cv2.putText(image, line, (10, 30 + 30 * i), font, 0.8, (255, 255, 255), 2)
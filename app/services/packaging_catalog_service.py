@@ -1,5 +1,6 @@
 """PackagingCatalog business logic service."""
 
+from app.core.read_through_cache import ReadThroughCache, invalidate_cache, read_through
 from app.repositories.packaging_catalog_repository import PackagingCatalogRepository
 from app.schemas.packaging_catalog_schema import (
     PackagingCatalogCreateRequest,
@@ -11,26 +12,38 @@ from app.schemas.packaging_catalog_schema import (
 class PackagingCatalogService:
     """Business logic for packagingcatalog operations (CRUD)."""
 
-    def __init__(self, repo: PackagingCatalogRepository) -> None:
+    def __init__(
+        self, repo: PackagingCatalogRepository, cache: ReadThroughCache | None = None
+    ) -> None:
         self.repo = repo
+        self.cache = cache  # Read-through cache ("packaging_catalog" namespace)
 
     async def create(self, request: PackagingCatalogCreateRequest) -> PackagingCatalogResponse:
         """Create a new packagingcatalog."""
         data = request.model_dump()
         model = await self.repo.create(data)
+        await invalidate_cache(self.cache, self.repo.session)
         return PackagingCatalogResponse.model_validate(model)
 
     async def get_by_id(self, id: int) -> PackagingCatalogResponse:
         """Get packagingcatalog by ID."""
-        model = await self.repo.get(id)
-        if not model:
-            raise ValueError("PackagingCatalog {id} not found")
-        return PackagingCatalogResponse.model_validate(model)
+
+        async def load() -> PackagingCatalogResponse:
+            model = await self.repo.get(id)
+            if not model:
+                raise ValueError("PackagingCatalog {id} not found")
+            return PackagingCatalogResponse.model_validate(model)
+
+        return await read_through(self.cache, f"id:{id}", load, PackagingCatalogResponse)
 
     async def get_all(self, limit: int = 100) -> list[PackagingCatalogResponse]:
         """Get all packagingcatalogs."""
-        models = await self.repo.get_multi(limit=limit)
-        return [PackagingCatalogResponse.model_validate(m) for m in models]
+
+        async def load() -> list[PackagingCatalogResponse]:
+            models = await self.repo.get_multi(limit=limit)
+            return [PackagingCatalogResponse.model_validate(m) for m in models]
+
+        return await read_through(self.cache, f"all:{limit}", load, list[PackagingCatalogResponse])
 
     async def update(
         self, id: int, request: PackagingCatalogUpdateRequest
@@ -42,6 +55,7 @@ class PackagingCatalogService:
 
         update_data = request.model_dump(exclude_unset=True)
         updated_model = await self.repo.update(id, update_data)
+        await invalidate_cache(self.cache, self.repo.session)
         return PackagingCatalogResponse.model_validate(updated_model)
 
     async def delete(self, id: int) -> None:
@@ -50,3 +64,4 @@ class PackagingCatalogService:
         if not model:
             raise ValueError("PackagingCatalog {id} not found")
         await self.repo.delete(id)
+        await invalidate_cache(self.cache, self.repo.session)
@@ -1,5 +1,6 @@
 """PackagingColor business logic service."""
 
+from app.core.read_through_cache import ReadThroughCache, invalidate_cache, read_through
 from app.repositories.packaging_color_repository import PackagingColorRepository
 from app.schemas.packaging_color_schema import (
     PackagingColorCreateRequest,
@@ -11,26 +12,38 @@ from app.schemas.packaging_color_schema import (
 class PackagingColorService:
     """Business logic for packagingcolor operations (CRUD)."""
 
-    def __init__(self, repo: PackagingColorRepository) -> None:
+    def __init__(
+        self, repo: PackagingColorRepository, cache: ReadThroughCache | None = None
+    ) -> None:
         self.repo = repo
+        self.cache = cache  # Read-through cache ("packaging_colors" namespace)
 
     async def create(self, request: PackagingColorCreateRequest) -> PackagingColorResponse:
         """Create a new packagingcolor."""
         data = request.model_dump()
         model = await self.repo.create(data)
+        await invalidate_cache(self.cache, self.repo.session)
         return PackagingColorResponse.model_validate(model)
 
     async def get_by_id(self, id: int) -> PackagingColorResponse:
         """Get packagingcolor by ID."""
-        model = await self.repo.get(id)
-        if not model:
-            raise ValueError("PackagingColor {id} not found")
-        return PackagingColorResponse.model_validate(model)
+
+        async def load() -> PackagingColorResponse:
+            model = await self.repo.get(id)
+            if not model:
+                raise ValueError("PackagingColor {id} not found")
+            return PackagingColorResponse.model_validate(model)
+
+        return await read_through(self.cache, f"id:{id}", load, PackagingColorResponse)
 
     async def get_all(self, limit: int = 100) -> list[PackagingColorResponse]:
         """Get all packagingcolors."""
-        models = await self.repo.get_multi(limit=limit)
-        return [PackagingColorResponse.model_validate(m) for m in models]
+
+        async def load() -> list[PackagingColorResponse]:
+            models = await self.repo.get_multi(limit=limit)
+            return [PackagingColorResponse.model_validate(m) for m in models]
+
+        return await read_through(self.cache, f"all:{limit}", load, list[PackagingColorResponse])
 
     async def update(self, id: int, request: PackagingColorUpdateRequest) -> PackagingColorResponse:
         """Update packagingcolor."""
@@ -40,6 +53,7 @@ class PackagingColorService:
 
         update_data = request.model_dump(exclude_unset=True)
         updated_model = await self.repo.update(id, update_data)
+        await invalidate_cache(self.cache, self.repo.session)
         return PackagingColorResponse.model_validate(updated_model)
 
     async def delete(self, id: int) -> None:
@@ -48,3 +62,4 @@ class PackagingColorService:
         if not model:
             raise ValueError("PackagingColor {id} not found")
         await self.repo.delete(id)
+        await invalidate_cache(self.cache, self.repo.session)
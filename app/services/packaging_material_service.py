@@ -1,5 +1,6 @@
 """PackagingMaterial business logic service."""
 
+from app.core.read_through_cache import ReadThroughCache, invalidate_cache, read_through
 from app.repositories.packaging_material_repository import PackagingMaterialRepository
 from app.schemas.packaging_material_schema import (
     PackagingMaterialCreateRequest,
@@ -11,26 +12,38 @@ from app.schemas.packaging_material_schema import (
 class PackagingMaterialService:
     """Business logic for packagingmaterial operations (CRUD)."""
 
-    def __init__(self, repo: PackagingMaterialRepository) -> None:
+    def __init__(
+        self, repo: PackagingMaterialRepository, cache: ReadThroughCache | None = None
+    ) -> None:
         self.repo = repo
+        self.cache = cache  # Read-through cache ("packaging_materials" namespace)
 
     async def create(self, request: PackagingMaterialCreateRequest) -> PackagingMaterialResponse:
         """Create a new packagingmaterial."""
         data = request.model_dump()
         model = await self.repo.create(data)
+        await invalidate_cache(self.cache, self.repo.session)
         return PackagingMaterialResponse.model_validate(model)
 
     async def get_by_id(self, id: int) -> PackagingMaterialResponse:
         """Get packagingmaterial by ID."""
-        model = await self.repo.get(id)
-        if not model:
-            raise ValueError("PackagingMaterial {id} not found")
-        return PackagingMaterialResponse.model_validate(model)
+
+        async def load() -> PackagingMaterialResponse:
+            model = await self.repo.get(id)
+            if not model:
+                raise ValueError("PackagingMaterial {id} not found")
+            return PackagingMaterialResponse.model_validate(model)
+
+        return await read_through(self.cache, f"id:{id}", load, PackagingMaterialResponse)
 
     async def get_all(self, limit: int = 100) -> list[PackagingMaterialResponse]:
         """Get all packagingmaterials."""
-        models = await self.repo.get_multi(limit=limit)
-        return [PackagingMaterialResponse.model_validate(m) for m in models]
+
+        async def load() -> list[PackagingMaterialResponse]:
+            models = await self.repo.get_multi(limit=limit)
+            return [PackagingMaterialResponse.model_validate(m) for m in models]
+
+        return await read_through(self.cache, f"all:{limit}", load, list[PackagingMaterialResponse])
 
     async def update(
         self, id: int, request: PackagingMaterialUpdateRequest
@@ -42,6 +55,7 @@ class PackagingMaterialService:
 
         update_data = request.model_dump(exclude_unset=True)
         updated_model = await self.repo.update(id, update_data)
+        await invalidate_cache(self.cache, self.repo.session)
         return PackagingMaterialResponse.model_validate(updated_model)
 
     async def delete(self, id: int) -> None:
@@ -50,3 +64,4 @@ class PackagingMaterialService:
         if not model:
             raise ValueError("PackagingMaterial {id} not found")
         await self.repo.delete(id)
+        await invalidate_cache(self.cache, self.repo.session)
@@ -1,5 +1,6 @@
 """PackagingType business logic service."""
 
+from app.core.read_through_cache import ReadThroughCache, invalidate_cache, read_through
 from app.repositories.packaging_type_repository import PackagingTypeRepository
 from app.schemas.packaging_type_schema import (
     PackagingTypeCreateRequest,
@@ -11,26 +12,38 @@ from app.schemas.packaging_type_schema import (
 class PackagingTypeService:
     """Business logic for packagingtype operations (CRUD)."""
 
-    def __init__(self, repo: PackagingTypeRepository) -> None:
+    def __init__(
+        self, repo: PackagingTypeRepository, cache: ReadThroughCache | None = None
+    ) -> None:
         self.repo = repo
+        self.cache = cache  # Read-through cache ("packaging_types" namespace)
 
     async def create(self, request: PackagingTypeCreateRequest) -> PackagingTypeResponse:
         """Create a new packagingtype."""
         data = request.model_dump()
         model = await self.repo.create(data)
+        await invalidate_cache(self.cache, self.repo.session)
         return PackagingTypeResponse.model_validate(model)
 
     async def get_by_id(self, id: int) -> PackagingTypeResponse:
         """Get packagingtype by ID."""
-        model = await self.repo.get(id)
-        if not model:
-            raise ValueError("PackagingType {id} not found")
-        return PackagingTypeResponse.model_validate(model)
+
+        async def load() -> PackagingTypeResponse:
+            model = await self.repo.get(id)
+            if not model:
+                raise ValueError("PackagingType {id} not found")
+            return PackagingTypeResponse.model_validate(model)
+
+        return await read_through(self.cache, f"id:{id}", load, PackagingTypeResponse)
 
     async def get_all(self, limit: int = 100) -> list[PackagingTypeResponse]:
         """Get all packagingtypes."""
-        models = await self.repo.get_multi(limit=limit)
-        return [PackagingTypeResponse.model_validate(m) for m in models]
+
+        async def load() -> list[PackagingTypeResponse]:
+            models = await self.repo.get_multi(limit=limit)
+            return [PackagingTypeResponse.model_validate(m) for m in models]
+
+        return await read_through(self.cache, f"all:{limit}", load, list[PackagingTypeResponse])
 
     async def update(self, id: int, request: PackagingTypeUpdateRequest) -> PackagingTypeResponse:
         """Update packagingtype."""
@@ -40,6 +53,7 @@ class PackagingTypeService:
 
         update_data = request.model_dump(exclude_unset=True)
         updated_model = await self.repo.update(id, update_data)
+        await invalidate_cache(self.cache, self.repo.session)
         return PackagingTypeResponse.model_validate(updated_model)
 
     async def delete(self, id: int) -> None:
@@ -48,3 +62,4 @@ class PackagingTypeService:
         if not model:
             raise ValueError("PackagingType {id} not found")
         await self.repo.delete(id)
+        await invalidate_cache(self.cache, self.repo.session)
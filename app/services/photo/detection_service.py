@@ -5,6 +5,7 @@ This service handles all detection operations including:
 - Bounding box validation
 - Linking detections to sessions
 - Detection statistics
+- Viewport queries for the detection viewer (points or grid clusters)
 
 Architecture:
     Layer: Service Layer (Business Logic)
@@ -18,18 +19,26 @@ Critical Rules:
     - All database operations are async
 """
 
+import math
+from collections.abc import AsyncIterator, Sequence
 from typing import Any
 
+from sqlalchemy import Row
+
+from app.core.config import settings
 from app.core.exceptions import (
     ValidationException,
 )
 from app.core.logging import get_logger
-from app.repositories.detection_repository import DetectionRepository
+from app.repositories.detection_repository import BBox, DetectionRepository
 from app.schemas.detection_schema import (
     DetectionBulkCreateRequest,
+    DetectionClusterColumns,
     DetectionCreate,
+    DetectionPointColumns,
     DetectionResponse,
     DetectionStatistics,
+    DetectionViewportResponse,
 )
 
 logger = get_logger(__name__)
@@ -221,6 +230,135 @@ class DetectionService:
         detections = await self.repo.get_by_session(session_id, limit=limit)
         return [DetectionResponse.model_validate(d) for d in detections]
 
+    def stream_detections_by_session(
+        self, session_id: int, batch_size: int
+    ) -> AsyncIterator[Sequence[Row[Any]]]:
+        """Stream all detections of a session in batches (exports).
+
+        Rows come from a server-side cursor: memory stays bounded by
+        batch_size whatever the session's size.
+
+        Args:
+            session_id: Photo processing session ID
+            batch_size: Rows per batch
+
+        Returns:
+            Async iterator of row batches (see
+            DetectionRepository.stream_by_session for the columns)
+        """
+        return self.repo.stream_by_session(session_id, batch_size)
+
+    async def get_detections_in_viewport(
+        self,
+        session_id: int,
+        zoom: int,
+        min_x: float | None = None,
+        min_y: float | None = None,
+        max_x: float | None = None,
+        max_y: float | None = None,
+    ) -> DetectionViewportResponse:
+        """Detections of a session for the viewer: points, or clusters when zoomed out.
+
+        Args:
+            session_id: Photo processing session ID
+            zoom: Viewer zoom, log2 of screen pixels per image pixel
+                (0 = actual size, -3 = 1/8 size)
+            min_x, min_y, max_x, max_y: Visible rectangle in image pixels
+                (all None = whole image)
+
+        Returns:
+            DetectionViewportResponse in columnar form
+
+        Raises:
+            ValidationException: If the rectangle is partial, empty or inverted
+
+        Business Rules:
+            - zoom >= DETECTION_POINTS_MIN_ZOOM: individual detections, unless
+              the viewport holds more than DETECTION_VIEWPORT_MAX_POINTS
+            - Otherwise: grid clusters of DETECTION_CLUSTER_CELL_PX screen
+              pixels (cell_px = DETECTION_CLUSTER_CELL_PX / 2**zoom image px)
+            - Dense viewports clustered at point zoom get cells large enough
+              to keep the clusters within DETECTION_VIEWPORT_MAX_POINTS
+        """
+        bbox = self._viewport_bbox(min_x, min_y, max_x, max_y)
+
+        if zoom >= settings.DETECTION_POINTS_MIN_ZOOM:
+            max_points = settings.DETECTION_VIEWPORT_MAX_POINTS
+            rows = await self.repo.get_points_in_bbox(session_id, bbox, limit=max_points + 1)
+            if len(rows) <= max_points:
+                points = DetectionPointColumns.model_construct(
+                    id=[r.id for r in rows],
+                    x=[float(r.center_x_px) for r in rows],
+                    y=[float(r.center_y_px) for r in rows],
+                    width=[r.width_px for r in rows],
+                    height=[r.height_px for r in rows],
+                    confidence=[float(r.detection_confidence) for r in rows],
+                    classification_id=[r.classification_id for r in rows],
+                    is_empty_container=[r.is_empty_container for r in rows],
+                    is_alive=[r.is_alive for r in rows],
+                )
+                return DetectionViewportResponse.model_construct(
+                    mode="points", zoom=zoom, total=len(rows), cell_px=None, points=points
+                )
+
+        cell_px = settings.DETECTION_CLUSTER_CELL_PX / 2**zoom
+        if zoom >= settings.DETECTION_POINTS_MIN_ZOOM:
+            # Screen-sized cells are a few image px here: bound the grid instead
+            extent = bbox or await self.repo.get_center_extent(session_id)
+            if extent is not None:
+                cell_px = max(
+                    cell_px, self._min_cell_px(extent, settings.DETECTION_VIEWPORT_MAX_POINTS)
+                )
+        rows = await self.repo.cluster_in_bbox(session_id, bbox, cell_px)
+        clusters = DetectionClusterColumns.model_construct(
+            x=[float(r.x) for r in rows],
+            y=[float(r.y) for r in rows],
+            count=[r.count for r in rows],
+            empty_container_count=[r.empty_container_count for r in rows],
+        )
+        return DetectionViewportResponse.model_construct(
+            mode="clusters",
+            zoom=zoom,
+            total=sum(clusters.count),
+            cell_px=cell_px,
+            clusters=clusters,
+        )
+
+    @staticmethod
+    def _min_cell_px(extent: BBox, max_cells: int) -> float:
+        """Smallest grid cell for which extent spans at most max_cells cells.
+
+        A w × h rectangle not aligned to the grid touches fewer than
+        (w / cell + 2) × (h / cell + 2) cells; this solves that bound for cell.
+        max_cells is raised to 9 (3 × 3), the least the bound can guarantee
+        with a finite cell.
+        """
+        width = max(extent[2] - extent[0], 1.0)
+        height = max(extent[3] - extent[1], 1.0)
+        area, half_perimeter = width * height, width + height
+        # Positive root of area·u² + 2·half_perimeter·u + 4 - max_cells = 0, u = 1/cell
+        inverse = (
+            math.sqrt(half_perimeter**2 + area * (max(max_cells, 9) - 4)) - half_perimeter
+        ) / area
+        return 1 / inverse
+
+    @staticmethod
+    def _viewport_bbox(
+        min_x: float | None, min_y: float | None, max_x: float | None, max_y: float | None
+    ) -> BBox | None:
+        if min_x is None and min_y is None and max_x is None and max_y is None:
+            return None
+        if min_x is None or min_y is None or max_x is None or max_y is None:
+            raise ValidationException(
+                field="viewport", message="min_x, min_y, max_x and max_y must be given together"
+            )
+        if min_x >= max_x or min_y >= max_y:
+            raise ValidationException(
+                field="viewport",
+                message=f"Empty viewport (min_x={min_x}, min_y={min_y}, max_x={max_x}, max_y={max_y})",
+            )
+        return (min_x, min_y, max_x, max_y)
+
     async def get_detection_statistics(self, session_id: int) -> DetectionStatistics:
         """Calculate detection statistics for a session.
 
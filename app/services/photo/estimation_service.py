@@ -19,6 +19,11 @@ Critical Rules:
     - All database operations are async
 """
 
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
+
+from sqlalchemy import Row
+
 from app.core.exceptions import (
     ValidationException,
 )
@@ -236,6 +241,24 @@ class EstimationService:
         estimations = await self.repo.get_by_session(session_id, limit=limit)
         return [EstimationResponse.model_validate(e) for e in estimations]
 
+    def stream_estimations_by_session(
+        self, session_id: int, batch_size: int
+    ) -> AsyncIterator[Sequence[Row[Any]]]:
+        """Stream all estimations of a session in batches (exports).
+
+        Rows come from a server-side cursor: memory stays bounded by
+        batch_size whatever the session's size.
+
+        Args:
+            session_id: Photo processing session ID
+            batch_size: Rows per batch
+
+        Returns:
+            Async iterator of row batches (see
+            EstimationRepository.stream_by_session for the columns)
+        """
+        return self.repo.stream_by_session(session_id, batch_size)
+
     async def get_estimations_by_method(
         self, calculation_method: CalculationMethodEnum, limit: int = 100
     ) -> list[EstimationResponse]:
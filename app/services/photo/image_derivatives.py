@@ -0,0 +1,134 @@
+"""Image Derivatives - All renditions of a photo from a single reduced decode.
+
+Thumbnails and previews used to be produced one at a time, each from a fresh
+full-resolution decode of the same bytes (upload request, then again in the
+ML callback). This module decodes once and derives every rendition from that
+in-memory image:
+
+- JPEG sources use draft mode (``Image.draft``): libjpeg decodes directly at
+  1/2, 1/4 or 1/8 scale (DCT scaling), so a 300px thumbnail of a 4000×3000
+  photo only touches a 500×375 image.
+- Renditions are produced largest → smallest, each resampled from the
+  previous one, so no rendition re-reads the full-size pixels.
+
+Architecture:
+    Layer: Service Layer (pure image utilities, no I/O)
+    Dependencies: Pillow
+    Used by: generate_thumbnail, upload_tasks
+
+Example:
+    ```python
+    renditions = generate_derivatives(original_bytes, {"thumbnail": 300, "preview": 1600})
+    thumbnail_bytes = renditions["thumbnail"].data
+    ```
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from io import BytesIO
+
+from PIL import Image
+
+# Output format for every rendition (thumbnails are always JPEG, see upload_thumbnail)
+DERIVATIVE_JPEG_QUALITY = 85
+
+# Decode at ≥ REDUCING_GAP × target size before the final LANCZOS pass.
+# Keeps LANCZOS quality while letting draft mode skip most of the pixels.
+REDUCING_GAP = 2.0
+
+
+@dataclass(frozen=True)
+class Rendition:
+    """One encoded rendition and its actual pixel size (aspect ratio kept)."""
+
+    data: bytes
+    width: int
+    height: int
+
+
+def open_reduced(image_bytes: bytes, max_side: int) -> Image.Image:
+    """Decode image bytes at the smallest scale that still covers max_side.
+
+    For JPEG, Image.draft() selects a DCT scale so the decoded image is at
+    least max_side × REDUCING_GAP on both axes. Other formats decode at full
+    size. Transparent/palette images are flattened onto white (JPEG output).
+
+    Args:
+        image_bytes: Encoded image (JPEG, PNG, WebP, ...)
+        max_side: Largest rendition (longest side, px) that will be derived
+
+    Returns:
+        Loaded RGB (or L) PIL image
+    """
+    image = Image.open(BytesIO(image_bytes))
+
+    if image.format == "JPEG":
+        target = int(max_side * REDUCING_GAP)
+        image.draft("RGB", (target, target))
+
+    image.load()
+
+    if image.mode in ("RGBA", "P", "LA"):
+        if image.mode == "P":
+            image = image.convert("RGBA")
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.split()[-1])
+        return background
+
+    if image.mode not in ("RGB", "L"):
+        return image.convert("RGB")
+
+    return image
+
+
+def fit_within(image: Image.Image, max_side: int) -> Image.Image:
+    """Return a copy of image whose longest side is at most max_side (aspect kept)."""
+    if max(image.size) <= max_side:
+        return image.copy()
+
+    resized = image.copy()
+    resized.thumbnail((max_side, max_side), Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP)
+    return resized
+
+
+def encode_jpeg(image: Image.Image, quality: int = DERIVATIVE_JPEG_QUALITY) -> bytes:
+    """Encode a PIL image as optimized JPEG bytes."""
+    output = BytesIO()
+    image.save(output, format="JPEG", quality=quality, optimize=True)
+    return output.getvalue()
+
+
+def generate_derivatives(
+    image_bytes: bytes,
+    sizes: Mapping[str, int],
+    quality: int = DERIVATIVE_JPEG_QUALITY,
+) -> dict[str, Rendition]:
+    """Produce every named rendition from one reduced decode.
+
+    Args:
+        image_bytes: Encoded source image
+        sizes: Rendition name → longest side in px (e.g., {"thumbnail": 300})
+        quality: JPEG quality for all renditions
+
+    Returns:
+        Rendition name → Rendition (JPEG bytes + encoded size; same keys as sizes)
+
+    Raises:
+        ValueError: If sizes is empty or contains a non-positive size
+        PIL.UnidentifiedImageError / OSError: If image_bytes cannot be decoded
+    """
+    if not sizes:
+        raise ValueError("sizes must contain at least one rendition")
+    if min(sizes.values()) <= 0:
+        raise ValueError(f"Rendition sizes must be positive, got {dict(sizes)}")
+
+    current = open_reduced(image_bytes, max(sizes.values()))
+
+    renditions: dict[str, Rendition] = {}
+    # Largest first: each rendition is resampled from the previous (larger) one
+    for name, max_side in sorted(sizes.items(), key=lambda item: item[1], reverse=True):
+        current = fit_within(current, max_side)
+        width, height = current.size
+        renditions[name] = Rendition(encode_jpeg(current, quality), width, height)
+
+    return renditions
@@ -0,0 +1,103 @@
+"""Image Fingerprint - Content hash and perceptual hash of an upload.
+
+Duplicate detection before inference needs two keys per photo:
+
+- content_sha256: identical bytes (the same file uploaded again)
+- perceptual_hash: 64-bit difference hash (dHash) of the image content, so
+  near-identical shots (same bench, minutes apart, slightly different
+  exposure or framing) differ in a few bits only
+
+The perceptual hash never decodes the full-resolution image: Pillow's draft
+mode lets the JPEG decoder scale by 1/2-1/8 in the DCT domain, so a
+4000x3000 photo is decoded at 500x375 and then reduced to 9x8 gray pixels.
+
+Architecture:
+    Layer: Service Layer (pure image utilities, no I/O besides the stream)
+    Dependencies: Pillow
+    Used by: PhotoUploadService (via app.core.executors.run_cpu_bound)
+"""
+
+import hashlib
+from dataclasses import dataclass
+from typing import BinaryIO
+
+from PIL import Image, ImageOps
+
+# dHash grid: HASH_SIZE rows of HASH_SIZE + 1 pixels → HASH_SIZE² bits
+HASH_SIZE = 8
+
+# Smallest decode requested from the JPEG decoder (draft mode)
+_DRAFT_SIZE = 64
+
+_READ_CHUNK_BYTES = 1024 * 1024
+_HASH_BITS = HASH_SIZE * HASH_SIZE
+_HASH_MASK = (1 << _HASH_BITS) - 1
+
+
+@dataclass(frozen=True)
+class ImageFingerprint:
+    """Duplicate detection keys of a photo.
+
+    Attributes:
+        content_sha256: SHA-256 hex digest of the file bytes
+        perceptual_hash: Signed 64-bit dHash (BIGINT column), None if the
+            image could not be decoded
+    """
+
+    content_sha256: str
+    perceptual_hash: int | None
+
+
+def fingerprint_image(stream: BinaryIO) -> ImageFingerprint:
+    """Hash the bytes and the reduced-size content of an image stream.
+
+    The stream position is restored to the start, so the same file object
+    can be streamed to S3 afterwards.
+
+    Args:
+        stream: Seekable binary stream (e.g., UploadFile.file)
+
+    Returns:
+        ImageFingerprint
+    """
+    stream.seek(0)
+    try:
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: stream.read(_READ_CHUNK_BYTES), b""):
+            digest.update(chunk)
+        stream.seek(0)
+        return ImageFingerprint(
+            content_sha256=digest.hexdigest(), perceptual_hash=perceptual_hash(stream)
+        )
+    finally:
+        stream.seek(0)
+
+
+def perceptual_hash(stream: BinaryIO) -> int | None:
+    """Difference hash of an image: one bit per horizontal gradient of a 9x8 thumbnail.
+
+    Returns:
+        Signed 64-bit hash (None if the stream is not a decodable image)
+    """
+    try:
+        image = Image.open(stream)
+        image.draft("L", (_DRAFT_SIZE, _DRAFT_SIZE))
+        image = ImageOps.exif_transpose(image)
+        pixels = (
+            image.convert("L").resize((HASH_SIZE + 1, HASH_SIZE), Image.Resampling.BOX).tobytes()
+        )
+    except Exception:
+        return None
+
+    bits = 0
+    for row in range(HASH_SIZE):
+        offset = row * (HASH_SIZE + 1)
+        for col in range(HASH_SIZE):
+            bits = (bits << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+
+    return bits - (1 << _HASH_BITS) if bits >> (_HASH_BITS - 1) else bits
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits of two perceptual hashes (0-64)."""
+    return ((a ^ b) & _HASH_MASK).bit_count()
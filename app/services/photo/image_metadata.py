@@ -0,0 +1,132 @@
+"""Image Metadata - Header-only parsing of dimensions and GPS.
+
+The upload path needs the image dimensions and the EXIF GPS position, never
+the pixels. ``read_image_header`` opens the image lazily (Pillow only reads
+the container headers: JPEG markers up to SOF, PNG IHDR/eXIf, WebP chunks)
+and parses the EXIF GPS IFD once, instead of decoding with piexif and
+re-opening with PIL as a fallback.
+
+Architecture:
+    Layer: Service Layer (pure image utilities, no I/O besides the stream)
+    Dependencies: Pillow
+    Used by: PhotoUploadService (via app.core.executors.run_cpu_bound)
+
+Example:
+    ```python
+    header = await run_cpu_bound(read_image_header, upload_file.file)
+    if header.gps is None:
+        raise ValidationException(...)
+    ```
+"""
+
+from dataclasses import dataclass
+from typing import Any, BinaryIO
+
+from PIL import ExifTags, Image
+
+# GPS IFD tag IDs (EXIF 2.3)
+_GPS_LATITUDE_REF = 1
+_GPS_LATITUDE = 2
+_GPS_LONGITUDE_REF = 3
+_GPS_LONGITUDE = 4
+
+
+@dataclass(frozen=True)
+class ImageHeader:
+    """Image properties read without decoding pixels.
+
+    Attributes:
+        width: Image width in pixels
+        height: Image height in pixels
+        format: Pillow format name (JPEG, PNG, WEBP, ...)
+        longitude: GPS longitude in decimal degrees (None if absent)
+        latitude: GPS latitude in decimal degrees (None if absent)
+    """
+
+    width: int
+    height: int
+    format: str | None
+    longitude: float | None = None
+    latitude: float | None = None
+
+    @property
+    def gps(self) -> tuple[float, float] | None:
+        """(longitude, latitude) if both are present, else None."""
+        if self.longitude is None or self.latitude is None:
+            return None
+        return (self.longitude, self.latitude)
+
+
+def read_image_header(stream: BinaryIO) -> ImageHeader:
+    """Read dimensions and GPS from an image stream without decoding pixels.
+
+    The stream position is restored to the start, so the same file object
+    can be streamed to S3 afterwards.
+
+    Args:
+        stream: Seekable binary stream (e.g., UploadFile.file)
+
+    Returns:
+        ImageHeader (GPS fields None if the photo has no usable GPS EXIF)
+
+    Raises:
+        PIL.UnidentifiedImageError: If the stream is not a supported image
+    """
+    stream.seek(0)
+    try:
+        image = Image.open(stream)
+        longitude, latitude = _gps_from_exif(image.getexif())
+        return ImageHeader(
+            width=image.width,
+            height=image.height,
+            format=image.format,
+            longitude=longitude,
+            latitude=latitude,
+        )
+    finally:
+        stream.seek(0)
+
+
+def _gps_from_exif(exif: Image.Exif) -> tuple[float | None, float | None]:
+    """Signed (longitude, latitude) from the EXIF GPS IFD."""
+    try:
+        gps_ifd = exif.get_ifd(ExifTags.IFD.GPSInfo)
+    except Exception:
+        return (None, None)
+
+    latitude = _dms_to_degrees(gps_ifd.get(_GPS_LATITUDE))
+    longitude = _dms_to_degrees(gps_ifd.get(_GPS_LONGITUDE))
+
+    if latitude is not None and _ref(gps_ifd.get(_GPS_LATITUDE_REF)) == "S":
+        latitude = -latitude
+    if longitude is not None and _ref(gps_ifd.get(_GPS_LONGITUDE_REF)) == "W":
+        longitude = -longitude
+
+    return (longitude, latitude)
+
+
+def _dms_to_degrees(value: Any) -> float | None:
+    """(degrees, minutes, seconds) rationals → decimal degrees."""
+    if not value or len(value) < 3:
+        return None
+    try:
+        degrees, minutes, seconds = (_rational(part) for part in value[:3])
+    except (TypeError, ValueError, ZeroDivisionError):
+        return None
+    return degrees + minutes / 60 + seconds / 3600
+
+
+def _rational(part: Any) -> float:
+    """IFDRational or legacy (numerator, denominator) tuple → float (0 if denominator is 0)."""
+    if isinstance(part, tuple):
+        numerator, denominator = part
+        return numerator / denominator if denominator else 0.0
+    value = float(part)
+    return 0.0 if value != value else value  # IFDRational(x, 0) is NaN
+
+
+def _ref(value: Any) -> str:
+    """Normalize a GPS direction reference (bytes or str) to an uppercase letter."""
+    if isinstance(value, bytes):
+        value = value.decode("ascii", errors="ignore")
+    return str(value or "").strip().upper()
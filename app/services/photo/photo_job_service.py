@@ -9,17 +9,117 @@ from typing import Any
 from redis.asyncio import Redis  # type: ignore[import-not-found]
 
 from app.core.config import settings
-from app.core.exceptions import ResourceNotFoundException
+from app.core.exceptions import ResourceNotFoundException, TooManyRequestsException
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+# Atomically add ARGV[1] photos to a tenant's in-flight counter unless that
+# would exceed ARGV[2]. Returns the new count, or -1 if the quota is exhausted.
+_RESERVE_SLOTS_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+if current + tonumber(ARGV[1]) > tonumber(ARGV[2]) then
+    return -1
+end
+local reserved = redis.call('INCRBY', KEYS[1], ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return reserved
+"""
+
+# Atomically release ARGV[1] slots of a tenant's in-flight counter and drop the
+# key once drained, so a reservation cannot land between the DECRBY and the DEL.
+# Shared with the Celery batch callback (ml_tasks._release_tenant_slots).
+RELEASE_SLOTS_SCRIPT = """
+local remaining = redis.call('DECRBY', KEYS[1], ARGV[1])
+if remaining <= 0 then
+    redis.call('DEL', KEYS[1])
+end
+return remaining
+"""
+
+
 class PhotoJobService:
     """Service responsible for tracking photo processing jobs in Redis."""
 
     SESSION_KEY_PREFIX = "upload_session"
     JOB_STATUS_PREFIX = "job_status"
+    TENANT_INFLIGHT_PREFIX = "upload_inflight"
+
+    @classmethod
+    def job_status_key(cls, job_id: str) -> str:
+        """Redis key of a job status (shared with Celery workers)."""
+        return f"{cls.JOB_STATUS_PREFIX}:{job_id}"
+
+    @staticmethod
+    def job_status_payload(job_id: str, status: str, **extra: Any) -> str:
+        """Serialized job status (shared with Celery workers)."""
+        return json.dumps(
+            {
+                "job_id": job_id,
+                "status": status,
+                "updated_at": datetime.now(UTC).isoformat(),
+                **extra,
+            }
+        )
+
+    @classmethod
+    def tenant_inflight_key(cls, tenant_id: int | str | None) -> str:
+        """Redis key counting a tenant's photos queued or running in the ML pipeline."""
+        return f"{cls.TENANT_INFLIGHT_PREFIX}:{tenant_id if tenant_id is not None else 'anonymous'}"
+
+    async def reserve_tenant_slots(
+        self,
+        redis: Redis,
+        tenant_id: int | str | None,
+        count: int,
+    ) -> int:
+        """Reserve ML pipeline slots for a tenant's photos.
+
+        Each tenant may have at most UPLOAD_MAX_INFLIGHT_PHOTOS_PER_TENANT
+        photos queued or running, so one large batch cannot fill the GPU
+        queue ahead of every other tenant. Slots are released by the batch
+        callback (release_tenant_slots) once the photos are processed.
+
+        Returns:
+            Photos in flight for the tenant after the reservation
+
+        Raises:
+            TooManyRequestsException: If the reservation would exceed the quota
+        """
+        key = self.tenant_inflight_key(tenant_id)
+        reserved = await redis.eval(
+            _RESERVE_SLOTS_SCRIPT,
+            1,
+            key,
+            count,
+            settings.UPLOAD_MAX_INFLIGHT_PHOTOS_PER_TENANT,
+            settings.REDIS_UPLOAD_SESSION_TTL,
+        )
+
+        if int(reserved) < 0:
+            raise TooManyRequestsException(
+                reason=(
+                    f"Tenant {tenant_id} would exceed "
+                    f"{settings.UPLOAD_MAX_INFLIGHT_PHOTOS_PER_TENANT} photos in processing"
+                ),
+                retry_after_seconds=60,
+            )
+
+        logger.debug(
+            "Reserved tenant pipeline slots",
+            extra={"redis_key": key, "count": count, "in_flight": int(reserved)},
+        )
+        return int(reserved)
+
+    async def release_tenant_slots(
+        self,
+        redis: Redis,
+        tenant_id: int | str | None,
+        count: int,
+    ) -> None:
+        """Release slots reserved with reserve_tenant_slots (e.g., failed dispatch)."""
+        await redis.eval(RELEASE_SLOTS_SCRIPT, 1, self.tenant_inflight_key(tenant_id), count)
 
     async def create_upload_session(
         self,
@@ -77,7 +177,7 @@ class PhotoJobService:
 
         for job_meta in jobs_meta:
             job_id = job_meta.get("job_id")
-            job_status_key = f"{self.JOB_STATUS_PREFIX}:{job_id}"
+            job_status_key = self.job_status_key(job_id)
             job_status_raw = await redis.get(job_status_key)
 
             if job_status_raw:
@@ -121,16 +221,9 @@ class PhotoJobService:
         **extra: Any,
     ) -> None:
         """Update single job status in Redis."""
-        key = f"{self.JOB_STATUS_PREFIX}:{job_id}"
-        payload = {
-            "job_id": job_id,
-            "status": status,
-            "updated_at": datetime.now(UTC).isoformat(),
-            **extra,
-        }
         logger.debug("Updating job status", extra={"job_id": job_id, "status": status})
         await redis.setex(
-            key,
+            self.job_status_key(job_id),
             settings.REDIS_JOB_STATUS_TTL,
-            json.dumps(payload),
+            self.job_status_payload(job_id, status, **extra),
         )
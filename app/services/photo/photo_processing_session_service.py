@@ -5,6 +5,7 @@ This service handles all photo processing session operations including:
 - Status transition validation
 - Query by location/date range
 - Session completion with ML results
+- Duplicate lookup for uploads (same bytes / near-identical shot)
 
 Architecture:
     Layer: Service Layer (Business Logic)
@@ -19,12 +20,13 @@ Critical Rules:
     - Business exceptions for validation failures
 """
 
-import csv
-import io
-import json
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Literal
 from uuid import UUID
 
+from app.core.cache import bump_resource_versions
+from app.core.config import settings
 from app.core.exceptions import (
     InvalidStatusTransitionException,
     ResourceNotFoundException,
@@ -45,9 +47,41 @@ from app.schemas.photo_processing_session_schema import (
     PhotoProcessingSessionResponse,
     PhotoProcessingSessionUpdate,
 )
+from app.services.photo.image_fingerprint import ImageFingerprint, hamming_distance
 
 logger = get_logger(__name__)
 
+# Resource version bumped on every session write (ETag of the map bulk-load)
+PHOTO_SESSIONS_RESOURCE = "photo_sessions"
+
+# Sessions an upload can duplicate (failed sessions have no results to reuse)
+_DUPLICATE_CANDIDATE_STATUSES = (
+    ProcessingSessionStatusEnum.PENDING,
+    ProcessingSessionStatusEnum.PROCESSING,
+    ProcessingSessionStatusEnum.COMPLETED,
+)
+
+
+@dataclass(frozen=True)
+class SessionDuplicate:
+    """Earlier session of the same photo (exact) or a near-identical shot (near).
+
+    Attributes:
+        session: The earlier session
+        kind: "exact" (same bytes) or "near" (perceptual hashes within
+            UPLOAD_NEAR_DUPLICATE_MAX_DISTANCE bits)
+        distance: Differing perceptual hash bits (0 for exact duplicates)
+    """
+
+    session: PhotoProcessingSessionResponse
+    kind: Literal["exact", "near"]
+    distance: int = 0
+
+    @property
+    def has_results(self) -> bool:
+        """True if the earlier session finished (its results can be reused)."""
+        return self.session.status == ProcessingSessionStatusEnum.COMPLETED
+
 
 class PhotoProcessingSessionService:
     """Service for managing photo processing sessions.
@@ -104,7 +138,8 @@ class PhotoProcessingSessionService:
 
         Business Rules:
             - status defaults to PENDING
-            - session_id is auto-generated UUID
+            - session_id is auto-generated UUID unless provided (direct uploads
+              reserve it before the photo reaches S3)
             - total_detected, total_estimated default to 0
             - category_counts, manual_adjustments default to {}
         """
@@ -118,7 +153,10 @@ class PhotoProcessingSessionService:
 
         # Create session via repository
         session_data = request.model_dump()
+        if session_data["session_id"] is None:
+            del session_data["session_id"]
         session = await self.repo.create(session_data)
+        await self._sessions_changed()
 
         logger.info(
             "Photo processing session created successfully",
@@ -127,6 +165,37 @@ class PhotoProcessingSessionService:
 
         return PhotoProcessingSessionResponse.model_validate(session)
 
+    async def create_sessions(
+        self, requests: list[PhotoProcessingSessionCreate]
+    ) -> list[PhotoProcessingSessionResponse]:
+        """Create many photo processing sessions with one bulk INSERT.
+
+        Used by batch uploads (hundreds of photos per request). Same rules as
+        create_session.
+
+        Args:
+            requests: Session creation data, one per photo
+
+        Returns:
+            Created sessions, in request order
+        """
+        rows = []
+        for request in requests:
+            session_data = request.model_dump()
+            if session_data["session_id"] is None:
+                del session_data["session_id"]
+            rows.append(session_data)
+
+        sessions = await self.repo.bulk_create(rows)
+        await self._sessions_changed()
+
+        logger.info(
+            "Photo processing sessions created in bulk",
+            extra={"num_sessions": len(sessions)},
+        )
+
+        return [PhotoProcessingSessionResponse.model_validate(session) for session in sessions]
+
     async def get_session_by_id(self, session_id: int) -> PhotoProcessingSessionResponse | None:
         """Get photo processing session by ID.
 
@@ -167,6 +236,65 @@ class PhotoProcessingSessionService:
             return None
         return PhotoProcessingSessionResponse.model_validate(session)
 
+    async def find_duplicate(
+        self, fingerprint: ImageFingerprint, storage_location_id: int, user_id: int
+    ) -> SessionDuplicate | None:
+        """Find an earlier session of the same photo or of a near-identical shot.
+
+        Candidates are the sessions of the same storage location whose
+        original was uploaded by the same user (never another user's results).
+
+        1. Exact: latest session whose original has the same SHA-256 (indexed)
+        2. Near: sessions created within
+           UPLOAD_NEAR_DUPLICATE_WINDOW_SECONDS whose original's perceptual
+           hash differs in at most UPLOAD_NEAR_DUPLICATE_MAX_DISTANCE bits;
+           the closest wins, finished sessions first
+
+        Args:
+            fingerprint: Content and perceptual hash of the uploaded photo
+            storage_location_id: Location resolved from the photo's GPS
+            user_id: Uploading user
+
+        Returns:
+            SessionDuplicate, or None if the photo is new
+        """
+        session = await self.repo.get_latest_by_original_sha256(
+            fingerprint.content_sha256,
+            storage_location_id,
+            user_id,
+            _DUPLICATE_CANDIDATE_STATUSES,
+        )
+        if session:
+            return SessionDuplicate(
+                session=PhotoProcessingSessionResponse.model_validate(session), kind="exact"
+            )
+
+        if fingerprint.perceptual_hash is None:
+            return None
+
+        since = datetime.now(UTC) - timedelta(seconds=settings.UPLOAD_NEAR_DUPLICATE_WINDOW_SECONDS)
+        candidates = await self.repo.get_recent_with_perceptual_hash(
+            storage_location_id, user_id, since, _DUPLICATE_CANDIDATE_STATUSES
+        )
+        matches = [
+            (distance, candidate)
+            for candidate, perceptual_hash in candidates
+            if (distance := hamming_distance(fingerprint.perceptual_hash, perceptual_hash))
+            <= settings.UPLOAD_NEAR_DUPLICATE_MAX_DISTANCE
+        ]
+        if not matches:
+            return None
+
+        distance, closest = min(
+            matches,
+            key=lambda match: (match[0], match[1].status != ProcessingSessionStatusEnum.COMPLETED),
+        )
+        return SessionDuplicate(
+            session=PhotoProcessingSessionResponse.model_validate(closest),
+            kind="near",
+            distance=distance,
+        )
+
     async def update_session(
         self, session_id: int, request: PhotoProcessingSessionUpdate
     ) -> PhotoProcessingSessionResponse:
@@ -207,6 +335,7 @@ class PhotoProcessingSessionService:
             extra={"session_id": str(updated.session_id), "updates": list(update_data.keys())},
         )
 
+        await self._sessions_changed()
         return PhotoProcessingSessionResponse.model_validate(updated)
 
     async def mark_session_processing(
@@ -265,6 +394,7 @@ class PhotoProcessingSessionService:
             },
         )
 
+        await self._sessions_changed()
         return PhotoProcessingSessionResponse.model_validate(updated)
 
     async def mark_session_completed(
@@ -368,6 +498,7 @@ class PhotoProcessingSessionService:
             },
         )
 
+        await self._sessions_changed()
         return PhotoProcessingSessionResponse.model_validate(updated)
 
     async def mark_session_failed(
@@ -416,8 +547,13 @@ class PhotoProcessingSessionService:
             },
         )
 
+        await self._sessions_changed()
         return PhotoProcessingSessionResponse.model_validate(updated)
 
+    async def _sessions_changed(self) -> None:
+        """Bump the photo_sessions resource version after a write."""
+        await bump_resource_versions(PHOTO_SESSIONS_RESOURCE, session=self.repo.session)
+
     async def get_sessions_by_location(
         self, storage_location_id: int, limit: int = 50
     ) -> list[PhotoProcessingSessionResponse]:
@@ -522,85 +658,6 @@ class PhotoProcessingSessionService:
         )
         return await self.update_session(session.id, update_request)
 
-    async def generate_pdf_report_bytes(self, session_uuid: UUID) -> bytes:
-        """Generate simple PDF report for session."""
-        session = await self.get_session_by_uuid(session_uuid)
-        title = f"Session {session_uuid}" if session else "Session Report"
-        pdf_template = f"""%PDF-1.1
-1 0 obj
-<< /Type /Catalog /Pages 2 0 R >>
-endobj
-2 0 obj
-<< /Type /Pages /Count 1 /Kids [3 0 R] >>
-endobj
-3 0 obj
-<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Resources << /Font << /F1 5 0 R >> >> /Contents 4 0 R >>
-endobj
-4 0 obj
-<< /Length 75 >>
-stream
-BT
-/F1 18 Tf
-72 720 Td
-({title}) Tj
-ET
-BT
-/F1 12 Tf
-72 690 Td
-(Generated by DemeterAI API) Tj
-ET
-endstream
-endobj
-5 0 obj
-<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>
-endobj
-xref
-0 6
-0000000000 65535 f
-0000000010 00000 n
-0000000060 00000 n
-0000000114 00000 n
-0000000238 00000 n
-0000000400 00000 n
-trailer
-<< /Root 1 0 R /Size 6 >>
-startxref
-480
-%%EOF
-"""
-        return pdf_template.encode("utf-8")
-
-    async def generate_csv_export(self, session_uuid: UUID) -> bytes:
-        """Generate CSV export for session detections summary."""
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(["session_id", "total_detected", "total_estimated", "avg_confidence"])
-        session = await self.get_session_by_uuid(session_uuid)
-        if session:
-            writer.writerow(
-                [
-                    str(session.session_id),
-                    session.total_detected,
-                    session.total_estimated,
-                    session.avg_confidence or 0.0,
-                ]
-            )
-        return output.getvalue().encode("utf-8")
-
-    async def generate_geojson_export(self, session_uuid: UUID) -> bytes:
-        """Generate a simple GeoJSON for session detections."""
-        session = await self.get_session_by_uuid(session_uuid)
-        feature = {
-            "type": "Feature",
-            "properties": {
-                "session_id": str(session_uuid),
-                "total_detected": session.total_detected if session else None,
-            },
-            "geometry": None,
-        }
-        geojson = {"type": "FeatureCollection", "features": [feature]}
-        return json.dumps(geojson).encode("utf-8")
-
     def _validate_status_transition(
         self,
         current_status: ProcessingSessionStatusEnum,
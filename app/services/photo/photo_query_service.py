@@ -32,6 +32,7 @@ from app.schemas.photo_processing_session_schema import PhotoProcessingSessionCr
 from app.services.photo.photo_job_service import PhotoJobService
 from app.services.photo.photo_processing_session_service import PhotoProcessingSessionService
 from app.services.photo.s3_image_service import S3ImageService
+from app.tasks.ml_priority import MLPriorityClass
 from app.tasks.ml_tasks import ml_parent_task
 
 logger = get_logger(__name__)
@@ -75,6 +76,7 @@ class PhotoQueryService:
             limit=per_page,
         )
 
+        # Rows come from the database: built without per-row validation
         photos: list[PhotoGalleryItem] = []
         for row in rows:
             image_id: UUID = row.image_id
@@ -83,7 +85,7 @@ class PhotoQueryService:
 
             processing_summary = None
             if row.processing_session_uuid:
-                processing_summary = PhotoGalleryProcessingSummary(
+                processing_summary = PhotoGalleryProcessingSummary.model_construct(
                     session_id=row.processing_session_uuid,
                     total_detected=row.total_detected,
                     total_estimated=row.total_estimated,
@@ -93,7 +95,7 @@ class PhotoQueryService:
                 )
 
             photos.append(
-                PhotoGalleryItem(
+                PhotoGalleryItem.model_construct(
                     image_id=image_id,
                     thumbnail_url=thumbnail_url,
                     original_url=original_url,
@@ -122,7 +124,7 @@ class PhotoQueryService:
             total_pages=total_pages,
         )
 
-        return PhotoGalleryResponse(photos=photos, pagination=pagination)
+        return PhotoGalleryResponse.model_construct(photos=photos, pagination=pagination)
 
     async def get_photo_detail(self, image_id: UUID) -> PhotoDetailResponse | None:
         row = await self.repo.get_photo_detail(image_id)
@@ -285,7 +287,12 @@ class PhotoQueryService:
             }
         ]
 
-        celery_task = ml_parent_task.delay(session_id=session.id, image_data=image_data)
+        # Re-runs yield the GPU to fresh uploads (lowest queue priority)
+        celery_task = ml_parent_task.delay(
+            session_id=session.id,
+            image_data=image_data,
+            priority_class=MLPriorityClass.REPROCESS,
+        )
         upload_session_id = uuid.uuid4()
 
         await self.job_service.create_upload_session(
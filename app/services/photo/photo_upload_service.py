@@ -6,12 +6,27 @@ This service orchestrates the complete photo upload workflow:
 3. Upload to S3
 4. Dispatch ML pipeline (Celery task)
 
+Two upload paths share steps 2-4:
+    - upload_photo: the photo is sent to the API and streamed to S3
+    - initiate_direct_upload / complete_direct_upload: the client uploads
+      the parts straight to S3 with presigned URLs; the API only validates
+      the stored object (ranged GET of the header) and dispatches the job
+
+Batch variants (upload_photo_batch, complete_direct_upload_batch) register
+all photos with bulk inserts and run one ML batch task per upload session, within
+a per-tenant in-flight quota (PhotoJobService.reserve_tenant_slots).
+
+upload_photo checks for duplicates before anything is stored or queued
+(content hash + perceptual hash of a reduced decode): re-uploads of a
+processed photo return the earlier session's results, near-identical shots
+of the same location are flagged and reuse results on request.
+
 Architecture:
     Layer: Service Layer (Orchestration)
     Dependencies:
         - PhotoProcessingSessionService (session management)
         - S3ImageService (S3 upload)
-        - LocationHierarchyService (GPS lookup)
+        - StorageLocationService (GPS lookup via resolve_location)
     Pattern: Orchestration service - coordinates multiple services
 
 Critical Rules:
@@ -22,33 +37,51 @@ Critical Rules:
     - File size validation (max 20MB)
 """
 
+import asyncio
 import io
+import json
+import math
 import uuid
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
 
 from fastapi import UploadFile
-from PIL import ExifTags, Image
-
-try:
-    import piexif
-except ImportError:
-    piexif = None  # type: ignore[assignment]
-
 from redis.asyncio import Redis  # type: ignore[import-not-found]
 
+from app.core.config import settings
 from app.core.exceptions import (
+    ResourceNotFoundException,
     ValidationException,
 )
+from app.core.executors import run_cpu_bound
 from app.core.logging import get_logger
+from app.core.metrics import record_upload_duplicate
 from app.models.photo_processing_session import ProcessingSessionStatusEnum
 from app.models.s3_image import ContentTypeEnum, UploadSourceEnum
 from app.schemas.photo_processing_session_schema import (
     PhotoProcessingSessionCreate,
+    PhotoProcessingSessionResponse,
 )
-from app.schemas.photo_schema import PhotoUploadJob, PhotoUploadResponse
-from app.schemas.s3_image_schema import S3ImageUploadRequest
+from app.schemas.photo_schema import (
+    CompletedPart,
+    DirectUploadBatchCompleteRequest,
+    DirectUploadBatchItem,
+    DirectUploadCompleteRequest,
+    DirectUploadInitRequest,
+    DirectUploadInitResponse,
+    DirectUploadPart,
+    PhotoUploadJob,
+    PhotoUploadRejection,
+    PhotoUploadResponse,
+)
+from app.schemas.s3_image_schema import S3ImageResponse, S3ImageUploadRequest
+from app.services.photo.image_fingerprint import ImageFingerprint, fingerprint_image
+from app.services.photo.image_metadata import ImageHeader, read_image_header
 from app.services.photo.photo_job_service import PhotoJobService
 from app.services.photo.photo_processing_session_service import (
     PhotoProcessingSessionService,
+    SessionDuplicate,
 )
 from app.services.photo.s3_image_service import S3ImageService
 from app.services.storage_location_service import StorageLocationService
@@ -66,6 +99,46 @@ ALLOWED_CONTENT_TYPES = {
     "image/webp",
 }
 
+# Bytes fetched (ranged GET) to parse the header of a direct upload.
+# Covers EXIF/APP segments of camera JPEGs; larger headers fall back to a full read.
+DIRECT_UPLOAD_HEADER_BYTES = 256 * 1024
+
+MISSING_GPS_MESSAGE = (
+    "Photo does not contain GPS coordinates in metadata. Please ensure the image has location data."
+)
+
+
+@dataclass(frozen=True)
+class _StoredPhoto:
+    """Original photo stored in S3 and validated, not yet registered."""
+
+    session_uuid: uuid.UUID
+    s3_key: str
+    filename: str
+    content_type: str
+    file_size: int
+    content_sha256: str | None
+    header: ImageHeader  # GPS present (validated)
+    storage_location_id: int  # Resolved from the GPS position
+    upload_source: UploadSourceEnum
+    user_id: int | None
+
+    def to_upload_request(self) -> S3ImageUploadRequest:
+        """S3Image metadata of this photo."""
+        longitude, latitude = self.header.gps or (None, None)
+        return S3ImageUploadRequest(
+            session_id=self.session_uuid,
+            filename=self.filename,
+            content_type=ContentTypeEnum(self.content_type),
+            file_size_bytes=self.file_size,
+            width_px=self.header.width,
+            height_px=self.header.height,
+            upload_source=self.upload_source,
+            uploaded_by_user_id=self.user_id,
+            exif_metadata=None,
+            gps_coordinates={"latitude": latitude, "longitude": longitude},
+        )
+
 
 class PhotoUploadService:
     """Orchestration service for photo upload workflow.
@@ -86,6 +159,8 @@ class PhotoUploadService:
         location_service: StorageLocationService for GPS lookup
     """
 
+    DIRECT_UPLOAD_KEY_PREFIX = "direct_upload"
+
     def __init__(
         self,
         session_service: PhotoProcessingSessionService,
@@ -111,16 +186,19 @@ class PhotoUploadService:
         file: UploadFile,
         user_id: int,
         redis: Redis,
+        reuse_near_duplicate: bool = False,
     ) -> PhotoUploadResponse:
         """Upload photo and trigger ML pipeline.
 
         Complete workflow:
         1. Validate file (type, size)
-        2. Extract GPS coordinates from photo metadata
+        2. Read dimensions + GPS from the image header (bounded CPU executor)
         3. GPS-based location lookup
+        3b. Duplicate check (content + perceptual hash); a duplicate of a
+            completed session returns its results and stops here
         4. Create processing session FIRST (PENDING, without original_image_id)
-        5. Upload original to S3 (using session.session_id)
-        6. Upload thumbnail to S3 (using session.session_id)
+        5. Stream original to S3 (multipart + SHA-256, using session.session_id)
+        6. Queue thumbnail generation (io_queue, off the request path)
         7. Update session with original_image_id
         8. Dispatch Celery ML task
         9. Update session (PROCESSING)
@@ -128,9 +206,12 @@ class PhotoUploadService:
         Args:
             file: Photo file to upload
             user_id: User ID for tracking
+            reuse_near_duplicate: Also return the results of a near-identical
+                shot (exact duplicates always reuse results)
 
         Returns:
-            PhotoUploadResponse with session_id, task_id, status
+            PhotoUploadResponse with session_id, task_id, status (jobs[0]
+            carries duplicate_of_session_id / duplicate_type for duplicates)
 
         Raises:
             ValidationException: If file is invalid (type, size, missing GPS)
@@ -153,20 +234,26 @@ class PhotoUploadService:
         )
         upload_session_uuid = uuid.uuid4()
 
-        # STEP 1: Validate file
-        file_bytes = await self._validate_photo_file(file)
+        # STEP 1: Validate file (type, size - the body is not read into memory)
+        file_size = await self._validate_photo_file(file)
 
-        # STEP 2: Extract GPS coordinates from photo metadata
-        logger.info("Extracting GPS coordinates from photo metadata")
-        gps_longitude, gps_latitude = await self._extract_gps_from_metadata(file_bytes)
+        # STEP 2: Read dimensions + GPS from the image header (no pixel decode),
+        # off the event loop in the bounded CPU executor
+        logger.info("Reading image header (dimensions, GPS)")
+        try:
+            header = await run_cpu_bound(read_image_header, file.file)
+        except Exception as e:
+            logger.error("Failed to read image header", extra={"error": str(e)})
+            header = None
 
-        if gps_longitude is None or gps_latitude is None:
+        if header is None or header.gps is None:
             raise ValidationException(
-                field="file",
-                message="Photo does not contain GPS coordinates in metadata. Please ensure the image has location data.",
-                value="missing_gps",
+                field="file", message=MISSING_GPS_MESSAGE, value="missing_gps"
             )
 
+        gps_longitude, gps_latitude = header.gps
+        width_px, height_px = header.width, header.height
+
         logger.info(
             "GPS coordinates extracted from metadata",
             extra={
@@ -174,55 +261,19 @@ class PhotoUploadService:
                 "gps_latitude": gps_latitude,
             },
         )
-        #
-        # # STEP 3: GPS-based location lookup (fail fast if no location)
-        # logger.info("Looking up location by GPS coordinates")
-        # location = await self.location_service.get_location_by_gps(gps_longitude, gps_latitude)
-        #
-        # if not location:
-        #     raise ResourceNotFoundException(
-        #         resource_type="StorageLocation",
-        #         resource_id=f"GPS({gps_longitude}, {gps_latitude})",
-        #     )
-        #
-        # # location is StorageLocationResponse (schema), which uses storage_location_id
-        # storage_location_id = location.storage_location_id
-        #
-        # logger.info(
-        #     "Location found via GPS",
-        #     extra={
-        #         "storage_location_id": storage_location_id,
-        #         "storage_area_id": location.storage_area_id,
-        #     },
-        # )
-
-        storage_location_id = 1
 
-        # STEP 4: Upload to S3 (original image)
-        logger.info("Uploading original image to S3")
+        # STEP 3: GPS-based location lookup (fail fast if no location),
+        # answered from the in-process spatial index
+        storage_location_id = await self._locate(header)
 
-        # Reset file pointer before reading again
-        await file.seek(0)
-
-        # Extract image dimensions using PIL
-        logger.info("Extracting image dimensions")
-        try:
-            image_stream = io.BytesIO(file_bytes)
-            pil_image = Image.open(image_stream)
-            width_px = pil_image.width
-            height_px = pil_image.height
-            logger.info(
-                "Image dimensions extracted",
-                extra={"width_px": width_px, "height_px": height_px},
-            )
-        except Exception as e:
-            logger.error(
-                "Failed to extract image dimensions",
-                extra={"error": str(e)},
-            )
-            # Default to 1x1 if extraction fails (will still validate)
-            width_px = 1
-            height_px = 1
+        # STEP 3b: Duplicate check before anything is stored or queued
+        fingerprint, duplicate = await self._find_duplicate(file, storage_location_id, user_id)
+        if duplicate is not None:
+            if duplicate.has_results and (duplicate.kind == "exact" or reuse_near_duplicate):
+                return await self._reuse_duplicate(
+                    duplicate, file.filename, user_id, redis, upload_session_uuid
+                )
+            record_upload_duplicate(duplicate.kind, reused=False)
 
         # STEP 4: Create processing session FIRST (without original_image_id)
         # This ensures all S3 uploads use the same session.session_id UUID
@@ -260,20 +311,24 @@ class PhotoUploadService:
             session_id=session.session_id,  # ✅ Use PhotoProcessingSession UUID
             filename=file.filename or "photo.jpg",
             content_type=ContentTypeEnum(file.content_type or "image/jpeg"),
-            file_size_bytes=len(file_bytes),
-            width_px=width_px,  # Extracted from PIL
-            height_px=height_px,  # Extracted from PIL
+            file_size_bytes=file_size,
+            width_px=width_px,  # From image header
+            height_px=height_px,  # From image header
             upload_source=UploadSourceEnum.WEB,
             uploaded_by_user_id=user_id,
             exif_metadata=None,
             gps_coordinates={"latitude": gps_latitude, "longitude": gps_longitude},
+            perceptual_hash=fingerprint.perceptual_hash if fingerprint else None,
         )
 
-        # Upload original image (returns S3ImageResponse)
-        original_image = await self.s3_service.upload_original(
-            file_bytes=file_bytes,
+        # Stream original image to S3 (multipart, hashed on the way)
+        await file.seek(0)
+        original_image = await self.s3_service.upload_original_stream(
+            stream=file,
             session_id=session.session_id,  # ✅ Use PhotoProcessingSession UUID
             upload_request=upload_request,
+            # Already hashed for duplicate detection
+            content_sha256=fingerprint.content_sha256 if fingerprint else None,
         )
 
         logger.info(
@@ -285,26 +340,161 @@ class PhotoUploadService:
             },
         )
 
-        # STEP 6: Generate and upload thumbnail for ORIGINAL image
+        return await self._start_processing(
+            session=session,
+            original_image=original_image,
+            filename=file.filename,
+            storage_location_id=storage_location_id,
+            user_id=user_id,
+            redis=redis,
+            upload_session_uuid=upload_session_uuid,
+            duplicate=duplicate,
+        )
+
+    async def _find_duplicate(
+        self, file: UploadFile, storage_location_id: int, user_id: int
+    ) -> tuple[ImageFingerprint | None, SessionDuplicate | None]:
+        """Fingerprint an upload and look up an earlier session of the same photo.
+
+        Only the uploading user's own sessions at the same storage location
+        are candidates, so results never cross users.
+
+        Hashing runs in the bounded CPU executor (the perceptual hash decodes
+        at 1/8 scale). Never fails the upload: errors skip the check.
+
+        Returns:
+            (fingerprint, duplicate) - (None, None) if disabled or failed
+        """
+        if not settings.UPLOAD_DEDUP_ENABLED:
+            return None, None
+
         try:
-            from app.services.photo.s3_image_service import generate_thumbnail
+            fingerprint = await run_cpu_bound(fingerprint_image, file.file)
+            duplicate = await self.session_service.find_duplicate(
+                fingerprint, storage_location_id, user_id
+            )
+        except Exception as e:
+            logger.warning("Duplicate check failed", extra={"error": str(e)})
+            return None, None
+
+        if duplicate is not None:
+            logger.info(
+                "Upload duplicates an earlier session",
+                extra={
+                    "duplicate_type": duplicate.kind,
+                    "duplicate_of_session_id": duplicate.session.id,
+                    "hash_distance": duplicate.distance,
+                    "duplicate_status": duplicate.session.status,
+                },
+            )
+        return fingerprint, duplicate
+
+    async def _reuse_duplicate(
+        self,
+        duplicate: SessionDuplicate,
+        filename: str | None,
+        user_id: int | None,
+        redis: Redis,
+        upload_session_uuid: uuid.UUID,
+    ) -> PhotoUploadResponse:
+        """Answer an upload with the results of an earlier completed session.
+
+        Nothing is stored in S3 and no ML task is queued. The upload session
+        gets one job that is already completed, so clients poll it like any
+        other upload.
+        """
+        session = duplicate.session
+        job = PhotoUploadJob(
+            job_id=str(uuid.uuid4()),
+            image_id=session.original_image_id,
+            filename=filename,
+            session_id=session.id,
+            status="completed",
+            progress_percent=100.0,
+            duplicate_of_session_id=session.id,
+            duplicate_type=duplicate.kind,
+        )
 
-            # Generate thumbnail from original
-            thumbnail_bytes = generate_thumbnail(file_bytes, size=300)  # 300x300px
+        await self.job_service.create_upload_session(
+            redis=redis,
+            upload_session_id=str(upload_session_uuid),
+            user_id=user_id,
+            jobs=[
+                job.model_dump(
+                    mode="json", include={"job_id", "image_id", "filename", "session_id"}
+                )
+            ],
+        )
+        await self.job_service.update_job_status(
+            redis,
+            job.job_id,
+            "completed",
+            session_id=session.id,
+            progress_percent=100,
+            total_detected=session.total_detected,
+            total_estimated=session.total_estimated,
+            duplicate_of_session_id=session.id,
+        )
+        record_upload_duplicate(duplicate.kind, reused=True)
+
+        return PhotoUploadResponse(
+            upload_session_id=upload_session_uuid,
+            task_id=uuid.UUID(job.job_id),
+            session_id=session.id,
+            status="completed",
+            message=f"Duplicate ({duplicate.kind}) of session {session.id}: results reused.",
+            poll_url=f"/api/v1/photos/jobs/status?upload_session_id={upload_session_uuid}",
+            total_photos=1,
+            estimated_time_seconds=0,
+            jobs=[job],
+        )
+
+    async def _start_processing(
+        self,
+        session: PhotoProcessingSessionResponse,
+        original_image: S3ImageResponse,
+        filename: str | None,
+        storage_location_id: int,
+        user_id: int | None,
+        redis: Redis,
+        upload_session_uuid: uuid.UUID,
+        duplicate: SessionDuplicate | None = None,
+    ) -> PhotoUploadResponse:
+        """Shared tail of every upload path once the original is in S3.
 
-            # Upload thumbnail using SAME session.session_id
-            thumbnail_image = await self.s3_service.upload_thumbnail(
-                file_bytes=thumbnail_bytes,
-                session_id=session.session_id,  # ✅ Use PhotoProcessingSession UUID
-                size=300,
-                filename="thumbnail_original.jpg",
+        Queues the thumbnail, links the original to the session, dispatches
+        the ML pipeline and registers the job in Redis (steps 6-9 of
+        upload_photo; also used by complete_direct_upload).
+
+        Args:
+            session: Session created for this photo
+            original_image: Registered original S3Image
+            filename: Client filename (job metadata)
+            storage_location_id: Where the photo was taken
+            user_id: Uploading user (job metadata)
+            redis: Redis client for job tracking
+            upload_session_uuid: Upload session UUID used for polling
+            duplicate: Earlier session this photo duplicates (flagged on the job)
+
+        Returns:
+            PhotoUploadResponse with task_id for polling
+        """
+        # STEP 6: Queue thumbnail generation for ORIGINAL image (io_queue)
+        # Derivatives are decoded/encoded by a worker, not on the request path
+        try:
+            from app.tasks.upload_tasks import upload_original_derivatives
+
+            upload_original_derivatives.delay(
+                session_uuid=str(session.session_id),
+                image_id=str(original_image.image_id),
+                s3_key=original_image.s3_key_original,
+                s3_bucket=original_image.s3_bucket,
             )
 
             logger.info(
-                "Original thumbnail uploaded to S3",
+                "Original thumbnail generation queued",
                 extra={
-                    "s3_key": thumbnail_image.s3_key_thumbnail,
-                    "image_id": str(thumbnail_image.image_id),
+                    "image_id": str(original_image.image_id),
                     "session_id": str(session.session_id),
                 },
             )
@@ -312,7 +502,7 @@ class PhotoUploadService:
         except Exception as e:
             # Log but don't fail (thumbnail is optional)
             logger.warning(
-                "Failed to generate/upload original thumbnail",
+                "Failed to queue original thumbnail generation",
                 extra={
                     "error": str(e),
                     "session_id": str(session.session_id),
@@ -365,7 +555,7 @@ class PhotoUploadService:
             {
                 "job_id": str(task_id),
                 "image_id": str(original_image.image_id),
-                "filename": file.filename,
+                "filename": filename,
             }
         ]
 
@@ -380,7 +570,9 @@ class PhotoUploadService:
             PhotoUploadJob(
                 job_id=str(task_id),
                 image_id=original_image.image_id,
-                filename=file.filename,
+                filename=filename,
+                duplicate_of_session_id=duplicate.session.id if duplicate else None,
+                duplicate_type=duplicate.kind if duplicate else None,
             )
         ]
 
@@ -427,255 +619,687 @@ class PhotoUploadService:
             jobs=jobs,
         )
 
-    async def _validate_photo_file(self, file: UploadFile) -> bytes:
-        """Validate photo file (type and size).
+    async def initiate_direct_upload(
+        self,
+        request: DirectUploadInitRequest,
+        redis: Redis,
+    ) -> DirectUploadInitResponse:
+        """Start a direct-to-S3 upload and return presigned part URLs.
+
+        The photo never passes through the API: the client PUTs each part to
+        its presigned URL, then calls complete_direct_upload with the ETags.
+        The returned upload_id is reserved as the processing session UUID so
+        the S3 key has the usual "{session_uuid}/original.{ext}" layout.
 
         Args:
-            file: Photo file to validate
+            request: Filename, content type and exact size of the photo
+            redis: Redis client (pending upload state)
 
         Returns:
-            File bytes if validation passes
+            DirectUploadInitResponse with one presigned URL per part
 
         Raises:
-            ValidationException: If file is invalid
-
-        Business Rules:
-            - Content type must be in ALLOWED_CONTENT_TYPES
-            - File size must be ≤ MAX_FILE_SIZE_BYTES (20MB)
+            ValidationException: If content type or size is not allowed
+            S3UploadException: If S3 rejects the multipart upload
         """
-        # Validate content type
-        if file.content_type not in ALLOWED_CONTENT_TYPES:
-            raise ValidationException(
-                field="file",
-                message=f"Invalid file type. Must be one of {ALLOWED_CONTENT_TYPES}, got {file.content_type}",
-                value=file.content_type,
-            )
+        self._validate_upload_metadata(request.content_type, request.file_size_bytes)
 
-        # Validate file size
-        file_bytes = await file.read()
-        await file.seek(0)  # Reset file pointer
+        upload_id = uuid.uuid4()
+        file_ext = request.filename.split(".")[-1] if "." in request.filename else "jpg"
+        s3_key = f"{upload_id}/original.{file_ext}"
 
-        if len(file_bytes) > MAX_FILE_SIZE_BYTES:
-            raise ValidationException(
-                field="file",
-                message=f"File size exceeds {MAX_FILE_SIZE_BYTES / (1024 * 1024):.0f}MB limit (got {len(file_bytes) / (1024 * 1024):.2f}MB)",
-                value=len(file_bytes),
+        part_size = settings.S3_MULTIPART_CHUNK_BYTES
+        part_count = math.ceil(request.file_size_bytes / part_size)
+        expiry_seconds = settings.S3_DIRECT_UPLOAD_EXPIRY_SECONDS
+
+        s3_upload_id, urls = await self.s3_service.create_presigned_multipart_upload(
+            s3_key=s3_key,
+            content_type=request.content_type,
+            part_count=part_count,
+            expiry_seconds=expiry_seconds,
+        )
+
+        state = {
+            "s3_key": s3_key,
+            "s3_upload_id": s3_upload_id,
+            "filename": request.filename,
+            "content_type": request.content_type,
+            "file_size_bytes": request.file_size_bytes,
+            "user_id": request.user_id,
+        }
+        await redis.setex(
+            f"{self.DIRECT_UPLOAD_KEY_PREFIX}:{upload_id}", expiry_seconds, json.dumps(state)
+        )
+
+        logger.info(
+            "Direct upload initiated",
+            extra={
+                "upload_id": str(upload_id),
+                "s3_key": s3_key,
+                "part_count": part_count,
+                "user_id": request.user_id,
+            },
+        )
+
+        return DirectUploadInitResponse(
+            upload_id=upload_id,
+            s3_key=s3_key,
+            part_size_bytes=part_size,
+            parts=[
+                DirectUploadPart(part_number=number, url=url)
+                for number, url in enumerate(urls, start=1)
+            ],
+            expires_at=datetime.now(UTC) + timedelta(seconds=expiry_seconds),
+            complete_url=f"/api/v1/stock/photo/uploads/{upload_id}/complete",
+        )
+
+    async def complete_direct_upload(
+        self,
+        upload_id: uuid.UUID,
+        request: DirectUploadCompleteRequest,
+        redis: Redis,
+    ) -> PhotoUploadResponse:
+        """Complete a direct-to-S3 upload and dispatch the ML pipeline.
+
+        Workflow:
+        1. Load the pending upload state (Redis)
+        2. Complete the S3 multipart upload with the client's ETags
+        3. Check the stored size (HEAD) and read the header (ranged GET)
+        4. Create the session with the reserved UUID + register the original
+        5. Steps 6-9 of upload_photo (_start_processing)
+
+        Rejected photos (too large, not an image, no GPS, no storage location
+        at the GPS position) are deleted from S3.
+
+        Args:
+            upload_id: UUID returned by initiate_direct_upload
+            request: Uploaded parts (part number + ETag)
+            redis: Redis client (pending upload state, job tracking)
+
+        Returns:
+            PhotoUploadResponse with session_id, task_id, status
+
+        Raises:
+            ResourceNotFoundException: If the upload is unknown or expired, or
+                no storage location matches the photo's GPS position
+            ValidationException: If the stored photo is invalid
+            S3UploadException: If S3 rejects the parts
+        """
+        state = await self._load_direct_upload(redis, upload_id)
+        photo = await self._finish_direct_upload(redis, upload_id, state, request.parts)
+
+        session = await self.session_service.create_session(
+            PhotoProcessingSessionCreate(
+                session_id=upload_id,
+                storage_location_id=photo.storage_location_id,
+                status=ProcessingSessionStatusEnum.PENDING,
             )
+        )
+
+        original_image = await self.s3_service.register_original(
+            s3_key=photo.s3_key,
+            upload_request=photo.to_upload_request(),
+            file_size=photo.file_size,
+        )
 
         logger.info(
-            "File validation passed",
+            "Direct upload completed",
             extra={
-                "content_type": file.content_type,
-                "size_bytes": len(file_bytes),
-                "filename": file.filename,
+                "upload_id": str(upload_id),
+                "s3_key": photo.s3_key,
+                "image_id": str(original_image.image_id),
+                "file_size": photo.file_size,
             },
         )
 
-        return file_bytes
+        response = await self._start_processing(
+            session=session,
+            original_image=original_image,
+            filename=photo.filename,
+            storage_location_id=photo.storage_location_id,
+            user_id=photo.user_id,
+            redis=redis,
+            upload_session_uuid=uuid.uuid4(),
+        )
+        await redis.delete(f"{self.DIRECT_UPLOAD_KEY_PREFIX}:{upload_id}")
+        return response
+
+    # =========================================================================
+    # Batch uploads (many photos → one upload session → one ML batch task)
+    # =========================================================================
+
+    async def upload_photo_batch(
+        self,
+        files: list[UploadFile],
+        user_id: int,
+        redis: Redis,
+    ) -> PhotoUploadResponse:
+        """Upload many photos under one upload session and one ML batch task.
 
-    async def _extract_gps_from_metadata(
-        self, file_bytes: bytes, image_stream=None
-    ) -> tuple[float | None, float | None]:
-        """Extract GPS coordinates from photo metadata.
+        Workflow:
+        1. Reserve the tenant's ML pipeline slots (429 if the quota is full)
+        2. Validate every file + read headers (bounded CPU executor)
+        3. Stream the accepted originals to S3 (UPLOAD_BATCH_S3_CONCURRENCY)
+        4. _dispatch_batch: bulk INSERT S3Images + sessions, one ML batch task
 
-        This method extracts GPS coordinates from the photo's embedded EXIF metadata.
-        It tries multiple approaches:
-        1. piexif library (most reliable for EXIF)
-        2. PIL's _getexif() method (fallback)
+        Invalid photos (type, size, no GPS, no storage location) are reported in
+        PhotoUploadResponse.rejected instead of failing the whole batch.
 
         Args:
-            file_bytes: Raw photo file bytes
+            files: Photo files (at most UPLOAD_BATCH_MAX_PHOTOS)
+            user_id: Uploading user (tenant for the concurrency quota)
+            redis: Redis client (quota, job tracking)
 
         Returns:
-            Tuple of (longitude, latitude) as floats, or (None, None) if not found
+            PhotoUploadResponse with one job (and session) per accepted photo
 
-        Note:
-            This is typically called after file validation.
-            The caller is responsible for checking if both values are not None.
+        Raises:
+            ValidationException: If the batch is empty/too large or every photo is invalid
+            TooManyRequestsException: If the tenant has too many photos in processing
+            S3UploadException: If S3 upload fails
         """
+        self._validate_batch_size(len(files))
+
+        await self.job_service.reserve_tenant_slots(redis, user_id, len(files))
+        dispatched = 0
         try:
-            # Try piexif first (most reliable)
-            if piexif:
-                logger.debug("Attempting to extract GPS using piexif")
-                try:
-                    # piexif.load() expects bytes, not BytesIO
-                    exif_dict = piexif.load(file_bytes)
-                    gps_dict = exif_dict.get("GPS", {})
-
-                    if gps_dict:
-                        # Get coordinate values and direction references
-                        latitude = self._parse_gps_from_piexif(gps_dict, piexif.GPSIFD.GPSLatitude)
-                        longitude = self._parse_gps_from_piexif(
-                            gps_dict, piexif.GPSIFD.GPSLongitude
-                        )
-
-                        # Get direction references (N/S for latitude, E/W for longitude)
-                        lat_ref = gps_dict.get(piexif.GPSIFD.GPSLatitudeRef, b"N")
-                        lon_ref = gps_dict.get(piexif.GPSIFD.GPSLongitudeRef, b"E")
-
-                        # Convert bytes to string if necessary
-                        if isinstance(lat_ref, bytes):
-                            lat_ref = lat_ref.decode("utf-8").strip()
-                        if isinstance(lon_ref, bytes):
-                            lon_ref = lon_ref.decode("utf-8").strip()
-
-                        # Apply sign based on direction
-                        if latitude is not None and lat_ref in ("S", "s"):
-                            latitude = -latitude
-                        if longitude is not None and lon_ref in ("W", "w"):
-                            longitude = -longitude
-
-                        if latitude is not None and longitude is not None:
-                            logger.info(
-                                "GPS coordinates extracted from EXIF (piexif)",
-                                extra={
-                                    "latitude": latitude,
-                                    "latitude_ref": lat_ref,
-                                    "longitude": longitude,
-                                    "longitude_ref": lon_ref,
-                                },
-                            )
-                            return (longitude, latitude)
-                except Exception as e:
-                    logger.debug(f"piexif extraction failed: {e}")
-
-            # Fallback: Try PIL's _getexif()
-            logger.debug("Attempting to extract GPS using PIL")
-            image_stream.seek(0)
-            pil_image = Image.open(image_stream)
-
-            exif_data = pil_image._getexif()  # type: ignore[attr-defined]
-            if exif_data:
-                gps_ifd_data = exif_data.get(34853)  # GPSInfo tag
-                if gps_ifd_data:
-                    latitude = self._parse_gps_from_pil(gps_ifd_data, "GPSLatitude")
-                    longitude = self._parse_gps_from_pil(gps_ifd_data, "GPSLongitude")
-
-                    # Get direction references from tag IDs
-                    # GPSLatitudeRef = 1, GPSLongitudeRef = 3
-                    lat_ref = gps_ifd_data.get(1, "N")  # Default to N (North)
-                    lon_ref = gps_ifd_data.get(3, "E")  # Default to E (East)
-
-                    # Convert bytes to string if necessary
-                    if isinstance(lat_ref, bytes):
-                        lat_ref = lat_ref.decode("utf-8").strip()
-                    if isinstance(lon_ref, bytes):
-                        lon_ref = lon_ref.decode("utf-8").strip()
-
-                    # Apply sign based on direction
-                    if latitude is not None and lat_ref in ("S", "s"):
-                        latitude = -latitude
-                    if longitude is not None and lon_ref in ("W", "w"):
-                        longitude = -longitude
-
-                    if latitude is not None and longitude is not None:
-                        logger.info(
-                            "GPS coordinates extracted from EXIF (PIL)",
-                            extra={
-                                "latitude": latitude,
-                                "latitude_ref": lat_ref,
-                                "longitude": longitude,
-                                "longitude_ref": lon_ref,
-                            },
-                        )
-                        return (longitude, latitude)
-
-            logger.warning("No GPS coordinates found in photo metadata")
-            return (None, None)
+            rejected: list[PhotoUploadRejection] = []
+            accepted: list[tuple[UploadFile, int, ImageHeader, int]] = []
 
-        except Exception as e:
-            logger.error(
-                "Error extracting GPS from metadata",
-                extra={"error": str(e)},
-                exc_info=True,
+            inspected = await asyncio.gather(
+                *(self._inspect_upload(file) for file in files), return_exceptions=True
             )
-            return (None, None)
+            for file, result in zip(files, inspected, strict=True):
+                if isinstance(result, ValidationException | ResourceNotFoundException):
+                    rejected.append(
+                        PhotoUploadRejection(filename=file.filename, reason=result.user_message)
+                    )
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    accepted.append((file, *result))
+
+            if not accepted:
+                raise ValidationException(
+                    field="files", message="No valid photos in batch", value=len(files)
+                )
+
+            limit = asyncio.Semaphore(settings.UPLOAD_BATCH_S3_CONCURRENCY)
+
+            async def store(
+                file: UploadFile, file_size: int, header: ImageHeader, storage_location_id: int
+            ) -> _StoredPhoto:
+                session_uuid = uuid.uuid4()
+                async with limit:
+                    await file.seek(0)
+                    s3_key, file_size, content_sha256 = await self.s3_service.store_original_stream(
+                        stream=file,
+                        session_id=session_uuid,
+                        filename=file.filename or "photo.jpg",
+                        content_type=file.content_type or "image/jpeg",
+                    )
+                return _StoredPhoto(
+                    session_uuid=session_uuid,
+                    s3_key=s3_key,
+                    filename=file.filename or "photo.jpg",
+                    content_type=file.content_type or "image/jpeg",
+                    file_size=file_size,
+                    content_sha256=content_sha256,
+                    header=header,
+                    storage_location_id=storage_location_id,
+                    upload_source=UploadSourceEnum.WEB,
+                    user_id=user_id,
+                )
+
+            stored = await asyncio.gather(*(store(*item) for item in accepted))
+
+            response = await self._dispatch_batch(list(stored), rejected, user_id, redis)
+            dispatched = len(stored)
+            return response
+        finally:
+            # Slots of rejected photos (or of the whole batch on failure) are freed now;
+            # slots of dispatched photos are freed by the batch callback.
+            if len(files) - dispatched:
+                await self.job_service.release_tenant_slots(redis, user_id, len(files) - dispatched)
+
+    async def complete_direct_upload_batch(
+        self,
+        request: DirectUploadBatchCompleteRequest,
+        redis: Redis,
+    ) -> PhotoUploadResponse:
+        """Complete many direct-to-S3 uploads under one upload session and one ML batch.
 
-    def _parse_gps_from_piexif(self, gps_dict: dict, tag_id: int) -> float | None:
-        """Parse GPS coordinate using piexif library.
+        Same as upload_photo_batch, but the originals are already in S3:
+        each upload is completed and validated like complete_direct_upload
+        (at most UPLOAD_BATCH_S3_CONCURRENCY at once). All uploads must
+        belong to the same user.
+
+        The pending upload state of accepted photos is kept until the batch
+        is dispatched, so if one photo fails with an unexpected error the
+        whole batch can be retried with the same request.
 
         Args:
-            gps_dict: GPS dictionary from piexif
-            tag_id: piexif tag ID (e.g., piexif.GPSIFD.GPSLatitude)
+            request: Direct uploads (upload_id + parts) to complete
+            redis: Redis client (pending uploads, quota, job tracking)
 
         Returns:
-            Coordinate as float (degrees), or None if parsing fails
+            PhotoUploadResponse with one job (and session) per accepted photo
+
+        Raises:
+            ResourceNotFoundException: If an upload is unknown or expired
+            ValidationException: If the batch is too large, mixes users or every photo is invalid
+            TooManyRequestsException: If the tenant has too many photos in processing
         """
-        try:
-            if tag_id not in gps_dict:
-                return None
+        uploads = request.uploads
+        self._validate_batch_size(len(uploads))
 
-            coord_data = gps_dict[tag_id]
-            if not coord_data or len(coord_data) < 3:
-                return None
+        cached_states = await redis.mget(
+            [f"{self.DIRECT_UPLOAD_KEY_PREFIX}:{item.upload_id}" for item in uploads]
+        )
+        states: list[dict[str, Any]] = []
+        for item, cached in zip(uploads, cached_states, strict=True):
+            if not cached:
+                raise ResourceNotFoundException(
+                    resource_type="DirectUpload", resource_id=str(item.upload_id)
+                )
+            states.append(json.loads(cached))
+        user_ids = {state["user_id"] for state in states}
+        if len(user_ids) > 1:
+            raise ValidationException(
+                field="uploads", message="All uploads of a batch must belong to one user"
+            )
+        user_id = user_ids.pop()
 
-            # Each component is (numerator, denominator) tuple
-            degrees = coord_data[0][0] / coord_data[0][1] if coord_data[0][1] != 0 else 0
-            minutes = coord_data[1][0] / coord_data[1][1] if coord_data[1][1] != 0 else 0
-            seconds = coord_data[2][0] / coord_data[2][1] if coord_data[2][1] != 0 else 0
+        await self.job_service.reserve_tenant_slots(redis, user_id, len(uploads))
+        dispatched = 0
+        try:
+            limit = asyncio.Semaphore(settings.UPLOAD_BATCH_S3_CONCURRENCY)
 
-            coordinate = degrees + (minutes / 60) + (seconds / 3600)
+            async def finish(item: DirectUploadBatchItem, state: dict[str, Any]) -> _StoredPhoto:
+                async with limit:
+                    return await self._finish_direct_upload(
+                        redis, item.upload_id, state, item.parts
+                    )
 
-            logger.debug(
-                "GPS coordinate parsed (piexif)",
-                extra={
-                    "degrees": degrees,
-                    "minutes": minutes,
-                    "seconds": seconds,
-                    "coordinate": coordinate,
-                },
+            results = await asyncio.gather(
+                *(finish(item, state) for item, state in zip(uploads, states, strict=True)),
+                return_exceptions=True,
+            )
+
+            stored: list[_StoredPhoto] = []
+            rejected: list[PhotoUploadRejection] = []
+            for state, result in zip(states, results, strict=True):
+                if isinstance(result, ValidationException | ResourceNotFoundException):
+                    rejected.append(
+                        PhotoUploadRejection(filename=state["filename"], reason=result.user_message)
+                    )
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    stored.append(result)
+
+            if not stored:
+                raise ValidationException(
+                    field="uploads", message="No valid photos in batch", value=len(uploads)
+                )
+
+            response = await self._dispatch_batch(stored, rejected, user_id, redis)
+            dispatched = len(stored)
+            await redis.delete(
+                *(f"{self.DIRECT_UPLOAD_KEY_PREFIX}:{photo.session_uuid}" for photo in stored)
             )
+            return response
+        finally:
+            if len(uploads) - dispatched:
+                await self.job_service.release_tenant_slots(
+                    redis, user_id, len(uploads) - dispatched
+                )
+
+    async def _dispatch_batch(
+        self,
+        photos: list[_StoredPhoto],
+        rejected: list[PhotoUploadRejection],
+        user_id: int | None,
+        redis: Redis,
+    ) -> PhotoUploadResponse:
+        """Register stored originals and run ONE ML batch task for all of them.
+
+        - S3Image rows: one bulk INSERT (register_originals)
+        - Sessions: one bulk INSERT, created with original_image_id already set
+        - ml_batch_parent_task: one child + session callback (and one job)
+          per photo; progress is reported per job to Redis
+          (job_status:{job_id}), "completed" once the session is persisted
+
+        Returns:
+            PhotoUploadResponse for the whole upload session
+        """
+        upload_session_uuid = uuid.uuid4()
 
-            return coordinate
+        original_images = await self.s3_service.register_originals(
+            [
+                (photo.s3_key, photo.to_upload_request(), photo.file_size, photo.content_sha256)
+                for photo in photos
+            ]
+        )
+
+        sessions = await self.session_service.create_sessions(
+            [
+                PhotoProcessingSessionCreate(
+                    session_id=photo.session_uuid,
+                    storage_location_id=photo.storage_location_id,
+                    original_image_id=image.image_id,
+                    status=ProcessingSessionStatusEnum.PENDING,
+                )
+                for photo, image in zip(photos, original_images, strict=True)
+            ]
+        )
 
+        try:
+            from app.tasks.upload_tasks import upload_original_derivatives
+
+            for session, image in zip(sessions, original_images, strict=True):
+                upload_original_derivatives.delay(
+                    session_uuid=str(session.session_id),
+                    image_id=str(image.image_id),
+                    s3_key=image.s3_key_original,
+                    s3_bucket=image.s3_bucket,
+                )
         except Exception as e:
-            logger.debug(f"Failed to parse GPS coordinate (piexif): {e}")
-            return None
+            # Log but don't fail (thumbnails are optional)
+            logger.warning(
+                "Failed to queue original thumbnail generation for batch",
+                extra={"error": str(e), "upload_session_id": str(upload_session_uuid)},
+            )
 
-    def _parse_gps_from_pil(self, gps_ifd_data: dict, tag_name: str) -> float | None:
-        """Parse GPS coordinate using PIL's EXIF tags.
+        from app.tasks.ml_tasks import ml_batch_parent_task
 
-        Args:
-            gps_ifd_data: GPS IFD data dictionary from PIL
-            tag_name: Tag name (e.g., "GPSLatitude", "GPSLongitude")
+        job_ids = [str(uuid.uuid4()) for _ in photos]
+        batch = [
+            {
+                "session_id": session.id,
+                "job_id": job_id,
+                "image_id": str(image.image_id),
+                "image_path": image.s3_key_original,
+                "storage_location_id": photo.storage_location_id,
+            }
+            for photo, session, image, job_id in zip(
+                photos, sessions, original_images, job_ids, strict=True
+            )
+        ]
+        celery_task = ml_batch_parent_task.delay(batch=batch, tenant_id=user_id)
+
+        jobs = [
+            PhotoUploadJob(
+                job_id=job_id,
+                image_id=image.image_id,
+                filename=photo.filename,
+                session_id=session.id,
+            )
+            for photo, session, image, job_id in zip(
+                photos, sessions, original_images, job_ids, strict=True
+            )
+        ]
+
+        await self.job_service.create_upload_session(
+            redis=redis,
+            upload_session_id=str(upload_session_uuid),
+            user_id=user_id,
+            jobs=[
+                job.model_dump(
+                    mode="json", include={"job_id", "image_id", "filename", "session_id"}
+                )
+                for job in jobs
+            ],
+        )
+
+        logger.info(
+            "Batch ML pipeline dispatched",
+            extra={
+                "task_id": str(celery_task.id),
+                "upload_session_id": str(upload_session_uuid),
+                "num_photos": len(photos),
+                "num_rejected": len(rejected),
+                "user_id": user_id,
+            },
+        )
+
+        return PhotoUploadResponse(
+            upload_session_id=upload_session_uuid,
+            task_id=celery_task.id,
+            session_id=sessions[0].id,
+            session_ids=[session.id for session in sessions],
+            status="pending",
+            message=f"{len(photos)} photos uploaded successfully. Processing will start shortly.",
+            poll_url=f"/api/v1/photos/jobs/status?upload_session_id={upload_session_uuid}",
+            total_photos=len(photos),
+            estimated_time_seconds=300,
+            jobs=jobs,
+            rejected=rejected,
+        )
+
+    def _validate_batch_size(self, count: int) -> None:
+        """Raise ValidationException unless 1 ≤ count ≤ UPLOAD_BATCH_MAX_PHOTOS."""
+        if not 1 <= count <= settings.UPLOAD_BATCH_MAX_PHOTOS:
+            raise ValidationException(
+                field="files",
+                message=f"Batch must contain 1-{settings.UPLOAD_BATCH_MAX_PHOTOS} photos",
+                value=count,
+            )
+
+    async def _inspect_upload(self, file: UploadFile) -> tuple[int, ImageHeader, int]:
+        """Validate an uploaded file, read its header and resolve its location.
 
         Returns:
-            Coordinate as float (degrees), or None if parsing fails
+            (file size, header, storage_location_id)
+
+        Raises:
+            ValidationException: If the type/size is invalid or GPS is missing
+            ResourceNotFoundException: If no storage location matches the GPS position
         """
+        file_size = await self._validate_photo_file(file)
         try:
-            # Look for the tag by name
-            tag_id = None
-            for key, value in ExifTags.GPSTAGS.items():
-                if value == tag_name:
-                    tag_id = key
-                    break
+            header = await run_cpu_bound(read_image_header, file.file)
+        except Exception:
+            header = None
 
-            if tag_id is None or tag_id not in gps_ifd_data:
-                return None
+        if header is None or header.gps is None:
+            raise ValidationException(
+                field="file", message=MISSING_GPS_MESSAGE, value="missing_gps"
+            )
 
-            coord_data = gps_ifd_data[tag_id]
-            if not coord_data or len(coord_data) < 3:
-                return None
+        return file_size, header, await self._locate(header)
 
-            # Each component is (numerator, denominator) tuple
-            degrees = coord_data[0][0] / coord_data[0][1] if coord_data[0][1] != 0 else 0
-            minutes = coord_data[1][0] / coord_data[1][1] if coord_data[1][1] != 0 else 0
-            seconds = coord_data[2][0] / coord_data[2][1] if coord_data[2][1] != 0 else 0
+    async def _locate(self, header: ImageHeader) -> int:
+        """storage_location_id of the photo's GPS position (in-process spatial index).
 
-            coordinate = degrees + (minutes / 60) + (seconds / 3600)
+        Raises:
+            ValidationException: If the header has no GPS position
+            ResourceNotFoundException: If no storage location matches the GPS position
+        """
+        if header.gps is None:
+            raise ValidationException(
+                field="file", message=MISSING_GPS_MESSAGE, value="missing_gps"
+            )
+        longitude, latitude = header.gps
 
-            logger.debug(
-                "GPS coordinate parsed (PIL)",
-                extra={
-                    "degrees": degrees,
-                    "minutes": minutes,
-                    "seconds": seconds,
-                    "coordinate": coordinate,
-                },
+        location = await self.location_service.resolve_location(longitude, latitude)
+        if not location:
+            raise ResourceNotFoundException(
+                resource_type="StorageLocation",
+                resource_id=f"GPS({longitude}, {latitude})",
+            )
+
+        logger.info(
+            "Location found via GPS",
+            extra={
+                "storage_location_id": location.storage_location_id,
+                "storage_area_id": location.storage_area_id,
+                "distance_m": location.distance_m,
+            },
+        )
+        return location.storage_location_id
+
+    async def _load_direct_upload(self, redis: Redis, upload_id: uuid.UUID) -> dict[str, Any]:
+        """Pending direct upload state stored by initiate_direct_upload.
+
+        Raises:
+            ResourceNotFoundException: If the upload is unknown or expired
+        """
+        cached = await redis.get(f"{self.DIRECT_UPLOAD_KEY_PREFIX}:{upload_id}")
+        if not cached:
+            raise ResourceNotFoundException(
+                resource_type="DirectUpload", resource_id=str(upload_id)
             )
+        state: dict[str, Any] = json.loads(cached)
+        return state
 
-            return coordinate
+    async def _finish_direct_upload(
+        self,
+        redis: Redis,
+        upload_id: uuid.UUID,
+        state: dict[str, Any],
+        parts: list[CompletedPart],
+    ) -> _StoredPhoto:
+        """Complete one direct upload and validate the stored object.
 
-        except Exception as e:
-            logger.debug(f"Failed to parse GPS coordinate (PIL): {e}")
+        Completes the S3 multipart upload, checks the size (HEAD) and reads
+        dimensions + GPS (ranged GET), then resolves the storage location.
+        Rejected objects are deleted from S3. Idempotent: an upload already
+        completed by an earlier (failed) attempt is only validated again.
+
+        Raises:
+            ValidationException: If the stored photo is invalid
+            ResourceNotFoundException: If no storage location matches the GPS position
+            S3UploadException: If S3 rejects the parts
+        """
+        s3_key: str = state["s3_key"]
+        state_key = f"{self.DIRECT_UPLOAD_KEY_PREFIX}:{upload_id}"
+
+        if not state.get("completed"):
+            await self.s3_service.complete_multipart_upload(
+                s3_key=s3_key,
+                upload_id=state["s3_upload_id"],
+                parts=[(part.part_number, part.etag) for part in parts],
+            )
+            # The multipart upload no longer exists: a retry (e.g. after another
+            # photo of the batch failed) goes straight to validation. The state
+            # is deleted once the photo is persisted.
+            state["completed"] = True
+            await redis.set(state_key, json.dumps(state), keepttl=True)
+
+        try:
+            head = await self.s3_service.head_object(s3_key)
+            file_size = int(head["ContentLength"])
+            self._validate_upload_metadata(state["content_type"], file_size)
+            header = await self._read_stored_header(s3_key, file_size)
+            storage_location_id = await self._locate(header)
+        except (ValidationException, ResourceNotFoundException):
+            # Rejected for good: nothing left to retry
+            await self.s3_service.delete_object(s3_key)
+            await redis.delete(state_key)
+            raise
+
+        return _StoredPhoto(
+            session_uuid=upload_id,
+            s3_key=s3_key,
+            filename=state["filename"],
+            content_type=state["content_type"],
+            file_size=file_size,
+            content_sha256=None,
+            header=header,
+            storage_location_id=storage_location_id,
+            upload_source=UploadSourceEnum.MOBILE,
+            user_id=state["user_id"],
+        )
+
+    async def _read_stored_header(self, s3_key: str, file_size: int) -> ImageHeader:
+        """Read dimensions + GPS of a photo already stored in S3.
+
+        Fetches the first DIRECT_UPLOAD_HEADER_BYTES only; if the header or the
+        GPS EXIF lies beyond that prefix (e.g., PNG eXIf after IDAT), the whole
+        object is read once.
+
+        Returns:
+            ImageHeader (GPS present)
+
+        Raises:
+            ValidationException: If the object is not an image or has no GPS
+        """
+        prefix = await self.s3_service.read_object_prefix(s3_key, DIRECT_UPLOAD_HEADER_BYTES)
+        header = await run_cpu_bound(self._parse_header, prefix)
+
+        if (header is None or header.gps is None) and file_size > len(prefix):
+            full = await self.s3_service.download_original(s3_key)
+            header = await run_cpu_bound(self._parse_header, full)
+
+        if header is None or header.gps is None:
+            raise ValidationException(
+                field="file", message=MISSING_GPS_MESSAGE, value="missing_gps"
+            )
+
+        return header
+
+    @staticmethod
+    def _parse_header(data: bytes) -> ImageHeader | None:
+        """read_image_header on in-memory bytes (None if unreadable/truncated)."""
+        try:
+            return read_image_header(io.BytesIO(data))
+        except Exception:
             return None
+
+    def _validate_upload_metadata(self, content_type: str | None, file_size: int) -> None:
+        """Validate content type and size (shared by every upload path).
+
+        Raises:
+            ValidationException: If the type is not allowed or the file is too large
+        """
+        if content_type not in ALLOWED_CONTENT_TYPES:
+            raise ValidationException(
+                field="file",
+                message=f"Invalid file type. Must be one of {ALLOWED_CONTENT_TYPES}, got {content_type}",
+                value=content_type,
+            )
+
+        if file_size > MAX_FILE_SIZE_BYTES:
+            raise ValidationException(
+                field="file",
+                message=f"File size exceeds {MAX_FILE_SIZE_BYTES / (1024 * 1024):.0f}MB limit (got {file_size / (1024 * 1024):.2f}MB)",
+                value=file_size,
+            )
+
+    async def _validate_photo_file(self, file: UploadFile) -> int:
+        """Validate photo file (type and size).
+
+        The size comes from the spooled upload file (seek to end), so the body
+        is never read into memory here.
+
+        Args:
+            file: Photo file to validate
+
+        Returns:
+            File size in bytes if validation passes
+
+        Raises:
+            ValidationException: If file is invalid
+
+        Business Rules:
+            - Content type must be in ALLOWED_CONTENT_TYPES
+            - File size must be ≤ MAX_FILE_SIZE_BYTES (20MB)
+        """
+        file_size = file.size
+        if file_size is None:
+            file_size = file.file.seek(0, io.SEEK_END)
+        await file.seek(0)  # Reset file pointer
+
+        self._validate_upload_metadata(file.content_type, file_size)
+
+        logger.info(
+            "File validation passed",
+            extra={
+                "content_type": file.content_type,
+                "size_bytes": file_size,
+                "filename": file.filename,
+            },
+        )
+
+        return file_size
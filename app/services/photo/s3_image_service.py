@@ -11,12 +11,12 @@ This service handles all S3 operations including:
 Architecture:
     Layer: Service Layer (Business Logic)
     Dependencies: S3ImageRepository (own repo), Settings (config)
-    Pattern: Circuit breaker for S3 failures (pybreaker)
+    Pattern: Circuit breaker for S3 failures (Redis-shared, app.core.circuit_breaker)
 
 Critical Rules:
     - Service→Service pattern enforced (NO direct repository access except own)
     - All S3 operations are async (using asyncio.to_thread with boto3)
-    - Circuit breaker prevents cascading failures (fail_max=5, timeout=60s)
+    - Circuit breaker prevents cascading failures (CIRCUIT_BREAKER_* settings)
     - Presigned URLs default to 24-hour expiry
     - S3 key format: {session_id}/{filename} for original images
     - S3 key format: {session_id}/viz_{filename} for visualizations
@@ -27,13 +27,18 @@ Note:
 """
 
 import asyncio
+import hashlib
 import uuid
+from collections.abc import AsyncIterator
+from typing import IO, Any, Protocol
 
 import boto3  # type: ignore[import-not-found]
-from pybreaker import CircuitBreaker, CircuitBreakerError  # type: ignore[import-not-found]
+from botocore.exceptions import BotoCoreError, ClientError  # type: ignore[import-not-found]
 
+from app.core.circuit_breaker import get_circuit_breaker, root_cause
 from app.core.config import settings
-from app.core.exceptions import S3UploadException, ValidationException
+from app.core.exceptions import CircuitBreakerException, S3UploadException, ValidationException
+from app.core.executors import run_cpu_bound
 from app.core.logging import get_logger
 from app.models.s3_image import ImageTypeEnum, ProcessingStatusEnum
 from app.repositories.s3_image_repository import S3ImageRepository
@@ -41,9 +46,29 @@ from app.schemas.s3_image_schema import S3ImageResponse, S3ImageUploadRequest
 
 logger = get_logger(__name__)
 
-# Circuit breaker for S3 operations (fail_max=5, reset_timeout=60s)
-# After 5 consecutive failures, circuit opens for 60 seconds
-s3_circuit_breaker = CircuitBreaker(fail_max=5, reset_timeout=60, name="S3CircuitBreaker")
+# Circuit breaker for S3 operations, shared by every API and worker process
+# (failure rate over a sliding window, see app.core.circuit_breaker)
+s3_circuit_breaker = get_circuit_breaker("s3")
+
+
+def is_s3_failure(exc: BaseException) -> bool:
+    """Whether an S3 call error counts against the shared S3 circuit breaker.
+
+    Transport errors, timeouts and 5xx responses do. Client errors (4xx such
+    as NoSuchKey, NoSuchUpload or InvalidPart) and errors raised by our own
+    code are answers from a healthy S3 and do not open the circuit.
+    """
+    cause = root_cause(exc)
+    if isinstance(cause, ClientError):
+        status = cause.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        return status is None or status >= 500
+    return isinstance(cause, BotoCoreError | TimeoutError | ConnectionError)
+
+
+class AsyncReadable(Protocol):
+    """Async binary stream (e.g., fastapi.UploadFile)."""
+
+    async def read(self, size: int = -1) -> bytes: ...
 
 
 class S3ImageService:
@@ -129,7 +154,7 @@ class S3ImageService:
         Raises:
             ValidationException: If file size is invalid
             S3UploadException: If S3 upload fails
-            CircuitBreakerError: If circuit breaker is open (too many failures)
+            CircuitBreakerException: If circuit breaker is open (too many failures)
 
         Example:
             ```python
@@ -181,7 +206,7 @@ class S3ImageService:
                 bucket=settings.S3_BUCKET_ORIGINAL,
                 content_type=upload_request.content_type.value,
             )
-        except CircuitBreakerError as e:
+        except CircuitBreakerException as e:
             logger.error(
                 "S3 circuit breaker open - too many failures",
                 s3_key=s3_key,
@@ -231,6 +256,375 @@ class S3ImageService:
 
         return S3ImageResponse.from_model(s3_image, presigned_url=presigned_url)
 
+    async def upload_original_stream(
+        self,
+        stream: AsyncReadable,
+        session_id: uuid.UUID,
+        upload_request: S3ImageUploadRequest,
+        content_sha256: str | None = None,
+    ) -> S3ImageResponse:
+        """Stream original photo to S3 (multipart) while hashing it.
+
+        Unlike upload_original(), the body is never held in memory as a whole:
+        it is read in S3_MULTIPART_CHUNK_BYTES parts, each part is uploaded
+        while the next one is read and the SHA-256 is updated. The binary is
+        not cached in PostgreSQL (workers read it from S3).
+
+        Args:
+            stream: Async stream positioned at the start of the image
+            session_id: Photo processing session UUID
+            upload_request: Upload metadata (filename, dimensions, etc.)
+            content_sha256: SHA-256 already computed by the caller (e.g., for
+                            duplicate detection); the stream is then not hashed again
+
+        Returns:
+            S3ImageResponse with S3 key and presigned URL
+
+        Raises:
+            ValidationException: If the stream is empty
+            S3UploadException: If S3 upload fails or circuit breaker is open
+        """
+        s3_key, file_size, content_sha256 = await self.store_original_stream(
+            stream=stream,
+            session_id=session_id,
+            filename=upload_request.filename,
+            content_type=upload_request.content_type.value,
+            content_sha256=content_sha256,
+        )
+
+        return await self.register_original(
+            s3_key=s3_key,
+            upload_request=upload_request,
+            file_size=file_size,
+            content_sha256=content_sha256,
+        )
+
+    async def store_original_stream(
+        self,
+        stream: AsyncReadable,
+        session_id: uuid.UUID,
+        filename: str,
+        content_type: str,
+        content_sha256: str | None = None,
+    ) -> tuple[str, int, str]:
+        """Stream an original photo to S3 without creating its S3Image record.
+
+        Building block of upload_original_stream; batch uploads store many
+        originals concurrently and then register them with one bulk insert
+        (register_originals).
+
+        Args:
+            stream: Async stream positioned at the start of the image
+            session_id: Photo processing session UUID (S3 key prefix)
+            filename: Original filename (extension of the S3 key)
+            content_type: MIME type stored on the object
+            content_sha256: Known SHA-256 of the stream (skips hashing)
+
+        Returns:
+            Tuple of (S3 key, size in bytes, SHA-256 hex digest)
+
+        Raises:
+            ValidationException: If the stream is empty
+            S3UploadException: If S3 upload fails or circuit breaker is open
+        """
+        first_chunk = await stream.read(settings.S3_MULTIPART_CHUNK_BYTES)
+        if not first_chunk:
+            raise ValidationException(field="file_bytes", message="File cannot be empty", value=0)
+
+        file_ext = filename.split(".")[-1] if "." in filename else "jpg"
+        s3_key = f"{session_id}/original.{file_ext}"
+
+        logger.info(
+            "Streaming original image to S3",
+            s3_key=s3_key,
+            bucket=settings.S3_BUCKET_ORIGINAL,
+            session_id=str(session_id),
+        )
+
+        try:
+            file_size, content_sha256 = await self._upload_stream_to_s3(
+                s3_key=s3_key,
+                first_chunk=first_chunk,
+                stream=stream,
+                bucket=settings.S3_BUCKET_ORIGINAL,
+                content_type=content_type,
+                content_sha256=content_sha256,
+            )
+        except CircuitBreakerException as e:
+            logger.error(
+                "S3 circuit breaker open - too many failures",
+                s3_key=s3_key,
+                bucket=settings.S3_BUCKET_ORIGINAL,
+            )
+            raise S3UploadException(
+                file_name=filename,
+                bucket=settings.S3_BUCKET_ORIGINAL,
+                error="S3 service temporarily unavailable (circuit breaker open)",
+            ) from e
+
+        return s3_key, file_size, content_sha256
+
+    async def register_original(
+        self,
+        s3_key: str,
+        upload_request: S3ImageUploadRequest,
+        file_size: int,
+        content_sha256: str | None = None,
+    ) -> S3ImageResponse:
+        """Create the S3Image record for an original that is already in S3.
+
+        Used after a streamed upload and after a direct-to-S3 (presigned)
+        upload completes. The binary is not cached in PostgreSQL.
+
+        Args:
+            s3_key: S3 key of the uploaded original
+            upload_request: Upload metadata (filename, dimensions, GPS, etc.)
+            file_size: Object size in bytes
+            content_sha256: SHA-256 hex digest (None if unknown)
+
+        Returns:
+            S3ImageResponse with S3 key and presigned URL
+        """
+        s3_image = await self.repo.create(
+            self._original_row(s3_key, upload_request, file_size, content_sha256)
+        )
+
+        presigned_url = await self.generate_presigned_url(
+            s3_key=s3_key, bucket=settings.S3_BUCKET_ORIGINAL, expiry_hours=24
+        )
+
+        logger.info(
+            "Original image registered",
+            image_id=str(s3_image.image_id),
+            s3_key=s3_key,
+            file_size=file_size,
+            content_sha256=content_sha256,
+        )
+
+        return S3ImageResponse.from_model(s3_image, presigned_url=presigned_url)
+
+    async def register_originals(
+        self,
+        originals: list[tuple[str, S3ImageUploadRequest, int, str | None]],
+    ) -> list[S3ImageResponse]:
+        """Create the S3Image records of many stored originals (one bulk INSERT).
+
+        Args:
+            originals: (s3_key, upload_request, file_size, content_sha256) per photo
+
+        Returns:
+            S3ImageResponse per photo (same order), with presigned URLs
+        """
+        s3_images = await self.repo.bulk_create(
+            [self._original_row(*original) for original in originals]
+        )
+
+        responses = []
+        for s3_image in s3_images:
+            presigned_url = await self.generate_presigned_url(
+                s3_key=s3_image.s3_key_original, bucket=settings.S3_BUCKET_ORIGINAL, expiry_hours=24
+            )
+            responses.append(S3ImageResponse.from_model(s3_image, presigned_url=presigned_url))
+
+        logger.info("Original images registered in bulk", count=len(responses))
+
+        return responses
+
+    @staticmethod
+    def _original_row(
+        s3_key: str,
+        upload_request: S3ImageUploadRequest,
+        file_size: int,
+        content_sha256: str | None,
+    ) -> dict[str, Any]:
+        """S3Image column values of an original already stored in S3."""
+        return {
+            "image_id": uuid.uuid4(),
+            "s3_bucket": settings.S3_BUCKET_ORIGINAL,
+            "s3_key_original": s3_key,
+            "image_type": ImageTypeEnum.ORIGINAL,
+            "content_type": upload_request.content_type,
+            "file_size_bytes": file_size,
+            "content_sha256": content_sha256,
+            "width_px": upload_request.width_px,
+            "height_px": upload_request.height_px,
+            "upload_source": upload_request.upload_source,
+            "uploaded_by_user_id": upload_request.uploaded_by_user_id,
+            "exif_metadata": upload_request.exif_metadata,
+            "gps_coordinates": upload_request.gps_coordinates,
+            "perceptual_hash": upload_request.perceptual_hash,
+            "status": ProcessingStatusEnum.UPLOADED,
+        }
+
+    # =========================================================================
+    # Direct-to-S3 (presigned multipart) uploads
+    # =========================================================================
+
+    async def create_presigned_multipart_upload(
+        self,
+        s3_key: str,
+        content_type: str,
+        part_count: int,
+        expiry_seconds: int,
+    ) -> tuple[str, list[str]]:
+        """Start a multipart upload and presign one PUT URL per part.
+
+        The client uploads the parts straight to S3; the API never sees the
+        body.
+
+        Args:
+            s3_key: Target S3 key
+            content_type: MIME type stored on the object
+            part_count: Number of parts (1-10,000)
+            expiry_seconds: Lifetime of the presigned URLs
+
+        Returns:
+            Tuple of (S3 UploadId, presigned URLs ordered by part number)
+
+        Raises:
+            ValidationException: If part_count is out of range
+            S3UploadException: If S3 rejects the request or circuit breaker is open
+        """
+        if not 1 <= part_count <= 10_000:
+            raise ValidationException(
+                field="part_count", message="Part count must be 1-10000", value=part_count
+            )
+
+        bucket = settings.S3_BUCKET_ORIGINAL
+        response = await self._call_s3(
+            "create_multipart_upload", Bucket=bucket, Key=s3_key, ContentType=content_type
+        )
+        upload_id = response["UploadId"]
+
+        urls = await asyncio.to_thread(
+            lambda: [
+                self.s3_client.generate_presigned_url(
+                    ClientMethod="upload_part",
+                    Params={
+                        "Bucket": bucket,
+                        "Key": s3_key,
+                        "UploadId": upload_id,
+                        "PartNumber": part_number,
+                    },
+                    ExpiresIn=expiry_seconds,
+                )
+                for part_number in range(1, part_count + 1)
+            ]
+        )
+
+        logger.info(
+            "Presigned multipart upload created",
+            s3_key=s3_key,
+            bucket=bucket,
+            part_count=part_count,
+        )
+
+        return upload_id, urls
+
+    async def complete_multipart_upload(
+        self, s3_key: str, upload_id: str, parts: list[tuple[int, str]]
+    ) -> None:
+        """Complete a client-driven multipart upload.
+
+        Args:
+            s3_key: S3 key of the upload
+            upload_id: S3 UploadId from create_presigned_multipart_upload
+            parts: (part number, ETag) pairs reported by the client
+
+        Raises:
+            S3UploadException: If S3 rejects the parts or circuit breaker is open
+        """
+        await self._call_s3(
+            "complete_multipart_upload",
+            Bucket=settings.S3_BUCKET_ORIGINAL,
+            Key=s3_key,
+            UploadId=upload_id,
+            MultipartUpload={
+                "Parts": [{"PartNumber": number, "ETag": etag} for number, etag in sorted(parts)]
+            },
+        )
+
+    async def head_object(self, s3_key: str) -> dict[str, Any]:
+        """HEAD an object in the original bucket (size, content type, ETag).
+
+        Raises:
+            S3UploadException: If the object does not exist or S3 fails
+        """
+        response: dict[str, Any] = await self._call_s3(
+            "head_object", Bucket=settings.S3_BUCKET_ORIGINAL, Key=s3_key
+        )
+        return response
+
+    async def read_object_prefix(self, s3_key: str, num_bytes: int) -> bytes:
+        """Read the first num_bytes of an object (ranged GET, for header parsing).
+
+        Raises:
+            S3UploadException: If the object does not exist or S3 fails
+        """
+        response = await self._call_s3(
+            "get_object",
+            Bucket=settings.S3_BUCKET_ORIGINAL,
+            Key=s3_key,
+            Range=f"bytes=0-{num_bytes - 1}",
+        )
+        body: bytes = await asyncio.to_thread(response["Body"].read)
+        return body
+
+    async def delete_object(self, s3_key: str) -> None:
+        """Delete an object that has no S3Image record (e.g., rejected upload).
+
+        Raises:
+            S3UploadException: If S3 fails or circuit breaker is open
+        """
+        await self._call_s3("delete_object", Bucket=settings.S3_BUCKET_ORIGINAL, Key=s3_key)
+
+    async def object_exists(self, s3_key: str) -> bool:
+        """Whether an object exists in the original bucket.
+
+        Uses a one-key LIST rather than HEAD, so a missing object is a normal
+        answer and not an error counted by the circuit breaker.
+
+        Raises:
+            S3UploadException: If S3 fails or circuit breaker is open
+        """
+        response = await self._call_s3(
+            "list_objects_v2", Bucket=settings.S3_BUCKET_ORIGINAL, Prefix=s3_key, MaxKeys=1
+        )
+        return any(obj["Key"] == s3_key for obj in response.get("Contents", []))
+
+    async def iter_object(self, s3_key: str, chunk_size: int) -> AsyncIterator[bytes]:
+        """Stream an object of the original bucket in chunks (no full download).
+
+        Raises:
+            S3UploadException: If the object does not exist or S3 fails
+        """
+        response = await self._call_s3("get_object", Bucket=settings.S3_BUCKET_ORIGINAL, Key=s3_key)
+        body = response["Body"]
+        try:
+            while chunk := await asyncio.to_thread(body.read, chunk_size):
+                yield chunk
+        finally:
+            body.close()
+
+    async def upload_fileobj(self, s3_key: str, fileobj: IO[bytes], content_type: str) -> None:
+        """Upload a file object to the original bucket (multipart for large files).
+
+        Args:
+            s3_key: Destination key
+            fileobj: Readable binary file, positioned at the start
+            content_type: MIME type stored with the object
+
+        Raises:
+            S3UploadException: If S3 fails or circuit breaker is open
+        """
+        await self._call_s3(
+            "upload_fileobj",
+            Fileobj=fileobj,
+            Bucket=settings.S3_BUCKET_ORIGINAL,
+            Key=s3_key,
+            ExtraArgs={"ContentType": content_type},
+        )
+
     async def upload_visualization(
         self,
         file_bytes: bytes,
@@ -261,7 +655,7 @@ class S3ImageService:
         Raises:
             ValidationException: If file size is invalid
             S3UploadException: If S3 upload fails
-            CircuitBreakerError: If circuit breaker is open
+            CircuitBreakerException: If circuit breaker is open
 
         Example:
             ```python
@@ -306,7 +700,7 @@ class S3ImageService:
                 bucket=settings.S3_BUCKET_ORIGINAL,  # NEW: Changed from VISUALIZATION
                 content_type=content_type,
             )
-        except CircuitBreakerError as e:
+        except CircuitBreakerException as e:
             logger.error(
                 "S3 circuit breaker open - too many failures",
                 s3_key=s3_key,
@@ -383,7 +777,7 @@ class S3ImageService:
         Raises:
             ValidationException: If file size is invalid
             S3UploadException: If S3 upload fails
-            CircuitBreakerError: If circuit breaker is open
+            CircuitBreakerException: If circuit breaker is open
 
         Example:
             ```python
@@ -430,7 +824,7 @@ class S3ImageService:
                 bucket=settings.S3_BUCKET_ORIGINAL,
                 content_type="image/jpeg",
             )
-        except CircuitBreakerError as e:
+        except CircuitBreakerException as e:
             logger.error(
                 "S3 circuit breaker open - too many failures",
                 s3_key=s3_key,
@@ -491,7 +885,7 @@ class S3ImageService:
 
         Raises:
             S3UploadException: If S3 download fails (reusing exception for consistency)
-            CircuitBreakerError: If circuit breaker is open
+            CircuitBreakerException: If circuit breaker is open
 
         Example:
             ```python
@@ -509,7 +903,7 @@ class S3ImageService:
 
         try:
             return await self._download_from_s3(s3_key=s3_key, bucket=bucket)  # type: ignore[no-any-return]
-        except CircuitBreakerError as e:
+        except CircuitBreakerException as e:
             logger.error(
                 "S3 circuit breaker open - too many failures",
                 s3_key=s3_key,
@@ -648,7 +1042,7 @@ class S3ImageService:
                 await self._delete_from_s3(
                     s3_key=s3_image.s3_key_original, bucket=s3_image.s3_bucket
                 )
-            except CircuitBreakerError as e:
+            except CircuitBreakerException as e:
                 logger.error(
                     "S3 circuit breaker open - cannot delete",
                     image_id=str(image_id),
@@ -711,14 +1105,14 @@ class S3ImageService:
     # Private helper methods (S3 operations with circuit breaker)
     # =========================================================================
 
-    @s3_circuit_breaker  # type: ignore[misc]
+    @s3_circuit_breaker.protect_async(is_failure=is_s3_failure)
     async def _upload_to_s3(
         self, s3_key: str, file_bytes: bytes, bucket: str, content_type: str
     ) -> None:
         """Upload file to S3 with circuit breaker protection.
 
-        This private method is wrapped by pybreaker circuit breaker.
-        After 5 consecutive failures, circuit opens for 60 seconds.
+        Protected by the shared "s3" circuit breaker: transport errors,
+        timeouts and 5xx responses count as failures (is_s3_failure).
 
         Uses boto3 (sync) with asyncio.to_thread() for async interface.
 
@@ -758,7 +1152,186 @@ class S3ImageService:
             )
             raise S3UploadException(file_name=s3_key, bucket=bucket, error=str(e)) from e
 
-    @s3_circuit_breaker  # type: ignore[misc]
+    @s3_circuit_breaker.protect_async(is_failure=is_s3_failure)
+    async def _upload_stream_to_s3(
+        self,
+        s3_key: str,
+        first_chunk: bytes,
+        stream: AsyncReadable,
+        bucket: str,
+        content_type: str,
+        content_sha256: str | None = None,
+    ) -> tuple[int, str]:
+        """Upload a stream to S3 with circuit breaker protection, hashing it on the way.
+
+        Bodies that fit in one chunk use a single put_object. Larger bodies
+        use a multipart upload; for every part, the S3 upload, the SHA-256
+        update (bounded CPU executor) and the read of the next part run
+        concurrently. A failed multipart upload is aborted.
+
+        Args:
+            s3_key: S3 key for the file
+            first_chunk: First part, already read by the caller (non-empty)
+            stream: Remaining body
+            bucket: S3 bucket name
+            content_type: MIME type
+            content_sha256: Known SHA-256 of the body; returned as is instead
+                            of hashing the parts again
+
+        Returns:
+            Tuple of (size in bytes, SHA-256 hex digest)
+
+        Raises:
+            S3UploadException: If upload fails
+        """
+        chunk_size = settings.S3_MULTIPART_CHUNK_BYTES
+        hasher = hashlib.sha256()
+
+        async def update_digest(chunk: bytes) -> None:
+            if content_sha256 is None:
+                await run_cpu_bound(hasher.update, chunk)
+
+        try:
+            next_chunk = await stream.read(chunk_size)
+
+            if not next_chunk:
+                await asyncio.gather(
+                    update_digest(first_chunk),
+                    asyncio.to_thread(
+                        self.s3_client.put_object,
+                        Bucket=bucket,
+                        Key=s3_key,
+                        Body=first_chunk,
+                        ContentType=content_type,
+                    ),
+                )
+                return len(first_chunk), content_sha256 or hasher.hexdigest()
+
+            multipart = await asyncio.to_thread(
+                self.s3_client.create_multipart_upload,
+                Bucket=bucket,
+                Key=s3_key,
+                ContentType=content_type,
+            )
+        except Exception as e:
+            logger.error(
+                "S3 upload failed", s3_key=s3_key, bucket=bucket, error=str(e), exc_info=True
+            )
+            raise S3UploadException(file_name=s3_key, bucket=bucket, error=str(e)) from e
+
+        upload_id = multipart["UploadId"]
+        parts: list[dict[str, object]] = []
+        file_size = 0
+
+        try:
+            chunk = first_chunk
+            while chunk:
+                part_number = len(parts) + 1
+                response, _, following = await asyncio.gather(
+                    asyncio.to_thread(
+                        self.s3_client.upload_part,
+                        Bucket=bucket,
+                        Key=s3_key,
+                        UploadId=upload_id,
+                        PartNumber=part_number,
+                        Body=chunk,
+                    ),
+                    update_digest(chunk),
+                    stream.read(chunk_size),  # b"" once the stream is exhausted
+                )
+                parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+                file_size += len(chunk)
+                chunk, next_chunk = next_chunk, following
+
+            await asyncio.to_thread(
+                self.s3_client.complete_multipart_upload,
+                Bucket=bucket,
+                Key=s3_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+
+        except Exception as e:
+            logger.error(
+                "S3 multipart upload failed",
+                s3_key=s3_key,
+                bucket=bucket,
+                parts_uploaded=len(parts),
+                error=str(e),
+                exc_info=True,
+            )
+            try:
+                await asyncio.to_thread(
+                    self.s3_client.abort_multipart_upload,
+                    Bucket=bucket,
+                    Key=s3_key,
+                    UploadId=upload_id,
+                )
+            except Exception as abort_error:
+                logger.warning("S3 multipart abort failed", s3_key=s3_key, error=str(abort_error))
+            raise S3UploadException(file_name=s3_key, bucket=bucket, error=str(e)) from e
+
+        logger.debug(
+            "S3 multipart upload successful",
+            s3_key=s3_key,
+            bucket=bucket,
+            file_size=file_size,
+            parts=len(parts),
+        )
+
+        return file_size, content_sha256 or hasher.hexdigest()
+
+    async def _call_s3(self, operation: str, **kwargs: Any) -> Any:
+        """Call a boto3 S3 client operation with circuit breaker protection.
+
+        Args:
+            operation: boto3 client method name (e.g., "head_object")
+            **kwargs: Operation parameters
+
+        Returns:
+            boto3 response
+
+        Raises:
+            S3UploadException: If the operation fails or circuit breaker is open
+        """
+        try:
+            return await self._s3_operation(operation, **kwargs)
+        except CircuitBreakerException as e:
+            logger.error(
+                "S3 circuit breaker open - too many failures",
+                operation=operation,
+                s3_key=kwargs.get("Key"),
+            )
+            raise S3UploadException(
+                file_name=str(kwargs.get("Key")),
+                bucket=str(kwargs.get("Bucket")),
+                error="S3 service temporarily unavailable (circuit breaker open)",
+            ) from e
+
+    @s3_circuit_breaker.protect_async(is_failure=is_s3_failure)
+    async def _s3_operation(self, operation: str, **kwargs: Any) -> Any:
+        """Run one boto3 S3 operation in a worker thread (wrapped by circuit breaker).
+
+        Raises:
+            S3UploadException: If the operation fails
+        """
+        try:
+            return await asyncio.to_thread(getattr(self.s3_client, operation), **kwargs)
+        except Exception as e:
+            logger.error(
+                "S3 operation failed",
+                operation=operation,
+                s3_key=kwargs.get("Key"),
+                error=str(e),
+                exc_info=True,
+            )
+            raise S3UploadException(
+                file_name=str(kwargs.get("Key")),
+                bucket=str(kwargs.get("Bucket")),
+                error=f"{operation} failed: {e}",
+            ) from e
+
+    @s3_circuit_breaker.protect_async(is_failure=is_s3_failure)
     async def _download_from_s3(self, s3_key: str, bucket: str) -> bytes:
         """Download file from S3 with circuit breaker protection.
 
@@ -802,7 +1375,7 @@ class S3ImageService:
                 file_name=s3_key, bucket=bucket, error=f"Download failed: {str(e)}"
             ) from e
 
-    @s3_circuit_breaker  # type: ignore[misc]
+    @s3_circuit_breaker.protect_async(is_failure=is_s3_failure)
     async def _delete_from_s3(self, s3_key: str, bucket: str) -> None:
         """Delete file from S3 with circuit breaker protection.
 
@@ -843,7 +1416,8 @@ def generate_thumbnail(image_bytes: bytes, size: int = 300) -> bytes:
     """Generate square thumbnail from image bytes.
 
     Uses PIL/Pillow to create a square thumbnail with JPEG compression.
-    Maintains aspect ratio and crops to center if needed.
+    Maintains aspect ratio and crops to center if needed. JPEG sources are
+    decoded at reduced scale (draft mode) - see image_derivatives.
 
     Args:
         image_bytes: Original image bytes
@@ -863,31 +1437,9 @@ def generate_thumbnail(image_bytes: bytes, size: int = 300) -> bytes:
         ```
     """
     try:
-        from io import BytesIO
-
-        from PIL import Image
-
-        # Open image from bytes
-        image = Image.open(BytesIO(image_bytes))
-
-        # Convert RGBA to RGB if needed (JPEG doesn't support transparency)
-        if image.mode in ("RGBA", "P", "LA"):
-            # Create white background
-            rgb_image = Image.new("RGB", image.size, (255, 255, 255))
-            # Paste image on white background
-            if image.mode == "P":
-                image = image.convert("RGBA")
-            rgb_image.paste(image, mask=image.split()[-1] if len(image.split()) == 4 else None)
-            image = rgb_image
-
-        # Create square thumbnail (maintains aspect ratio, crops to center)
-        # PIL's thumbnail() method maintains aspect ratio
-        image.thumbnail((size, size), Image.Resampling.LANCZOS)
-
-        # Save to bytes as JPEG
-        output = BytesIO()
-        image.save(output, format="JPEG", quality=85, optimize=True)
-        thumbnail_bytes = output.getvalue()
+        from app.services.photo.image_derivatives import generate_derivatives
+
+        thumbnail_bytes = generate_derivatives(image_bytes, {"thumbnail": size})["thumbnail"].data
 
         logger.debug(
             "Thumbnail generated",
@@ -0,0 +1,436 @@
+"""Session Export Service - CSV/GeoJSON/PDF downloads of a processing session.
+
+Exports cover every detection and estimation of a session, which can be tens
+of thousands of rows. They are never built in memory:
+
+- CSV: rows are read in batches from a server-side cursor and written out
+  batch by batch (one ``record_type`` column tells detections and
+  estimations apart)
+- GeoJSON: a FeatureCollection written feature by feature; detections are
+  Points (bounding box center), estimations Polygons (vegetation area), both
+  in image pixel coordinates
+- PDF: a one-page summary (totals, confidence, categories) with the
+  processed image's thumbnail, rendered by Pillow
+
+Generated files are cached in S3 under the session UUID. The key includes
+the session's last update time, so a re-processed or manually adjusted
+session gets a fresh export while repeated downloads of an unchanged session
+are streamed straight from S3. A file is uploaded only once it has been
+generated completely (an aborted download caches nothing).
+
+Architecture:
+    Layer: Service Layer (Business Logic)
+    Dependencies: PhotoProcessingSessionService, DetectionService,
+        EstimationService, S3ImageService
+    Used by: photo controller (report.pdf, export.csv, detections.geojson)
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from decimal import Decimal
+from enum import Enum
+from tempfile import SpooledTemporaryFile
+from typing import IO, Any, Literal
+from uuid import UUID
+
+from PIL import Image, ImageDraw, ImageFont
+
+from app.core.config import settings
+from app.core.exceptions import S3UploadException
+from app.core.executors import run_cpu_bound
+from app.core.logging import get_logger
+from app.schemas.photo_processing_session_schema import PhotoProcessingSessionResponse
+from app.services.photo.detection_service import DetectionService
+from app.services.photo.estimation_service import EstimationService
+from app.services.photo.photo_processing_session_service import PhotoProcessingSessionService
+from app.services.photo.s3_image_service import S3ImageService
+
+logger = get_logger(__name__)
+
+type ExportFormat = Literal["csv", "geojson", "pdf"]
+
+# Format → (file extension, media type)
+EXPORT_FORMATS: dict[str, tuple[str, str]] = {
+    "csv": ("csv", "text/csv"),
+    "geojson": ("geojson", "application/geo+json"),
+    "pdf": ("pdf", "application/pdf"),
+}
+
+CSV_COLUMNS = [
+    "record_type",
+    "id",
+    "classification_id",
+    "center_x_px",
+    "center_y_px",
+    "width_px",
+    "height_px",
+    "confidence",
+    "is_empty_container",
+    "is_alive",
+    "detected_area_cm2",
+    "estimated_count",
+    "calculation_method",
+]
+
+# PDF page: A4 at 100 dpi
+PDF_PAGE_SIZE = (827, 1169)
+PDF_RESOLUTION = 100.0
+PDF_MARGIN = 60
+
+
+@dataclass(frozen=True)
+class SessionExport:
+    """A session export ready to be sent.
+
+    Attributes:
+        filename: Download file name (session_<uuid>.<ext>)
+        media_type: MIME type
+        body: Chunks of the file
+        finalize: Coroutine to run once the body has been sent (caches a
+            freshly generated file in S3); None when served from the cache
+    """
+
+    filename: str
+    media_type: str
+    body: AsyncIterator[bytes]
+    finalize: Callable[[], Awaitable[None]] | None = None
+
+
+class SessionExportService:
+    """Generates, caches and serves per-session exports."""
+
+    def __init__(
+        self,
+        session_service: PhotoProcessingSessionService,
+        detection_service: DetectionService,
+        estimation_service: EstimationService,
+        s3_service: S3ImageService,
+    ) -> None:
+        self.session_service = session_service
+        self.detection_service = detection_service
+        self.estimation_service = estimation_service
+        self.s3_service = s3_service
+
+    async def open_export(self, session_uuid: UUID, fmt: ExportFormat) -> SessionExport | None:
+        """Export of a session, from the S3 cache or generated on the fly.
+
+        Args:
+            session_uuid: Session UUID
+            fmt: "csv", "geojson" or "pdf"
+
+        Returns:
+            SessionExport, or None if the session does not exist
+        """
+        session = await self.session_service.get_session_by_uuid(session_uuid)
+        if session is None:
+            return None
+
+        extension, media_type = EXPORT_FORMATS[fmt]
+        filename = f"session_{session_uuid}.{extension}"
+        s3_key = self.cache_key(session, extension)
+
+        if await self._is_cached(s3_key):
+            logger.info("Serving cached session export", session_id=str(session_uuid), fmt=fmt)
+            body = self.s3_service.iter_object(s3_key, settings.EXPORT_DOWNLOAD_CHUNK_BYTES)
+            return SessionExport(filename=filename, media_type=media_type, body=body)
+
+        logger.info("Generating session export", session_id=str(session_uuid), fmt=fmt)
+        spooled = _SpooledExport(self._generate(session, fmt))
+        return SessionExport(
+            filename=filename,
+            media_type=media_type,
+            body=spooled.body(),
+            finalize=lambda: self._store(spooled, s3_key, media_type),
+        )
+
+    @staticmethod
+    def cache_key(session: PhotoProcessingSessionResponse, extension: str) -> str:
+        """S3 key of a session's export (changes whenever the session is updated)."""
+        version = int((session.updated_at or session.created_at).timestamp())
+        return f"exports/{session.session_id}/{version}/session_{session.session_id}.{extension}"
+
+    async def _is_cached(self, s3_key: str) -> bool:
+        try:
+            return await self.s3_service.object_exists(s3_key)
+        except S3UploadException as e:
+            # S3 unavailable: generate without the cache rather than fail the download
+            logger.warning("Export cache lookup failed", s3_key=s3_key, error=str(e))
+            return False
+
+    async def _store(self, spooled: _SpooledExport, s3_key: str, media_type: str) -> None:
+        """Upload a generated export to the cache (skipped if generation was cut short)."""
+        try:
+            if spooled.complete:
+                spooled.file.seek(0)
+                await self.s3_service.upload_fileobj(s3_key, spooled.file, media_type)
+                logger.info("Cached session export", s3_key=s3_key)
+        except S3UploadException as e:
+            logger.warning("Caching session export failed", s3_key=s3_key, error=str(e))
+        finally:
+            spooled.file.close()
+
+    def _generate(
+        self, session: PhotoProcessingSessionResponse, fmt: ExportFormat
+    ) -> AsyncIterator[bytes]:
+        if fmt == "csv":
+            return self._generate_csv(session)
+        if fmt == "geojson":
+            return self._generate_geojson(session)
+        return self._generate_pdf(session)
+
+    # ------------------------------------------------------------------
+    # CSV
+    # ------------------------------------------------------------------
+
+    async def _generate_csv(self, session: PhotoProcessingSessionResponse) -> AsyncIterator[bytes]:
+        batch_size = settings.EXPORT_STREAM_BATCH_ROWS
+        yield _csv_rows([CSV_COLUMNS])
+
+        async for batch in self.detection_service.stream_detections_by_session(
+            session.id, batch_size
+        ):
+            yield _csv_rows(
+                (
+                    "detection",
+                    d.id,
+                    d.classification_id,
+                    d.center_x_px,
+                    d.center_y_px,
+                    d.width_px,
+                    d.height_px,
+                    d.detection_confidence,
+                    d.is_empty_container,
+                    d.is_alive,
+                    None,
+                    None,
+                    None,
+                )
+                for d in batch
+            )
+
+        async for batch in self.estimation_service.stream_estimations_by_session(
+            session.id, batch_size
+        ):
+            yield _csv_rows(
+                (
+                    "estimation",
+                    e.id,
+                    e.classification_id,
+                    None,
+                    None,
+                    None,
+                    None,
+                    e.estimation_confidence,
+                    None,
+                    None,
+                    e.detected_area_cm2,
+                    e.estimated_count,
+                    _plain(e.calculation_method),
+                )
+                for e in batch
+            )
+
+    # ------------------------------------------------------------------
+    # GeoJSON
+    # ------------------------------------------------------------------
+
+    async def _generate_geojson(
+        self, session: PhotoProcessingSessionResponse
+    ) -> AsyncIterator[bytes]:
+        batch_size = settings.EXPORT_STREAM_BATCH_ROWS
+        header = {
+            "type": "FeatureCollection",
+            # Foreign member: coordinates are image pixels, not WGS84
+            "properties": {"session_id": str(session.session_id), "crs": "image_px"},
+        }
+        yield _dumps(header)[:-1] + b',"features":['
+        first = True
+
+        async for batch in self.detection_service.stream_detections_by_session(
+            session.id, batch_size
+        ):
+            features = [_detection_feature(d) for d in batch]
+            if features:
+                yield (b"" if first else b",") + b",".join(features)
+                first = False
+
+        async for batch in self.estimation_service.stream_estimations_by_session(
+            session.id, batch_size
+        ):
+            features = [f for f in map(_estimation_feature, batch) if f is not None]
+            if features:
+                yield (b"" if first else b",") + b",".join(features)
+                first = False
+
+        yield b"]}"
+
+    # ------------------------------------------------------------------
+    # PDF
+    # ------------------------------------------------------------------
+
+    async def _generate_pdf(self, session: PhotoProcessingSessionResponse) -> AsyncIterator[bytes]:
+        thumbnail = await self._processed_thumbnail(session)
+        yield await run_cpu_bound(render_summary_pdf, session, thumbnail)
+
+    async def _processed_thumbnail(self, session: PhotoProcessingSessionResponse) -> bytes | None:
+        if session.processed_image_id is None:
+            return None
+        try:
+            processed = await self.s3_service.repo.get(session.processed_image_id)
+            if processed is None or not processed.s3_key_thumbnail:
+                return None
+            return await self.s3_service.download_original(processed.s3_key_thumbnail)
+        except S3UploadException as e:
+            logger.warning(
+                "Thumbnail unavailable for session report",
+                session_id=str(session.session_id),
+                error=str(e),
+            )
+            return None
+
+
+class _SpooledExport:
+    """Copies a generated export into a temporary file while it is streamed."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        self._chunks = chunks
+        # Closed by SessionExportService._store once the response has been sent,
+        # or by body() if the response is cut short
+        self.file: IO[bytes] = SpooledTemporaryFile(  # noqa: SIM115
+            max_size=settings.EXPORT_SPOOL_MAX_MEMORY_BYTES
+        )
+        self.complete = False
+
+    async def body(self) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self._chunks:
+                self.file.write(chunk)
+                yield chunk
+            self.complete = True
+        finally:
+            # On client disconnect the response's background task (_store) never runs
+            if not self.complete:
+                self.file.close()
+
+
+def _plain(value: Any) -> Any:
+    """Decimal → float, Enum → value (JSON/CSV friendly)."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _csv_rows(rows: Iterable[Iterable[Any]]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":"), default=_plain).encode("utf-8")
+
+
+def _detection_feature(d: Any) -> bytes:
+    return _dumps(
+        {
+            "type": "Feature",
+            "id": f"detection/{d.id}",
+            "geometry": {"type": "Point", "coordinates": [d.center_x_px, d.center_y_px]},
+            "properties": {
+                "record_type": "detection",
+                "classification_id": d.classification_id,
+                "width_px": d.width_px,
+                "height_px": d.height_px,
+                "confidence": d.detection_confidence,
+                "is_empty_container": d.is_empty_container,
+                "is_alive": d.is_alive,
+            },
+        }
+    )
+
+
+def _estimation_feature(e: Any) -> bytes | None:
+    coordinates = (e.vegetation_polygon or {}).get("coordinates")
+    if not coordinates:
+        return None
+    if not isinstance(coordinates[0][0], list):
+        coordinates = [coordinates]  # Stored as a bare ring
+    return _dumps(
+        {
+            "type": "Feature",
+            "id": f"estimation/{e.id}",
+            "geometry": {"type": "Polygon", "coordinates": coordinates},
+            "properties": {
+                "record_type": "estimation",
+                "classification_id": e.classification_id,
+                "detected_area_cm2": e.detected_area_cm2,
+                "estimated_count": e.estimated_count,
+                "calculation_method": e.calculation_method,
+                "confidence": e.estimation_confidence,
+            },
+        }
+    )
+
+
+def render_summary_pdf(session: PhotoProcessingSessionResponse, thumbnail: bytes | None) -> bytes:
+    """Render the one-page session summary as PDF (CPU-bound).
+
+    Args:
+        session: Session with its aggregated results
+        thumbnail: JPEG of the processed image's thumbnail, if available
+
+    Returns:
+        PDF bytes
+    """
+    page = Image.new("RGB", PDF_PAGE_SIZE, "white")
+    draw = ImageDraw.Draw(page)
+    title_font = ImageFont.load_default(size=28)
+    font = ImageFont.load_default(size=16)
+
+    lines = [
+        f"Status: {_plain(session.status)}",
+        f"Created: {session.created_at:%Y-%m-%d %H:%M} UTC",
+        f"Total detected: {session.total_detected}",
+        f"Total estimated: {session.total_estimated}",
+        f"Empty containers: {session.total_empty_containers}",
+        "Average confidence: "
+        + (f"{session.avg_confidence:.1%}" if session.avg_confidence is not None else "n/a"),
+        f"Validated: {'yes' if session.validated else 'no'}",
+    ]
+    if session.category_counts:
+        lines.append("Categories:")
+        lines.extend(
+            f"    {category}: {count}"
+            for category, count in sorted(session.category_counts.items(), key=lambda kv: -kv[1])
+        )
+
+    y = PDF_MARGIN
+    draw.text((PDF_MARGIN, y), "DemeterAI - Session report", font=title_font, fill="black")
+    y += 40
+    draw.text((PDF_MARGIN, y), str(session.session_id), font=font, fill="gray")
+    y += 40
+    for line in lines[:40]:
+        draw.text((PDF_MARGIN, y), line, font=font, fill="black")
+        y += 24
+
+    if thumbnail:
+        try:
+            with Image.open(io.BytesIO(thumbnail)) as image:
+                image = image.convert("RGB")
+                image.thumbnail(
+                    (PDF_PAGE_SIZE[0] - 2 * PDF_MARGIN, PDF_PAGE_SIZE[1] - y - 2 * PDF_MARGIN)
+                )
+                page.paste(image, (PDF_MARGIN, y + PDF_MARGIN // 2))
+        except OSError:
+            pass  # Undecodable thumbnail: the summary is still useful
+
+    output = io.BytesIO()
+    page.save(output, "PDF", resolution=PDF_RESOLUTION)
+    return output.getvalue()
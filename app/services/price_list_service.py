@@ -1,5 +1,6 @@
 """PriceList business logic service."""
 
+from app.core.read_through_cache import ReadThroughCache, invalidate_cache, read_through
 from app.repositories.price_list_repository import PriceListRepository
 from app.schemas.price_list_schema import (
     PriceListCreateRequest,
@@ -11,26 +12,36 @@ from app.schemas.price_list_schema import (
 class PriceListService:
     """Business logic for pricelist operations (CRUD)."""
 
-    def __init__(self, repo: PriceListRepository) -> None:
+    def __init__(self, repo: PriceListRepository, cache: ReadThroughCache | None = None) -> None:
         self.repo = repo
+        self.cache = cache  # Read-through cache ("price_lists" namespace)
 
     async def create(self, request: PriceListCreateRequest) -> PriceListResponse:
         """Create a new pricelist."""
         data = request.model_dump()
         model = await self.repo.create(data)
+        await invalidate_cache(self.cache, self.repo.session)
         return PriceListResponse.model_validate(model)
 
     async def get_by_id(self, id: int) -> PriceListResponse:
         """Get pricelist by ID."""
-        model = await self.repo.get(id)
-        if not model:
-            raise ValueError("PriceList {id} not found")
-        return PriceListResponse.model_validate(model)
+
+        async def load() -> PriceListResponse:
+            model = await self.repo.get(id)
+            if not model:
+                raise ValueError("PriceList {id} not found")
+            return PriceListResponse.model_validate(model)
+
+        return await read_through(self.cache, f"id:{id}", load, PriceListResponse)
 
     async def get_all(self, limit: int = 100) -> list[PriceListResponse]:
         """Get all pricelists."""
-        models = await self.repo.get_multi(limit=limit)
-        return [PriceListResponse.model_validate(m) for m in models]
+
+        async def load() -> list[PriceListResponse]:
+            models = await self.repo.get_multi(limit=limit)
+            return [PriceListResponse.model_validate(m) for m in models]
+
+        return await read_through(self.cache, f"all:{limit}", load, list[PriceListResponse])
 
     async def update(self, id: int, request: PriceListUpdateRequest) -> PriceListResponse:
         """Update pricelist."""
@@ -40,6 +51,7 @@ class PriceListService:
 
         update_data = request.model_dump(exclude_unset=True)
         updated_model = await self.repo.update(id, update_data)
+        await invalidate_cache(self.cache, self.repo.session)
         return PriceListResponse.model_validate(updated_model)
 
     async def delete(self, id: int) -> None:
@@ -48,3 +60,4 @@ class PriceListService:
         if not model:
             raise ValueError("PriceList {id} not found")
         await self.repo.delete(id)
+        await invalidate_cache(self.cache, self.repo.session)
@@ -1,5 +1,6 @@
 """Product category business logic service (ROOT taxonomy level)."""
 
+from app.core.read_through_cache import ReadThroughCache, invalidate_cache, read_through
 from app.repositories.product_category_repository import ProductCategoryRepository
 from app.schemas.product_category_schema import (
     ProductCategoryCreateRequest,
@@ -11,8 +12,11 @@ from app.schemas.product_category_schema import (
 class ProductCategoryService:
     """Business logic for product category operations (CRUD + validation)."""
 
-    def __init__(self, category_repo: ProductCategoryRepository) -> None:
+    def __init__(
+        self, category_repo: ProductCategoryRepository, cache: ReadThroughCache | None = None
+    ) -> None:
         self.category_repo = category_repo
+        self.cache = cache  # Read-through cache ("product_categories" namespace)
 
     async def create_category(
         self, request: ProductCategoryCreateRequest
@@ -20,20 +24,29 @@ class ProductCategoryService:
         """Create a new product category with code uniqueness validation."""
         category_data = request.model_dump()
         category_model = await self.category_repo.create(category_data)
+        await invalidate_cache(self.cache, self.category_repo.session)
         return ProductCategoryResponse.from_model(category_model)
 
     async def get_category_by_id(self, category_id: int) -> ProductCategoryResponse:
         """Get category by ID."""
-        category_model = await self.category_repo.get(category_id)
-        if not category_model:
-            raise ValueError(f"ProductCategory {category_id} not found")
-        return ProductCategoryResponse.from_model(category_model)
+
+        async def load() -> ProductCategoryResponse:
+            category_model = await self.category_repo.get(category_id)
+            if not category_model:
+                raise ValueError(f"ProductCategory {category_id} not found")
+            return ProductCategoryResponse.from_model(category_model)
+
+        return await read_through(self.cache, f"id:{category_id}", load, ProductCategoryResponse)
 
     async def get_all_categories(self, active_only: bool = True) -> list[ProductCategoryResponse]:
         """Get all categories (active_only filter for future soft delete support)."""
         # Note: active_only parameter reserved for future soft delete implementation
-        categories = await self.category_repo.get_multi(limit=100)
-        return [ProductCategoryResponse.from_model(c) for c in categories]
+
+        async def load() -> list[ProductCategoryResponse]:
+            categories = await self.category_repo.get_multi(limit=100)
+            return [ProductCategoryResponse.from_model(c) for c in categories]
+
+        return await read_through(self.cache, "all", load, list[ProductCategoryResponse])
 
     async def update_category(
         self, category_id: int, request: ProductCategoryUpdateRequest
@@ -45,6 +58,7 @@ class ProductCategoryService:
 
         update_data = request.model_dump(exclude_unset=True)
         updated_model = await self.category_repo.update(category_id, update_data)
+        await invalidate_cache(self.cache, self.category_repo.session)
         return ProductCategoryResponse.from_model(updated_model)
 
     async def delete_category(self, category_id: int) -> None:
@@ -54,12 +68,19 @@ class ProductCategoryService:
         if not category_model:
             raise ValueError(f"ProductCategory {category_id} not found")
         await self.category_repo.delete(category_id)
+        await invalidate_cache(self.cache, self.category_repo.session)
 
     # Convenience aliases for controller compatibility
     async def get_all(self, skip: int = 0, limit: int = 100) -> list[ProductCategoryResponse]:
         """Alias for get_all_categories with pagination."""
-        categories = await self.category_repo.get_multi(skip=skip, limit=limit)
-        return [ProductCategoryResponse.from_model(c) for c in categories]
+
+        async def load() -> list[ProductCategoryResponse]:
+            categories = await self.category_repo.get_multi(skip=skip, limit=limit)
+            return [ProductCategoryResponse.from_model(c) for c in categories]
+
+        return await read_through(
+            self.cache, f"all:{skip}:{limit}", load, list[ProductCategoryResponse]
+        )
 
     async def create(self, request: ProductCategoryCreateRequest) -> ProductCategoryResponse:
         """Alias for create_category."""
@@ -1,5 +1,6 @@
 """Product family business logic service (LEVEL 2 taxonomy)."""
 
+from app.core.read_through_cache import ReadThroughCache, invalidate_cache, read_through
 from app.repositories.product_family_repository import ProductFamilyRepository
 from app.schemas.product_family_schema import (
     ProductFamilyCreateRequest,
@@ -13,10 +14,14 @@ class ProductFamilyService:
     """Business logic for product family operations (CRUD + category validation)."""
 
     def __init__(
-        self, family_repo: ProductFamilyRepository, category_service: ProductCategoryService
+        self,
+        family_repo: ProductFamilyRepository,
+        category_service: ProductCategoryService,
+        cache: ReadThroughCache | None = None,
     ) -> None:
         self.family_repo = family_repo
         self.category_service = category_service
+        self.cache = cache  # Read-through cache ("product_families" namespace)
 
     async def create_family(self, request: ProductFamilyCreateRequest) -> ProductFamilyResponse:
         """Create product family with parent category validation."""
@@ -26,24 +31,39 @@ class ProductFamilyService:
 
         family_data = request.model_dump()
         family_model = await self.family_repo.create(family_data)
+        await invalidate_cache(self.cache, self.family_repo.session)
         return ProductFamilyResponse.from_model(family_model)
 
     async def get_family_by_id(self, family_id: int) -> ProductFamilyResponse:
         """Get family by ID."""
-        family_model = await self.family_repo.get(family_id)
-        if not family_model:
-            raise ValueError(f"ProductFamily {family_id} not found")
-        return ProductFamilyResponse.from_model(family_model)
+
+        async def load() -> ProductFamilyResponse:
+            family_model = await self.family_repo.get(family_id)
+            if not family_model:
+                raise ValueError(f"ProductFamily {family_id} not found")
+            return ProductFamilyResponse.from_model(family_model)
+
+        return await read_through(self.cache, f"id:{family_id}", load, ProductFamilyResponse)
 
     async def get_families_by_category(self, category_id: int) -> list[ProductFamilyResponse]:
         """Get all families for a specific category."""
-        families = await self.family_repo.get_multi(category_id=category_id)
-        return [ProductFamilyResponse.from_model(f) for f in families]
+
+        async def load() -> list[ProductFamilyResponse]:
+            families = await self.family_repo.get_multi(category_id=category_id)
+            return [ProductFamilyResponse.from_model(f) for f in families]
+
+        return await read_through(
+            self.cache, f"category:{category_id}", load, list[ProductFamilyResponse]
+        )
 
     async def get_all_families(self) -> list[ProductFamilyResponse]:
         """Get all families."""
-        families = await self.family_repo.get_multi(limit=200)
-        return [ProductFamilyResponse.from_model(f) for f in families]
+
+        async def load() -> list[ProductFamilyResponse]:
+            families = await self.family_repo.get_multi(limit=200)
+            return [ProductFamilyResponse.from_model(f) for f in families]
+
+        return await read_through(self.cache, "all", load, list[ProductFamilyResponse])
 
     async def update_family(
         self, family_id: int, request: ProductFamilyUpdateRequest
@@ -55,6 +75,7 @@ class ProductFamilyService:
 
         update_data = request.model_dump(exclude_unset=True)
         updated_model = await self.family_repo.update(family_id, update_data)
+        await invalidate_cache(self.cache, self.family_repo.session)
         return ProductFamilyResponse.from_model(updated_model)
 
     async def delete_family(self, family_id: int) -> None:
@@ -63,6 +84,7 @@ class ProductFamilyService:
         if not family_model:
             raise ValueError(f"ProductFamily {family_id} not found")
         await self.family_repo.delete(family_id)
+        await invalidate_cache(self.cache, self.family_repo.session)
 
     # Convenience aliases for controller compatibility
     async def get_by_category(self, category_id: int) -> list[ProductFamilyResponse]:
@@ -71,8 +93,14 @@ class ProductFamilyService:
 
     async def get_all(self, skip: int = 0, limit: int = 200) -> list[ProductFamilyResponse]:
         """Alias for get_all_families with pagination."""
-        families = await self.family_repo.get_multi(skip=skip, limit=limit)
-        return [ProductFamilyResponse.from_model(f) for f in families]
+
+        async def load() -> list[ProductFamilyResponse]:
+            families = await self.family_repo.get_multi(skip=skip, limit=limit)
+            return [ProductFamilyResponse.from_model(f) for f in families]
+
+        return await read_through(
+            self.cache, f"all:{skip}:{limit}", load, list[ProductFamilyResponse]
+        )
 
     async def create(self, request: ProductFamilyCreateRequest) -> ProductFamilyResponse:
         """Alias for create_family."""
@@ -10,6 +10,7 @@ This service handles product management with:
 from sqlalchemy import select
 
 from app.core.exceptions import NotFoundException
+from app.core.read_through_cache import ReadThroughCache, invalidate_cache, read_through
 from app.repositories.product_repository import ProductRepository
 from app.schemas.product_schema import (
     ProductCreateRequest,
@@ -23,16 +24,21 @@ class ProductService:
     """Business logic for product operations (CRUD + SKU auto-generation)."""
 
     def __init__(
-        self, product_repo: ProductRepository, family_service: ProductFamilyService
+        self,
+        product_repo: ProductRepository,
+        family_service: ProductFamilyService,
+        cache: ReadThroughCache | None = None,
     ) -> None:
         """Initialize service with repository and family service.
 
         Args:
             product_repo: Product repository (own repository)
             family_service: Family service for validation (Service→Service pattern)
+            cache: Read-through cache ("products" namespace); None reads the database
         """
         self.product_repo = product_repo
         self.family_service = family_service
+        self.cache = cache
 
     async def _generate_sku(self, family_id: int, common_name: str) -> str:
         """Generate unique SKU for product.
@@ -121,6 +127,7 @@ class ProductService:
 
         # Create via repository
         product_model = await self.product_repo.create(product_data)
+        await invalidate_cache(self.cache, self.product_repo.session)
 
         return ProductResponse.from_model(product_model)
 
@@ -136,10 +143,14 @@ class ProductService:
         Raises:
             NotFoundException: If product not found
         """
-        product_model = await self.product_repo.get(product_id)
-        if not product_model:
-            raise NotFoundException(resource="Product", identifier=product_id)
-        return ProductResponse.from_model(product_model)
+
+        async def load() -> ProductResponse:
+            product_model = await self.product_repo.get(product_id)
+            if not product_model:
+                raise NotFoundException(resource="Product", identifier=product_id)
+            return ProductResponse.from_model(product_model)
+
+        return await read_through(self.cache, f"id:{product_id}", load, ProductResponse)
 
     async def get_product_by_sku(self, sku: str) -> ProductResponse:
         """Get product by SKU.
@@ -153,15 +164,19 @@ class ProductService:
         Raises:
             ValueError: If product not found
         """
-        # Query by SKU (unique constraint)
-        stmt = select(self.product_repo.model).where(self.product_repo.model.sku == sku.upper())
-        result = await self.product_repo.session.execute(stmt)
-        product_model = result.scalar_one_or_none()
 
-        if not product_model:
-            raise NotFoundException(resource="Product", identifier=f"SKU:{sku}")
+        async def load() -> ProductResponse:
+            # Query by SKU (unique constraint)
+            stmt = select(self.product_repo.model).where(self.product_repo.model.sku == sku.upper())
+            result = await self.product_repo.session.execute(stmt)
+            product_model = result.scalar_one_or_none()
 
-        return ProductResponse.from_model(product_model)
+            if not product_model:
+                raise NotFoundException(resource="Product", identifier=f"SKU:{sku}")
+
+            return ProductResponse.from_model(product_model)
+
+        return await read_through(self.cache, f"sku:{sku.upper()}", load, ProductResponse)
 
     async def get_products_by_family(
         self, family_id: int, limit: int = 100
@@ -178,16 +193,21 @@ class ProductService:
         # Validate family exists via FamilyService
         await self.family_service.get_family_by_id(family_id)
 
-        # Query products by family
-        stmt = (
-            select(self.product_repo.model)
-            .where(self.product_repo.model.family_id == family_id)
-            .limit(limit)
-        )
-        result = await self.product_repo.session.execute(stmt)
-        products = result.scalars().all()
+        async def load() -> list[ProductResponse]:
+            # Query products by family
+            stmt = (
+                select(self.product_repo.model)
+                .where(self.product_repo.model.family_id == family_id)
+                .limit(limit)
+            )
+            result = await self.product_repo.session.execute(stmt)
+            products = result.scalars().all()
 
-        return [ProductResponse.from_model(p) for p in products]
+            return [ProductResponse.from_model(p) for p in products]
+
+        return await read_through(
+            self.cache, f"family:{family_id}:{limit}", load, list[ProductResponse]
+        )
 
     async def get_all_products(self, limit: int = 200) -> list[ProductResponse]:
         """Get all products.
@@ -198,8 +218,12 @@ class ProductService:
         Returns:
             List of ProductResponse objects
         """
-        products = await self.product_repo.get_multi(limit=limit)
-        return [ProductResponse.from_model(p) for p in products]
+
+        async def load() -> list[ProductResponse]:
+            products = await self.product_repo.get_multi(limit=limit)
+            return [ProductResponse.from_model(p) for p in products]
+
+        return await read_through(self.cache, f"all:{limit}", load, list[ProductResponse])
 
     async def update_product(
         self, product_id: int, request: ProductUpdateRequest
@@ -232,6 +256,7 @@ class ProductService:
 
         # Update via repository
         updated_model = await self.product_repo.update(product_id, update_data)
+        await invalidate_cache(self.cache, self.product_repo.session)
 
         return ProductResponse.from_model(updated_model)
 
@@ -251,6 +276,7 @@ class ProductService:
 
         # Delete via repository
         await self.product_repo.delete(product_id)
+        await invalidate_cache(self.cache, self.product_repo.session)
 
     # Convenience aliases for controller compatibility
     async def get_by_category_and_family(
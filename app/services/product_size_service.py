@@ -1,5 +1,6 @@
 """ProductSize business logic service."""
 
+from app.core.read_through_cache import ReadThroughCache, invalidate_cache, read_through
 from app.repositories.product_size_repository import ProductSizeRepository
 from app.schemas.product_size_schema import (
     ProductSizeCreateRequest,
@@ -11,26 +12,36 @@ from app.schemas.product_size_schema import (
 class ProductSizeService:
     """Business logic for productsize operations (CRUD)."""
 
-    def __init__(self, repo: ProductSizeRepository) -> None:
+    def __init__(self, repo: ProductSizeRepository, cache: ReadThroughCache | None = None) -> None:
         self.repo = repo
+        self.cache = cache  # Read-through cache ("product_sizes" namespace)
 
     async def create(self, request: ProductSizeCreateRequest) -> ProductSizeResponse:
         """Create a new productsize."""
         data = request.model_dump()
         model = await self.repo.create(data)
+        await invalidate_cache(self.cache, self.repo.session)
         return ProductSizeResponse.from_model(model)
 
     async def get_by_id(self, id: int) -> ProductSizeResponse:
         """Get productsize by ID."""
-        model = await self.repo.get(id)
-        if not model:
-            raise ValueError("ProductSize {id} not found")
-        return ProductSizeResponse.from_model(model)
+
+        async def load() -> ProductSizeResponse:
+            model = await self.repo.get(id)
+            if not model:
+                raise ValueError("ProductSize {id} not found")
+            return ProductSizeResponse.from_model(model)
+
+        return await read_through(self.cache, f"id:{id}", load, ProductSizeResponse)
 
     async def get_all(self, limit: int = 100) -> list[ProductSizeResponse]:
         """Get all productsizes."""
-        models = await self.repo.get_multi(limit=limit)
-        return [ProductSizeResponse.from_model(m) for m in models]
+
+        async def load() -> list[ProductSizeResponse]:
+            models = await self.repo.get_multi(limit=limit)
+            return [ProductSizeResponse.from_model(m) for m in models]
+
+        return await read_through(self.cache, f"all:{limit}", load, list[ProductSizeResponse])
 
     async def update(self, id: int, request: ProductSizeUpdateRequest) -> ProductSizeResponse:
         """Update productsize."""
@@ -40,6 +51,7 @@ class ProductSizeService:
 
         update_data = request.model_dump(exclude_unset=True)
         updated_model = await self.repo.update(id, update_data)
+        await invalidate_cache(self.cache, self.repo.session)
         if updated_model is None:
             raise ValueError(f"Failed to update ProductSize {id}")
         return ProductSizeResponse.from_model(updated_model)
@@ -50,3 +62,4 @@ class ProductSizeService:
         if not model:
             raise ValueError("ProductSize {id} not found")
         await self.repo.delete(id)
+        await invalidate_cache(self.cache, self.repo.session)
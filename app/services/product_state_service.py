@@ -1,5 +1,6 @@
 """ProductState business logic service."""
 
+from app.core.read_through_cache import ReadThroughCache, invalidate_cache, read_through
 from app.repositories.product_state_repository import ProductStateRepository
 from app.schemas.product_state_schema import (
     ProductStateCreateRequest,
@@ -11,26 +12,36 @@ from app.schemas.product_state_schema import (
 class ProductStateService:
     """Business logic for productstate operations (CRUD)."""
 
-    def __init__(self, repo: ProductStateRepository) -> None:
+    def __init__(self, repo: ProductStateRepository, cache: ReadThroughCache | None = None) -> None:
         self.repo = repo
+        self.cache = cache  # Read-through cache ("product_states" namespace)
 
     async def create(self, request: ProductStateCreateRequest) -> ProductStateResponse:
         """Create a new productstate."""
         data = request.model_dump()
         model = await self.repo.create(data)
+        await invalidate_cache(self.cache, self.repo.session)
         return ProductStateResponse.from_model(model)
 
     async def get_by_id(self, id: int) -> ProductStateResponse:
         """Get productstate by ID."""
-        model = await self.repo.get(id)
-        if not model:
-            raise ValueError("ProductState {id} not found")
-        return ProductStateResponse.from_model(model)
+
+        async def load() -> ProductStateResponse:
+            model = await self.repo.get(id)
+            if not model:
+                raise ValueError("ProductState {id} not found")
+            return ProductStateResponse.from_model(model)
+
+        return await read_through(self.cache, f"id:{id}", load, ProductStateResponse)
 
     async def get_all(self, limit: int = 100) -> list[ProductStateResponse]:
         """Get all productstates."""
-        models = await self.repo.get_multi(limit=limit)
-        return [ProductStateResponse.from_model(m) for m in models]
+
+        async def load() -> list[ProductStateResponse]:
+            models = await self.repo.get_multi(limit=limit)
+            return [ProductStateResponse.from_model(m) for m in models]
+
+        return await read_through(self.cache, f"all:{limit}", load, list[ProductStateResponse])
 
     async def update(self, id: int, request: ProductStateUpdateRequest) -> ProductStateResponse:
         """Update productstate."""
@@ -40,6 +51,7 @@ class ProductStateService:
 
         update_data = request.model_dump(exclude_unset=True)
         updated_model = await self.repo.update(id, update_data)
+        await invalidate_cache(self.cache, self.repo.session)
         if updated_model is None:
             raise ValueError(f"Failed to update ProductState {id}")
         return ProductStateResponse.from_model(updated_model)
@@ -50,3 +62,4 @@ class ProductStateService:
         if not model:
             raise ValueError("ProductState {id} not found")
         await self.repo.delete(id)
+        await invalidate_cache(self.cache, self.repo.session)
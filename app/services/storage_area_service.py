@@ -63,6 +63,7 @@ from app.schemas.storage_area_schema import (
     StorageAreaUpdateRequest,
     StorageAreaWithLocationsResponse,
 )
+from app.services.location_hierarchy_cache import invalidate_location_hierarchy
 from app.services.warehouse_service import WarehouseService
 
 
@@ -180,6 +181,7 @@ class StorageAreaService:
 
         # Create in database
         area = await self.storage_area_repo.create(area_data)
+        await invalidate_location_hierarchy(self.storage_area_repo.session)
 
         # 5. Transform to response schema (PostGIS → GeoJSON)
         return StorageAreaResponse.from_model(area)
@@ -207,6 +209,27 @@ class StorageAreaService:
 
         return StorageAreaResponse.from_model(area)
 
+    async def get_storage_areas_by_ids(self, area_ids: set[int]) -> dict[int, StorageAreaResponse]:
+        """Get many storage areas in one query (batch GPS resolution).
+
+        Args:
+            area_ids: Primary keys (missing ids are absent from the result)
+
+        Returns:
+            storage_area_id → StorageAreaResponse
+        """
+        if not area_ids:
+            return {}
+
+        from sqlalchemy import select
+
+        model = self.storage_area_repo.model
+        result = await self.storage_area_repo.session.execute(
+            select(model).where(model.storage_area_id.in_(area_ids))
+        )
+        areas = [StorageAreaResponse.from_model(area) for area in result.scalars().all()]
+        return {area.storage_area_id: area for area in areas}
+
     async def get_storage_area_by_gps(
         self, longitude: float, latitude: float, warehouse_id: int | None = None
     ) -> StorageAreaResponse | None:
@@ -435,6 +458,7 @@ class StorageAreaService:
         updated = await self.storage_area_repo.update(area_id, update_data)
         if not updated:
             raise StorageAreaNotFoundException(area_id=area_id)
+        await invalidate_location_hierarchy(self.storage_area_repo.session)
 
         # 4. Transform to response
         return StorageAreaResponse.from_model(updated)
@@ -471,6 +495,7 @@ class StorageAreaService:
 
         # Soft delete (set active=False)
         await self.storage_area_repo.update(area_id, {"active": False})
+        await invalidate_location_hierarchy(self.storage_area_repo.session)
         return True
 
     def _validate_within_parent(
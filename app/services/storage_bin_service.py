@@ -3,6 +3,7 @@
 from app.core.exceptions import DuplicateCodeException, StorageBinNotFoundException
 from app.repositories.storage_bin_repository import StorageBinRepository
 from app.schemas.storage_bin_schema import StorageBinCreateRequest, StorageBinResponse
+from app.services.location_hierarchy_cache import invalidate_location_hierarchy
 from app.services.storage_location_service import StorageLocationService
 
 
@@ -32,6 +33,7 @@ class StorageBinService:
 
         bin_data = request.model_dump()
         bin_model = await self.bin_repo.create(bin_data)
+        await invalidate_location_hierarchy(self.bin_repo.session)
         return StorageBinResponse.from_model(bin_model)
 
     async def get_storage_bin_by_id(self, bin_id: int) -> StorageBinResponse:
@@ -49,3 +51,24 @@ class StorageBinService:
         result = await self.bin_repo.session.execute(query)
         bins = result.scalars().all()
         return [StorageBinResponse.from_model(b) for b in bins]
+
+    async def get_bins_by_locations(
+        self, location_ids: set[int]
+    ) -> dict[int, list[StorageBinResponse]]:
+        """Bins of many locations in one query (location_id → bins, [] if none)."""
+        bins_by_location: dict[int, list[StorageBinResponse]] = {
+            location_id: [] for location_id in location_ids
+        }
+        if not location_ids:
+            return bins_by_location
+
+        from sqlalchemy import select
+
+        query = select(self.bin_repo.model).where(
+            self.bin_repo.model.storage_location_id.in_(location_ids)
+        )
+        result = await self.bin_repo.session.execute(query)
+        for b in result.scalars().all():
+            bin_response = StorageBinResponse.from_model(b)
+            bins_by_location[bin_response.storage_location_id].append(bin_response)
+        return bins_by_location
@@ -1,5 +1,7 @@
 """StorageLocationConfig business logic service."""
 
+from app.core.read_through_cache import ReadThroughCache, invalidate_cache, read_through
+from app.models.storage_location_config import StorageLocationConfig
 from app.repositories.storage_location_config_repository import StorageLocationConfigRepository
 from app.schemas.storage_location_config_schema import (
     StorageLocationConfigBulkRequest,
@@ -12,8 +14,11 @@ from app.schemas.storage_location_config_schema import (
 class StorageLocationConfigService:
     """Business logic for storagelocationconfig operations (CRUD)."""
 
-    def __init__(self, repo: StorageLocationConfigRepository) -> None:
+    def __init__(
+        self, repo: StorageLocationConfigRepository, cache: ReadThroughCache | None = None
+    ) -> None:
         self.repo = repo
+        self.cache = cache  # Read-through cache ("storage_location_configs" namespace)
 
     async def create(
         self, request: StorageLocationConfigCreateRequest
@@ -21,19 +26,30 @@ class StorageLocationConfigService:
         """Create a new storagelocationconfig."""
         data = request.model_dump()
         model = await self.repo.create(data)
+        await invalidate_cache(self.cache, self.repo.session)
         return StorageLocationConfigResponse.from_model(model)
 
     async def get_by_id(self, id: int) -> StorageLocationConfigResponse:
         """Get storagelocationconfig by ID."""
-        model = await self.repo.get(id)
-        if not model:
-            raise ValueError("StorageLocationConfig {id} not found")
-        return StorageLocationConfigResponse.from_model(model)
+
+        async def load() -> StorageLocationConfigResponse:
+            model = await self.repo.get(id)
+            if not model:
+                raise ValueError("StorageLocationConfig {id} not found")
+            return StorageLocationConfigResponse.from_model(model)
+
+        return await read_through(self.cache, f"id:{id}", load, StorageLocationConfigResponse)
 
     async def get_all(self, limit: int = 100) -> list[StorageLocationConfigResponse]:
         """Get all storagelocationconfigs."""
-        models = await self.repo.get_multi(limit=limit)
-        return [StorageLocationConfigResponse.from_model(m) for m in models]
+
+        async def load() -> list[StorageLocationConfigResponse]:
+            models = await self.repo.get_multi(limit=limit)
+            return [StorageLocationConfigResponse.from_model(m) for m in models]
+
+        return await read_through(
+            self.cache, f"all:{limit}", load, list[StorageLocationConfigResponse]
+        )
 
     async def update(
         self, id: int, request: StorageLocationConfigUpdateRequest
@@ -47,6 +63,7 @@ class StorageLocationConfigService:
         updated_model = await self.repo.update(id, update_data)
         if not updated_model:
             raise ValueError(f"StorageLocationConfig {id} not found after update")
+        await invalidate_cache(self.cache, self.repo.session)
         return StorageLocationConfigResponse.from_model(updated_model)
 
     async def delete(self, id: int) -> None:
@@ -55,27 +72,39 @@ class StorageLocationConfigService:
         if not model:
             raise ValueError("StorageLocationConfig {id} not found")
         await self.repo.delete(id)
+        await invalidate_cache(self.cache, self.repo.session)
 
     async def get_by_location(self, location_id: int) -> StorageLocationConfigResponse | None:
         """Get configuration for a specific location."""
+
+        async def load() -> StorageLocationConfigResponse | None:
+            model = await self._find_by_location(location_id)
+            return StorageLocationConfigResponse.from_model(model) if model else None
+
+        return await read_through(
+            self.cache,
+            f"location:{location_id}",
+            load,
+            StorageLocationConfigResponse | None,
+        )
+
+    async def _find_by_location(self, location_id: int) -> StorageLocationConfig | None:
+        """Query the configuration of a location (uncached)."""
         # Query by storage_location_id
         from sqlalchemy import select
 
-        from app.models.storage_location_config import StorageLocationConfig
-
         stmt = select(StorageLocationConfig).where(
             StorageLocationConfig.storage_location_id == location_id
         )
         result = await self.repo.session.execute(stmt)
-        model = result.scalars().first()
-        return StorageLocationConfigResponse.from_model(model) if model else None
+        return result.scalars().first()
 
     async def create_or_update(
         self, request: StorageLocationConfigCreateRequest
     ) -> StorageLocationConfigResponse:
         """Create or update configuration for a location."""
-        # Check if config exists for this location
-        existing = await self.get_by_location(request.storage_location_id)
+        # Check if config exists for this location (database, not cache: we write next)
+        existing = await self._find_by_location(request.storage_location_id)
 
         if existing:
             # Update existing
@@ -83,6 +112,7 @@ class StorageLocationConfigService:
             updated_model = await self.repo.update(existing.id, update_data)
             if not updated_model:
                 raise ValueError(f"StorageLocationConfig {existing.id} not found after update")
+            await invalidate_cache(self.cache, self.repo.session)
             return StorageLocationConfigResponse.from_model(updated_model)
         else:
             # Create new
@@ -4,7 +4,7 @@ Level 3 of location hierarchy - CRITICAL for photo localization.
 GPS → Warehouse → Area → Location (this service orchestrates the full chain).
 
 Key Features:
-- GPS-based hierarchical lookup (warehouse → area → location)
+- GPS-based lookup via the in-process spatial index (LocationResolver)
 - Parent area validation via StorageAreaService
 - QR code management for physical tracking
 - Point geometry validation (must be within parent area polygon)
@@ -39,6 +39,8 @@ from app.schemas.storage_location_schema import (
     StorageLocationResponse,
     StorageLocationUpdateRequest,
 )
+from app.services.location_hierarchy_cache import invalidate_location_hierarchy
+from app.services.location_resolver import ResolvedLocation, get_location_resolver
 from app.services.storage_area_service import StorageAreaService
 from app.services.warehouse_service import WarehouseService
 
@@ -115,6 +117,8 @@ class StorageLocationService:
 
         # Create in database
         location = await self.location_repo.create(location_data)
+        get_location_resolver().invalidate()
+        await invalidate_location_hierarchy(self.location_repo.session)
 
         # 5. Transform to response
         return StorageLocationResponse.from_model(location)
@@ -129,14 +133,9 @@ class StorageLocationService:
     async def get_location_by_gps(
         self, longitude: float, latitude: float
     ) -> StorageLocationResponse | None:
-        """GPS-based full hierarchy lookup (CRITICAL for photo localization).
+        """GPS-based location lookup (CRITICAL for photo localization).
 
-        Orchestrates warehouse → area → location chain.
-
-        Workflow:
-            1. Find warehouse containing GPS point (via WarehouseService)
-            2. Find storage area within warehouse (via StorageAreaService)
-            3. Find storage location within area (via StorageLocationRepository)
+        Resolves the point with resolve_location, then loads the location.
 
         Args:
             longitude: GPS longitude (WGS84)
@@ -144,44 +143,94 @@ class StorageLocationService:
 
         Returns:
             StorageLocationResponse if point found, None otherwise
-
-        Performance:
-            ~100-150ms for full chain (3 PostGIS queries with GIST indexes)
         """
-        # 1. Find warehouse
-        warehouse = await self.warehouse_service.get_warehouse_by_gps(longitude, latitude)
-        if not warehouse:
+        resolved = await self.resolve_location(longitude, latitude)
+        if not resolved:
             return None
 
-        # 2. Find storage area
-        area = await self.area_service.get_storage_area_by_gps(
-            longitude, latitude, warehouse_id=warehouse.warehouse_id
-        )
-        if not area:
+        location = await self.location_repo.get(resolved.storage_location_id)
+        if not location:
             return None
 
-        # 3. Find storage location
-        from geoalchemy2.functions import ST_Equals
-        from sqlalchemy import func, select
+        return StorageLocationResponse.from_model(location)
 
-        # NOTE: Database stores geometries as (lat, lon) instead of (lon, lat)
-        # Inverting coordinates to match the stored data
-        point = func.ST_SetSRID(func.ST_MakePoint(latitude, longitude), 4326)
+    async def resolve_location(self, longitude: float, latitude: float) -> ResolvedLocation | None:
+        """Resolve GPS coordinates to storage location/area/warehouse ids.
 
-        # Storage locations are POINTS, so use ST_Equals instead of ST_Contains
-        query = select(self.location_repo.model).where(
-            (ST_Equals(self.location_repo.model.coordinates, point))
-            & (self.location_repo.model.storage_area_id == area.storage_area_id)
-            & (self.location_repo.model.active == True)  # noqa: E712
+        Point-in-polygon against the active locations, else the nearest
+        location within LOCATION_GPS_TOLERANCE_METERS. Answered from the
+        process-wide spatial index (no per-call spatial query); PostGIS is
+        only queried when the index is unavailable.
+
+        Args:
+            longitude: GPS longitude (WGS84)
+            latitude: GPS latitude (WGS84)
+
+        Returns:
+            ResolvedLocation, or None if the point is not at any location
+
+        Performance:
+            ~10-50µs from the index (plus a one-row change check every
+            LOCATION_INDEX_REFRESH_SECONDS)
+        """
+        return await get_location_resolver().resolve(self.location_repo, longitude, latitude)
+
+    async def resolve_locations(
+        self, points: list[tuple[float, float]]
+    ) -> list[ResolvedLocation | None]:
+        """Resolve many (longitude, latitude) points at once (see resolve_location).
+
+        Answered from the spatial index; without it, one PostGIS query
+        resolves all points.
+
+        Returns:
+            One ResolvedLocation (or None) per point, in input order
+        """
+        return await get_location_resolver().resolve_many(self.location_repo, points)
+
+    async def get_locations_by_ids(
+        self, location_ids: set[int]
+    ) -> dict[int, StorageLocationResponse]:
+        """Get many storage locations in one query (batch GPS resolution).
+
+        Returns:
+            location_id → StorageLocationResponse (missing ids are absent)
+        """
+        if not location_ids:
+            return {}
+
+        from sqlalchemy import select
+
+        model = self.location_repo.model
+        result = await self.location_repo.session.execute(
+            select(model).where(model.location_id.in_(location_ids))
         )
+        locations = [StorageLocationResponse.from_model(loc) for loc in result.scalars().all()]
+        return {location.storage_location_id: location for location in locations}
+
+    async def get_locations_by_areas(
+        self, area_ids: set[int], active_only: bool = True
+    ) -> dict[int, list[StorageLocationResponse]]:
+        """Locations of many storage areas in one query (area_id → locations, [] if none)."""
+        locations_by_area: dict[int, list[StorageLocationResponse]] = {
+            area_id: [] for area_id in area_ids
+        }
+        if not area_ids:
+            return locations_by_area
 
-        result = await self.location_repo.session.execute(query)
-        location = result.scalars().first()
+        from sqlalchemy import select
 
-        if not location:
-            return None
+        query = select(self.location_repo.model).where(
+            self.location_repo.model.storage_area_id.in_(area_ids)
+        )
+        if active_only:
+            query = query.where(self.location_repo.model.active == True)  # noqa: E712
 
-        return StorageLocationResponse.from_model(location)
+        result = await self.location_repo.session.execute(query)
+        for loc in result.scalars().all():
+            location = StorageLocationResponse.from_model(loc)
+            locations_by_area[location.storage_area_id].append(location)
+        return locations_by_area
 
     async def get_locations_by_area(
         self, storage_area_id: int, active_only: bool = True
@@ -228,6 +277,8 @@ class StorageLocationService:
         updated = await self.location_repo.update(location_id, update_data)
         if not updated:
             raise StorageLocationNotFoundException(location_id=location_id)
+        get_location_resolver().invalidate()
+        await invalidate_location_hierarchy(self.location_repo.session)
         return StorageLocationResponse.from_model(updated)
 
     async def delete_storage_location(self, location_id: int) -> bool:
@@ -237,6 +288,8 @@ class StorageLocationService:
             raise StorageLocationNotFoundException(location_id=location_id)
 
         await self.location_repo.update(location_id, {"active": False})
+        get_location_resolver().invalidate()
+        await invalidate_location_hierarchy(self.location_repo.session)
         return True
 
     def _validate_point_within_area(
@@ -54,6 +54,7 @@ from app.schemas.warehouse_schema import (
     WarehouseUpdateRequest,
     WarehouseWithAreasResponse,
 )
+from app.services.location_hierarchy_cache import invalidate_location_hierarchy
 
 
 class WarehouseService:
@@ -145,6 +146,7 @@ class WarehouseService:
 
         # Create in database
         warehouse = await self.warehouse_repo.create(warehouse_data)
+        await invalidate_location_hierarchy(self.warehouse_repo.session)
 
         # 4. Transform to response schema (PostGIS → GeoJSON)
         return WarehouseResponse.from_model(warehouse)
@@ -172,6 +174,27 @@ class WarehouseService:
 
         return WarehouseResponse.from_model(warehouse)
 
+    async def get_warehouses_by_ids(self, warehouse_ids: set[int]) -> dict[int, WarehouseResponse]:
+        """Get many warehouses in one query (batch GPS resolution).
+
+        Args:
+            warehouse_ids: Primary keys (missing ids are absent from the result)
+
+        Returns:
+            warehouse_id → WarehouseResponse
+        """
+        if not warehouse_ids:
+            return {}
+
+        from sqlalchemy import select
+
+        model = self.warehouse_repo.model
+        result = await self.warehouse_repo.session.execute(
+            select(model).where(model.warehouse_id.in_(warehouse_ids))
+        )
+        warehouses = [WarehouseResponse.from_model(w) for w in result.scalars().all()]
+        return {warehouse.warehouse_id: warehouse for warehouse in warehouses}
+
     async def get_warehouse_by_gps(
         self, longitude: float, latitude: float
     ) -> WarehouseResponse | None:
@@ -314,6 +337,7 @@ class WarehouseService:
         updated = await self.warehouse_repo.update(warehouse_id, update_data)
         if not updated:
             raise WarehouseNotFoundException(warehouse_id=warehouse_id)
+        await invalidate_location_hierarchy(self.warehouse_repo.session)
 
         # 4. Transform to response
         return WarehouseResponse.from_model(updated)
@@ -350,6 +374,7 @@ class WarehouseService:
 
         # Soft delete (set active=False)
         await self.warehouse_repo.update(warehouse_id, {"active": False})
+        await invalidate_location_hierarchy(self.warehouse_repo.session)
         return True
 
     def _validate_geometry(self, geojson: dict[str, Any]) -> None:
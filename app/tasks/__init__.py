@@ -8,6 +8,10 @@ Task Modules:
         - ml_parent_task: Orchestrates child tasks via chord pattern
         - ml_child_task: Processes single image through ML pipeline
         - ml_aggregation_callback: Aggregates results from all children
+    - upload_tasks: Upload follow-up work (I/O queue)
+        - upload_original_derivatives: Thumbnail renditions of the original photo
+    - ml_priority: GPU queue priority classes (interactive, batch, reprocess)
+      and per-tenant fair share of batch uploads
 
 Worker Topology:
     - GPU Queue (pool=solo): ML inference tasks
@@ -29,9 +33,11 @@ from app.tasks.ml_tasks import (
     ml_child_task,
     ml_parent_task,
 )
+from app.tasks.upload_tasks import upload_original_derivatives
 
 __all__ = [
     "ml_parent_task",
     "ml_child_task",
     "ml_aggregation_callback",
+    "upload_original_derivatives",
 ]
@@ -0,0 +1,144 @@
+"""Priority classes and fair-share ordering of the GPU queue.
+
+gpu_queue is a Redis priority queue (broker_transport_options in
+app.celery_app): kombu keeps one list per priority 0-9 and GPU workers always
+pop the lowest number first, so a queued interactive image runs next no
+matter how many batch images are ahead of it.
+
+Classes (priority):
+    - interactive (0): single photo uploads, a user waits for the result
+    - batch (3-8): batch uploads. A tenant's images drop one level per
+      ML_FAIR_SHARE_LEVEL_PHOTOS images it already has in flight, so a
+      500-photo batch yields to a later 10-photo batch of another tenant
+      instead of running strictly first
+    - reprocess (9): re-runs of already processed photos
+
+Children carry priority_class/queued_at kwargs: workers record the queue wait
+of each image, and the API samples depth and oldest wait per class from the
+broker lists when /metrics is scraped.
+"""
+
+import base64
+import json
+import time
+from collections.abc import Sequence
+from enum import StrEnum
+from typing import Any
+
+from redis.asyncio import Redis  # type: ignore[import-not-found]
+
+from app.celery_app import app
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import get_metrics_collector, update_ml_queue_metrics
+
+logger = get_logger(__name__)
+
+GPU_QUEUE = "gpu_queue"
+
+
+class MLPriorityClass(StrEnum):
+    """Scheduling class of an ML image."""
+
+    INTERACTIVE = "interactive"
+    BATCH = "batch"
+    REPROCESS = "reprocess"
+
+
+# Broker priority range of each class (0 = highest)
+CLASS_PRIORITIES: dict[MLPriorityClass, range] = {
+    MLPriorityClass.INTERACTIVE: range(0, 3),
+    MLPriorityClass.BATCH: range(3, 9),
+    MLPriorityClass.REPROCESS: range(9, 10),
+}
+
+
+def class_priority(priority_class: MLPriorityClass) -> int:
+    """Broker priority of images of a class (the class's highest level)."""
+    return CLASS_PRIORITIES[priority_class].start
+
+
+def priority_class_of(priority: int) -> MLPriorityClass:
+    """Class a broker priority belongs to."""
+    for priority_class, priorities in CLASS_PRIORITIES.items():
+        if priority in priorities:
+            return priority_class
+    return MLPriorityClass.REPROCESS
+
+
+def fair_share_priorities(count: int, queued_ahead: int) -> list[int]:
+    """Broker priorities of a tenant's batch images, in dispatch order.
+
+    Image i is the tenant's (queued_ahead + i)-th image in flight and is
+    demoted one level per ML_FAIR_SHARE_LEVEL_PHOTOS images before it
+    (down to the lowest batch level).
+
+    Args:
+        count: Images in the batch
+        queued_ahead: Images the tenant already has queued or running
+    """
+    levels = CLASS_PRIORITIES[MLPriorityClass.BATCH]
+    step = max(1, settings.ML_FAIR_SHARE_LEVEL_PHOTOS)
+    return [min(levels[-1], levels.start + (queued_ahead + i) // step) for i in range(count)]
+
+
+def priority_queue_keys(queue: str = GPU_QUEUE) -> dict[int, str]:
+    """Redis list of each broker priority of a queue (kombu naming)."""
+    options = app.conf.broker_transport_options
+    sep = options.get("sep", "\x06\x16")
+    return {
+        priority: f"{queue}{sep}{priority}" if priority else queue
+        for priority in options.get("priority_steps", [0])
+    }
+
+
+def _queued_at(raw: str | bytes | None) -> float | None:
+    """queued_at kwarg of a raw broker message (None if absent/unreadable)."""
+    if raw is None:
+        return None
+    try:
+        message = json.loads(raw)
+        body: Any = message["body"]
+        if message.get("properties", {}).get("body_encoding") == "base64":
+            body = base64.b64decode(body)
+        _args, kwargs, _embed = json.loads(body)
+        return float(kwargs["queued_at"])
+    except (ValueError, TypeError, KeyError):
+        return None
+
+
+async def refresh_ml_queue_metrics(redis: Redis, queue: str = GPU_QUEUE) -> None:
+    """Sample depth and oldest wait per priority class (never raises).
+
+    One pipelined round trip: LLEN of every priority list plus its oldest
+    message (the tail, kombu pushes on the left and pops on the right).
+    """
+    if get_metrics_collector() is None:
+        return
+
+    keys = priority_queue_keys(queue)
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            for key in keys.values():
+                pipe.llen(key)
+                pipe.lindex(key, -1)
+            replies: Sequence[Any] = await pipe.execute()
+    except Exception as e:
+        logger.warning(
+            f"Failed to sample ML queue depth: {e}",
+            extra={"queue": queue, "error": str(e)},
+        )
+        return
+
+    now = time.time()
+    depth = dict.fromkeys(MLPriorityClass, 0)
+    oldest = dict.fromkeys(MLPriorityClass, 0.0)
+    for i, priority in enumerate(keys):
+        priority_class = priority_class_of(priority)
+        depth[priority_class] += int(replies[2 * i])
+        queued_at = _queued_at(replies[2 * i + 1])
+        if queued_at is not None:
+            oldest[priority_class] = max(oldest[priority_class], now - queued_at)
+
+    for priority_class in MLPriorityClass:
+        update_ml_queue_metrics(priority_class, depth[priority_class], oldest[priority_class])
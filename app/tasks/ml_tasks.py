@@ -11,6 +11,8 @@ Architecture:
     Layer: Task Layer (Async Queue Processing)
     Pattern: Celery chord (parent → [child1, child2, ...] → callback)
     Routing: gpu_queue (ML tasks), cpu_queue (aggregation)
+    Scheduling: gpu_queue priorities per class - interactive uploads, then
+        batch uploads (fair share per tenant), then reprocessing (ml_priority)
     Retry: Exponential backoff (2s, 4s, 8s), max 3 retries
 
 Task Flow:
@@ -29,6 +31,10 @@ Task Flow:
        ├─> Updates PhotoProcessingSession (status, counts, confidence)
        └─> Creates StockBatch record
 
+    Batch uploads: ml_batch_parent_task(batch) dispatches one chain per photo
+    (one session each): ml_child_task → ml_batch_session_callback, which runs
+    step 3 for that session and releases its tenant in-flight slot.
+
 Performance:
     - CPU: 5-10 minutes per 4000×3000px photo
     - GPU: 1-3 minutes per photo (3-5x speedup)
@@ -37,7 +43,9 @@ Performance:
 Error Handling:
     - Partial failures: Chord callback receives partial results
     - Max retries: 3 attempts with 2s, 4s, 8s backoff
-    - Circuit breaker: Fails fast after max retries
+    - Circuit breakers (shared by all workers via Redis): "db" scope for the
+      parent tasks, one "gpu:{worker}:{device}" scope per GPU for inference;
+      an open GPU circuit hands images back to the queue without running them
     - DLQ: Failed tasks logged for manual inspection
 
 Example:
@@ -46,37 +54,52 @@ Example:
     >>> # Celery spawns 3 child tasks, aggregates results in callback
 """
 
+import contextlib
 import os
+import re
+import shutil
+import socket
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from celery import Task, chord  # type: ignore[import-not-found]
+from celery import Task, chord, group  # type: ignore[import-not-found]
 
 from app.celery_app import app
+from app.core.circuit_breaker import (
+    CircuitBreaker,
+    get_circuit_breaker,
+    gpu_policy,
+    root_cause,
+)
 from app.core.exceptions import (
     CircuitBreakerException,
     ValidationException,
 )
 from app.core.logging import get_logger
+from app.core.metrics import record_ml_queue_wait, record_ml_recount_segments
 from app.services.ml_processing.band_estimation_service import BandEstimationService
+from app.services.ml_processing.detection_array import DetectionArray
+from app.services.ml_processing.incremental_recount import RecountPrior, build_recount_prior
 from app.services.ml_processing.pipeline_coordinator import (
     MLPipelineCoordinator,
     PipelineResult,
 )
 from app.services.ml_processing.sahi_detection_service import SAHIDetectionService
 from app.services.ml_processing.segmentation_service import SegmentationService
+from app.tasks.ml_priority import MLPriorityClass, class_priority, fair_share_priorities
 
 logger = get_logger(__name__)
 
-# Circuit Breaker Configuration (CEL008)
-CIRCUIT_BREAKER_THRESHOLD = 5  # Open circuit after 5 consecutive failures
-CIRCUIT_BREAKER_TIMEOUT = 300  # 5 minutes cooldown before retry
-circuit_breaker_state: dict[str, Any] = {
-    "failures": 0,
-    "last_failure_time": None,
-    "state": "closed",  # closed, open, half_open
-}
+# Circuit breaker scopes (CEL008, state shared in Redis, see app.core.circuit_breaker)
+DB_CIRCUIT_SCOPE = "db"  # Parent tasks: session updates + chord dispatch
+
+# StorageBin.code limits (see StorageBin.validate_code)
+STORAGE_BIN_CODE_MAX_LENGTH = 100
+ML_BIN_TYPE_MAX_LENGTH = 20  # Container type part of ML bin codes
+_BIN_CODE_INVALID_CHARS = re.compile(r"[^A-Z0-9_]")
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -84,88 +107,55 @@ circuit_breaker_state: dict[str, Any] = {
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-def check_circuit_breaker() -> None:
-    """Check circuit breaker state before executing task.
+def check_circuit_breaker() -> bool:
+    """Check the database circuit before dispatching ML work.
+
+    The circuit is shared by every worker process and host: it opens when the
+    failure rate of parent tasks over the sliding window is too high, and
+    after the cooldown a single worker probes recovery.
 
-    Circuit Breaker States:
-        - closed: Normal operation (failures < threshold)
-        - open: Too many failures (reject all requests for timeout period)
-        - half_open: Testing recovery (allow 1 request to test)
+    Returns:
+        True if this task is the half-open probe (pass it to record_*)
 
     Raises:
         CircuitBreakerException: If circuit is open (too many failures)
-
-    Business Rules:
-        - Circuit opens after 5 consecutive failures
-        - Circuit stays open for 5 minutes (cooldown)
-        - After cooldown, transitions to half_open (test recovery)
     """
-    global circuit_breaker_state
-
-    state = circuit_breaker_state["state"]
+    return get_circuit_breaker(DB_CIRCUIT_SCOPE).before_call()
 
-    if state == "closed":
-        # Normal operation
-        return
 
-    if state == "open":
-        # Check if cooldown period has passed
-        last_failure = circuit_breaker_state["last_failure_time"]
-        if last_failure is not None:
-            elapsed = (datetime.utcnow() - last_failure).total_seconds()
-            if elapsed >= CIRCUIT_BREAKER_TIMEOUT:
-                # Transition to half_open (test recovery)
-                circuit_breaker_state["state"] = "half_open"
-                logger.info("Circuit breaker transitioning to HALF_OPEN (testing recovery)")
-                return
-
-        # Circuit still open
-        failures = circuit_breaker_state["failures"]
-        raise CircuitBreakerException(
-            reason=f"Circuit breaker OPEN due to {failures} failures. "
-            f"Retry after cooldown period ({CIRCUIT_BREAKER_TIMEOUT}s)."
-        )
-
-    if state == "half_open":
-        # Allow request to test recovery
-        logger.info("Circuit breaker HALF_OPEN: Allowing test request")
-        return
+def record_circuit_breaker_success(probe: bool = False) -> None:
+    """Record successful dispatch (a successful probe closes the circuit)."""
+    get_circuit_breaker(DB_CIRCUIT_SCOPE).record_success(probe)
 
 
-def record_circuit_breaker_success() -> None:
-    """Record successful task execution (reset circuit breaker)."""
-    global circuit_breaker_state
+def record_circuit_breaker_failure(probe: bool = False) -> None:
+    """Record failed dispatch (may open the circuit for every worker)."""
+    get_circuit_breaker(DB_CIRCUIT_SCOPE).record_failure(probe)
 
-    state = circuit_breaker_state["state"]
 
-    if state == "half_open":
-        # Recovery successful, close circuit
-        circuit_breaker_state["state"] = "closed"
-        circuit_breaker_state["failures"] = 0
-        circuit_breaker_state["last_failure_time"] = None
-        logger.info("Circuit breaker CLOSED (recovery successful)")
-    elif state == "closed":
-        # Reset failure counter on success
-        circuit_breaker_state["failures"] = 0
+def _gpu_circuit_breaker(task: Task) -> CircuitBreaker:
+    """Circuit of the GPU this worker runs on ("gpu:{worker}:{device}").
 
+    Inference failures on one GPU open its circuit only: the worker then
+    fails fast and hands its images back to the queue, while other GPUs
+    keep working.
+    """
+    worker = task.request.hostname or socket.gethostname()
+    device = os.environ.get("CUDA_VISIBLE_DEVICES") or "0"
+    return get_circuit_breaker(f"gpu:{worker}:{device}", gpu_policy())
 
-def record_circuit_breaker_failure() -> None:
-    """Record task failure (increment circuit breaker counter)."""
-    global circuit_breaker_state
 
-    failures = int(circuit_breaker_state["failures"]) + 1
-    circuit_breaker_state["failures"] = failures
-    circuit_breaker_state["last_failure_time"] = datetime.utcnow()
+def _is_gpu_failure(exc: BaseException) -> bool:
+    """Whether an inference error counts against this GPU's circuit.
 
-    if failures >= CIRCUIT_BREAKER_THRESHOLD:
-        # Open circuit
-        circuit_breaker_state["state"] = "open"
-        logger.error(
-            f"Circuit breaker OPENED after {failures} failures. "
-            f"Cooldown: {CIRCUIT_BREAKER_TIMEOUT}s"
-        )
-    else:
-        logger.warning(f"Circuit breaker failure recorded: {failures}/{CIRCUIT_BREAKER_THRESHOLD}")
+    CUDA errors and out-of-memory (torch raises RuntimeError subclasses),
+    host memory exhaustion and timeouts do. Errors about the image itself
+    (unreadable file, bad input values) say nothing about the GPU.
+    """
+    cause = root_cause(exc)
+    if isinstance(cause, NotImplementedError | RecursionError):
+        return False
+    return isinstance(cause, RuntimeError | MemoryError | TimeoutError | ConnectionError)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -212,6 +202,53 @@ def _map_container_type_to_bin_category(container_type: str) -> str:
     return mapping.get(normalized, "segment")
 
 
+def _ml_bin_code(
+    location_code: str,
+    storage_location_id: int,
+    container_type: str,
+    index: int,
+    timestamp: str,
+) -> str:
+    """Build the code of an ML-created StorageBin.
+
+    Bins are written with a Core bulk insert, which does not run
+    StorageBin.validate_code, so the code is made valid here: uppercase,
+    WAREHOUSE-AREA-LOCATION-BIN pattern ([A-Z0-9_] parts) and at most
+    STORAGE_BIN_CODE_MAX_LENGTH characters.
+
+    Args:
+        location_code: Parent storage location code (prefix)
+        storage_location_id: Parent storage location ID (prefix fallback)
+        container_type: Container type from ML pipeline
+        index: 1-based segment index
+        timestamp: Creation timestamp (YYYYmmddHHMMSS)
+
+    Returns:
+        str: Valid code, {location_code}-ML-{container_type}{index}-{timestamp}
+        (prefix shortened if needed, invalid characters replaced by "_")
+
+    Example:
+        >>> _ml_bin_code("inv01-north-a1", 3, "segment", 1, "20251024143000")
+        "INV01-NORTH-A1-ML-SEGMENT001-20251024143000"
+    """
+    parts = [
+        _BIN_CODE_INVALID_CHARS.sub("_", part)
+        for part in location_code.strip().upper().split("-")
+        if part.strip()
+    ]
+    prefix = "-".join(parts) or f"LOC{storage_location_id}"
+    bin_type = _BIN_CODE_INVALID_CHARS.sub("_", container_type.strip().upper()) or "SEGMENT"
+    suffix = f"-ML-{bin_type[:ML_BIN_TYPE_MAX_LENGTH]}{index:03d}-{timestamp}"
+
+    max_prefix_length = STORAGE_BIN_CODE_MAX_LENGTH - len(suffix)
+    if len(prefix) > max_prefix_length:
+        # Keep the location ID so shortened prefixes of different locations stay unique
+        location_tag = f"_{storage_location_id}"
+        prefix = prefix[: max_prefix_length - len(location_tag)].rstrip("-") + location_tag
+
+    return prefix + suffix
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # CEL005: ML Parent Task (Chord Orchestration)
 # ═══════════════════════════════════════════════════════════════════════════
@@ -222,6 +259,7 @@ def ml_parent_task(
     self: Task,
     session_id: int,
     image_data: list[dict[str, Any]],
+    priority_class: str = MLPriorityClass.INTERACTIVE,
 ) -> dict[str, Any]:
     """ML parent task: Spawns child tasks using chord pattern (CEL004, CEL005).
 
@@ -237,6 +275,8 @@ def ml_parent_task(
             - image_id (str): S3Image UUID as string (for tracking)
             - image_path (str): Local path or S3 key to image file
             - storage_location_id (int): Where photo was taken
+        priority_class: GPU queue class of the children ("interactive" for
+            uploads, "reprocess" for re-runs, see app.tasks.ml_priority)
 
     Returns:
         dict with:
@@ -270,7 +310,7 @@ def ml_parent_task(
 
     # CEL008: Check circuit breaker before processing
     try:
-        check_circuit_breaker()
+        probe = check_circuit_breaker()
     except CircuitBreakerException as e:
         logger.error(
             f"Circuit breaker OPEN: Rejecting task for session {session_id}",
@@ -292,14 +332,19 @@ def ml_parent_task(
         _mark_session_processing(session_id, celery_task_id=self.request.id)
 
         # CEL004: Create child task signatures (one per image)
-        # Each child task runs on GPU queue for ML inference
+        # Each child task runs on GPU queue for ML inference, ahead of or
+        # behind other work according to its priority class
+        priority = class_priority(MLPriorityClass(priority_class))
+        queued_at = time.time()
         child_signatures = [
             ml_child_task.s(
                 session_id=session_id,
                 image_id=img["image_id"],
                 image_path=img["image_path"],
                 storage_location_id=img["storage_location_id"],
-            )
+                priority_class=priority_class,
+                queued_at=queued_at,
+            ).set(priority=priority)
             for img in image_data
         ]
 
@@ -317,6 +362,7 @@ def ml_parent_task(
             f"Chord dispatched for session {session_id}: {len(child_signatures)} children → callback",
             extra={"session_id": session_id, "task_id": self.request.id},
         )
+        record_circuit_breaker_success(probe)
 
         return {
             "session_id": session_id,
@@ -332,7 +378,7 @@ def ml_parent_task(
             exc_info=True,
         )
         _mark_session_failed(session_id, str(exc))
-        record_circuit_breaker_failure()
+        record_circuit_breaker_failure(probe)
 
         # Retry with exponential backoff (CEL008)
         raise self.retry(exc=exc, countdown=2**self.request.retries) from exc
@@ -350,7 +396,10 @@ def ml_child_task(
     image_id: str,  # S3Image UUID as string
     image_path: str,
     storage_location_id: int,
-) -> dict[str, Any]:
+    job_id: str | None = None,
+    priority_class: str = MLPriorityClass.INTERACTIVE,
+    queued_at: float | None = None,
+) -> dict[str, Any] | None:
     """ML child task: Process one image through complete ML pipeline (CEL006).
 
     This task runs on GPU worker (pool=solo) to prevent CUDA context conflicts.
@@ -364,16 +413,25 @@ def ml_child_task(
         image_id: S3Image UUID as string (for tracking/logging)
         image_path: Path to image file (local or S3 key)
         storage_location_id: Storage location where photo was taken
+        job_id: Upload job ID (batch uploads). When set, progress is reported
+            to Redis (job_status:{job_id}) and a permanently failed image
+            returns None instead of raising, so its session callback still
+            runs (marks the session failed, releases the tenant slot).
+        priority_class: GPU queue class (metrics label, see app.tasks.ml_priority).
+            Reprocess runs never reuse previous results (full re-count).
+        queued_at: Dispatch time (epoch seconds) for the queue wait metric
 
     Returns:
-        dict with ML results:
+        dict with ML results (None if a batch image failed permanently):
             - image_id (int): S3Image ID
             - total_detected (int): Total plants detected
             - total_estimated (int): Total plants estimated
             - avg_confidence (float): Average detection confidence (0.0-1.0)
             - segments_processed (int): Number of containers processed
+            - segments_reused (int): Containers whose detections were reused
+              from the previous session (incremental re-count)
             - processing_time_seconds (float): Pipeline elapsed time
-            - detections (list[dict]): Detection records for bulk insert
+            - detections (dict): Columnar DetectionArray payload (to_json())
             - estimations (list[dict]): Estimation records for bulk insert
 
     Raises:
@@ -390,6 +448,8 @@ def ml_child_task(
         - Max retries: 3
         - Backoff: Exponential (2s, 4s, 8s)
         - Countdown: 2^retry_count seconds
+        - GPU circuit open: retried when the circuit will probe again,
+          without fetching the image or running inference
 
     Example:
         >>> result = ml_child_task.delay(
@@ -400,6 +460,11 @@ def ml_child_task(
         ... )
         >>> # Returns: {"total_detected": 842, "total_estimated": 158, ...}
     """
+    queue_wait = None
+    if queued_at is not None and not self.request.retries:
+        queue_wait = max(0.0, time.time() - queued_at)
+        record_ml_queue_wait(priority_class, queue_wait)
+
     logger.info(
         f"ML child task started for session {session_id}, image {image_id}",
         extra={
@@ -407,10 +472,17 @@ def ml_child_task(
             "image_id": image_id,
             "image_path": image_path,
             "task_id": self.request.id,
+            "priority_class": priority_class,
+            "queue_wait_seconds": queue_wait,
         },
     )
+    _report_job_status(job_id, "processing", session_id=session_id, progress_percent=0)
+    gpu_breaker = _gpu_circuit_breaker(self)
 
     try:
+        # CEL008: This GPU's circuit is open → fail before fetching the image
+        gpu_breaker.fail_fast()
+
         # Priority order: PostgreSQL → /tmp local cache → S3 download
         # This enables Celery workers in separate containers to access images efficiently
 
@@ -516,6 +588,18 @@ def ml_child_task(
             band_estimation_service=band_estimation_service,
         )
 
+        # Plant size history from the previous session at this location drives
+        # adaptive SAHI tiling (None → default 512px / 25% overlap)
+        plant_area_profile = _load_plant_area_profile(session_id, storage_location_id)
+
+        # Previous session at this location: segment layout + detections to
+        # reuse where the bench did not change (None → full run)
+        recount_prior = (
+            _load_recount_prior(session_id, storage_location_id)
+            if priority_class != MLPriorityClass.REPROCESS
+            else None
+        )
+
         # Run complete ML pipeline (blocking, async coordination handled internally)
         # This is CPU/GPU intensive (5-10 mins CPU, 1-3 mins GPU)
         import asyncio
@@ -525,14 +609,22 @@ def ml_child_task(
             extra={"processing_path": processing_path, "is_local": is_local_file},
         )
 
-        result: PipelineResult = asyncio.run(
-            coordinator.process_complete_pipeline(
-                session_id=session_id,
-                image_path=processing_path,
-                worker_id=0,  # GPU worker 0
-                conf_threshold_segment=0.30,
-                conf_threshold_detect=0.25,
+        # CEL008: Inference outcome counts towards this GPU's circuit
+        with gpu_breaker.protect(is_failure=_is_gpu_failure):
+            result: PipelineResult = asyncio.run(
+                coordinator.process_complete_pipeline(
+                    session_id=session_id,
+                    image_path=processing_path,
+                    worker_id=0,  # GPU worker 0
+                    conf_threshold_segment=0.30,
+                    conf_threshold_detect=0.25,
+                    plant_area_profile=plant_area_profile,
+                    recount_prior=recount_prior,
+                )
             )
+        record_ml_recount_segments(
+            reused=result.segments_reused,
+            detected=result.segments_processed - result.segments_reused,
         )
 
         # PROBLEM 4 FIX: DON'T delete temp file here!
@@ -551,13 +643,11 @@ def ml_child_task(
                 "image_id": image_id,
                 "total_detected": result.total_detected,
                 "total_estimated": result.total_estimated,
+                "segments_reused": result.segments_reused,
                 "processing_time": result.processing_time_seconds,
             },
         )
 
-        # CEL008: Record success (reset circuit breaker)
-        record_circuit_breaker_success()
-
         # Convert SegmentResult objects to dict format for JSON serialization
         segments_dict = [
             {
@@ -566,10 +656,22 @@ def ml_child_task(
                 "bbox": seg.bbox,  # (x1, y1, x2, y2) normalized
                 "polygon": seg.polygon,  # List of (x, y) tuples normalized
                 "area_pixels": seg.area_pixels,  # Fixed: was mask_area
+                "detected_at": seg.detected_at,  # Set when detections were reused
             }
             for seg in result.segments
         ]
 
+        # Inference done; ml_batch_session_callback reports completion once
+        # the session is persisted
+        _report_job_status(
+            job_id,
+            "processing",
+            session_id=session_id,
+            progress_percent=90,
+            total_detected=result.total_detected,
+            total_estimated=result.total_estimated,
+        )
+
         # Return results for chord callback aggregation
         return {
             "image_id": image_id,
@@ -577,19 +679,36 @@ def ml_child_task(
             "total_estimated": result.total_estimated,
             "avg_confidence": result.avg_confidence,
             "segments_processed": result.segments_processed,
+            "segments_reused": result.segments_reused,
             "processing_time_seconds": result.processing_time_seconds,
-            "detections": result.detections,
+            "detections": result.detections.to_json(),
             "estimations": result.estimations,
             "segments": segments_dict,  # NEW: Include segments for StorageBin creation
         }
 
+    except CircuitBreakerException as e:
+        # CEL008: GPU circuit open - hand the image back to the queue (same
+        # task ID, so the chord still waits for it) for a healthy GPU worker
+        logger.warning(
+            f"GPU circuit open, deferring session {session_id}, image {image_id}: {e}",
+            extra={"session_id": session_id, "image_id": image_id, "scope": gpu_breaker.scope},
+        )
+        if job_id is not None and self.request.retries >= self.max_retries:
+            _report_job_status(job_id, "failed", session_id=session_id, error=str(e))
+            return None
+
+        countdown = e.retry_after_seconds or 2**self.request.retries
+        raise self.retry(exc=e, countdown=countdown) from e
+
     except FileNotFoundError as e:
         logger.error(
             f"ML child task failed (image not found) for session {session_id}, image {image_id}: {e}",
             extra={"session_id": session_id, "image_id": image_id, "error": str(e)},
         )
         # Don't retry if file doesn't exist (permanent failure)
-        record_circuit_breaker_failure()
+        if job_id is not None:
+            _report_job_status(job_id, "failed", session_id=session_id, error=str(e))
+            return None
         raise
 
     except Exception as exc:
@@ -604,8 +723,9 @@ def ml_child_task(
             exc_info=True,
         )
 
-        # CEL008: Record failure
-        record_circuit_breaker_failure()
+        if job_id is not None and self.request.retries >= self.max_retries:
+            _report_job_status(job_id, "failed", session_id=session_id, error=str(exc))
+            return None
 
         # CEL008: Retry with exponential backoff
         countdown = 2**self.request.retries  # 2s, 4s, 8s
@@ -705,11 +825,13 @@ def ml_aggregation_callback(
         )
 
         # Aggregate all detections/estimations/segments for bulk insert
-        all_detections = []
+        # (detections accept both columnar payloads and legacy lists of dicts)
+        all_detections = DetectionArray.concat(
+            [DetectionArray.coerce(r.get("detections")) for r in valid_results]
+        )
         all_estimations = []
         all_segments = []
         for r in valid_results:
-            all_detections.extend(r.get("detections", []))
             all_estimations.extend(r.get("estimations", []))
             all_segments.extend(r.get("segments", []))  # NEW: Aggregate segments
 
@@ -898,105 +1020,68 @@ def ml_aggregation_callback(
                         extra={"session_id": session_id, "s3_key": viz_s3_key},
                     )
 
-                    # PROBLEM 5 FIX: Generate TWO thumbnails (original + processed)
-
-                    # THUMBNAIL 1: Original image thumbnail
+                    # Deep Zoom tiles for the zoomable viewer (optional, don't fail on error)
                     try:
-                        from app.services.photo.s3_image_service import generate_thumbnail
-
-                        # Read original image from /tmp (already downloaded via 3-tier cache)
-                        original_temp_path = f"/tmp/session_{session_id}_original.jpg"
-                        if Path(original_temp_path).exists():
-                            with open(original_temp_path, "rb") as f:
-                                original_bytes = f.read()
+                        _upload_deep_zoom_output(
+                            s3_client=s3_client,
+                            bucket=settings.S3_BUCKET_ORIGINAL,
+                            s3_prefix=f"{session_uuid}/processed",
+                            viz_path=viz_path,
+                            session_id=session_id,
+                        )
+                    except Exception as tiles_error:
+                        logger.warning(
+                            f"ML aggregation callback: Failed to upload Deep Zoom tiles: {tiles_error}",
+                            extra={"session_id": session_id, "error": str(tiles_error)},
+                        )
 
-                            # Generate thumbnail from original
-                            thumbnail_original_bytes = generate_thumbnail(
-                                original_bytes, size=settings.S3_THUMBNAIL_SIZE
-                            )
+                    # Processed thumbnail: already encoded by _generate_visualization
+                    # from the in-memory preview (no AVIF decode here). The original
+                    # thumbnail is produced at upload time by upload_original_derivatives
+                    # (io_queue).
+                    try:
+                        thumb_path = Path(f"{Path(viz_path).with_suffix('')}_thumb.jpg")
+                        if thumb_path.exists():
+                            thumbnail_processed_bytes = thumb_path.read_bytes()
 
-                            # S3 key format: {UUID}/thumbnail_original.jpg
-                            thumbnail_original_s3_key = f"{session_uuid}/thumbnail_original.jpg"
+                            # S3 key format: {UUID}/thumbnail_processed.jpg
+                            thumbnail_processed_s3_key = f"{session_uuid}/thumbnail_processed.jpg"
 
                             logger.info(
-                                f"ML aggregation callback: Uploading original thumbnail to S3: {thumbnail_original_s3_key}",
+                                f"ML aggregation callback: Uploading processed thumbnail to S3: {thumbnail_processed_s3_key}",
                                 extra={
                                     "session_id": session_id,
-                                    "s3_key": thumbnail_original_s3_key,
-                                    "thumbnail_size": len(thumbnail_original_bytes),
+                                    "s3_key": thumbnail_processed_s3_key,
+                                    "thumbnail_size": len(thumbnail_processed_bytes),
                                 },
                             )
 
-                            # Upload original thumbnail to S3
+                            # Upload processed thumbnail to original bucket
                             s3_client.put_object(
                                 Bucket=settings.S3_BUCKET_ORIGINAL,
-                                Key=thumbnail_original_s3_key,
-                                Body=thumbnail_original_bytes,
+                                Key=thumbnail_processed_s3_key,
+                                Body=thumbnail_processed_bytes,
                                 ContentType="image/jpeg",
                             )
 
                             logger.info(
-                                f"ML aggregation callback: Original thumbnail uploaded to S3: {thumbnail_original_s3_key}",
+                                f"ML aggregation callback: Processed thumbnail uploaded to S3: {thumbnail_processed_s3_key}",
                                 extra={
                                     "session_id": session_id,
-                                    "s3_key": thumbnail_original_s3_key,
+                                    "s3_key": thumbnail_processed_s3_key,
                                 },
                             )
 
                         else:
                             logger.warning(
-                                "ML aggregation callback: Original image not found in /tmp, skipping original thumbnail",
-                                extra={
-                                    "session_id": session_id,
-                                    "expected_path": original_temp_path,
-                                },
+                                "ML aggregation callback: Visualization thumbnail not found, skipping processed thumbnail",
+                                extra={"session_id": session_id, "expected_path": str(thumb_path)},
                             )
 
-                    except Exception as thumb_original_error:
-                        # Log but don't fail (thumbnail is optional)
-                        logger.warning(
-                            f"ML aggregation callback: Failed to generate/upload original thumbnail: {thumb_original_error}",
-                            extra={"session_id": session_id, "error": str(thumb_original_error)},
-                        )
-
-                    # THUMBNAIL 2: Processed visualization thumbnail
-                    try:
-                        from app.services.photo.s3_image_service import generate_thumbnail
-
-                        # Generate thumbnail from visualization (processed image)
-                        thumbnail_processed_bytes = generate_thumbnail(
-                            viz_bytes, size=settings.S3_THUMBNAIL_SIZE
-                        )
-
-                        # S3 key format: {UUID}/thumbnail_processed.jpg
-                        thumbnail_processed_s3_key = f"{session_uuid}/thumbnail_processed.jpg"
-
-                        logger.info(
-                            f"ML aggregation callback: Uploading processed thumbnail to S3: {thumbnail_processed_s3_key}",
-                            extra={
-                                "session_id": session_id,
-                                "s3_key": thumbnail_processed_s3_key,
-                                "thumbnail_size": len(thumbnail_processed_bytes),
-                            },
-                        )
-
-                        # Upload processed thumbnail to original bucket
-                        s3_client.put_object(
-                            Bucket=settings.S3_BUCKET_ORIGINAL,
-                            Key=thumbnail_processed_s3_key,
-                            Body=thumbnail_processed_bytes,
-                            ContentType="image/jpeg",
-                        )
-
-                        logger.info(
-                            f"ML aggregation callback: Processed thumbnail uploaded to S3: {thumbnail_processed_s3_key}",
-                            extra={"session_id": session_id, "s3_key": thumbnail_processed_s3_key},
-                        )
-
                     except Exception as thumb_processed_error:
                         # Log but don't fail (thumbnail is optional)
                         logger.warning(
-                            f"ML aggregation callback: Failed to generate/upload processed thumbnail: {thumb_processed_error}",
+                            f"ML aggregation callback: Failed to upload processed thumbnail: {thumb_processed_error}",
                             extra={"session_id": session_id, "error": str(thumb_processed_error)},
                         )
 
@@ -1035,7 +1120,11 @@ def ml_aggregation_callback(
                     db_session.close()
                     sync_engine.dispose()
 
-                # Cleanup temp visualization file
+                # Cleanup temp visualization file (+ thumbnail, Deep Zoom descriptor and tiles)
+                viz_stem = Path(viz_path).with_suffix("")
+                Path(f"{viz_stem}_thumb.jpg").unlink(missing_ok=True)
+                Path(f"{viz_stem}.dzi").unlink(missing_ok=True)
+                shutil.rmtree(f"{viz_stem}_files", ignore_errors=True)
                 if Path(viz_path).exists():
                     os.remove(viz_path)
                     logger.info(
@@ -1171,6 +1260,179 @@ def ml_aggregation_callback(
         raise
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# Batch Uploads: One Chain per Photo (Child → Session Callback)
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+@app.task(bind=True, queue="cpu_queue", max_retries=2)  # type: ignore[misc]
+def ml_batch_parent_task(
+    self: Task,
+    batch: list[dict[str, Any]],
+    tenant_id: int | None = None,
+) -> dict[str, Any]:
+    """Batch parent task: ONE task dispatching every photo of a batch upload.
+
+    Each photo has its own PhotoProcessingSession (one photo per session, as
+    with single uploads) and runs as a chain ml_child_task →
+    ml_batch_session_callback, all dispatched in one group instead of one
+    parent task + chord per photo. Sessions are aggregated as their photos
+    finish, never in one long callback for the whole batch.
+
+    Args:
+        batch: One dict per photo with keys:
+            - session_id (int): PhotoProcessingSession ID of the photo
+            - job_id (str): Upload job ID (Redis progress reporting)
+            - image_id (str): S3Image UUID
+            - image_path (str): S3 key of the original
+            - storage_location_id (int): Where photo was taken
+        tenant_id: Tenant whose in-flight slots the batch holds (released one
+            per session by ml_batch_session_callback, see
+            PhotoJobService.reserve_tenant_slots). Its other
+            images in flight push the batch down the GPU queue (fair share,
+            see app.tasks.ml_priority.fair_share_priorities)
+
+    Returns:
+        dict with:
+            - num_images (int): Number of child tasks spawned
+            - session_ids (list[int]): Sessions of the batch
+            - status (str): "processing"
+            - celery_task_id (str): Parent task ID
+
+    Raises:
+        ValidationException: If batch is empty
+        CircuitBreakerException: If circuit breaker is open
+    """
+    session_ids = [item["session_id"] for item in batch]
+
+    logger.info(
+        f"ML batch parent task started with {len(batch)} images",
+        extra={"num_images": len(batch), "tenant_id": tenant_id, "task_id": self.request.id},
+    )
+
+    if not batch:
+        raise ValidationException(field="batch", message="batch cannot be empty")
+
+    try:
+        probe = check_circuit_breaker()
+    except CircuitBreakerException as e:
+        _fail_batch(batch, tenant_id, str(e))
+        raise
+
+    try:
+        _mark_sessions_processing(session_ids, celery_task_id=self.request.id)
+
+        priorities = fair_share_priorities(len(batch), _tenant_queued_ahead(tenant_id, len(batch)))
+        queued_at = time.time()
+        # Children return None on permanent failure (job_id set), so every
+        # session callback runs and releases its tenant slot.
+        session_chains = [
+            ml_child_task.s(
+                session_id=item["session_id"],
+                image_id=item["image_id"],
+                image_path=item["image_path"],
+                storage_location_id=item["storage_location_id"],
+                job_id=item["job_id"],
+                priority_class=MLPriorityClass.BATCH,
+                queued_at=queued_at,
+            ).set(priority=priority)
+            | ml_batch_session_callback.s(
+                session_id=item["session_id"], job_id=item["job_id"], tenant_id=tenant_id
+            )
+            for item, priority in zip(batch, priorities, strict=True)
+        ]
+        group(session_chains).apply_async()
+
+        logger.info(
+            f"Batch dispatched: {len(session_chains)} child → session callback chains",
+            extra={"num_children": len(session_chains), "task_id": self.request.id},
+        )
+        record_circuit_breaker_success(probe)
+
+        return {
+            "num_images": len(batch),
+            "session_ids": session_ids,
+            "status": "processing",
+            "celery_task_id": self.request.id,
+        }
+
+    except Exception as exc:
+        logger.error(
+            f"ML batch parent task failed: {exc}",
+            extra={"num_images": len(batch), "error": str(exc)},
+            exc_info=True,
+        )
+        record_circuit_breaker_failure(probe)
+
+        if self.request.retries >= self.max_retries:
+            _fail_batch(batch, tenant_id, str(exc))
+            raise
+
+        raise self.retry(exc=exc, countdown=2**self.request.retries) from exc
+
+
+@app.task(queue="cpu_queue")  # type: ignore[misc]
+def ml_batch_session_callback(
+    result: dict[str, Any] | None,
+    session_id: int,
+    job_id: str | None = None,
+    tenant_id: int | None = None,
+) -> dict[str, Any]:
+    """Batch callback: aggregate ONE session of a batch, right after its child.
+
+    Chained after the session's ml_child_task (the child result is the first
+    argument), so every session is persisted as soon as its photo has been
+    processed, within one task's time limit and independently of the rest of
+    the batch. Aggregation is ml_aggregation_callback (run inline), so
+    persistence, visualization and status updates are identical to single
+    uploads. The job is reported completed only once the session is
+    persisted, and the session's tenant slot is released in any case.
+
+    Args:
+        result: Child result, None if the photo failed permanently
+        session_id: Session of the photo
+        job_id: Upload job ID (Redis progress reporting)
+        tenant_id: Tenant whose in-flight slot is released
+
+    Returns:
+        ml_aggregation_callback summary ({"status": "failed", "error": ...}
+        if aggregation raised)
+    """
+    try:
+        summary = ml_aggregation_callback([result], session_id=session_id)
+    except Exception as exc:
+        logger.error(
+            f"ML batch aggregation failed for session {session_id}: {exc}",
+            extra={"session_id": session_id, "error": str(exc)},
+            exc_info=True,
+        )
+        summary = {"session_id": session_id, "status": "failed", "error": str(exc)}
+    finally:
+        _release_tenant_slots(tenant_id, 1)
+
+    if summary.get("status") != "failed":
+        _report_job_status(
+            job_id,
+            "completed",
+            session_id=session_id,
+            progress_percent=100,
+            total_detected=summary.get("total_detected"),
+            total_estimated=summary.get("total_estimated"),
+        )
+    elif result is not None:  # Otherwise the child already reported its failure
+        _report_job_status(job_id, "failed", session_id=session_id, error=summary.get("error"))
+
+    return summary
+
+
+def _fail_batch(batch: list[dict[str, Any]], tenant_id: int | None, error_message: str) -> None:
+    """Mark every session/job of a batch failed and release its tenant slots."""
+    _mark_sessions_failed([item["session_id"] for item in batch], error_message)
+    for item in batch:
+        _report_job_status(item["job_id"], "failed", error=error_message)
+    _release_tenant_slots(tenant_id, len(batch))
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Helper Functions (Database Updates)
 # ═══════════════════════════════════════════════════════════════════════════
@@ -1210,6 +1472,7 @@ def _mark_session_processing(session_id: int, celery_task_id: str) -> None:
             db_session.status = "processing"
             db_session.celery_task_id = celery_task_id
             session.commit()
+            _bump_photo_sessions_version()
             logger.info(
                 "Session marked as processing",
                 extra={"session_id": db_session.session_id, "celery_task_id": celery_task_id},
@@ -1278,6 +1541,7 @@ def _mark_session_completed(
             db_session.processed_image_id = processed_image_id
             db_session.processing_end_time = datetime.utcnow()
             session.commit()
+            _bump_photo_sessions_version()
             logger.info(
                 "Session marked as completed",
                 extra={
@@ -1333,6 +1597,7 @@ def _mark_session_failed(session_id: int, error_message: str) -> None:
             db_session.error_message = error_message
             db_session.processing_end_time = datetime.utcnow()
             session.commit()
+            _bump_photo_sessions_version()
             logger.warning(
                 "Session marked as failed",
                 extra={"session_id": db_session.session_id, "error_message": error_message},
@@ -1350,6 +1615,167 @@ def _mark_session_failed(session_id: int, error_message: str) -> None:
         sync_engine.dispose()
 
 
+def _mark_sessions_processing(session_ids: list[int], celery_task_id: str) -> None:
+    """Mark many sessions as PROCESSING with one UPDATE (batch parent task).
+
+    Args:
+        session_ids: PhotoProcessingSession database IDs
+        celery_task_id: Batch parent Celery task ID for tracking
+    """
+    _update_sessions(session_ids, {"status": "processing", "celery_task_id": celery_task_id})
+
+
+def _mark_sessions_failed(session_ids: list[int], error_message: str) -> None:
+    """Mark many sessions as FAILED with one UPDATE (batch errors).
+
+    Args:
+        session_ids: PhotoProcessingSession database IDs
+        error_message: Error description
+    """
+    # Already logged by _update_sessions - can't update database if connection is broken
+    with contextlib.suppress(Exception):
+        _update_sessions(
+            session_ids,
+            {
+                "status": "failed",
+                "error_message": error_message,
+                "processing_end_time": datetime.utcnow(),
+            },
+        )
+
+
+def _update_sessions(session_ids: list[int], values: dict[str, Any]) -> None:
+    """UPDATE photo_processing_sessions SET values WHERE id IN session_ids."""
+    from sqlalchemy import create_engine, update
+    from sqlalchemy.orm import sessionmaker
+
+    from app.core.config import settings
+    from app.models.photo_processing_session import PhotoProcessingSession as SessionModel
+
+    sync_engine = create_engine(
+        settings.DATABASE_URL.replace("postgresql+asyncpg", "postgresql"),
+        pool_size=5,
+        max_overflow=10,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+    )
+    SyncSession = sessionmaker(bind=sync_engine, autocommit=False, autoflush=False)
+    session = SyncSession()
+
+    try:
+        session.execute(
+            update(SessionModel).where(SessionModel.id.in_(session_ids)).values(**values)
+        )
+        session.commit()
+        _bump_photo_sessions_version()
+        logger.info(
+            f"{len(session_ids)} sessions updated",
+            extra={"num_sessions": len(session_ids), "status": values.get("status")},
+        )
+    except Exception as e:
+        session.rollback()
+        logger.error(
+            f"Failed to update sessions: {e}",
+            extra={"num_sessions": len(session_ids), "error": str(e)},
+            exc_info=True,
+        )
+        raise
+    finally:
+        session.close()
+        sync_engine.dispose()
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Helper: Upload Job Tracking (Redis)
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+@lru_cache(maxsize=1)
+def _get_redis_client() -> Any:
+    """Synchronous Redis client for job progress and tenant slots (per worker)."""
+    import redis
+
+    from app.core.config import settings
+
+    return redis.Redis.from_url(settings.REDIS_URL)
+
+
+def _bump_photo_sessions_version() -> None:
+    """Bump the photo_sessions resource version after a session write (never raises).
+
+    Same counter as PhotoProcessingSessionService writes: the map bulk-load
+    ETag changes when ML results land.
+    """
+    from app.core.cache import resource_version_key
+    from app.services.photo.photo_processing_session_service import PHOTO_SESSIONS_RESOURCE
+
+    try:
+        _get_redis_client().incr(resource_version_key(PHOTO_SESSIONS_RESOURCE))
+    except Exception as e:
+        logger.warning(
+            f"Failed to bump photo session version: {e}",
+            extra={"error": str(e)},
+        )
+
+
+def _report_job_status(job_id: str | None, status: str, **extra: Any) -> None:
+    """Write an upload job status (same format as PhotoJobService.update_job_status).
+
+    No-op without job_id. Never raises: progress reporting must not fail ML work.
+    """
+    if job_id is None:
+        return
+
+    from app.core.config import settings
+    from app.services.photo.photo_job_service import PhotoJobService
+
+    try:
+        _get_redis_client().setex(
+            PhotoJobService.job_status_key(job_id),
+            settings.REDIS_JOB_STATUS_TTL,
+            PhotoJobService.job_status_payload(job_id, status, **extra),
+        )
+    except Exception as e:
+        logger.warning(
+            f"Failed to report job status for job {job_id}: {e}",
+            extra={"job_id": job_id, "status": status, "error": str(e)},
+        )
+
+
+def _tenant_queued_ahead(tenant_id: int | None, count: int) -> int:
+    """Images the tenant had in flight before a batch of count (0 if unknown).
+
+    The in-flight counter already includes the batch (reserved at upload time).
+    """
+    from app.services.photo.photo_job_service import PhotoJobService
+
+    try:
+        in_flight = int(
+            _get_redis_client().get(PhotoJobService.tenant_inflight_key(tenant_id)) or 0
+        )
+    except Exception as e:
+        logger.warning(
+            f"Failed to read in-flight photos of tenant {tenant_id}: {e}",
+            extra={"tenant_id": tenant_id, "error": str(e)},
+        )
+        return 0
+    return max(0, in_flight - count)
+
+
+def _release_tenant_slots(tenant_id: int | None, count: int) -> None:
+    """Release a tenant's in-flight slots reserved at upload time (never raises)."""
+    from app.services.photo.photo_job_service import RELEASE_SLOTS_SCRIPT, PhotoJobService
+
+    key = PhotoJobService.tenant_inflight_key(tenant_id)
+    try:
+        _get_redis_client().eval(RELEASE_SLOTS_SCRIPT, 1, key, count)
+    except Exception as e:
+        logger.warning(
+            f"Failed to release {count} in-flight slots for tenant {tenant_id}: {e}",
+            extra={"tenant_id": tenant_id, "count": count, "error": str(e)},
+        )
+
+
 def _cleanup_image_binary_data(image_ids: list[str]) -> None:
     """Delete binary image data from PostgreSQL after ML processing completes.
 
@@ -1421,27 +1847,260 @@ def _cleanup_image_binary_data(image_ids: list[str]) -> None:
         sync_engine.dispose()
 
 
-def _generate_visualization(
-    session_id: int,
-    detections: list[dict[str, Any]],
-    estimations: list[dict[str, Any]],
-) -> str | None:
-    """Generate visualization image with detection circles and estimation polygons.
+def _load_plant_area_profile(
+    session_id: int, storage_location_id: int | None
+) -> list[float | None] | None:
+    """Load per-band plant areas from the previous session at a location.
+
+    Used by adaptive SAHI tiling: close-up benches with large plants are
+    sliced on downscaled tiles, far benches stay at full resolution.
+
+    Failures are non-fatal (returns None → default slicing), since this is an
+    optimization hint only.
+
+    Args:
+        session_id: Current PhotoProcessingSession ID (excluded from history)
+        storage_location_id: Storage location where the photo was taken
+
+    Returns:
+        Per-band median plant area (pixels², None for uncalibrated bands),
+        or None if there is no usable history
+    """
+    if not storage_location_id:
+        return None
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from app.core.config import settings
+    from app.models.detection import Detection
+    from app.models.photo_processing_session import (
+        PhotoProcessingSession,
+        ProcessingSessionStatusEnum,
+    )
+    from app.models.s3_image import S3Image
+    from app.services.ml_processing.slice_planner import plant_area_profile
+
+    if not settings.SAHI_ADAPTIVE_TILING_ENABLED:
+        return None
+
+    sync_engine = create_engine(
+        settings.DATABASE_URL.replace("postgresql+asyncpg", "postgresql"),
+        pool_size=1,
+        max_overflow=0,
+        pool_pre_ping=True,
+    )
+    SyncSession = sessionmaker(bind=sync_engine, autocommit=False, autoflush=False)
+    session = SyncSession()
+
+    try:
+        previous = (
+            session.query(PhotoProcessingSession.id, S3Image.height_px)
+            .join(S3Image, S3Image.image_id == PhotoProcessingSession.original_image_id)
+            .filter(
+                PhotoProcessingSession.storage_location_id == storage_location_id,
+                PhotoProcessingSession.status == ProcessingSessionStatusEnum.COMPLETED,
+                PhotoProcessingSession.id != session_id,
+                PhotoProcessingSession.total_detected > 0,
+            )
+            .order_by(PhotoProcessingSession.created_at.desc())
+            .first()
+        )
+
+        if previous is None or not previous.height_px:
+            return None
+
+        rows = (
+            session.query(Detection.center_y_px, Detection.width_px, Detection.height_px)
+            .filter(Detection.session_id == previous.id)
+            .all()
+        )
+
+        profile = plant_area_profile(
+            ((float(y), float(w), float(h)) for y, w, h in rows),
+            image_height=int(previous.height_px),
+        )
+
+        logger.info(
+            "Loaded plant size history for adaptive tiling",
+            extra={
+                "session_id": session_id,
+                "previous_session_id": previous.id,
+                "storage_location_id": storage_location_id,
+                "band_areas": profile,
+            },
+        )
+
+        return profile if any(area is not None for area in profile) else None
+
+    except Exception as e:
+        logger.warning(
+            f"Failed to load plant size history, using default slicing: {e}",
+            extra={"session_id": session_id, "storage_location_id": storage_location_id},
+        )
+        return None
+    finally:
+        session.close()
+        sync_engine.dispose()
+
+
+def _load_recount_prior(session_id: int, storage_location_id: int | None) -> RecountPrior | None:
+    """Load the previous session at a location for an incremental re-count.
+
+    Reads the previous completed session's segment layout (the StorageBins
+    it created), its detections and its thumbnail (registration reference).
+    Failures are non-fatal (returns None → full run).
+
+    Args:
+        session_id: Current PhotoProcessingSession ID (excluded from history)
+        storage_location_id: Storage location where the photo was taken
+
+    Returns:
+        RecountPrior, or None if disabled or there is no usable history
+    """
+    if not storage_location_id:
+        return None
+
+    from datetime import timedelta
+
+    import boto3
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from app.core.config import settings
+    from app.models.detection import Detection
+    from app.models.photo_processing_session import (
+        PhotoProcessingSession,
+        ProcessingSessionStatusEnum,
+    )
+    from app.models.s3_image import S3Image
+    from app.models.storage_bin import StorageBin
+
+    if not settings.ML_INCREMENTAL_RECOUNT_ENABLED:
+        return None
+
+    sync_engine = create_engine(
+        settings.DATABASE_URL.replace("postgresql+asyncpg", "postgresql"),
+        pool_size=1,
+        max_overflow=0,
+        pool_pre_ping=True,
+    )
+    SyncSession = sessionmaker(bind=sync_engine, autocommit=False, autoflush=False)
+    session = SyncSession()
+
+    try:
+        previous = (
+            session.query(
+                PhotoProcessingSession.id,
+                PhotoProcessingSession.session_id,
+                S3Image.width_px,
+                S3Image.height_px,
+            )
+            .join(S3Image, S3Image.image_id == PhotoProcessingSession.original_image_id)
+            .filter(
+                PhotoProcessingSession.storage_location_id == storage_location_id,
+                PhotoProcessingSession.status == ProcessingSessionStatusEnum.COMPLETED,
+                PhotoProcessingSession.id != session_id,
+                PhotoProcessingSession.created_at
+                >= datetime.utcnow() - timedelta(days=settings.ML_RECOUNT_MAX_AGE_DAYS),
+            )
+            .order_by(PhotoProcessingSession.created_at.desc())
+            .first()
+        )
+        if previous is None or not previous.width_px or not previous.height_px:
+            return None
+
+        # One bin per segment, tagged with the session that created it (GIN index)
+        bins_metadata = [
+            metadata
+            for (metadata,) in session.query(StorageBin.position_metadata)
+            .filter(StorageBin.position_metadata.contains({"session_id": previous.id}))
+            .order_by(StorageBin.bin_id)
+        ]
+        if not bins_metadata:
+            return None
+
+        detection_rows = (
+            session.query(
+                Detection.center_x_px,
+                Detection.center_y_px,
+                Detection.width_px,
+                Detection.height_px,
+                Detection.detection_confidence,
+            )
+            .filter(Detection.session_id == previous.id)
+            .all()
+        )
+
+        # Registration reference: thumbnail written by upload_original_derivatives
+        reference = (
+            boto3.client("s3")
+            .get_object(
+                Bucket=settings.S3_BUCKET_ORIGINAL,
+                Key=f"{previous.session_id}/thumbnail_original.jpg",
+            )["Body"]
+            .read()
+        )
+
+        prior = build_recount_prior(
+            session_id=previous.id,
+            image_size=(int(previous.width_px), int(previous.height_px)),
+            reference_bytes=reference,
+            bins_metadata=bins_metadata,
+            detection_rows=detection_rows,
+        )
+
+        logger.info(
+            "Loaded previous session for incremental re-count",
+            extra={
+                "session_id": session_id,
+                "previous_session_id": previous.id,
+                "storage_location_id": storage_location_id,
+                "num_segments": len(bins_metadata),
+                "num_detections": len(detection_rows),
+                "usable": prior is not None,
+            },
+        )
+        return prior
+
+    except Exception as e:
+        logger.warning(
+            f"Failed to load previous session, running a full count: {e}",
+            extra={"session_id": session_id, "storage_location_id": storage_location_id},
+        )
+        return None
+    finally:
+        session.close()
+        sync_engine.dispose()
+
+
+def _generate_visualization(
+    session_id: int,
+    detections: DetectionArray,
+    estimations: list[dict[str, Any]],
+) -> str | None:
+    """Generate visualization image with detection circles and estimation polygons.
 
     This function creates a visualization overlay on the original image showing:
-    1. Detection circles (green, transparent)
-    2. Estimation polygons (blue, transparent with gaussian blur)
+    1. Detection circles (cyan, transparent)
+    2. Estimation polygons (blue, transparent with soft edges)
     3. Text legend (detected count, estimated count, confidence)
-    4. Compressed as AVIF format (50% size reduction)
+    4. Encoded as a ≤VIZ_PREVIEW_MAX_PX AVIF preview plus Deep Zoom tiles
     5. Saved to /tmp/processed/ for S3 upload
 
+    Rendering and encoding are done by VisualizationRenderer (vectorized
+    rasterization, blending only on dirty pixels/regions).
+
     Args:
         session_id: PhotoProcessingSession database ID
-        detections: List of detection dicts with center_x_px, center_y_px, width_px, height_px, confidence
+        detections: DetectionArray with all detections in full-image coordinates
         estimations: List of estimation dicts with vegetation_polygon, estimated_count
 
     Returns:
-        Path to generated visualization file in /tmp/processed/, or None if failed
+        Path to the generated preview in /tmp/processed/, or None if failed.
+        The JPEG thumbnail (session_X_viz_thumb.jpg, resized from the in-memory
+        preview) and Deep Zoom output (if enabled: session_X_viz.dzi and
+        session_X_viz_files/) sit next to it.
 
     Raises:
         No exceptions - logs warnings and returns None on failure
@@ -1453,17 +2112,16 @@ def _generate_visualization(
         4. CALLBACK_DRAW_DETS: Draw transparent circles for detections
         5. CALLBACK_DRAW_ESTS: Draw transparent polygons for estimations
         6. CALLBACK_LEGEND: Add text legend (detected, estimated, confidence)
-        7. CALLBACK_COMPRESS: Compress as AVIF format
+        7. CALLBACK_COMPRESS: Encode AVIF preview + Deep Zoom tiles
         8. CALLBACK_SAVE_TEMP: Save to /tmp/processed/
     """
     import cv2
-    import numpy as np
-    from PIL import Image
     from sqlalchemy import create_engine
     from sqlalchemy.orm import sessionmaker
 
     from app.core.config import settings
     from app.models.photo_processing_session import PhotoProcessingSession as SessionModel
+    from app.services.ml_processing.visualization_renderer import VisualizationRenderer
 
     logger.info(
         f"[Session {session_id}] Starting visualization generation",
@@ -1604,91 +2262,14 @@ def _generate_visualization(
         )
 
         # ═══════════════════════════════════════════════════════════════════════════
-        # STEP 4: Draw detection circles (cyan, simple, professional)
-        # ═══════════════════════════════════════════════════════════════════════════
-        if detections:
-            logger.info(
-                f"[Session {session_id}] Drawing {len(detections)} detection circles",
-                extra={"session_id": session_id, "num_detections": len(detections)},
-            )
-
-            overlay = image.copy()
-            color_cyan = (255, 255, 0)  # BGR format (cyan) - professional and visible
-
-            for det in detections:
-                center_x = int(det["center_x_px"])
-                center_y = int(det["center_y_px"])
-                width = int(det["width_px"])
-                height = int(det["height_px"])
-
-                # Calculate radius: 75% of the detection box size
-                # Use min(width, height) to ensure circle fits within detection
-                radius = int(min(width, height) * 0.75 / 2)
-
-                # Draw filled circle on overlay (centered at detection center)
-                cv2.circle(overlay, (center_x, center_y), radius, color_cyan, -1)
-
-            # Blend overlay with original (alpha=0.3 for semi-transparency)
-            image = cv2.addWeighted(image, 0.7, overlay, 0.3, 0)
-
-            logger.info(
-                f"[Session {session_id}] Detection circles drawn successfully",
-                extra={"session_id": session_id},
-            )
-
-        # ═══════════════════════════════════════════════════════════════════════════
-        # STEP 5: Draw estimation polygons (blue, transparent with blur)
-        # ═══════════════════════════════════════════════════════════════════════════
-        if estimations:
-            logger.info(
-                f"[Session {session_id}] Drawing {len(estimations)} estimation polygons",
-                extra={"session_id": session_id, "num_estimations": len(estimations)},
-            )
-
-            overlay = image.copy()
-            color_blue = (255, 0, 0)  # BGR format (blue)
-
-            for est in estimations:
-                vegetation_polygon = est.get("vegetation_polygon", {})
-                if not vegetation_polygon or "coordinates" not in vegetation_polygon:
-                    continue
-
-                # Extract coordinates from JSONB polygon
-                coords = vegetation_polygon["coordinates"]
-                if not coords:
-                    continue
-
-                # Convert to numpy array for cv2.fillPoly
-                pts = np.array(coords, dtype=np.int32)
-                pts = pts.reshape((-1, 1, 2))
-
-                # Draw filled polygon on overlay
-                cv2.fillPoly(overlay, [pts], color_blue)
-
-            # Apply gaussian blur to overlay for softer appearance
-            overlay_blurred = cv2.GaussianBlur(overlay, (9, 9), 0)
-
-            # Blend blurred overlay with original (alpha=0.2 for estimations)
-            image = cv2.addWeighted(image, 0.8, overlay_blurred, 0.2, 0)
-
-            logger.info(
-                f"[Session {session_id}] Estimation polygons drawn successfully",
-                extra={"session_id": session_id},
-            )
-
-        # ═══════════════════════════════════════════════════════════════════════════
-        # STEP 6: Add text legend (top-left corner)
+        # STEP 4-6: Render detections, estimations and legend (vectorized, in place)
         # ═══════════════════════════════════════════════════════════════════════════
         total_detected = len(detections)
         total_estimated = sum(est.get("estimated_count", 0) for est in estimations)
-        avg_confidence = (
-            sum(det.get("confidence", 0.0) for det in detections) / len(detections)
-            if detections
-            else 0.0
-        )
+        avg_confidence = detections.mean_confidence()
 
         logger.info(
-            f"[Session {session_id}] Adding legend: {total_detected} detected, {total_estimated} estimated, {avg_confidence:.0%} confidence",
+            f"[Session {session_id}] Rendering {total_detected} detections, {len(estimations)} estimation polygons, legend: {total_estimated} estimated, {avg_confidence:.0%} confidence",
             extra={
                 "session_id": session_id,
                 "total_detected": total_detected,
@@ -1697,80 +2278,51 @@ def _generate_visualization(
             },
         )
 
-        # Text parameters
-        font = cv2.FONT_HERSHEY_SIMPLEX
-        font_scale = 0.8
-        font_thickness = 2
-        color_white = (255, 255, 255)
-        color_black = (0, 0, 0)
-
-        # Draw background rectangle for text (black with transparency)
-        cv2.rectangle(image, (5, 5), (400, 100), color_black, -1)
-
-        # Draw text lines
-        cv2.putText(
-            image,
-            f"Detected: {total_detected}",
-            (10, 30),
-            font,
-            font_scale,
-            color_white,
-            font_thickness,
-        )
-        cv2.putText(
-            image,
-            f"Estimated: {total_estimated}",
-            (10, 60),
-            font,
-            font_scale,
-            color_white,
-            font_thickness,
-        )
-        cv2.putText(
+        renderer = VisualizationRenderer()
+        renderer.render(
             image,
-            f"Confidence: {avg_confidence:.0%}",
-            (10, 90),
-            font,
-            font_scale,
-            color_white,
-            font_thickness,
+            detections,
+            estimations,
+            legend=[
+                f"Detected: {total_detected}",
+                f"Estimated: {total_estimated}",
+                f"Confidence: {avg_confidence:.0%}",
+            ],
         )
 
         # ═══════════════════════════════════════════════════════════════════════════
-        # STEP 7: Save to temp path and compress as AVIF
+        # STEP 7: Encode preview (AVIF/WebP) + Deep Zoom tiles and save to temp path
         # ═══════════════════════════════════════════════════════════════════════════
+        rendered = renderer.encode(image)
+
         output_dir = Path("/tmp/processed")
         output_dir.mkdir(parents=True, exist_ok=True)
-        output_path = output_dir / f"session_{session_id}_viz.avif"
+        output_path = output_dir / f"session_{session_id}_viz.{rendered.preview_format}"
+        output_path.write_bytes(rendered.preview)
 
-        logger.info(
-            f"[Session {session_id}] Compressing visualization as AVIF",
-            extra={"session_id": session_id, "output_path": str(output_path)},
-        )
+        if rendered.thumbnail is not None:
+            output_dir.joinpath(f"session_{session_id}_viz_thumb.jpg").write_bytes(
+                rendered.thumbnail
+            )
 
-        # Convert BGR to RGB for PIL
-        image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-        image_pil = Image.fromarray(image_rgb)
+        if rendered.dzi is not None:
+            # Deep Zoom layout: session_X_viz.dzi + session_X_viz_files/{level}/{col}_{row}.jpg
+            output_dir.joinpath(f"session_{session_id}_viz.dzi").write_text(rendered.dzi)
+            tiles_dir = output_dir / f"session_{session_id}_viz_files"
+            for tile_path, tile_bytes in rendered.tiles.items():
+                target = tiles_dir / tile_path
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_bytes(tile_bytes)
 
-        # Save as AVIF with compression (fallback to WebP if AVIF not supported)
-        try:
-            image_pil.save(str(output_path), "AVIF", quality=85, speed=4)
-            logger.info(
-                f"[Session {session_id}] Visualization saved as AVIF",
-                extra={"session_id": session_id, "output_path": str(output_path)},
-            )
-        except Exception as e:
-            # Fallback to WebP if AVIF not supported
-            logger.warning(
-                f"[Session {session_id}] AVIF not supported, falling back to WebP: {e}",
-                extra={"session_id": session_id, "error": str(e)},
-            )
-            output_path = output_dir / f"session_{session_id}_viz.webp"
-            image_pil.save(str(output_path), "WEBP", quality=85)
-            logger.info(
-                f"[Session {session_id}] Visualization saved as WebP",
-                extra={"session_id": session_id, "output_path": str(output_path)},
-            )
+        logger.info(
+            f"[Session {session_id}] Visualization saved as {rendered.preview_format} preview "
+            f"({len(rendered.preview)} bytes) + {len(rendered.tiles)} Deep Zoom tiles",
+            extra={
+                "session_id": session_id,
+                "output_path": str(output_path),
+                "num_tiles": len(rendered.tiles),
+            },
+        )
 
         # Cleanup temp original file
         if Path(temp_original_path).exists():
@@ -1792,6 +2344,71 @@ def _generate_visualization(
         return None
 
 
+def _upload_deep_zoom_output(
+    s3_client: Any,
+    bucket: str,
+    s3_prefix: str,
+    viz_path: str,
+    session_id: int,
+) -> int:
+    """Upload the Deep Zoom descriptor and tiles written by _generate_visualization.
+
+    Layout follows the DZI convention so viewers (e.g., OpenSeadragon) can
+    load "{s3_prefix}.dzi" directly:
+        {s3_prefix}.dzi
+        {s3_prefix}_files/{level}/{col}_{row}.jpg
+
+    Tiles are small, so uploads run in a thread pool (boto3 clients are
+    thread-safe) instead of one round trip at a time.
+
+    Args:
+        s3_client: boto3 S3 client
+        bucket: Target bucket
+        s3_prefix: Key prefix without extension (e.g., "{uuid}/processed")
+        viz_path: Preview path returned by _generate_visualization
+        session_id: PhotoProcessingSession ID (logging)
+
+    Returns:
+        Number of tiles uploaded (0 if no Deep Zoom output exists)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    viz_stem = Path(viz_path).with_suffix("")
+    dzi_path = Path(f"{viz_stem}.dzi")
+    tiles_dir = Path(f"{viz_stem}_files")
+    if not dzi_path.exists() or not tiles_dir.is_dir():
+        return 0
+
+    content_types = {".jpg": "image/jpeg", ".webp": "image/webp"}
+    tile_paths = [p for p in tiles_dir.rglob("*") if p.is_file()]
+
+    def upload(tile_path: Path) -> None:
+        s3_client.put_object(
+            Bucket=bucket,
+            Key=f"{s3_prefix}_files/{tile_path.relative_to(tiles_dir).as_posix()}",
+            Body=tile_path.read_bytes(),
+            ContentType=content_types.get(tile_path.suffix, "application/octet-stream"),
+        )
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        list(pool.map(upload, tile_paths))
+
+    # Descriptor last: viewers only see the pyramid once all tiles exist
+    s3_client.put_object(
+        Bucket=bucket,
+        Key=f"{s3_prefix}.dzi",
+        Body=dzi_path.read_bytes(),
+        ContentType="application/xml",
+    )
+
+    logger.info(
+        f"[Session {session_id}] Uploaded Deep Zoom output: {len(tile_paths)} tiles to {s3_prefix}_files/",
+        extra={"session_id": session_id, "num_tiles": len(tile_paths), "s3_prefix": s3_prefix},
+    )
+
+    return len(tile_paths)
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Helper: Create StorageBins from ML Segments
 # ═══════════════════════════════════════════════════════════════════════════
@@ -1801,6 +2418,7 @@ def _create_storage_bins(
     db_session: Any,
     session_id: int,
     storage_location_id: int,
+    location_code: str,
     segments: list[dict[str, Any]],
 ) -> list[int]:
     """Create StorageBins from ML segmentation results.
@@ -1809,37 +2427,44 @@ def _create_storage_bins(
     output BEFORE creating stock batches. Each segment becomes a StorageBin with
     position_metadata containing the ML output.
 
+    The work is set-based: the StorageBinTypes of all segments are loaded in one
+    query, missing types are created in one flush, and all bins are written with
+    a single INSERT ... RETURNING. The number of round trips does not grow with
+    the number of segments.
+
     Args:
         db_session: Synchronous SQLAlchemy session
         session_id: PhotoProcessingSession ID
         storage_location_id: Parent storage location ID
+        location_code: Parent storage location code (prefix of the bin codes)
         segments: List of segment dicts with container_type, bbox, polygon, confidence
 
     Returns:
-        list[int]: List of created StorageBin IDs
+        list[int]: List of created StorageBin IDs (in segment order)
 
     Raises:
         Exception: If StorageBinType lookup or StorageBin creation fails
 
     Business Logic:
-        1. For each unique container_type, get or create StorageBinType
-        2. For each segment, create a StorageBin with:
-           - Unique code: ML-{session_id}-{container_type}-{index}-{timestamp}
+        1. Load the StorageBinTypes of all container_types, create missing ones
+        2. For each segment, build a StorageBin row with:
+           - Unique code: {location_code}-ML-{container_type}{index}-{timestamp}
            - position_metadata: Full ML output (bbox, polygon, confidence)
            - storage_bin_type_id: Mapped from container_type
-        3. Return list of created bin IDs for StockBatch creation
+        3. Insert all rows at once, return bin IDs for StockBatch creation
 
     Example:
         >>> segments = [
         ...     {"container_type": "segment", "bbox": [0.1, 0.2, 0.3, 0.4], "confidence": 0.92, ...},
         ...     {"container_type": "box", "bbox": [0.5, 0.6, 0.7, 0.8], "confidence": 0.88, ...},
         ... ]
-        >>> bin_ids = _create_storage_bins(db_session, 123, 1, segments)
+        >>> bin_ids = _create_storage_bins(db_session, 123, 1, "INV01-NORTH-A1", segments)
         >>> # Returns: [1, 2] (two new StorageBin IDs)
     """
+    from sqlalchemy import insert, select
+
     from app.models.storage_bin import StorageBin
-    from app.models.storage_bin_type import StorageBinType
-    from app.models.storage_location import StorageLocation
+    from app.models.storage_bin_type import BinCategoryEnum, StorageBinType
 
     if not segments:
         logger.warning(
@@ -1857,49 +2482,39 @@ def _create_storage_bins(
         },
     )
 
-    # Validate storage_location exists
-    storage_location = (
-        db_session.query(StorageLocation).filter_by(location_id=storage_location_id).first()
-    )
-    if not storage_location:
-        raise ValueError(f"StorageLocation {storage_location_id} not found")
-
-    # Get parent codes for StorageBin.code construction
-    # Format: WAREHOUSE-AREA-LOCATION-BIN (4 parts)
-    location_code = storage_location.code  # e.g., "INV01-NORTH-A1"
-
-    created_bin_ids: list[int] = []
-    timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
-
-    for idx, segment in enumerate(segments, start=1):
-        container_type = segment.get("container_type", "segment")
-        confidence = segment.get("confidence", 0.0)
-        bbox = segment.get("bbox", [])
-        polygon = segment.get("polygon", [])
-        area_pixels = segment.get("area_pixels", 0)  # Fixed: was mask_area
-
-        # Map container_type to BinCategoryEnum
-        bin_category = _map_container_type_to_bin_category(container_type)
-
-        # Get or create StorageBinType
-        bin_type = db_session.query(StorageBinType).filter_by(category=bin_category).first()
-
-        if not bin_type:
-            # Create default StorageBinType if not exists
-            bin_type_code = f"ML_{bin_category.upper()}_DEFAULT"
-            bin_type = StorageBinType(
-                code=bin_type_code,
+    # Map every container_type to BinCategoryEnum, then resolve all types in one query
+    container_types = [segment.get("container_type", "segment") for segment in segments]
+    categories = {_map_container_type_to_bin_category(ct) for ct in container_types}
+
+    bin_type_ids: dict[str, int] = {}
+    existing_types = db_session.execute(
+        select(StorageBinType.bin_type_id, StorageBinType.category)
+        .where(StorageBinType.category.in_(sorted(categories)))
+        .order_by(StorageBinType.bin_type_id)
+    ).all()
+    for bin_type_id, category in existing_types:
+        bin_type_ids.setdefault(BinCategoryEnum(category).value, bin_type_id)
+
+    missing_categories = sorted(categories - bin_type_ids.keys())
+    if missing_categories:
+        # Create default StorageBinTypes for the missing categories (one flush)
+        new_types = [
+            StorageBinType(
+                code=f"ML_{bin_category.upper()}_DEFAULT",
                 name=f"ML-Detected {bin_category.capitalize()}",
                 category=bin_category,
                 is_grid=False,
                 description=f"Auto-generated bin type for ML-detected {bin_category} containers",
             )
-            db_session.add(bin_type)
-            db_session.flush()
-            db_session.refresh(bin_type)
+            for bin_category in missing_categories
+        ]
+        db_session.add_all(new_types)
+        db_session.flush()
 
+        for bin_category, bin_type in zip(missing_categories, new_types, strict=True):
+            bin_type_ids[bin_category] = bin_type.bin_type_id
             logger.info(
-                f"[Session {session_id}] Created new StorageBinType: {bin_type_code} (category={bin_category})",
+                f"[Session {session_id}] Created new StorageBinType: {bin_type.code} (category={bin_category})",
                 extra={
                     "session_id": session_id,
                     "bin_type_id": bin_type.bin_type_id,
@@ -1907,9 +2522,20 @@ def _create_storage_bins(
                 },
             )
 
+    timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+    bin_rows: list[dict[str, Any]] = []
+
+    for idx, (segment, container_type) in enumerate(
+        zip(segments, container_types, strict=True), start=1
+    ):
+        confidence = segment.get("confidence", 0.0)
+        bbox = segment.get("bbox", [])
+        polygon = segment.get("polygon", [])
+        area_pixels = segment.get("area_pixels", 0)  # Fixed: was mask_area
+
         # Create unique StorageBin code
         # Format: WAREHOUSE-AREA-LOCATION-BIN (e.g., "INV01-NORTH-A1-ML-SEG001-20251024143000")
-        bin_code = f"{location_code}-ML-{container_type.upper()}{idx:03d}-{timestamp}"
+        bin_code = _ml_bin_code(location_code, storage_location_id, container_type, idx, timestamp)
 
         # Create position_metadata JSONB
         position_metadata = {
@@ -1922,37 +2548,46 @@ def _create_storage_bins(
             },
             "confidence": confidence,
             "ml_model_version": "yolov11n-seg-v1.0.0",
-            "detected_at": datetime.utcnow().isoformat(),
+            # Reused segments keep the time their plants were actually detected
+            "detected_at": segment.get("detected_at") or datetime.utcnow().isoformat(),
             "container_type": container_type,
             "area_pixels": area_pixels,  # Fixed: was mask_area
             "session_id": session_id,
         }
 
-        # Create StorageBin
-        storage_bin = StorageBin(
-            storage_location_id=storage_location_id,
-            storage_bin_type_id=bin_type.bin_type_id,
-            code=bin_code,
-            label=f"ML {container_type.capitalize()} #{idx}",
-            description=f"ML-detected {container_type} from session {session_id} (confidence: {confidence:.3f})",
-            position_metadata=position_metadata,
-            status="active",
-        )
-        db_session.add(storage_bin)
-        db_session.flush()
-        db_session.refresh(storage_bin)
+        bin_rows.append(
+            {
+                "storage_location_id": storage_location_id,
+                "storage_bin_type_id": bin_type_ids[
+                    _map_container_type_to_bin_category(container_type)
+                ],
+                "code": bin_code,
+                "label": f"ML {container_type.capitalize()} #{idx}",
+                "description": f"ML-detected {container_type} from session {session_id} (confidence: {confidence:.3f})",
+                "position_metadata": position_metadata,
+                "status": "active",
+            }
+        )
 
-        created_bin_ids.append(storage_bin.bin_id)
+    # Single INSERT ... RETURNING, IDs come back in the order of bin_rows
+    created_bin_ids: list[int] = list(
+        db_session.scalars(
+            insert(StorageBin).returning(StorageBin.bin_id, sort_by_parameter_order=True),
+            bin_rows,
+        )
+    )
 
+    for bin_id, row in zip(created_bin_ids, bin_rows, strict=True):
         logger.debug(
-            f"[Session {session_id}] Created StorageBin: bin_id={storage_bin.bin_id}, code={bin_code}, "
-            f"type={container_type}, confidence={confidence:.3f}",
+            f"[Session {session_id}] Created StorageBin: bin_id={bin_id}, code={row['code']}, "
+            f"type={row['position_metadata']['container_type']}, "
+            f"confidence={row['position_metadata']['confidence']:.3f}",
             extra={
                 "session_id": session_id,
-                "bin_id": storage_bin.bin_id,
-                "bin_code": bin_code,
-                "container_type": container_type,
-                "confidence": confidence,
+                "bin_id": bin_id,
+                "bin_code": row["code"],
+                "container_type": row["position_metadata"]["container_type"],
+                "confidence": row["position_metadata"]["confidence"],
             },
         )
 
@@ -1970,7 +2605,7 @@ def _create_storage_bins(
 
 def _persist_ml_results(
     session_id: int,
-    detections: list[dict[str, Any]],
+    detections: DetectionArray,
     estimations: list[dict[str, Any]],
     segments: list[dict[str, Any]] | None = None,
     storage_location_id: int | None = None,
@@ -1980,9 +2615,13 @@ def _persist_ml_results(
     This function creates StorageBins from ML segments, then creates a StockBatch
     and StockMovement, and bulk inserts all detections and estimations.
 
+    Reference rows are resolved with one query each and new rows are written in
+    bulk, so the number of round trips per session is constant (it does not
+    grow with the number of segments).
+
     Args:
         session_id: PhotoProcessingSession database ID
-        detections: List of detection dicts from ML pipeline
+        detections: DetectionArray from ML pipeline
         estimations: List of estimation dicts from ML pipeline
         segments: List of segment dicts with container_type, bbox, polygon (optional)
         storage_location_id: Storage location ID for StorageBin creation (optional)
@@ -1992,8 +2631,9 @@ def _persist_ml_results(
         Exception: If database operations fail
 
     Business Flow:
-        0. Validate storage_location_id (from param or PhotoProcessingSession)
-        0b. Create StorageBins from ML segments (if provided)
+        0. Resolve location and StorageLocationConfig in one query
+           (storage_location_id from param or PhotoProcessingSession)
+        0b. Create StorageBins from ML segments (single INSERT ... RETURNING)
         1. Create StockBatch (using first created bin_id or default=1)
         2. Create StockMovement (movement_type=foto, source_type=ia)
         3. Get or create Classification (default: product_id=1)
@@ -2002,7 +2642,7 @@ def _persist_ml_results(
         6. Bulk insert detections with FKs (session_id, stock_movement_id, classification_id)
         7. Bulk insert estimations with FKs (session_id, stock_movement_id, classification_id)
     """
-    from sqlalchemy import create_engine
+    from sqlalchemy import and_, create_engine, select
     from sqlalchemy.orm import sessionmaker
 
     from app.core.config import settings
@@ -2035,32 +2675,64 @@ def _persist_ml_results(
         from app.models.photo_processing_session import PhotoProcessingSession
         from app.models.stock_batch import StockBatch
         from app.models.stock_movement import StockMovement
+        from app.models.storage_location import StorageLocation
         from app.models.storage_location_config import StorageLocationConfig
 
         # ═══════════════════════════════════════════════════════════════════════════
-        # STEP 0: Validate storage_location_id and create StorageBins from segments
+        # STEP 0: Resolve location context and create StorageBins from segments
         # ═══════════════════════════════════════════════════════════════════════════
         logger.info(
-            f"[Session {session_id}] Step 0: Validating storage_location_id and creating StorageBins",
+            f"[Session {session_id}] Step 0: Resolving location context and creating StorageBins",
             extra={"session_id": session_id, "storage_location_id": storage_location_id},
         )
 
-        # If storage_location_id not provided, try to get from PhotoProcessingSession
-        if storage_location_id is None:
-            session_record = (
-                db_session.query(PhotoProcessingSession).filter_by(id=session_id).first()
+        # One query for the location and its active StorageLocationConfig. If
+        # storage_location_id was not provided, it comes from the PhotoProcessingSession.
+        location_id_clause = (
+            storage_location_id
+            if storage_location_id is not None
+            else select(PhotoProcessingSession.storage_location_id)
+            .where(PhotoProcessingSession.id == session_id)
+            .scalar_subquery()
+        )
+        context = db_session.execute(
+            select(
+                StorageLocation.location_id,
+                StorageLocation.code,
+                StorageLocationConfig.id.label("config_id"),
+                StorageLocationConfig.product_id,
+                StorageLocationConfig.expected_product_state_id,
+                StorageLocationConfig.packaging_catalog_id,
             )
-            if session_record and session_record.storage_location_id:
-                storage_location_id = session_record.storage_location_id
-                logger.info(
-                    f"[Session {session_id}] Retrieved storage_location_id from session: {storage_location_id}",
-                    extra={"session_id": session_id, "storage_location_id": storage_location_id},
-                )
-            else:
+            .outerjoin(
+                StorageLocationConfig,
+                and_(
+                    StorageLocationConfig.storage_location_id == StorageLocation.location_id,
+                    StorageLocationConfig.active.is_(True),
+                ),
+            )
+            .where(StorageLocation.location_id == location_id_clause)
+            .order_by(StorageLocationConfig.id)
+            .limit(1)
+        ).first()
+
+        if context is None:
+            if storage_location_id is None:
                 raise ValueError(
                     f"storage_location_id is NULL for session {session_id}. "
                     "Cannot create StorageBins without location context."
                 )
+            raise ValueError(
+                f"Cannot create StorageBins for session {session_id}: "
+                f"StorageLocation {storage_location_id} not found"
+            )
+
+        if storage_location_id is None:
+            logger.info(
+                f"[Session {session_id}] Retrieved storage_location_id from session: {context.location_id}",
+                extra={"session_id": session_id, "storage_location_id": context.location_id},
+            )
+        storage_location_id = context.location_id
 
         # Create StorageBins from ML segments
         created_bin_ids: list[int] = []
@@ -2070,6 +2742,7 @@ def _persist_ml_results(
                     db_session=db_session,
                     session_id=session_id,
                     storage_location_id=storage_location_id,
+                    location_code=context.code,
                     segments=segments,
                 )
                 logger.info(
@@ -2086,7 +2759,9 @@ def _persist_ml_results(
                     extra={"session_id": session_id, "error": str(e)},
                     exc_info=True,
                 )
-                raise ValueError(f"Cannot create StorageBins for session {session_id}: {str(e)}") from e
+                raise ValueError(
+                    f"Cannot create StorageBins for session {session_id}: {str(e)}"
+                ) from e
         else:
             logger.warning(
                 f"[Session {session_id}] No segments provided, cannot create StorageBins. "
@@ -2095,25 +2770,13 @@ def _persist_ml_results(
             )
 
         # ═══════════════════════════════════════════════════════════════════════════
-        # STEP 0b: Look up StorageLocationConfig for product and packaging info
+        # STEP 0b: Product and packaging info from the StorageLocationConfig
         # ═══════════════════════════════════════════════════════════════════════════
-        logger.info(
-            f"[Session {session_id}] Step 0b: Looking up StorageLocationConfig",
-            extra={"session_id": session_id, "storage_location_id": storage_location_id},
-        )
-
-        # Try to get configuration for this storage location
-        config = (
-            db_session.query(StorageLocationConfig)
-            .filter_by(storage_location_id=storage_location_id, active=True)
-            .first()
-        )
-
         # Determine product_id, product_state_id, and packaging_catalog_id
-        if config:
-            product_id = config.product_id
-            product_state_id = config.expected_product_state_id
-            packaging_catalog_id = config.packaging_catalog_id  # May be None
+        if context.config_id is not None:
+            product_id = context.product_id
+            product_state_id = context.expected_product_state_id
+            packaging_catalog_id = context.packaging_catalog_id  # May be None
             logger.info(
                 f"[Session {session_id}] Using StorageLocationConfig: product_id={product_id}, "
                 f"product_state_id={product_state_id}, packaging_catalog_id={packaging_catalog_id}",
@@ -2161,38 +2824,19 @@ def _persist_ml_results(
             )
         current_storage_bin_id = created_bin_ids[0]
 
+        total_quantity = len(detections) + sum(est.get("estimated_count", 0) for est in estimations)
+
         stock_batch = StockBatch(
             batch_code=batch_code,
             current_storage_bin_id=current_storage_bin_id,
             product_id=product_id,  # From config or fallback
             product_state_id=product_state_id,  # From config or fallback (SEEDLING=3)
-            quantity_initial=len(detections)
-            + sum(est.get("estimated_count", 0) for est in estimations),
-            quantity_current=len(detections)
-            + sum(est.get("estimated_count", 0) for est in estimations),
+            quantity_initial=total_quantity,
+            quantity_current=total_quantity,
             quantity_empty_containers=0,
             has_packaging=bool(packaging_catalog_id),  # True if packaging_catalog_id is not None
             packaging_catalog_id=packaging_catalog_id,  # None if no packaging data
         )
-        db_session.add(stock_batch)
-        db_session.flush()  # Get batch_id
-        db_session.refresh(stock_batch)
-
-        logger.info(
-            f"[Session {session_id}] Created StockBatch: batch_id={stock_batch.id}, batch_code={batch_code}, "
-            f"current_storage_bin_id={current_storage_bin_id}, product_id={product_id}, "
-            f"product_state_id={product_state_id}, has_packaging={stock_batch.has_packaging}",
-            extra={
-                "session_id": session_id,
-                "batch_id": stock_batch.id,
-                "batch_code": batch_code,
-                "current_storage_bin_id": current_storage_bin_id,
-                "product_id": product_id,
-                "product_state_id": product_state_id,
-                "packaging_catalog_id": packaging_catalog_id,
-                "has_packaging": stock_batch.has_packaging,
-            },
-        )
 
         # ═══════════════════════════════════════════════════════════════════════════
         # STEP 2: Create StockMovement for this ML processing
@@ -2202,10 +2846,10 @@ def _persist_ml_results(
             extra={"session_id": session_id},
         )
 
-        total_quantity = len(detections) + sum(est.get("estimated_count", 0) for est in estimations)
-
+        # Linked through the relationship: one flush inserts the batch, then the
+        # movement with the returned batch_id (no refresh round trips)
         stock_movement = StockMovement(
-            batch_id=stock_batch.id,
+            batch=stock_batch,
             movement_type="foto",
             source_type="ia",
             is_inbound=True,
@@ -2214,10 +2858,24 @@ def _persist_ml_results(
             user_id=1,  # Default ML user (TODO: Get from configuration)
             reason_description=f"ML photo processing session {session_id}",
         )
-        db_session.add(stock_movement)
-        db_session.flush()  # Get stock_movement_id
-        db_session.refresh(stock_movement)
+        db_session.add_all([stock_batch, stock_movement])
+        db_session.flush()  # Get batch_id and stock_movement_id
 
+        logger.info(
+            f"[Session {session_id}] Created StockBatch: batch_id={stock_batch.id}, batch_code={batch_code}, "
+            f"current_storage_bin_id={current_storage_bin_id}, product_id={product_id}, "
+            f"product_state_id={product_state_id}, has_packaging={stock_batch.has_packaging}",
+            extra={
+                "session_id": session_id,
+                "batch_id": stock_batch.id,
+                "batch_code": batch_code,
+                "current_storage_bin_id": current_storage_bin_id,
+                "product_id": product_id,
+                "product_state_id": product_state_id,
+                "packaging_catalog_id": packaging_catalog_id,
+                "has_packaging": stock_batch.has_packaging,
+            },
+        )
         logger.info(
             f"[Session {session_id}] Created StockMovement: id={stock_movement.id}, quantity={total_quantity}",
             extra={
@@ -2276,8 +2934,7 @@ def _persist_ml_results(
                 description=f"Auto-generated classification for ML pipeline (product_id={product_id}, packaging_catalog_id={packaging_catalog_id})",
             )
             db_session.add(classification)
-            db_session.flush()
-            db_session.refresh(classification)
+            db_session.flush()  # Get classification_id
 
             logger.info(
                 f"[Session {session_id}] Created new Classification: classification_id={classification.classification_id}, "
@@ -2310,36 +2967,15 @@ def _persist_ml_results(
                 extra={"session_id": session_id, "num_detections": len(detections)},
             )
 
-            detection_records = []
-            for det in detections:
-                # Calculate bbox_coordinates from center + width/height
-                center_x = float(det["center_x_px"])
-                center_y = float(det["center_y_px"])
-                width = int(det["width_px"])
-                height = int(det["height_px"])
-
-                x1 = center_x - (width / 2)
-                y1 = center_y - (height / 2)
-                x2 = center_x + (width / 2)
-                y2 = center_y + (height / 2)
-
-                detection_record = Detection(
-                    session_id=session_id,
-                    stock_movement_id=stock_movement.id,
-                    classification_id=classification.classification_id,
-                    center_x_px=center_x,
-                    center_y_px=center_y,
-                    width_px=width,
-                    height_px=height,
-                    bbox_coordinates={"x1": x1, "y1": y1, "x2": x2, "y2": y2},
-                    detection_confidence=float(det.get("confidence", 0.0)),
-                    is_empty_container=False,
-                    is_alive=True,
-                )
-                detection_records.append(detection_record)
+            # Rows are built column-wise from the arrays (no ORM object per detection)
+            detection_records = detections.to_db_rows(
+                session_id=session_id,
+                stock_movement_id=stock_movement.id,
+                classification_id=classification.classification_id,
+            )
 
             # Bulk insert detections
-            db_session.bulk_save_objects(detection_records)
+            db_session.bulk_insert_mappings(Detection, detection_records)
             logger.info(
                 f"[Session {session_id}] Successfully bulk inserted {len(detection_records)} detections",
                 extra={"session_id": session_id, "num_detections": len(detection_records)},
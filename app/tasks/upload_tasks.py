@@ -0,0 +1,178 @@
+"""Upload Celery Tasks - Derivative generation off the upload request path.
+
+This module implements the I/O-bound follow-up work of a photo upload:
+- Original photo renditions (thumbnail_original.jpg) generated from a single
+  reduced-scale decode (see app.services.photo.image_derivatives)
+- Upload of the renditions to S3 + S3Image THUMBNAIL records
+
+Architecture:
+    Layer: Task Layer (Async Queue Processing)
+    Routing: io_queue (gevent pool) - "app.tasks.upload_*" route
+    Retry: Exponential backoff (2s, 4s, 8s), max 3 retries
+
+Task Flow:
+    PhotoUploadService.upload_photo
+       ├─> Uploads original to S3 (+ binary cache in PostgreSQL)
+       └─> upload_original_derivatives.delay(...)   [I/O queue]
+              ├─> Loads original bytes (PostgreSQL cache → S3)
+              ├─> Decodes once (JPEG draft mode) → all renditions
+              └─> Uploads renditions to S3, creates S3Image records
+
+Example:
+    >>> upload_original_derivatives.delay(
+    ...     session_uuid="8f1c...", image_id="1d2e...", s3_key="8f1c.../original.jpg",
+    ...     s3_bucket="demeter-photos-original",
+    ... )
+"""
+
+from typing import Any
+
+from celery import Task  # type: ignore[import-not-found]
+
+from app.celery_app import app
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Original Photo Derivatives (thumbnail)
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+@app.task(bind=True, queue="io_queue", max_retries=3)  # type: ignore[misc]
+def upload_original_derivatives(
+    self: Task,
+    session_uuid: str,
+    image_id: str,
+    s3_key: str,
+    s3_bucket: str,
+) -> dict[str, Any]:
+    """Generate and upload the renditions of an uploaded original photo.
+
+    Replaces the synchronous thumbnail step of the upload request: the API
+    returns as soon as the original is stored, and this task produces every
+    rendition from ONE reduced decode of the original bytes.
+
+    Args:
+        session_uuid: PhotoProcessingSession UUID (S3 key prefix)
+        image_id: S3Image UUID of the original (PostgreSQL binary cache lookup)
+        s3_key: S3 key of the original (fallback download)
+        s3_bucket: S3 bucket of the original
+
+    Returns:
+        dict with:
+            - session_uuid (str): Session UUID
+            - renditions (dict[str, str]): Rendition name → S3 key
+            - image_ids (list[str]): Created S3Image UUIDs
+
+    Raises:
+        Retry: On S3/DB errors (exponential backoff, max 3 retries)
+    """
+    from uuid import uuid4
+
+    import boto3
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from app.core.config import settings
+    from app.models.s3_image import (
+        ContentTypeEnum,
+        ImageTypeEnum,
+        ProcessingStatusEnum,
+        S3Image,
+        UploadSourceEnum,
+    )
+    from app.services.photo.image_derivatives import generate_derivatives
+
+    # Rendition name → (longest side px, S3 filename)
+    renditions_spec = {
+        "thumbnail_original": (settings.S3_THUMBNAIL_SIZE, "thumbnail_original.jpg"),
+    }
+
+    logger.info(
+        f"Generating original derivatives for session {session_uuid}",
+        extra={"session_uuid": session_uuid, "image_id": image_id, "task_id": self.request.id},
+    )
+
+    sync_engine = create_engine(
+        settings.DATABASE_URL.replace("postgresql+asyncpg", "postgresql"),
+        pool_size=5,
+        max_overflow=10,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+    )
+    SyncSession = sessionmaker(bind=sync_engine, autocommit=False, autoflush=False)
+    db_session = SyncSession()
+
+    try:
+        s3_client = boto3.client("s3")
+
+        # PRIORITY 1: PostgreSQL binary cache (written by upload_original)
+        original = db_session.query(S3Image).filter(S3Image.image_id == image_id).first()
+        if original is not None and original.image_data:
+            original_bytes = bytes(original.image_data)
+        else:
+            # PRIORITY 2: S3 (cache already cleaned up or row not visible yet)
+            response = s3_client.get_object(Bucket=s3_bucket, Key=s3_key)
+            original_bytes = response["Body"].read()
+
+        encoded = generate_derivatives(
+            original_bytes, {name: size for name, (size, _) in renditions_spec.items()}
+        )
+
+        uploaded: dict[str, str] = {}
+        image_ids: list[str] = []
+        for name, (_, filename) in renditions_spec.items():
+            rendition = encoded[name]
+            rendition_key = f"{session_uuid}/{filename}"
+            s3_client.put_object(
+                Bucket=settings.S3_BUCKET_ORIGINAL,
+                Key=rendition_key,
+                Body=rendition.data,
+                ContentType="image/jpeg",
+            )
+
+            rendition_id = uuid4()
+            db_session.add(
+                S3Image(
+                    image_id=rendition_id,
+                    s3_bucket=settings.S3_BUCKET_ORIGINAL,
+                    s3_key_original=rendition_key,  # Keep for backward compatibility
+                    s3_key_thumbnail=rendition_key,
+                    image_type=ImageTypeEnum.THUMBNAIL,
+                    content_type=ContentTypeEnum.JPEG,
+                    file_size_bytes=len(rendition.data),
+                    width_px=rendition.width,
+                    height_px=rendition.height,
+                    upload_source=UploadSourceEnum.API,
+                    status=ProcessingStatusEnum.READY,
+                )
+            )
+            uploaded[name] = rendition_key
+            image_ids.append(str(rendition_id))
+
+        db_session.commit()
+
+        logger.info(
+            f"Original derivatives uploaded for session {session_uuid}: {list(uploaded.values())}",
+            extra={"session_uuid": session_uuid, "renditions": uploaded},
+        )
+
+        return {"session_uuid": session_uuid, "renditions": uploaded, "image_ids": image_ids}
+
+    except Exception as exc:
+        db_session.rollback()
+        logger.warning(
+            f"Failed to generate original derivatives for session {session_uuid}: {exc}",
+            extra={
+                "session_uuid": session_uuid,
+                "error": str(exc),
+                "retry": self.request.retries,
+            },
+        )
+        raise self.retry(exc=exc, countdown=2**self.request.retries) from exc
+
+    finally:
+        db_session.close()
+        sync_engine.dispose()
@@ -15,6 +15,7 @@ Tests get a fresh database state for each test function (scope="function").
 # =============================================================================
 import os
 from datetime import UTC
+from unittest.mock import patch
 
 import pytest
 import pytest_asyncio
@@ -22,6 +23,7 @@ from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import NullPool
 
+from app.core.circuit_breaker import LocalCircuitStore, reset_circuit_breakers
 from app.core.config import settings
 from app.core.logging import get_logger
 from app.db.base import Base
@@ -1512,6 +1514,19 @@ async def sql_fixtures(db_session):
 # =============================================================================
 
 
+@pytest.fixture(autouse=True)
+def isolated_circuit_breakers():
+    """Keep circuit breaker state in-process and reset it after each test.
+
+    Failures simulated by one test must not open a circuit (e.g. "s3") for
+    the next one, and tests never write breaker state to a real Redis.
+    """
+    store = LocalCircuitStore()
+    with patch("app.core.circuit_breaker._default_store", return_value=store):
+        yield store
+    reset_circuit_breakers()
+
+
 @pytest.fixture
 def mock_settings(monkeypatch):
     """Override settings for testing.
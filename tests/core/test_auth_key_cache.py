@@ -0,0 +1,226 @@
+"""Tests for the JWKS key store and the verified-token cache.
+
+A local JWKS stand-in (httpx.MockTransport) replaces Auth0.
+
+Tests verify:
+- Keys are fetched once and served from memory
+- Unknown key IDs force a refresh, rate-limited
+- Stale keys are refreshed in the background and kept on failure
+- Verified tokens skip signature verification until they expire
+"""
+
+import asyncio
+import base64
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwt
+
+from app.core import auth
+from app.core.auth import Auth0Config, JWKSKeyStore, VerifiedTokenCache, verify_token
+from app.core.exceptions import UnauthorizedException
+
+CONFIG = Auth0Config(
+    domain="demeter.test.auth0.com",
+    api_audience="https://api.demeter.test",
+    jwks_uri="https://demeter.test.auth0.com/.well-known/jwks.json",
+    issuer="https://demeter.test.auth0.com/",
+)
+
+
+def _b64(value: int) -> str:
+    raw = value.to_bytes((value.bit_length() + 7) // 8, "big")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+class SigningKey:
+    """RSA key pair published under a kid."""
+
+    def __init__(self, kid: str) -> None:
+        self.kid = kid
+        self._private = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    @property
+    def jwk(self) -> dict[str, str]:
+        numbers = self._private.public_key().public_numbers()
+        return {
+            "kty": "RSA",
+            "kid": self.kid,
+            "use": "sig",
+            "n": _b64(numbers.n),
+            "e": _b64(numbers.e),
+        }
+
+    def sign(self, **claims) -> str:
+        pem = self._private.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+        now = int(time.time())
+        payload = {
+            "sub": "auth0|1",
+            "email": "user@example.com",
+            "iat": now,
+            "exp": now + 3600,
+            "aud": CONFIG.api_audience,
+            "iss": CONFIG.issuer,
+            "https://demeter.ai/roles": ["admin"],
+            **claims,
+        }
+        return jwt.encode(payload, pem, algorithm="RS256", headers={"kid": self.kid})
+
+
+class FakeJWKS:
+    """Local JWKS endpoint counting its requests."""
+
+    def __init__(self, *keys: SigningKey) -> None:
+        self.keys = list(keys)
+        self.requests = 0
+        self.fail = False
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        if self.fail:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"keys": [key.jwk for key in self.keys]})
+
+    def store(self, ttl_seconds: float = 3600, min_refresh: float = 30) -> JWKSKeyStore:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+        return JWKSKeyStore(ttl_seconds, min_refresh, client=client)
+
+
+@pytest.fixture(scope="module")
+def key_a():
+    return SigningKey("a")
+
+
+@pytest.fixture(scope="module")
+def key_b():
+    return SigningKey("b")
+
+
+@pytest.fixture(autouse=True)
+def auth0_config():
+    with patch.object(auth, "get_auth0_config", return_value=CONFIG):
+        yield
+
+
+class TestJWKSKeyStore:
+    """Test key lookup and refresh."""
+
+    @pytest.mark.asyncio
+    async def test_keys_fetched_once(self, key_a):
+        jwks = FakeJWKS(key_a)
+        store = jwks.store()
+
+        first = await store.get_key("a")
+        second = await store.get_key("a")
+
+        assert first is second
+        assert jwks.requests == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_kid_forces_refresh(self, key_a, key_b):
+        jwks = FakeJWKS(key_a)
+        store = jwks.store(min_refresh=0)
+        await store.get_key("a")
+        jwks.keys.append(key_b)  # Key rotation
+
+        assert await store.get_key("b") is not None
+        assert jwks.requests == 2
+
+    @pytest.mark.asyncio
+    async def test_forced_refresh_is_rate_limited(self, key_a):
+        jwks = FakeJWKS(key_a)
+        store = jwks.store(min_refresh=30)
+        await store.get_key("a")
+
+        for _ in range(3):
+            with pytest.raises(UnauthorizedException):
+                await store.get_key("forged")
+
+        assert jwks.requests == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_keys_refresh_in_background_and_survive_failures(self, key_a):
+        jwks = FakeJWKS(key_a)
+        store = jwks.store(ttl_seconds=0)
+        await store.get_key("a")
+        jwks.fail = True
+
+        assert await store.get_key("a") is not None
+        await store._refresh_task
+
+        assert jwks.requests == 2
+        assert await store.get_key("a") is not None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_use_shares_one_fetch(self, key_a):
+        jwks = FakeJWKS(key_a)
+        store = jwks.store()
+
+        await asyncio.gather(*(store.get_key("a") for _ in range(5)))
+
+        assert jwks.requests == 1
+
+
+class TestVerifyToken:
+    """Test verification through the caches."""
+
+    @pytest.fixture
+    def caches(self, key_a):
+        jwks = FakeJWKS(key_a)
+        with (
+            patch.object(auth, "get_jwks_key_store", return_value=jwks.store()),
+            patch.object(auth, "get_verified_token_cache", return_value=VerifiedTokenCache(10)),
+            patch.object(auth, "record_cache_request"),
+        ):
+            yield jwks
+
+    @pytest.mark.asyncio
+    async def test_repeated_token_skips_verification(self, caches, key_a):
+        token = key_a.sign()
+
+        claims = await verify_token(token)
+        with patch.object(auth.jwt, "decode", side_effect=AssertionError("verified again")):
+            assert await verify_token(token) == claims
+
+        assert claims.roles == ["admin"]
+        assert caches.requests == 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_signature_is_rejected_and_not_cached(self, caches):
+        forged = SigningKey("a").sign()  # Same kid, other key
+
+        for _ in range(2):
+            with pytest.raises(UnauthorizedException):
+                await verify_token(forged)
+
+
+class TestVerifiedTokenCache:
+    """Test the LRU itself."""
+
+    def _claims(self, exp: int):
+        return auth.TokenClaims.model_construct(sub="auth0|1", exp=exp)
+
+    def test_expired_entries_are_dropped(self):
+        cache = VerifiedTokenCache(10)
+        cache.put("t", self._claims(int(time.time()) - 1))
+
+        assert cache.get("t") is None
+
+    def test_least_recently_used_is_evicted(self):
+        cache = VerifiedTokenCache(2)
+        exp = int(time.time()) + 60
+        for token in ("a", "b"):
+            cache.put(token, self._claims(exp))
+        cache.get("a")
+        cache.put("c", self._claims(exp))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
@@ -0,0 +1,308 @@
+"""Tests for the distributed circuit breakers.
+
+Breakers of different "workers" are separate CircuitBreaker instances sharing
+one store, as processes share Redis in production.
+
+Tests verify:
+- The circuit opens on the failure rate over the sliding window, not on a
+  fixed count, and old failures age out
+- An open circuit is seen by every worker
+- Half-open: exactly one probe; its outcome closes or re-opens the circuit
+- Coroutines are protected (failures of awaited calls are counted)
+- Only errors accepted by the is_failure predicate count (S3: transport,
+  timeout and 5xx; GPU: CUDA/OOM), others leave the circuit closed
+- Redis outages fall back to in-process state
+- ML child task: an open GPU circuit skips image fetch and inference
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError, EndpointConnectionError
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.core import circuit_breaker
+from app.core.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+    CircuitState,
+    FallbackCircuitStore,
+    LocalCircuitStore,
+)
+from app.core.exceptions import CircuitBreakerException, S3UploadException
+from app.services.photo.s3_image_service import is_s3_failure
+from app.tasks.ml_tasks import _is_gpu_failure
+
+POLICY = CircuitBreakerPolicy(
+    failure_rate=0.5, min_calls=4, window_seconds=60, open_seconds=30, probe_timeout_seconds=10
+)
+
+
+class Clock:
+    """Controllable time.time() for the breaker module."""
+
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    clock = Clock()
+    with patch.object(circuit_breaker.time, "time", clock):
+        yield clock
+
+
+@pytest.fixture
+def store():
+    return LocalCircuitStore()
+
+
+def worker(store, scope: str = "s3") -> CircuitBreaker:
+    return CircuitBreaker(scope, POLICY, store=store)
+
+
+def fail(breaker: CircuitBreaker, times: int = 1) -> None:
+    for _ in range(times):
+        breaker.before_call()
+        breaker.record_failure()
+
+
+def succeed(breaker: CircuitBreaker, times: int = 1) -> None:
+    for _ in range(times):
+        breaker.before_call()
+        breaker.record_success()
+
+
+class TestFailureRate:
+    """Test opening on the sliding-window failure rate."""
+
+    def test_opens_at_failure_rate(self, store, clock):
+        breaker = worker(store)
+        succeed(breaker, 2)
+        fail(breaker, 1)
+        assert store.state("s3")[0] is CircuitState.CLOSED  # 1/3 failed, below min_calls
+
+        fail(breaker, 1)  # 2/4 failed
+
+        assert store.state("s3")[0] is CircuitState.OPEN
+        with pytest.raises(CircuitBreakerException) as exc_info:
+            breaker.before_call()
+        assert exc_info.value.retry_after_seconds == 30
+
+    def test_low_failure_rate_stays_closed(self, store, clock):
+        breaker = worker(store)
+        for _ in range(5):  # Sporadic failures, never consecutive-count based
+            succeed(breaker, 2)
+            clock.now += 2  # Successes are written at most once per second
+            fail(breaker, 1)
+
+        assert store.state("s3")[0] is CircuitState.CLOSED
+
+    def test_old_failures_leave_the_window(self, store, clock):
+        breaker = worker(store)
+        fail(breaker, 3)
+        clock.now += POLICY.window_seconds + POLICY.bucket_seconds
+
+        fail(breaker, 1)
+
+        assert store.state("s3")[0] is CircuitState.CLOSED
+
+
+class TestSharedState:
+    """Test that workers see each other's circuits."""
+
+    def test_circuit_opened_by_one_worker_rejects_others(self, store, clock):
+        a, b = worker(store), worker(store)
+        fail(a, 4)
+
+        with pytest.raises(CircuitBreakerException):
+            b.before_call()
+
+    def test_scopes_are_independent(self, store, clock):
+        fail(worker(store, "gpu:gpu@host-1:0"), 4)
+
+        assert worker(store, "gpu:gpu@host-2:0").before_call() is False
+
+    def test_single_probe_after_cooldown(self, store, clock):
+        a, b = worker(store), worker(store)
+        fail(a, 4)
+        clock.now += POLICY.open_seconds + 1
+
+        assert a.before_call() is True  # Probe
+        with pytest.raises(CircuitBreakerException):
+            b.before_call()
+
+        a.record_success(probe=True)
+
+        assert b.before_call() is False
+        assert store.state("s3")[0] is CircuitState.CLOSED
+
+    def test_failed_probe_reopens(self, store, clock):
+        a, b = worker(store), worker(store)
+        fail(a, 4)
+        clock.now += POLICY.open_seconds + 1
+
+        probe = b.before_call()
+        b.record_failure(probe)
+
+        assert store.state("s3")[0] is CircuitState.OPEN
+        clock.now += POLICY.open_seconds + 1
+        assert a.before_call() is True  # Next probe
+
+    def test_crashed_probe_lease_expires(self, store, clock):
+        a, b = worker(store), worker(store)
+        fail(a, 4)
+        clock.now += POLICY.open_seconds + 1
+        assert a.before_call() is True  # Probe never reports back
+
+        clock.now += POLICY.probe_timeout_seconds + 1
+
+        assert b.before_call() is True
+
+
+class TestWrappers:
+    """Test protect() / protect_async()."""
+
+    @pytest.mark.asyncio
+    async def test_coroutine_failures_are_counted(self, store, clock):
+        breaker = worker(store)
+        calls = 0
+
+        @breaker.protect_async
+        async def s3_call() -> None:
+            nonlocal calls
+            calls += 1
+            raise OSError("S3 down")
+
+        for _ in range(4):
+            with pytest.raises(OSError):
+                await s3_call()
+        with pytest.raises(CircuitBreakerException):
+            await s3_call()
+
+        assert calls == 4
+
+    def test_protect_records_outcome(self, store, clock):
+        breaker = worker(store)
+        for _ in range(4):
+            with pytest.raises(RuntimeError), breaker.protect():
+                raise RuntimeError("CUDA error")
+
+        with pytest.raises(CircuitBreakerException), breaker.protect():
+            pytest.fail("call admitted while open")
+
+    @pytest.mark.asyncio
+    async def test_excluded_errors_do_not_open_circuit(self, store, clock):
+        breaker = worker(store)
+
+        @breaker.protect_async(is_failure=is_s3_failure)
+        async def s3_call() -> None:
+            try:
+                raise s3_error(404, "NoSuchKey")
+            except ClientError as e:
+                raise S3UploadException(file_name="k", bucket="b", error=str(e)) from e
+
+        for _ in range(10):
+            with pytest.raises(S3UploadException):
+                await s3_call()
+
+        assert store.state("s3")[0] is CircuitState.CLOSED
+
+    def test_excluded_errors_count_as_success(self, store, clock):
+        breaker = worker(store)
+        fail(breaker, 2)
+        for _ in range(4):
+            with pytest.raises(ValueError), breaker.protect(is_failure=_is_gpu_failure):
+                raise ValueError("unreadable image")
+        fail(breaker)  # 3/7 failed, below the 50% failure rate
+
+        assert store.state("s3")[0] is CircuitState.CLOSED
+
+
+def s3_error(status: int, code: str) -> ClientError:
+    return ClientError(
+        {"Error": {"Code": code}, "ResponseMetadata": {"HTTPStatusCode": status}}, "GetObject"
+    )
+
+
+class TestFailurePredicates:
+    """Test which dependency errors count as failures."""
+
+    @pytest.mark.parametrize(
+        ("exc", "expected"),
+        [
+            (s3_error(503, "SlowDown"), True),
+            (s3_error(500, "InternalError"), True),
+            (EndpointConnectionError(endpoint_url="http://s3"), True),
+            (TimeoutError(), True),
+            (s3_error(404, "NoSuchKey"), False),
+            (s3_error(400, "InvalidPart"), False),
+            (ValueError("bad key"), False),
+        ],
+    )
+    def test_s3(self, exc, expected):
+        wrapped = S3UploadException(file_name="k", bucket="b", error="wrapped")
+        wrapped.__cause__ = exc
+
+        assert is_s3_failure(exc) is expected
+        assert is_s3_failure(wrapped) is expected
+
+    @pytest.mark.parametrize(
+        ("exc", "expected"),
+        [
+            (RuntimeError("CUDA error: device-side assert"), True),
+            (MemoryError(), True),
+            (ValueError("bad input"), False),
+            (FileNotFoundError("missing"), False),
+            (NotImplementedError(), False),
+        ],
+    )
+    def test_gpu(self, exc, expected):
+        assert _is_gpu_failure(exc) is expected
+
+
+class TestRedisFallback:
+    """Test degradation when Redis is unreachable."""
+
+    def test_unreachable_redis_uses_local_state(self, clock):
+        redis_store = MagicMock()
+        redis_store.state.side_effect = RedisConnectionError("refused")
+        redis_store.add.side_effect = RedisConnectionError("refused")
+        local = LocalCircuitStore()
+        breaker = CircuitBreaker("s3", POLICY, store=FallbackCircuitStore(redis_store, local))
+
+        fail(breaker, 4)
+
+        assert local.state("s3")[0] is CircuitState.OPEN
+        assert redis_store.state.call_count == 1  # Not retried before REDIS_RETRY_SECONDS
+
+
+class TestGpuFastFail:
+    """Test the ML child task against an open GPU circuit."""
+
+    def test_open_gpu_circuit_skips_inference(self, isolated_circuit_breakers):
+        from app.tasks import ml_tasks
+
+        with (
+            patch.object(ml_tasks, "_report_job_status"),
+            patch.object(ml_tasks, "_load_plant_area_profile") as mock_profile,
+            patch.object(ml_tasks, "MLPipelineCoordinator") as mock_pipeline,
+            patch.object(ml_tasks.os, "environ", {"CUDA_VISIBLE_DEVICES": "1"}),
+            patch.object(ml_tasks.socket, "gethostname", return_value="gpu-host"),
+        ):
+            breaker = ml_tasks.get_circuit_breaker("gpu:gpu-host:1", circuit_breaker.gpu_policy())
+            isolated_circuit_breakers.trip(breaker.scope, breaker.policy)
+
+            with pytest.raises(CircuitBreakerException):
+                ml_tasks.ml_child_task(
+                    session_id=1,
+                    image_id="img-1",
+                    image_path="s1/original.jpg",
+                    storage_location_id=1,
+                )
+
+        mock_profile.assert_not_called()
+        mock_pipeline.assert_not_called()
@@ -0,0 +1,100 @@
+"""Tests for conditional GETs (ETag / If-None-Match).
+
+Tests verify:
+- Responses carry a strong ETag and Cache-Control
+- A matching If-None-Match is answered with a bodiless 304 before the endpoint runs
+- Version bumps and different query strings change the ETag
+- Without Redis, endpoints are served normally
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.http_cache import conditional_get, etag_matches
+
+
+@pytest.fixture
+def versions():
+    with patch("app.core.http_cache.get_resource_versions", new_callable=AsyncMock) as mock:
+        mock.return_value = [1]
+        yield mock
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def client(calls):
+    app = FastAPI()
+
+    @app.get("/items", dependencies=[Depends(conditional_get("items"))])
+    async def list_items(limit: int = 10) -> list[int]:
+        calls.append(limit)
+        return list(range(limit))
+
+    return TestClient(app)
+
+
+class TestConditionalGet:
+    """Test the route dependency."""
+
+    def test_response_has_etag_and_cache_control(self, client, versions):
+        response = client.get("/items")
+
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('"')
+        assert "must-revalidate" in response.headers["cache-control"]
+        versions.assert_awaited_once_with(("items",))
+
+    def test_matching_etag_returns_304_without_running_endpoint(self, client, versions, calls):
+        etag = client.get("/items").headers["etag"]
+
+        response = client.get("/items", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert calls == [10]
+
+    def test_version_bump_changes_etag(self, client, versions):
+        etag = client.get("/items").headers["etag"]
+        versions.return_value = [2]
+
+        response = client.get("/items", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_query_string_is_part_of_etag(self, client, versions):
+        assert client.get("/items?limit=1").headers["etag"] != client.get("/items").headers["etag"]
+
+    def test_redis_unavailable_serves_without_etag(self, client, versions):
+        versions.return_value = None
+
+        response = client.get("/items", headers={"If-None-Match": "*"})
+
+        assert response.status_code == 200
+        assert "etag" not in response.headers
+
+
+class TestEtagMatches:
+    """Test If-None-Match parsing."""
+
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            ('"abc"', True),
+            ('"x", "abc"', True),
+            ('W/"abc"', True),
+            ("*", True),
+            ('"x"', False),
+            (None, False),
+        ],
+    )
+    def test_etag_matches(self, header, expected):
+        assert etag_matches(header, '"abc"') is expected
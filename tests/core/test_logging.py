@@ -5,9 +5,15 @@ Tests verify:
 - Structured JSON output format
 - Correlation ID generation and propagation
 - Thread-safe context variables
+- Request sampling, queued output and the correlation ID middleware
+- Logging overhead on the request path (benchmarks)
 """
 
+import io
 import json
+import logging
+import sys
+import time
 
 import pytest
 
@@ -15,8 +21,12 @@ from app.core.logging import (
     clear_correlation_id,
     get_correlation_id,
     get_logger,
+    log_sampled_var,
+    sample_request_logs,
     set_correlation_id,
     setup_logging,
+    start_queued_logging,
+    stop_queued_logging,
 )
 
 
@@ -277,3 +287,150 @@ class TestExtraFields:
         log_entry = json.loads(output.split("\n")[-1])
         assert log_entry["metadata"] == {"key1": "value1", "key2": "value2"}
         assert log_entry["tags"] == ["tag1", "tag2", "tag3"]
+
+
+class TestRequestSampling:
+    """Test per-route request sampling of debug/info logs."""
+
+    def teardown_method(self):
+        log_sampled_var.set(True)
+
+    def test_route_rate_overrides_default(self):
+        rates = {"/health": 0.0, "/health/deep": 1.0}
+
+        assert sample_request_logs("/api/v1/products", 1.0, rates) is True
+        assert sample_request_logs("/health", 1.0, rates) is False
+        assert sample_request_logs("/health/deep", 0.0, rates) is True  # Longest prefix
+
+    def test_unsampled_request_keeps_only_warnings(self, capfd):
+        setup_logging("DEBUG")
+        logger = get_logger(__name__)
+        sample_request_logs("/metrics", 1.0, {"/metrics": 0.0})
+
+        logger.info("Sampled-out info")
+        logger.warning("Kept warning")
+
+        output = capfd.readouterr().out
+        assert "Sampled-out info" not in output
+        assert "Kept warning" in output
+
+    def test_unsampled_request_filters_stdlib_loggers(self):
+        stream = io.StringIO()
+        handler = logging.StreamHandler(stream)
+        root = logging.getLogger()
+        root.addHandler(handler)
+        ml_logger = logging.getLogger("app.services.ml_processing.test")
+        ml_logger.setLevel(logging.DEBUG)
+        try:
+            setup_logging("DEBUG")
+            sample_request_logs("/metrics", 1.0, {"/metrics": 0.0})
+
+            ml_logger.info("Sampled-out info")
+            ml_logger.warning("Kept warning")
+        finally:
+            root.removeHandler(handler)
+            ml_logger.setLevel(logging.NOTSET)
+
+        assert "Sampled-out info" not in stream.getvalue()
+        assert "Kept warning" in stream.getvalue()
+
+
+class TestLogWriter:
+    """Test the queued (background thread) log output."""
+
+    def test_queued_lines_are_written_in_order(self, capfd):
+        setup_logging("INFO")
+        logger = get_logger(__name__)
+
+        start_queued_logging()
+        try:
+            for i in range(50):
+                logger.info("Queued line", n=i)
+        finally:
+            stop_queued_logging()
+
+        lines = [json.loads(line) for line in capfd.readouterr().out.splitlines() if line]
+        assert [line["n"] for line in lines if line["event"] == "Queued line"] == list(range(50))
+
+
+class TestCorrelationIdMiddleware:
+    """Test the pure ASGI request middleware."""
+
+    def test_correlation_id_echoed_and_one_line_logged(self, capfd):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from app.main import CorrelationIdMiddleware
+
+        app = FastAPI()
+        app.add_middleware(CorrelationIdMiddleware)
+
+        @app.get("/ping")
+        async def ping():
+            return {"correlation_id": get_correlation_id()}
+
+        setup_logging("INFO")
+        capfd.readouterr()
+        response = TestClient(app).get("/ping", headers={"X-Correlation-ID": "abc-123"})
+
+        assert response.headers["X-Correlation-ID"] == "abc-123"
+        assert response.json() == {"correlation_id": "abc-123"}
+        out = capfd.readouterr().out
+        lines = [json.loads(line) for line in out.splitlines() if line.startswith("{")]
+        request_lines = [line for line in lines if line["event"] == "Request completed"]
+        assert len(request_lines) == 1
+        assert request_lines[0]["status_code"] == 200
+        assert request_lines[0]["correlation_id"] == "abc-123"
+        clear_correlation_id()
+
+
+@pytest.mark.benchmark
+class TestLoggingOverhead:
+    """Benchmarks: logging cost on the request path."""
+
+    def test_queued_logging_does_not_block_on_slow_stdout(self, monkeypatch):
+        class SlowStdout(io.StringIO):
+            def write(self, s):
+                time.sleep(0.002)  # Back-pressured log driver
+                return super().write(s)
+
+        setup_logging("INFO")
+        logger = get_logger(__name__)
+        monkeypatch.setattr(sys, "stdout", SlowStdout())
+
+        start = time.perf_counter()
+        for _ in range(50):
+            logger.info("Direct line")
+        direct = time.perf_counter() - start
+
+        start_queued_logging()
+        try:
+            start = time.perf_counter()
+            for _ in range(50):
+                logger.info("Queued line")
+            queued = time.perf_counter() - start
+        finally:
+            stop_queued_logging()
+
+        assert direct >= 0.1
+        assert queued < direct / 5
+
+    def test_sampled_out_events_skip_rendering(self, monkeypatch):
+        setup_logging("INFO")
+        logger = get_logger(__name__)
+        monkeypatch.setattr(sys, "stdout", io.StringIO())
+
+        def timed(n: int = 2000) -> float:
+            start = time.perf_counter()
+            for i in range(n):
+                logger.info("Benchmark line", i=i, payload={"key": "value"})
+            return time.perf_counter() - start
+
+        rendered = timed()
+        sample_request_logs("/health", 1.0, {"/health": 0.0})
+        try:
+            dropped = timed()
+        finally:
+            log_sampled_var.set(True)
+
+        assert dropped < rendered / 2
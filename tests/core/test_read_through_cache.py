@@ -0,0 +1,263 @@
+"""Tests for the read-through catalog cache (in-process L1 + Redis L2).
+
+Tests verify:
+- Misses load once and fill both levels; other processes hit Redis
+- Concurrent misses share one load (single-flight)
+- Invalidation drops the namespace now and again at transaction end
+- Redis failures and expired/unreadable entries degrade to loads
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.read_through_cache import ReadThroughCache, read_through
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the hash commands the cache uses."""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.deletes = 0
+        self.versions: dict[str, int] = {}
+
+    async def hget(self, name: str, key: str) -> str | None:
+        return self.hashes.get(name, {}).get(key)
+
+    async def hset(self, name: str, key: str, value: str) -> None:
+        self.hashes.setdefault(name, {})[key] = value
+
+    async def expire(self, name: str, ttl: int) -> None:
+        pass
+
+    async def delete(self, name: str) -> None:
+        self.deletes += 1
+        self.hashes.pop(name, None)
+
+    async def incr(self, name: str) -> int:
+        self.versions[name] = self.versions.get(name, 0) + 1
+        return self.versions[name]
+
+
+def make_cache(redis) -> ReadThroughCache:
+    return ReadThroughCache(
+        "items", ttl_seconds=60, l1_ttl_seconds=30, l1_max_entries=10, redis=redis
+    )
+
+
+def make_loader(*values):
+    return AsyncMock(side_effect=list(values))
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def recorded():
+    with patch("app.core.read_through_cache.record_cache_request") as record:
+        yield record
+
+
+def results(recorded) -> list[str]:
+    return [c.args[1] for c in recorded.call_args_list]
+
+
+class TestLookups:
+    """Test L1/L2/database lookup order."""
+
+    @pytest.mark.asyncio
+    async def test_miss_loads_once_then_hits_l1(self, redis, recorded):
+        cache = make_cache(redis)
+        loader = make_loader([Item(id=1, name="a")])
+
+        first = await cache.get_or_load("all", loader, list[Item])
+        second = await cache.get_or_load("all", loader, list[Item])
+
+        assert first == second == [Item(id=1, name="a")]
+        loader.assert_awaited_once()
+        assert "all" in redis.hashes["read_cache:items"]
+        assert results(recorded) == ["miss", "l1_hit"]
+
+    @pytest.mark.asyncio
+    async def test_other_process_hits_l2(self, redis, recorded):
+        await make_cache(redis).get_or_load("id:1", make_loader(Item(id=1, name="a")), Item)
+        loader = make_loader()
+
+        value = await make_cache(redis).get_or_load("id:1", loader, Item)
+
+        assert value == Item(id=1, name="a")
+        loader.assert_not_awaited()
+        assert results(recorded) == ["miss", "l2_hit"]
+
+    @pytest.mark.asyncio
+    async def test_expired_l2_entry_is_a_miss(self, redis, recorded):
+        redis.hashes["read_cache:items"] = {
+            "id:1": f"{time.time() - 1:.0f}:" + '{"id":1,"name":"old"}'
+        }
+
+        value = await make_cache(redis).get_or_load(
+            "id:1", make_loader(Item(id=1, name="new")), Item
+        )
+
+        assert value.name == "new"
+
+    @pytest.mark.asyncio
+    async def test_l1_evicts_least_recently_used(self, redis, recorded):
+        cache = make_cache(redis)
+        cache.l1_max_entries = 2
+        for key in ("a", "b", "c"):
+            await cache.get_or_load(key, make_loader(1), int)
+
+        assert list(cache._l1) == ["b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_serve_loader_result(self, recorded):
+        redis = AsyncMock()
+        redis.hget.side_effect = ConnectionError("redis down")
+        redis.hset.side_effect = ConnectionError("redis down")
+        redis.delete.side_effect = ConnectionError("redis down")
+        cache = make_cache(redis)
+
+        assert await cache.get_or_load("id:1", make_loader(7), int) == 7
+        await cache.invalidate()
+
+    @pytest.mark.asyncio
+    async def test_loader_errors_are_not_cached(self, redis, recorded):
+        cache = make_cache(redis)
+        loader = make_loader(ValueError("Item 1 not found"), 1)
+
+        with pytest.raises(ValueError):
+            await cache.get_or_load("id:1", loader, int)
+
+        assert await cache.get_or_load("id:1", loader, int) == 1
+
+    @pytest.mark.asyncio
+    async def test_read_through_without_cache_calls_loader(self):
+        loader = make_loader(3)
+
+        assert await read_through(None, "id:1", loader, int) == 3
+
+
+class TestSingleFlight:
+    """Test stampede protection."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self, redis, recorded):
+        cache = make_cache(redis)
+        release = asyncio.Event()
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return [Item(id=1, name="a")]
+
+        waiters = [
+            asyncio.create_task(cache.get_or_load("all", loader, list[Item])) for _ in range(10)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        values = await asyncio.gather(*waiters)
+
+        assert calls == 1
+        assert all(v == [Item(id=1, name="a")] for v in values)
+        assert results(recorded).count("coalesced") == 9
+
+    @pytest.mark.asyncio
+    async def test_waiters_receive_loader_error(self, redis, recorded):
+        cache = make_cache(redis)
+        release = asyncio.Event()
+
+        async def loader():
+            await release.wait()
+            raise ValueError("boom")
+
+        waiters = [asyncio.create_task(cache.get_or_load("k", loader, int)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        outcomes = await asyncio.gather(*waiters, return_exceptions=True)
+
+        assert all(isinstance(o, ValueError) for o in outcomes)
+
+    @pytest.mark.asyncio
+    async def test_waiter_loads_itself_if_loading_request_is_cancelled(self, redis, recorded):
+        cache = make_cache(redis)
+        never = asyncio.Event()
+
+        async def slow_loader():
+            await never.wait()
+
+        leader = asyncio.create_task(cache.get_or_load("k", slow_loader, int))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(cache.get_or_load("k", make_loader(5), int))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == 5
+
+
+class TestInvalidation:
+    """Test namespace invalidation on writes."""
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_both_levels(self, redis, recorded):
+        cache = make_cache(redis)
+        await cache.get_or_load("all", make_loader(1), int)
+
+        await cache.invalidate()
+
+        assert redis.hashes == {}
+        assert await cache.get_or_load("all", make_loader(2), int) == 2
+
+    @pytest.mark.asyncio
+    async def test_load_started_before_invalidation_is_not_stored(self, redis, recorded):
+        cache = make_cache(redis)
+        release = asyncio.Event()
+
+        async def stale_loader():
+            await release.wait()
+            return 1
+
+        load = asyncio.create_task(cache.get_or_load("all", stale_loader, int))
+        await asyncio.sleep(0)
+        await cache.invalidate()
+        release.set()
+
+        assert await load == 1
+        assert cache._l1 == {}
+        assert redis.hashes == {}
+
+    @pytest.mark.asyncio
+    async def test_drops_again_when_transaction_ends(self, redis, recorded):
+        cache = make_cache(redis)
+        session = AsyncSession()
+        sync_session = session.sync_session
+
+        await cache.invalidate(session)
+        await cache.get_or_load("all", make_loader(1), int)  # Read before the commit
+
+        # Flush subtransaction: not the commit
+        sync_session.dispatch.after_transaction_end(sync_session, SimpleNamespace(parent=object()))
+        assert "all" in cache._l1
+
+        sync_session.dispatch.after_transaction_end(sync_session, SimpleNamespace(parent=None))
+        await asyncio.sleep(0)
+
+        assert cache._l1 == {}
+        assert redis.hashes == {}
+        assert redis.deletes == 2
+        assert redis.versions == {"items:version": 2}
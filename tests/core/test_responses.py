@@ -0,0 +1,183 @@
+"""Tests for fast JSON responses (pydantic-core serialization).
+
+Tests verify:
+- Bodies match FastAPI's default serialization of the same models
+- Headers set by route dependencies (ETag) are kept
+- Long arrays are streamed as one valid JSON document
+- The fast path beats the default encoding on a large map payload (benchmark)
+"""
+
+import json
+import time
+from datetime import UTC, datetime
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from fastapi import Depends, FastAPI, Response
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.responses import json_response
+from app.models.s3_image import ProcessingStatusEnum
+from app.schemas.map_schema import (
+    LocationPreviewMetrics,
+    MapBulkLoadResponse,
+    StorageAreaNode,
+    StorageLocationNode,
+    WarehouseNode,
+)
+from app.schemas.photo_output_schema import (
+    GalleryPagination,
+    PhotoGalleryItem,
+    PhotoGalleryResponse,
+)
+
+
+def make_gallery() -> PhotoGalleryResponse:
+    item = PhotoGalleryItem.model_construct(
+        image_id=uuid4(),
+        thumbnail_url="https://bucket/thumb.jpg",
+        original_url=None,
+        status=ProcessingStatusEnum.READY,
+        error_details=None,
+        uploaded_at=datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC),
+        warehouse_name="Norte",
+        processing_session=None,
+    )
+    return PhotoGalleryResponse.model_construct(
+        photos=[item], pagination=GalleryPagination(total_items=1, total_pages=1)
+    )
+
+
+def make_map(warehouses: int, locations_per_area: int) -> MapBulkLoadResponse:
+    preview = LocationPreviewMetrics.model_construct(
+        current_quantity=120,
+        previous_quantity=100,
+        quantity_change=20,
+        last_photo_date=datetime(2025, 1, 2, tzinfo=UTC),
+        last_photo_thumbnail_url="https://bucket/thumb.jpg?X-Amz-Signature=abc",
+        status="completed",
+        quality_score=0.93,
+    )
+    return MapBulkLoadResponse.model_construct(
+        warehouses=[
+            WarehouseNode.model_construct(
+                warehouse_id=w,
+                code=f"WH-{w}",
+                name=f"Warehouse {w}",
+                storage_areas=[
+                    StorageAreaNode.model_construct(
+                        storage_area_id=a,
+                        code=f"A-{a}",
+                        name=f"Area {a}",
+                        position="N",
+                        locations=[
+                            StorageLocationNode.model_construct(
+                                location_id=i, code=f"L-{i}", name=f"Location {i}", preview=preview
+                            )
+                            for i in range(locations_per_area)
+                        ],
+                    )
+                    for a in range(5)
+                ],
+            )
+            for w in range(warehouses)
+        ]
+    )
+
+
+class TestJsonResponse:
+    """Test the fast path against FastAPI's default encoding."""
+
+    def test_body_matches_default_serialization(self):
+        gallery = make_gallery()
+        app = FastAPI()
+
+        @app.get("/default", response_model=PhotoGalleryResponse)
+        async def default() -> PhotoGalleryResponse:
+            return gallery
+
+        @app.get("/fast", response_model=PhotoGalleryResponse)
+        async def fast(response: Response) -> Response:
+            return json_response(gallery, response)
+
+        client = TestClient(app)
+
+        assert client.get("/fast").json() == client.get("/default").json()
+
+    def test_dependency_headers_are_kept(self):
+        def set_etag(response: Response) -> None:
+            response.headers["ETag"] = '"v1"'
+
+        app = FastAPI()
+
+        @app.get("/fast", dependencies=[Depends(set_etag)])
+        async def fast(response: Response) -> Response:
+            return json_response(make_gallery(), response)
+
+        response = TestClient(app).get("/fast")
+
+        assert response.headers["etag"] == '"v1"'
+        assert response.headers["content-type"] == "application/json"
+
+    def test_long_arrays_are_streamed(self):
+        bulk_load = make_map(warehouses=7, locations_per_area=2)
+
+        with (
+            patch("app.core.responses.settings.JSON_STREAM_MIN_ITEMS", 5),
+            patch("app.core.responses.settings.JSON_STREAM_CHUNK_ITEMS", 3),
+        ):
+            response = json_response(bulk_load, stream_field="warehouses")
+            short = json_response(make_map(2, 2), stream_field="warehouses")
+
+        assert isinstance(response, StreamingResponse)
+        assert not isinstance(short, StreamingResponse)
+
+        app = FastAPI()
+        app.get("/map")(lambda: response)
+        body = TestClient(app).get("/map").json()
+
+        assert body == bulk_load.model_dump(mode="json")
+
+    def test_streamed_array_of_empty_model(self):
+        with patch("app.core.responses.settings.JSON_STREAM_MIN_ITEMS", 0):
+            response = json_response(MapBulkLoadResponse(), stream_field="warehouses")
+
+        app = FastAPI()
+        app.get("/map")(lambda: response)
+
+        assert TestClient(app).get("/map").json() == {"warehouses": []}
+
+
+@pytest.mark.benchmark
+class TestSerializationOverhead:
+    """Benchmark: fast path vs FastAPI's default encoding of a large map."""
+
+    def test_fast_path_is_faster_than_default_encoding(self):
+        bulk_load = make_map(warehouses=10, locations_per_area=100)  # 5000 locations
+        app = FastAPI()
+
+        @app.get("/default", response_model=MapBulkLoadResponse)
+        async def default() -> MapBulkLoadResponse:
+            return bulk_load
+
+        @app.get("/fast", response_model=MapBulkLoadResponse)
+        async def fast(response: Response) -> Response:
+            return json_response(bulk_load, response, stream_field="warehouses")
+
+        client = TestClient(app)
+
+        def timed(path: str, n: int = 5) -> float:
+            assert json.loads(client.get(path).content) == expected  # Warm-up
+            start = time.perf_counter()
+            for _ in range(n):
+                client.get(path)
+            return time.perf_counter() - start
+
+        expected = bulk_load.model_dump(mode="json")
+        default_seconds = timed("/default")
+        fast_seconds = timed("/fast")
+
+        # End to end, including the test client's own handling of the body
+        assert fast_seconds < default_seconds * 0.8
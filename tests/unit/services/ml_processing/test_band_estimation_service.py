@@ -383,6 +383,20 @@ class TestBandEstimationService:
         # Assert: Should return default 2500.0
         assert avg_area == 2500.0, f"Expected default 2500.0, got {avg_area}"
 
+    @pytest.mark.asyncio
+    async def test_calibrate_plant_size_insufficient_samples_uses_prior(self, service):
+        """Test fallback to the band's historical plant area when one is known."""
+        detections = [
+            {"center_x_px": i * 10, "center_y_px": 50, "width_px": 40, "height_px": 40}
+            for i in range(5)
+        ]
+
+        avg_area = service._calibrate_plant_size(
+            detections, band_number=1, image_height=1000, prior_area=900.0
+        )
+
+        assert avg_area == 900.0
+
     @pytest.mark.asyncio
     async def test_calibrate_plant_size_filters_by_band_y_range(self, service):
         """Test calibration only uses detections within band's y-range.
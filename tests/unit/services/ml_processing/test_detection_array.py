@@ -0,0 +1,231 @@
+"""Unit tests for DetectionArray - array-backed detection container.
+
+This module tests:
+- Construction from xyxy boxes, legacy dicts and columnar JSON payloads
+- Vectorized offset / scale / band filtering
+- concat() class-table merging
+- Conversion to legacy records and Detection table rows
+
+Architecture:
+    - Layer: Services / ML Processing
+    - Dependencies: NumPy (no SAHI/torch required)
+"""
+
+import json
+
+import numpy as np  # type: ignore[import-not-found]
+import pytest
+
+# =============================================================================
+# Test Classes - Construction
+# =============================================================================
+
+
+class TestDetectionArrayConstruction:
+    """Test DetectionArray constructors and validation."""
+
+    def test_from_xyxy_computes_center_and_size(self):
+        """Boxes become center/size columns with a compact class table."""
+        from app.services.ml_processing.detection_array import DetectionArray
+
+        dets = DetectionArray.from_xyxy(
+            [[10, 20, 50, 80], [100, 100, 120, 110]],
+            [0.9, 0.4],
+            [3, 7],
+            {3: "plant", 7: "suculenta"},
+        )
+
+        assert len(dets) == 2
+        np.testing.assert_allclose(dets.center_x, [30, 110])
+        np.testing.assert_allclose(dets.center_y, [50, 105])
+        np.testing.assert_allclose(dets.width, [40, 20])
+        np.testing.assert_allclose(dets.height, [60, 10])
+        assert dets.class_names == ["plant", "suculenta"]
+        assert dets.class_id.tolist() == [0, 1]
+        assert dets.center_x.dtype == np.float32
+
+    def test_from_records_skips_malformed(self):
+        """Legacy dicts are accepted; malformed entries are dropped."""
+        from app.services.ml_processing.detection_array import DetectionArray
+
+        dets = DetectionArray.from_records(
+            [
+                {"center_x_px": 10, "center_y_px": 20, "width_px": 4, "height_px": 6},
+                {"center_x_px": 1, "center_y_px": 2},  # Missing size
+                {
+                    "center_x_px": 30,
+                    "center_y_px": 40,
+                    "width_px": 8,
+                    "height_px": 8,
+                    "confidence": 0.8,
+                    "class_name": "suculenta",
+                },
+            ]
+        )
+
+        assert len(dets) == 2
+        assert dets.confidence.tolist() == pytest.approx([0.0, 0.8])
+        assert [dets.class_names[i] for i in dets.class_id] == ["plant", "suculenta"]
+
+    def test_coerce_passthrough_and_none(self):
+        """coerce() returns DetectionArrays unchanged and None as empty."""
+        from app.services.ml_processing.detection_array import DetectionArray
+
+        dets = _sample()
+
+        assert DetectionArray.coerce(dets) is dets
+        assert len(DetectionArray.coerce(None)) == 0
+
+    def test_mismatched_columns_raise(self):
+        """Columns of different lengths raise ValueError."""
+        from app.services.ml_processing.detection_array import DetectionArray
+
+        with pytest.raises(ValueError, match="length"):
+            DetectionArray([1, 2], [1], [1], [1], [0.5], [0], ["plant"])
+
+    def test_class_id_out_of_table_raises(self):
+        """class_id must index into class_names."""
+        from app.services.ml_processing.detection_array import DetectionArray
+
+        with pytest.raises(ValueError, match="class_id"):
+            DetectionArray([1], [1], [1], [1], [0.5], [2], ["plant"])
+
+
+# =============================================================================
+# Test Classes - Transforms
+# =============================================================================
+
+
+class TestDetectionArrayTransforms:
+    """Test vectorized transforms (never mutate the source)."""
+
+    def test_offset_translates_centers_only(self):
+        """Segment origin offset moves centers; sizes unchanged."""
+        dets = _sample()
+
+        moved = dets.offset(1000, 500)
+
+        np.testing.assert_allclose(moved.center_x, dets.center_x + 1000)
+        np.testing.assert_allclose(moved.center_y, dets.center_y + 500)
+        np.testing.assert_allclose(moved.width, dets.width)
+        assert dets.center_x[0] == pytest.approx(30)  # Source untouched
+
+    def test_scale_multiplies_geometry(self):
+        """scale() maps downscaled predictions back to original pixels."""
+        dets = _sample().scale(2.0)
+
+        np.testing.assert_allclose(dets.center_x, [60, 220, 400])
+        np.testing.assert_allclose(dets.width, [80, 40, 40])
+
+    def test_in_y_range_is_half_open(self):
+        """Band filter keeps centers in [y_start, y_end)."""
+        dets = _sample()  # center_y = 50, 105, 300
+
+        band = dets.in_y_range(50, 300)
+
+        assert band.center_y.tolist() == [50, 105]
+
+    def test_concat_merges_class_tables(self):
+        """Different class tables are merged and ids remapped."""
+        from app.services.ml_processing.detection_array import DetectionArray
+
+        a = DetectionArray.from_xyxy([[0, 0, 10, 10]], [0.5], [0], {0: "plant"})
+        b = DetectionArray.from_xyxy(
+            [[0, 0, 10, 10], [5, 5, 9, 9]], [0.6, 0.7], [1, 0], {0: "suculenta", 1: "plant"}
+        )
+
+        joined = DetectionArray.concat([a, DetectionArray.empty(), b])
+
+        assert len(joined) == 3
+        assert [joined.class_names[i] for i in joined.class_id] == [
+            "plant",
+            "plant",
+            "suculenta",
+        ]
+
+    def test_mean_confidence(self):
+        """Average confidence, 0.0 when empty."""
+        from app.services.ml_processing.detection_array import DetectionArray
+
+        assert _sample().mean_confidence() == pytest.approx((0.9 + 0.4 + 0.7) / 3)
+        assert DetectionArray.empty().mean_confidence() == 0.0
+
+
+# =============================================================================
+# Test Classes - Export
+# =============================================================================
+
+
+class TestDetectionArrayExport:
+    """Test JSON payloads, legacy records and DB rows."""
+
+    def test_json_round_trip(self):
+        """to_json() is JSON-serializable and from_json() restores it."""
+        from app.services.ml_processing.detection_array import DetectionArray
+
+        dets = _sample()
+
+        payload = json.loads(json.dumps(dets.to_json()))
+        restored = DetectionArray.coerce(payload)
+
+        np.testing.assert_allclose(restored.xyxy(), dets.xyxy())
+        np.testing.assert_allclose(restored.confidence, dets.confidence)
+        assert restored.class_names == dets.class_names
+
+    def test_to_records_matches_legacy_dict_format(self):
+        """Records have the keys the old pipeline dicts had."""
+        records = _sample().to_records(session_id=7)
+
+        assert records[0] == {
+            "session_id": 7,
+            "center_x_px": 30.0,
+            "center_y_px": 50.0,
+            "width_px": 40.0,
+            "height_px": 60.0,
+            "confidence": 0.9,
+            "class_name": "plant",
+        }
+
+    def test_to_db_rows_uses_integer_sizes(self):
+        """DB rows round sizes and derive bbox from center and int size."""
+        from app.services.ml_processing.detection_array import DetectionArray
+
+        dets = DetectionArray.from_xyxy([[10.0, 20.0, 25.5, 31.9]], [0.87654], [0])
+
+        (row,) = dets.to_db_rows(session_id=1, stock_movement_id=2, classification_id=3)
+
+        assert row["width_px"] == 16
+        assert row["height_px"] == 12
+        assert row["center_x_px"] == pytest.approx(17.75)
+        assert row["bbox_coordinates"]["x1"] == pytest.approx(17.75 - 8)
+        assert row["detection_confidence"] == pytest.approx(0.8765)
+        assert row["stock_movement_id"] == 2
+        assert row["is_alive"] is True
+
+    def test_to_db_rows_keeps_sub_pixel_sizes_non_zero(self):
+        """Sub-pixel widths/heights are stored as 1px, not 0."""
+        from app.services.ml_processing.detection_array import DetectionArray
+
+        dets = DetectionArray.from_xyxy([[10.0, 20.0, 10.4, 20.6]], [0.5], [0])
+
+        (row,) = dets.to_db_rows(session_id=1)
+
+        assert (row["width_px"], row["height_px"]) == (1, 1)
+        assert row["bbox_coordinates"]["x2"] - row["bbox_coordinates"]["x1"] == pytest.approx(1)
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _sample():
+    """Three detections, two classes."""
+    from app.services.ml_processing.detection_array import DetectionArray
+
+    return DetectionArray.from_xyxy(
+        [[10, 20, 50, 80], [100, 100, 120, 110], [190, 290, 210, 310]],
+        [0.9, 0.4, 0.7],
+        [0, 0, 1],
+        {0: "plant", 1: "suculenta"},
+    )
@@ -0,0 +1,180 @@
+"""Unit tests for the incremental re-count (previous session of a location).
+
+This module tests:
+- Registration: the camera offset between two shots of the same bench
+- Change scoring: exposure changes are ignored, emptied containers are not
+- plan_recount: reuse/re-detect decision per segment, stale detections,
+  fallback to a full run when the photos cannot be aligned
+- MLPipelineCoordinator: segmentation skipped, SAHI only on changed segments
+
+Architecture:
+    - Layer: Services / ML Processing
+    - Dependencies: OpenCV, NumPy (models mocked)
+"""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import cv2
+import numpy as np
+import pytest
+
+from app.services.ml_processing.detection_array import DetectionArray
+from app.services.ml_processing.incremental_recount import build_recount_prior, plan_recount
+
+WIDTH, HEIGHT = 2000, 1500
+NOW = datetime(2026, 10, 18, tzinfo=UTC)
+
+# Left container (top-left) stays, right container (bottom-right) is emptied
+SEGMENTS = [
+    {
+        "bbox": {"x1": 0.05, "y1": 0.05, "x2": 0.45, "y2": 0.45},
+        "detected_at": "2026-10-11T08:00:00",
+    },
+    {
+        "bbox": {"x1": 0.55, "y1": 0.55, "x2": 0.95, "y2": 0.92},
+        "detected_at": "2026-10-11T08:00:00",
+    },
+]
+DETECTIONS = [(100.0, 100.0, 20.0, 20.0, 0.9), (1500.0, 1000.0, 20.0, 20.0, 0.8)]
+
+
+@pytest.fixture(scope="module")
+def bench():
+    """Larger-than-frame synthetic bench: plants on soil."""
+    rng = np.random.default_rng(0)
+    image = np.full((HEIGHT + 100, WIDTH + 100, 3), (40, 70, 90), np.uint8)
+    for _ in range(3000):
+        x, y = rng.integers(0, WIDTH + 100, size=2)
+        cv2.circle(
+            image,
+            (int(x), int(y)),
+            int(rng.integers(8, 25)),
+            (40, int(rng.integers(120, 220)), 60),
+            -1,
+        )
+    return image
+
+
+def _shot(bench, shift_x: int = 0, shift_y: int = 0, gain: float = 1.0) -> np.ndarray:
+    """Frame of the bench with the camera moved (content moves by +shift)."""
+    top, left = 50 - shift_y, 50 - shift_x
+    frame = bench[top : top + HEIGHT, left : left + WIDTH].copy()
+    return cv2.convertScaleAbs(frame, alpha=gain, beta=0)
+
+
+def _reduced_gray(frame: np.ndarray) -> np.ndarray:
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    return cv2.resize(gray, (WIDTH // 4, HEIGHT // 4), interpolation=cv2.INTER_AREA)
+
+
+def _corners(segment) -> list[list[float]]:
+    bbox = segment["bbox"]
+    if len(bbox) < 4:
+        return []
+    return [
+        [bbox["x1"], bbox["y1"]],
+        [bbox["x2"], bbox["y1"]],
+        [bbox["x2"], bbox["y2"]],
+        [bbox["x1"], bbox["y2"]],
+    ]
+
+
+def _prior(bench, segments=SEGMENTS):
+    thumbnail = cv2.resize(_shot(bench), (300, 225), interpolation=cv2.INTER_AREA)
+    return build_recount_prior(
+        session_id=7,
+        image_size=(WIDTH, HEIGHT),
+        reference_bytes=cv2.imencode(".jpg", thumbnail)[1].tobytes(),
+        bins_metadata=[
+            {"container_type": "segment", "confidence": 0.9, "segmentation_mask": _corners(s), **s}
+            for s in segments
+        ],
+        detection_rows=DETECTIONS,
+    )
+
+
+class TestPlanRecount:
+    """Test registration and the per-segment reuse decision."""
+
+    def test_unchanged_segment_reused_changed_one_redetected(self, bench):
+        current = _shot(bench, shift_x=20, shift_y=-15, gain=1.15)
+        cv2.rectangle(current, (1100, 800), (1900, 1400), (40, 70, 90), -1)
+
+        plan = plan_recount(_prior(bench), _reduced_gray(current), now=NOW)
+
+        assert plan.registration.dx == pytest.approx(0.01, abs=0.002)
+        assert plan.registration.dy == pytest.approx(-0.01, abs=0.004)
+        assert plan.changed == [False, True]
+        assert plan.segments_reused == 1
+        assert plan.segments[0].bbox[0] == pytest.approx(0.06, abs=0.002)
+        assert plan.segments[0].detected_at == "2026-10-11T08:00:00"
+        assert plan.segments[1].detected_at is None
+
+    def test_reused_detections_follow_the_camera(self, bench):
+        plan = plan_recount(_prior(bench), _reduced_gray(_shot(bench, shift_x=20)), now=NOW)
+
+        reused = plan.reused_detections(0, WIDTH, HEIGHT)
+
+        assert len(reused) == 1  # Only the detection inside the segment
+        assert reused.center_x[0] == pytest.approx(120.0, abs=4.0)
+        assert reused.center_y[0] == pytest.approx(100.0, abs=4.0)
+
+    def test_stale_detections_are_redetected(self, bench):
+        stale = [{**s, "detected_at": "2026-08-01T08:00:00"} for s in SEGMENTS]
+
+        plan = plan_recount(_prior(bench, stale), _reduced_gray(_shot(bench)), now=NOW)
+
+        assert plan.changed == [True, True]
+
+    def test_unrelated_photo_falls_back_to_full_run(self, bench):
+        other = np.ascontiguousarray(_shot(bench)[::-1, ::-1])
+
+        assert plan_recount(_prior(bench), _reduced_gray(other), now=NOW) is None
+
+    def test_different_geometry_falls_back_to_full_run(self, bench):
+        portrait = np.ascontiguousarray(_reduced_gray(_shot(bench)).T)
+
+        assert plan_recount(_prior(bench), portrait, now=NOW) is None
+
+    def test_incomplete_layout_has_no_prior(self, bench):
+        assert _prior(bench, [{"bbox": {"x1": 0.1}}]) is None
+
+
+class TestCoordinatorRecount:
+    """Test the pipeline with a recount prior."""
+
+    @pytest.mark.asyncio
+    async def test_only_changed_segments_are_detected(self, bench, tmp_path):
+        from app.services.ml_processing.pipeline_coordinator import MLPipelineCoordinator
+
+        current = _shot(bench)
+        cv2.rectangle(current, (1100, 800), (1900, 1400), (40, 70, 90), -1)
+        image_path = tmp_path / "bench.jpg"
+        cv2.imwrite(str(image_path), current)
+
+        segmentation = AsyncMock()
+        sahi = AsyncMock()
+        sahi.detect_in_segmento.return_value = DetectionArray.empty()
+        band_estimation = AsyncMock()
+        band_estimation.estimate_undetected_plants.return_value = []
+        coordinator = MLPipelineCoordinator(segmentation, sahi, band_estimation, MagicMock())
+
+        with patch(
+            "app.services.ml_processing.incremental_recount.datetime", wraps=datetime
+        ) as mock_datetime:
+            mock_datetime.now.return_value = NOW
+            result = await coordinator.process_complete_pipeline(
+                session_id=8,
+                image_path=image_path,
+                plant_area_profile=[900.0, None, None, None],
+                recount_prior=_prior(bench),
+            )
+
+        segmentation.segment_image.assert_not_called()
+        sahi.detect_in_segmento.assert_called_once()  # Right container only
+        assert result.segments_processed == 2
+        assert result.segments_reused == 1
+        assert result.total_detected == 1  # Reused detection of the left container
+        estimate_kwargs = band_estimation.estimate_undetected_plants.call_args.kwargs
+        assert estimate_kwargs["prior_plant_areas"] == [900.0, None, None, None]
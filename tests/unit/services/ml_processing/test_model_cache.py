@@ -466,6 +466,71 @@ class TestModelCacheErrorHandling:
         assert "detect" in det_path.lower(), "Detect path should contain 'detect'"
 
 
+class TestModelCacheBackends:
+    """Test backend selection (torch, onnx, openvino, torchscript)."""
+
+    def setup_method(self):
+        """Clear cache before each test."""
+        from app.services.ml_processing.model_cache import ModelCache
+
+        ModelCache._instances.clear()
+        ModelCache._lock = threading.Lock()
+
+    def test_default_backend_is_torch(self):
+        """Default configuration keeps loading .pt weights."""
+        from app.services.ml_processing.model_cache import ModelCache
+
+        assert ModelCache.get_backend("segment") == "torch"
+        assert ModelCache.get_backend("detect") == "torch"
+
+    def test_invalid_backend_raises_error(self):
+        """Unknown backend names are rejected with ValueError."""
+        from app.services.ml_processing.model_cache import ModelCache
+
+        with patch("app.services.ml_processing.model_cache.settings") as mock_settings:
+            mock_settings.ML_DETECT_BACKEND = "tensorrt"
+
+            with pytest.raises(ValueError, match="Invalid backend"):
+                ModelCache.get_backend("detect")
+
+    def test_artifact_paths_per_backend(self):
+        """Each backend resolves to its exported artifact name."""
+        from app.services.ml_processing.model_cache import ModelCache
+
+        assert ModelCache._get_model_path("detect", "onnx").endswith("detect.onnx")
+        assert ModelCache._get_model_path("detect", "openvino").endswith("detect_openvino_model")
+        assert ModelCache._get_model_path("segment", "torchscript").endswith("segment.torchscript")
+
+    def test_exported_backend_skips_to_and_fuse(self, mock_yolo, tmp_path):
+        """Exported graphs are loaded with explicit task, without .to()/.fuse()."""
+        from app.services.ml_processing.model_cache import ModelCache
+
+        (tmp_path / "detect.onnx").write_bytes(b"onnx")
+
+        with patch("app.services.ml_processing.model_cache.settings") as mock_settings:
+            mock_settings.ML_CHECKPOINTS_DIR = str(tmp_path)
+            mock_settings.ML_DETECT_BACKEND = "onnx"
+
+            model = ModelCache.get_model("detect", worker_id=0)
+
+        mock_yolo.assert_called_once_with(str(tmp_path / "detect.onnx"), task="detect")
+        model.to.assert_not_called()
+        model.fuse.assert_not_called()
+
+    def test_missing_exported_artifact_raises(self, mock_yolo, tmp_path):
+        """Missing export gives an actionable FileNotFoundError."""
+        from app.services.ml_processing.model_cache import ModelCache
+
+        with patch("app.services.ml_processing.model_cache.settings") as mock_settings:
+            mock_settings.ML_CHECKPOINTS_DIR = str(tmp_path)
+            mock_settings.ML_SEGMENT_BACKEND = "openvino"
+
+            with pytest.raises(FileNotFoundError, match="model_export"):
+                ModelCache.get_model("segment", worker_id=0)
+
+        assert mock_yolo.call_count == 0
+
+
 # =============================================================================
 # Pytest Fixtures
 # =============================================================================
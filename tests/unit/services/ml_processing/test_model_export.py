@@ -0,0 +1,119 @@
+"""Unit tests for backend export parity checks.
+
+Tests the box matching used to compare exported backends (ONNX, OpenVINO,
+TorchScript) against the .pt reference model, and the ParityReport
+acceptance thresholds, and the CLI flag handling.
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+
+class TestMatchPredictions:
+    """Test greedy IoU matching between reference and exported predictions."""
+
+    def test_identical_predictions_fully_matched(self):
+        """Identical boxes match 1:1 with zero confidence drift."""
+        from app.services.ml_processing.model_export import match_predictions
+
+        boxes = np.array([[0, 0, 10, 10], [20, 20, 40, 40]], dtype=float)
+        cls = np.array([0, 0])
+        conf = np.array([0.9, 0.8])
+
+        matched, deltas = match_predictions(boxes, cls, conf, boxes, cls, conf)
+
+        assert matched == 2
+        assert deltas == [0.0, 0.0]
+
+    def test_class_mismatch_not_matched(self):
+        """Boxes of a different class never count as reproduced."""
+        from app.services.ml_processing.model_export import match_predictions
+
+        boxes = np.array([[0, 0, 10, 10]], dtype=float)
+
+        matched, _ = match_predictions(
+            boxes, np.array([0]), np.array([0.9]), boxes, np.array([1]), np.array([0.9])
+        )
+
+        assert matched == 0
+
+    def test_candidate_used_only_once(self):
+        """Two reference boxes cannot both match the same candidate."""
+        from app.services.ml_processing.model_export import match_predictions
+
+        ref = np.array([[0, 0, 10, 10], [0, 0, 10, 11]], dtype=float)
+        cand = np.array([[0, 0, 10, 10]], dtype=float)
+
+        matched, _ = match_predictions(
+            ref, np.array([0, 0]), np.array([0.9, 0.8]), cand, np.array([0]), np.array([0.9])
+        )
+
+        assert matched == 1
+
+    def test_low_iou_not_matched(self):
+        """Boxes overlapping less than the IoU threshold are not matched."""
+        from app.services.ml_processing.model_export import match_predictions
+
+        ref = np.array([[0, 0, 10, 10]], dtype=float)
+        cand = np.array([[8, 8, 18, 18]], dtype=float)
+
+        matched, _ = match_predictions(
+            ref, np.array([0]), np.array([0.9]), cand, np.array([0]), np.array([0.9])
+        )
+
+        assert matched == 0
+
+
+class TestParityReport:
+    """Test ParityReport acceptance thresholds."""
+
+    def test_passed_when_recall_and_counts_close(self):
+        from app.services.ml_processing.model_export import ParityReport
+
+        report = ParityReport(
+            backend="onnx", reference_boxes=1000, candidate_boxes=1010, matched_boxes=985
+        )
+
+        assert report.recall == pytest.approx(0.985)
+        assert report.passed()
+
+    def test_failed_when_recall_low(self):
+        from app.services.ml_processing.model_export import ParityReport
+
+        report = ParityReport(
+            backend="openvino", reference_boxes=1000, candidate_boxes=1000, matched_boxes=900
+        )
+
+        assert not report.passed()
+
+    def test_empty_reference_counts_as_perfect(self):
+        from app.services.ml_processing.model_export import ParityReport
+
+        report = ParityReport(backend="torchscript")
+
+        assert report.recall == 1.0
+        assert report.passed()
+
+
+class TestMain:
+    """Test CLI precision flags."""
+
+    @pytest.mark.parametrize(
+        ("flags", "half", "int8"),
+        [
+            ([], None, None),
+            (["--half", "--int8"], True, True),
+            (["--no-half", "--no-int8"], False, False),
+        ],
+    )
+    def test_precision_flags_default_to_settings(self, flags, half, int8):
+        from app.services.ml_processing import model_export
+
+        with patch.object(model_export, "export_model") as export:
+            code = model_export.main(["--model-type", "detect", "--backend", "onnx", *flags])
+
+        assert code == 0
+        assert export.call_args.kwargs["half"] is half
+        assert export.call_args.kwargs["int8"] is int8
@@ -0,0 +1,228 @@
+"""Unit tests for SlicePlanner - resolution-adaptive SAHI tiling.
+
+This module tests:
+- SlicePlan validation
+- Plan derivation from expected plant size (downscale, overlap bounds)
+- Per-band plant area profile from previous session detections
+- Expected plant area lookup for a segment's vertical span
+
+Architecture:
+    - Layer: Services / ML Processing
+    - Dependencies: NumPy (no SAHI/torch required)
+"""
+
+import pytest
+
+# =============================================================================
+# Test Classes - SlicePlan
+# =============================================================================
+
+
+class TestSlicePlan:
+    """Test SlicePlan dataclass validation."""
+
+    def test_defaults_match_legacy_slicing(self):
+        """Default plan is the previous fixed 512px / 25% / full resolution."""
+        from app.services.ml_processing.slice_planner import SlicePlan
+
+        plan = SlicePlan()
+
+        assert plan.slice_size == 512
+        assert plan.overlap_ratio == 0.25
+        assert plan.scale == 1.0
+        assert plan.model_slice_size == 512
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"slice_size": 0},
+            {"overlap_ratio": 1.0},
+            {"overlap_ratio": -0.1},
+            {"scale": 0.0},
+            {"scale": 1.5},
+        ],
+    )
+    def test_invalid_fields_raise(self, kwargs):
+        """Out-of-range fields raise ValueError."""
+        from app.services.ml_processing.slice_planner import SlicePlan
+
+        with pytest.raises(ValueError):
+            SlicePlan(**kwargs)
+
+
+# =============================================================================
+# Test Classes - SlicePlanner
+# =============================================================================
+
+
+class TestSlicePlanner:
+    """Test SlicePlanner.plan() decisions."""
+
+    def setup_method(self):
+        """Planner with explicit configuration (independent of settings)."""
+        from app.services.ml_processing.slice_planner import SlicePlanner
+
+        self.planner = SlicePlanner(
+            enabled=True,
+            base_slice_px=512,
+            target_object_px=48.0,
+            min_scale=0.25,
+            min_overlap=0.1,
+            max_overlap=0.4,
+        )
+
+    def test_unknown_size_uses_default_plan(self):
+        """No history → legacy 512px / 25% / scale 1.0."""
+        plan = self.planner.plan(None)
+
+        assert (plan.slice_size, plan.overlap_ratio, plan.scale) == (512, 0.25, 1.0)
+
+    def test_large_plants_are_downscaled(self):
+        """150px plants → scale 0.32, tiles cover 1600px of the crop."""
+        plan = self.planner.plan(150.0 * 150.0)
+
+        assert plan.scale == pytest.approx(0.32)
+        assert plan.slice_size == 1600
+        assert plan.model_slice_size == 512
+        assert plan.overlap_ratio == pytest.approx(180.0 / 1600.0)
+
+    def test_small_plants_are_never_upscaled(self):
+        """Plants smaller than the target keep full resolution."""
+        plan = self.planner.plan(20.0 * 20.0)
+
+        assert plan.scale == 1.0
+        assert plan.slice_size == 512
+        assert plan.overlap_ratio == pytest.approx(0.1)  # Clamped to min_overlap
+
+    def test_scale_clamped_to_min_scale(self):
+        """Huge plants never downscale beyond min_scale."""
+        plan = self.planner.plan(1000.0 * 1000.0)
+
+        assert plan.scale == 0.25
+        assert plan.slice_size == 2048
+        assert plan.overlap_ratio == 0.4  # Clamped to max_overlap
+
+    def test_large_plants_reduce_tile_count(self):
+        """Close-up plants need far fewer tiles for the same crop."""
+        import math
+
+        def tile_count(size: int, plan) -> int:
+            step = plan.slice_size * (1 - plan.overlap_ratio)
+            per_axis = max(1, math.ceil((size - plan.slice_size) / step) + 1)
+            return per_axis * per_axis
+
+        default = tile_count(3000, self.planner.plan(None))
+        adaptive = tile_count(3000, self.planner.plan(120.0 * 120.0))
+
+        assert adaptive <= default / 2
+
+    def test_disabled_planner_uses_default_plan(self):
+        """Disabled planner ignores plant size."""
+        from app.services.ml_processing.slice_planner import SlicePlanner
+
+        planner = SlicePlanner(enabled=False, base_slice_px=512)
+
+        assert planner.plan(150.0 * 150.0).scale == 1.0
+
+
+# =============================================================================
+# Test Classes - Profile helpers
+# =============================================================================
+
+
+class TestPlantAreaProfile:
+    """Test plant_area_profile() and expected_plant_area()."""
+
+    def test_profile_median_per_band(self):
+        """Each band gets the median area of its detections."""
+        from app.services.ml_processing.slice_planner import plant_area_profile
+
+        # 12 detections per band, band k has plants of side 20 * (k + 1)
+        detections = [
+            (band * 250 + 100, 20.0 * (band + 1), 20.0 * (band + 1))
+            for band in range(4)
+            for _ in range(12)
+        ]
+
+        profile = plant_area_profile(detections, image_height=1000)
+
+        assert profile == [400.0, 1600.0, 3600.0, 6400.0]
+
+    def test_profile_sparse_band_is_none(self):
+        """Bands below min_samples are uncalibrated."""
+        from app.services.ml_processing.slice_planner import plant_area_profile
+
+        detections = [(100.0, 30.0, 30.0)] * 12 + [(900.0, 50.0, 50.0)] * 3
+
+        profile = plant_area_profile(detections, image_height=1000)
+
+        assert profile == [900.0, None, None, None]
+
+    def test_profile_empty(self):
+        """No detections → all bands uncalibrated."""
+        from app.services.ml_processing.slice_planner import plant_area_profile
+
+        assert plant_area_profile([], image_height=1000) == [None] * 4
+
+    def test_expected_area_uses_smallest_overlapping_band(self):
+        """Segment spanning bands 2-3 uses band 2 (smaller, farther plants)."""
+        from app.services.ml_processing.slice_planner import expected_plant_area
+
+        profile = [400.0, 1600.0, 3600.0, 6400.0]
+
+        assert expected_plant_area(profile, 0.30, 0.70) == 1600.0
+        assert expected_plant_area(profile, 0.80, 1.00) == 6400.0
+
+    def test_expected_area_without_history(self):
+        """Missing profile or uncalibrated bands → None."""
+        from app.services.ml_processing.slice_planner import expected_plant_area
+
+        assert expected_plant_area(None, 0.0, 1.0) is None
+        assert expected_plant_area([None, None, 900.0, None], 0.0, 0.4) is None
+
+
+# =============================================================================
+# Test Classes - SAHIDetectionService with a plan
+# =============================================================================
+
+
+class TestSAHIWithSlicePlan:
+    """Test that a plan's enlarged tile does not bypass tiling for medium crops."""
+
+    @pytest.mark.asyncio
+    async def test_crop_smaller_than_planned_tile_is_still_sliced(self, tmp_path):
+        """A 900×700 crop under a 1600px plan runs one downscaled, filtered tile."""
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        import cv2
+        import numpy as np
+
+        from app.services.ml_processing import sahi_detection_service as sahi_module
+        from app.services.ml_processing.slice_planner import SlicePlan
+        from app.services.ml_processing.tile_filter import TileFilterStats
+
+        def slice_bboxes(image_height, image_width, slice_height, slice_width, **kwargs):
+            return [[0, 0, min(image_width, slice_width), min(image_height, slice_height)]]
+
+        image_path = tmp_path / "segment.jpg"
+        cv2.imwrite(str(image_path), np.full((700, 900, 3), 120, np.uint8))
+        tile_filter = MagicMock()
+        tile_filter.select_tiles.return_value = ([True], TileFilterStats(total=1, processed=1))
+        service = sahi_module.SAHIDetectionService(worker_id=0, tile_filter=tile_filter)
+        service._model = MagicMock()
+        prediction = MagicMock(object_prediction_list=[])
+
+        with (
+            patch.object(service, "_direct_detection_fallback", AsyncMock()) as fallback,
+            patch.object(sahi_module, "AutoDetectionModel", MagicMock()),
+            patch.object(sahi_module, "get_slice_bboxes", side_effect=slice_bboxes),
+            patch.object(sahi_module, "get_prediction", return_value=prediction) as predict,
+        ):
+            await service.detect_in_segmento(
+                image_path,
+                slice_plan=SlicePlan(slice_size=1600, overlap_ratio=0.1, scale=0.32),
+            )
+
+        fallback.assert_not_called()
+        tile_filter.select_tiles.assert_called_once()
+        assert predict.call_args.args[0].shape[:2] == (224, 288)  # Downscaled by 0.32
@@ -0,0 +1,135 @@
+"""Unit tests for TileFilter - SAHI tile pre-filter.
+
+This module tests the tile pre-filter for:
+- Skipping tiles outside the segment polygon mask
+- Skipping tiles without plausible vegetation (ExG + soil rule)
+- Keeping tiles with sparse vegetation (permissive thresholds)
+- Disabled filter passthrough
+- TileFilterStats accounting
+
+Architecture:
+    - Layer: Services / ML Processing
+    - Dependencies: OpenCV, NumPy (no SAHI/torch required)
+"""
+
+import numpy as np  # type: ignore[import-not-found]
+import pytest
+
+# =============================================================================
+# Test Classes - TileFilter
+# =============================================================================
+
+
+class TestTileFilterSelectTiles:
+    """Test TileFilter.select_tiles() keep/skip decisions."""
+
+    def test_keeps_green_tiles_and_skips_soil_tiles(self, half_green_image, tile_grid):
+        """Green half is kept, dark-soil half is skipped as background."""
+        from app.services.ml_processing.tile_filter import TileFilter
+
+        tile_filter = TileFilter(
+            enabled=True,
+            min_mask_coverage=0.02,
+            min_vegetation_ratio=0.01,
+            exg_threshold=0.05,
+            downscale=8,
+        )
+
+        keep, stats = tile_filter.select_tiles(half_green_image, tile_grid)
+
+        # Tiles are 256px wide on a 1024px image: left two columns are green
+        expected = np.array([box[0] < 512 for box in tile_grid])
+        np.testing.assert_array_equal(keep, expected)
+        assert stats.total == len(tile_grid)
+        assert stats.processed == int(expected.sum())
+        assert stats.skipped_background == len(tile_grid) - int(expected.sum())
+        assert stats.skipped_mask == 0
+
+    def test_skips_tiles_outside_segment_mask(self, green_image, tile_grid):
+        """Tiles entirely outside the polygon mask are skipped even if green."""
+        from app.services.ml_processing.tile_filter import TileFilter
+
+        tile_filter = TileFilter(
+            enabled=True,
+            min_mask_coverage=0.02,
+            min_vegetation_ratio=0.01,
+            exg_threshold=0.05,
+            downscale=8,
+        )
+
+        mask = np.zeros(green_image.shape[:2], dtype=np.uint8)
+        mask[:512, :] = 255  # Top half inside the container
+
+        keep, stats = tile_filter.select_tiles(green_image, tile_grid, segment_mask=mask)
+
+        expected = np.array([box[1] < 512 for box in tile_grid])
+        np.testing.assert_array_equal(keep, expected)
+        assert stats.skipped_mask == len(tile_grid) - int(expected.sum())
+        assert stats.skipped_background == 0
+        assert stats.skipped == stats.skipped_mask
+
+    def test_keeps_tile_with_sparse_vegetation(self, tile_grid):
+        """A single small plant in an otherwise soil tile keeps the tile."""
+        from app.services.ml_processing.tile_filter import TileFilter
+
+        image = np.full((1024, 1024, 3), (20, 25, 30), dtype=np.uint8)  # Dark soil (BGR)
+        image[100:140, 100:140] = (40, 180, 60)  # One 40px plant in tile (0, 0)
+
+        tile_filter = TileFilter(
+            enabled=True,
+            min_mask_coverage=0.02,
+            min_vegetation_ratio=0.005,
+            exg_threshold=0.05,
+            downscale=8,
+        )
+
+        keep, stats = tile_filter.select_tiles(image, tile_grid)
+
+        assert keep[0]
+        assert stats.processed == 1
+
+    def test_disabled_filter_keeps_all_tiles(self, half_green_image, tile_grid):
+        """Disabled filter is a passthrough."""
+        from app.services.ml_processing.tile_filter import TileFilter
+
+        tile_filter = TileFilter(enabled=False, downscale=8)
+
+        keep, stats = tile_filter.select_tiles(half_green_image, tile_grid)
+
+        assert keep.all()
+        assert stats.processed == stats.total == len(tile_grid)
+        assert stats.skipped == 0
+
+    def test_empty_tile_list(self, green_image):
+        """No tiles planned returns empty keep mask."""
+        from app.services.ml_processing.tile_filter import TileFilter
+
+        keep, stats = TileFilter(enabled=True, downscale=8).select_tiles(green_image, [])
+
+        assert keep.shape == (0,)
+        assert stats.total == 0
+
+
+# =============================================================================
+# Pytest Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def tile_grid():
+    """4x4 grid of 256px tiles covering a 1024x1024 image."""
+    return [[x, y, x + 256, y + 256] for y in range(0, 1024, 256) for x in range(0, 1024, 256)]
+
+
+@pytest.fixture
+def green_image():
+    """1024x1024 BGR image fully covered by foliage green."""
+    return np.full((1024, 1024, 3), (40, 180, 60), dtype=np.uint8)
+
+
+@pytest.fixture
+def half_green_image():
+    """1024x1024 BGR image: left half foliage, right half dark soil."""
+    image = np.full((1024, 1024, 3), (20, 25, 30), dtype=np.uint8)
+    image[:, :512] = (40, 180, 60)
+    return image
@@ -0,0 +1,201 @@
+"""Unit tests for VisualizationRenderer - vectorized overlay + Deep Zoom output.
+
+This module tests:
+- Vectorized disk rasterization (matches per-disk reference)
+- Detection blending only touches detection pixels
+- Estimation polygons blend inside their region only
+- Preview/thumbnail downscaling and Deep Zoom tile pyramid layout
+
+Architecture:
+    - Layer: Services / ML Processing
+    - Dependencies: OpenCV, NumPy, Pillow (no SAHI/torch required)
+"""
+
+import math
+
+import numpy as np  # type: ignore[import-not-found]
+import pytest
+
+# =============================================================================
+# Test Classes - Rasterization
+# =============================================================================
+
+
+class TestRasterizeDisks:
+    """Test rasterize_disks() against a per-disk reference."""
+
+    def test_matches_per_disk_reference(self):
+        """Same pixels as testing each disk independently."""
+        from app.services.ml_processing.visualization_renderer import rasterize_disks
+
+        rng = np.random.default_rng(0)
+        cx = rng.integers(-10, 210, 200)
+        cy = rng.integers(-10, 110, 200)
+        radii = rng.integers(0, 12, 200)
+
+        mask = rasterize_disks((100, 200), cx, cy, radii)
+
+        yy, xx = np.mgrid[0:100, 0:200]
+        expected = np.zeros((100, 200), dtype=bool)
+        for x, y, r in zip(cx, cy, radii, strict=True):
+            expected |= (xx - x) ** 2 + (yy - y) ** 2 <= r * r
+
+        np.testing.assert_array_equal(mask, expected)
+
+    def test_empty_input(self):
+        """No disks → empty mask."""
+        from app.services.ml_processing.visualization_renderer import rasterize_disks
+
+        empty = np.empty(0, dtype=np.int32)
+
+        assert not rasterize_disks((10, 10), empty, empty, empty).any()
+
+
+# =============================================================================
+# Test Classes - Rendering
+# =============================================================================
+
+
+class TestVisualizationRendererRender:
+    """Test VisualizationRenderer.render() blending."""
+
+    def test_detections_blend_only_inside_disks(self, renderer, gray_image):
+        """Pixels inside a detection move toward cyan; others are untouched."""
+        from app.services.ml_processing.detection_array import DetectionArray
+
+        dets = DetectionArray.from_xyxy([[40, 40, 80, 80]], [0.9], [0])
+        original = gray_image.copy()
+
+        renderer.render(gray_image, dets)
+
+        # Radius = 40 * 0.75 / 2 = 15 around (60, 60)
+        np.testing.assert_array_equal(gray_image[60, 60], [166, 166, 90])  # == cv2.addWeighted
+        np.testing.assert_array_equal(gray_image[60, 90], original[60, 90])
+        assert (gray_image != original).any(axis=2).sum() == pytest.approx(
+            math.pi * 15**2, rel=0.05
+        )
+
+    def test_estimation_polygon_blends_inside_region(self, renderer, gray_image):
+        """Polygon interior is tinted blue; far pixels are untouched."""
+        from app.services.ml_processing.detection_array import DetectionArray
+
+        original = gray_image.copy()
+        estimations = [
+            {"vegetation_polygon": {"coordinates": [[10, 10], [50, 10], [50, 50], [10, 50]]}}
+        ]
+
+        renderer.render(gray_image, DetectionArray.empty(), estimations)
+
+        assert gray_image[30, 30, 0] > original[30, 30, 0]  # Blue channel up
+        assert gray_image[30, 30, 2] < original[30, 30, 2]  # Red channel down
+        np.testing.assert_array_equal(gray_image[150, 150], original[150, 150])
+
+
+# =============================================================================
+# Test Classes - Encoding
+# =============================================================================
+
+
+class TestVisualizationRendererEncode:
+    """Test preview + Deep Zoom encoding."""
+
+    def test_preview_is_downscaled(self, renderer):
+        """Preview longest side is capped at preview_max_px."""
+        import io
+
+        from PIL import Image
+
+        image = np.zeros((300, 600, 3), dtype=np.uint8)
+
+        output = renderer.encode(image)
+
+        with Image.open(io.BytesIO(output.preview)) as preview:
+            assert max(preview.size) == 128
+        assert (output.width, output.height) == (600, 300)
+
+    def test_thumbnail_from_in_memory_preview(self, renderer):
+        """JPEG thumbnail capped at thumbnail_px; 0 disables it."""
+        import io
+
+        from PIL import Image
+
+        from app.services.ml_processing.visualization_renderer import VisualizationRenderer
+
+        image = np.zeros((300, 600, 3), dtype=np.uint8)
+
+        output = renderer.encode(image)
+
+        with Image.open(io.BytesIO(output.thumbnail)) as thumbnail:
+            assert thumbnail.format == "JPEG"
+            assert thumbnail.size == (32, 16)
+        disabled = VisualizationRenderer(preview_max_px=64, tiles_enabled=False, thumbnail_px=0)
+        assert disabled.encode(image).thumbnail is None
+
+    def test_deep_zoom_pyramid_layout(self, renderer):
+        """Every level from 1×1 to full resolution has its tile grid."""
+        from app.services.ml_processing.visualization_renderer import deep_zoom_max_level
+
+        image = np.zeros((300, 600, 3), dtype=np.uint8)
+
+        output = renderer.encode(image)
+
+        max_level = deep_zoom_max_level(600, 300)
+        assert max_level == 10
+        assert "10/9_4.jpg" in output.tiles  # ceil(600/64)=10 cols, ceil(300/64)=5 rows
+        assert "0/0_0.jpg" in output.tiles
+        assert 'TileSize="64"' in output.dzi
+        assert 'Width="600" Height="300"' in output.dzi
+
+        expected = 0
+        w, h = 600, 300
+        for _ in range(max_level, -1, -1):
+            expected += math.ceil(w / 64) * math.ceil(h / 64)
+            w, h = max(1, math.ceil(w / 2)), max(1, math.ceil(h / 2))
+        assert len(output.tiles) == expected
+
+    def test_tiles_disabled(self):
+        """Disabled tiles → preview only."""
+        from app.services.ml_processing.visualization_renderer import VisualizationRenderer
+
+        output = VisualizationRenderer(preview_max_px=64, tiles_enabled=False).encode(
+            np.zeros((100, 100, 3), dtype=np.uint8)
+        )
+
+        assert output.tiles == {}
+        assert output.dzi is None
+
+    def test_invalid_tile_format_raises(self):
+        """Unknown tile format raises ValueError."""
+        from app.services.ml_processing.visualization_renderer import VisualizationRenderer
+
+        with pytest.raises(ValueError, match="tile_format"):
+            VisualizationRenderer(tile_format="tiff")
+
+
+# =============================================================================
+# Pytest Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def renderer():
+    """Small preview/tiles so tests stay fast."""
+    from app.services.ml_processing.visualization_renderer import VisualizationRenderer
+
+    return VisualizationRenderer(
+        preview_max_px=128,
+        preview_quality=60,
+        preview_speed=10,
+        tiles_enabled=True,
+        tile_size=64,
+        tile_overlap=1,
+        tile_format="jpeg",
+        tile_quality=70,
+        thumbnail_px=32,
+    )
+
+
+@pytest.fixture
+def gray_image():
+    """200x200 mid-gray BGR image."""
+    return np.full((200, 200, 3), 128, dtype=np.uint8)
@@ -0,0 +1,215 @@
+"""Unit tests for DetectionService viewport queries (detection viewer).
+
+Tests business logic with mocked repository dependencies.
+No database access - uses AsyncMock for DetectionRepository.
+
+Test categories:
+- points: zoomed in, columnar conversion, dense viewports fall back to
+  clusters whose count stays within the point limit
+- clusters: zoomed out, cell size per zoom level
+- viewport validation: partial and empty rectangles
+- binary encoding: column layout
+
+See:
+    - Service: app/services/photo/detection_service.py
+    - Repository: app/repositories/detection_repository.py
+    - Migration: alembic/versions/e5f6a7b8c9d0_add_center_geom_to_detections.py
+"""
+
+from array import array
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.core.exceptions import ValidationException
+from app.repositories.detection_repository import DetectionRepository
+from app.services.photo.detection_service import DetectionService
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+def point_row(id: int, empty: bool = False) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=id,
+        center_x_px=Decimal("10.50") * id,
+        center_y_px=Decimal("20.25"),
+        width_px=30,
+        height_px=40,
+        detection_confidence=Decimal("0.9100"),
+        classification_id=None if empty else 7,
+        is_empty_container=empty,
+        is_alive=not empty,
+    )
+
+
+def cluster_row(count: int, empty: int = 0) -> SimpleNamespace:
+    return SimpleNamespace(
+        x=Decimal("100.0"), y=Decimal("200.0"), count=count, empty_container_count=empty
+    )
+
+
+@pytest.fixture
+def mock_repo():
+    """Create mock DetectionRepository for testing."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def detection_service(mock_repo):
+    """Create DetectionService with mocked repository."""
+    return DetectionService(repo=mock_repo)
+
+
+@pytest.fixture(autouse=True)
+def viewer_settings():
+    with (
+        patch("app.services.photo.detection_service.settings.DETECTION_POINTS_MIN_ZOOM", -2),
+        patch("app.services.photo.detection_service.settings.DETECTION_CLUSTER_CELL_PX", 64),
+        patch("app.services.photo.detection_service.settings.DETECTION_VIEWPORT_MAX_POINTS", 3),
+    ):
+        yield
+
+
+# ============================================================================
+# Points / clusters
+# ============================================================================
+
+
+class TestViewportModes:
+    """Test the points/clusters decision."""
+
+    @pytest.mark.asyncio
+    async def test_zoomed_in_returns_points_as_columns(self, detection_service, mock_repo):
+        mock_repo.get_points_in_bbox.return_value = [point_row(1), point_row(2, empty=True)]
+
+        viewport = await detection_service.get_detections_in_viewport(
+            5, zoom=0, min_x=0, min_y=0, max_x=500, max_y=500
+        )
+
+        assert viewport.mode == "points"
+        assert viewport.total == 2
+        assert viewport.points.id == [1, 2]
+        assert viewport.points.x == [10.5, 21.0]
+        assert viewport.points.confidence == [0.91, 0.91]
+        assert viewport.points.classification_id == [7, None]
+        assert viewport.clusters is None
+        mock_repo.get_points_in_bbox.assert_awaited_once_with(5, (0, 0, 500, 500), limit=4)
+        mock_repo.cluster_in_bbox.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_zoomed_out_returns_clusters(self, detection_service, mock_repo):
+        mock_repo.cluster_in_bbox.return_value = [cluster_row(120, empty=4), cluster_row(30)]
+
+        viewport = await detection_service.get_detections_in_viewport(5, zoom=-4)
+
+        assert viewport.mode == "clusters"
+        assert viewport.total == 150
+        assert viewport.cell_px == 64 * 16
+        assert viewport.clusters.count == [120, 30]
+        mock_repo.cluster_in_bbox.assert_awaited_once_with(5, None, 1024)
+        mock_repo.get_points_in_bbox.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_dense_viewport_is_clustered_at_point_zoom(self, detection_service, mock_repo):
+        mock_repo.get_points_in_bbox.return_value = [point_row(i) for i in range(1, 5)]
+        mock_repo.get_center_extent.return_value = (0.0, 0.0, 10.0, 10.0)
+        mock_repo.cluster_in_bbox.return_value = [cluster_row(4)]
+
+        viewport = await detection_service.get_detections_in_viewport(5, zoom=1)
+
+        assert viewport.mode == "clusters"
+        assert viewport.cell_px == 32
+        assert viewport.total == 4
+        mock_repo.get_center_extent.assert_awaited_once_with(5)
+
+    @pytest.mark.asyncio
+    async def test_dense_fallback_cell_bounds_cluster_count(self, detection_service, mock_repo):
+        """At high zoom the screen-sized cell (16 px) is widened to the grid bound."""
+        mock_repo.get_points_in_bbox.return_value = [point_row(i) for i in range(1, 5)]
+        mock_repo.cluster_in_bbox.return_value = [cluster_row(4)]
+
+        viewport = await detection_service.get_detections_in_viewport(
+            5, zoom=2, min_x=0, min_y=0, max_x=1000, max_y=1000
+        )
+
+        # (1000 / cell + 2)² ≤ 9 cells (the limit of 3 is raised to 3 × 3)
+        assert viewport.cell_px == pytest.approx(1000)
+        mock_repo.get_center_extent.assert_not_awaited()
+
+    def test_min_cell_px_keeps_grid_within_limit(self):
+        extent = (123.4, 56.7, 20_123.4, 5_056.7)
+
+        cell = DetectionService._min_cell_px(extent, 20_000)
+
+        cells_x = int(extent[2] // cell) - int(extent[0] // cell) + 1
+        cells_y = int(extent[3] // cell) - int(extent[1] // cell) + 1
+        assert cells_x * cells_y <= 20_000
+        # Tight: a 10% smaller cell no longer satisfies the bound
+        assert (20_000 / (cell / 1.1) + 2) * (5_000 / (cell / 1.1) + 2) > 20_000
+
+
+class TestViewportValidation:
+    """Test rejection of malformed viewports."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "bounds",
+        [
+            {"min_x": 0, "min_y": 0},
+            {"min_x": 10, "min_y": 0, "max_x": 10, "max_y": 5},
+            {"min_x": 0, "min_y": 8, "max_x": 10, "max_y": 5},
+        ],
+    )
+    async def test_partial_or_empty_viewport_is_rejected(self, detection_service, bounds):
+        with pytest.raises(ValidationException):
+            await detection_service.get_detections_in_viewport(5, zoom=0, **bounds)
+
+
+# ============================================================================
+# Encoding / SQL
+# ============================================================================
+
+
+class TestBinaryEncoding:
+    """Test the columnar binary layout."""
+
+    @pytest.mark.asyncio
+    async def test_points_layout(self, detection_service, mock_repo):
+        mock_repo.get_points_in_bbox.return_value = [point_row(1), point_row(2, empty=True)]
+        viewport = await detection_service.get_detections_in_viewport(5, zoom=0)
+
+        body = viewport.to_binary()
+
+        assert len(body) == 2 * (4 * 5 + 2 * 2 + 1)
+        assert viewport.item_count == 2
+        assert array("i", body[0:8]).tolist() == [1, 2]
+        assert array("f", body[8:16]).tolist() == [10.5, 21.0]
+        assert array("i", body[32:40]).tolist() == [7, -1]
+        assert array("H", body[40:44]).tolist() == [30, 30]
+        assert list(body[48:50]) == [2, 1]  # alive / empty container
+
+    @pytest.mark.asyncio
+    async def test_clusters_layout(self, detection_service, mock_repo):
+        mock_repo.cluster_in_bbox.return_value = [cluster_row(120, empty=4)]
+        viewport = await detection_service.get_detections_in_viewport(5, zoom=-6)
+
+        assert array("I", viewport.to_binary()[8:16]).tolist() == [120, 4]
+
+
+class TestViewportQueries:
+    """Test the repository's SQL (compiled, not executed)."""
+
+    def test_viewport_filter_uses_session_and_bbox_overlap(self):
+        repo = DetectionRepository(AsyncMock())
+        stmt = repo._in_bbox(select(repo.model.id), 5, (0, 0, 100, 100))
+
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+        assert "detections.session_id = " in sql
+        assert "detections.center_geom && ST_MakeEnvelope(" in sql
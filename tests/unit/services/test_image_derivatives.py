@@ -0,0 +1,126 @@
+"""Unit tests for image_derivatives - single-decode thumbnail/preview renditions.
+
+This module tests:
+- JPEG draft-mode decoding (reduced DCT scale, never below the target size)
+- All renditions produced from one decode, aspect ratio preserved
+- Transparent PNG flattening onto white (JPEG output)
+- Input validation
+
+Architecture:
+    - Layer: Service Layer (pure image utilities)
+    - Dependencies: Pillow (no S3/database required)
+"""
+
+import io
+
+import pytest
+from PIL import Image
+
+# =============================================================================
+# Test Classes - Reduced decode
+# =============================================================================
+
+
+class TestOpenReduced:
+    """Test open_reduced() draft-mode decoding."""
+
+    def test_jpeg_is_decoded_at_reduced_scale(self, large_jpeg_bytes):
+        """4000x3000 JPEG for a 300px target decodes at 1/4 scale (≥ 2× target)."""
+        from app.services.photo.image_derivatives import open_reduced
+
+        image = open_reduced(large_jpeg_bytes, 300)
+
+        assert image.size == (1000, 750)
+        assert image.mode == "RGB"
+
+    def test_large_target_keeps_full_resolution(self, large_jpeg_bytes):
+        """Draft mode never decodes below the requested size."""
+        from app.services.photo.image_derivatives import open_reduced
+
+        assert open_reduced(large_jpeg_bytes, 4000).size == (4000, 3000)
+
+    def test_transparent_png_is_flattened_on_white(self, transparent_png_bytes):
+        """Transparent pixels become white RGB."""
+        from app.services.photo.image_derivatives import open_reduced
+
+        image = open_reduced(transparent_png_bytes, 100)
+
+        assert image.mode == "RGB"
+        assert image.getpixel((0, 0)) == (255, 255, 255)
+
+
+# =============================================================================
+# Test Classes - Renditions
+# =============================================================================
+
+
+class TestGenerateDerivatives:
+    """Test generate_derivatives() rendition output."""
+
+    def test_all_renditions_fit_their_size(self, large_jpeg_bytes):
+        """Each rendition is a JPEG whose longest side equals its size."""
+        from app.services.photo.image_derivatives import generate_derivatives
+
+        renditions = generate_derivatives(large_jpeg_bytes, {"thumbnail": 300, "preview": 1600})
+
+        assert set(renditions) == {"thumbnail", "preview"}
+        with Image.open(io.BytesIO(renditions["thumbnail"].data)) as thumbnail:
+            assert thumbnail.format == "JPEG"
+            assert thumbnail.size == (300, 225)
+        with Image.open(io.BytesIO(renditions["preview"].data)) as preview:
+            assert preview.size == (1600, 1200)
+
+    def test_rendition_reports_encoded_size(self, large_jpeg_bytes):
+        """width/height are the encoded size, not the requested bounding box."""
+        from app.services.photo.image_derivatives import generate_derivatives
+
+        thumbnail = generate_derivatives(large_jpeg_bytes, {"thumbnail": 300})["thumbnail"]
+
+        with Image.open(io.BytesIO(thumbnail.data)) as encoded:
+            assert (thumbnail.width, thumbnail.height) == encoded.size == (300, 225)
+
+    def test_small_image_is_not_upscaled(self, transparent_png_bytes):
+        """Images smaller than the rendition keep their size."""
+        from app.services.photo.image_derivatives import generate_derivatives
+
+        renditions = generate_derivatives(transparent_png_bytes, {"thumbnail": 300})
+
+        with Image.open(io.BytesIO(renditions["thumbnail"].data)) as thumbnail:
+            assert thumbnail.size == (200, 100)
+
+    def test_invalid_sizes_raise(self, large_jpeg_bytes):
+        """Empty or non-positive sizes raise ValueError."""
+        from app.services.photo.image_derivatives import generate_derivatives
+
+        with pytest.raises(ValueError, match="at least one"):
+            generate_derivatives(large_jpeg_bytes, {})
+        with pytest.raises(ValueError, match="positive"):
+            generate_derivatives(large_jpeg_bytes, {"thumbnail": 0})
+
+    def test_invalid_bytes_raise(self):
+        """Undecodable input raises (wrapped by generate_thumbnail)."""
+        from app.services.photo.image_derivatives import generate_derivatives
+
+        with pytest.raises(OSError):
+            generate_derivatives(b"not an image", {"thumbnail": 300})
+
+
+# =============================================================================
+# Pytest Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def large_jpeg_bytes():
+    """4000x3000 JPEG (typical greenhouse photo size)."""
+    buffer = io.BytesIO()
+    Image.new("RGB", (4000, 3000), color=(40, 120, 60)).save(buffer, format="JPEG", quality=85)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def transparent_png_bytes():
+    """200x100 fully transparent RGBA PNG."""
+    buffer = io.BytesIO()
+    Image.new("RGBA", (200, 100), color=(0, 0, 0, 0)).save(buffer, format="PNG")
+    return buffer.getvalue()
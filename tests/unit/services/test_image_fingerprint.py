@@ -0,0 +1,83 @@
+"""Unit tests for image fingerprints (duplicate detection keys).
+
+This module tests:
+- fingerprint_image: SHA-256 of the bytes, stream rewound for the S3 upload
+- perceptual_hash: near-identical shots differ in a few bits, different
+  scenes in many; undecodable bytes yield None
+"""
+
+import hashlib
+import io
+
+from PIL import Image, ImageDraw, ImageEnhance
+
+from app.services.photo.image_fingerprint import (
+    fingerprint_image,
+    hamming_distance,
+    perceptual_hash,
+)
+
+
+def _scene(seed: int, size: tuple[int, int] = (1200, 900)) -> Image.Image:
+    """Synthetic photo: rows of "plants" whose layout depends on seed."""
+    image = Image.new("RGB", size, (90, 70, 50))
+    draw = ImageDraw.Draw(image)
+    for i in range(24):
+        x = (i * 137 * (seed + 1)) % size[0]
+        y = (i * 89 * (seed + 3)) % size[1]
+        radius = 40 + (i * seed) % 60
+        draw.ellipse((x, y, x + radius, y + radius), fill=(40, 160 + i % 60, 60))
+    return image
+
+
+def _jpeg(image: Image.Image, quality: int = 90) -> io.BytesIO:
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=quality)
+    buffer.seek(0)
+    return buffer
+
+
+class TestFingerprintImage:
+    """Test the combined fingerprint."""
+
+    def test_content_hash_matches_bytes_and_stream_is_rewound(self):
+        stream = _jpeg(_scene(1))
+        stream.seek(10)
+
+        fingerprint = fingerprint_image(stream)
+
+        assert fingerprint.content_sha256 == hashlib.sha256(stream.getvalue()).hexdigest()
+        assert fingerprint.perceptual_hash is not None
+        assert stream.tell() == 0
+
+    def test_not_an_image_has_no_perceptual_hash(self):
+        fingerprint = fingerprint_image(io.BytesIO(b"not an image"))
+
+        assert fingerprint.perceptual_hash is None
+        assert fingerprint.content_sha256 == hashlib.sha256(b"not an image").hexdigest()
+
+
+class TestPerceptualHash:
+    """Test the distance between hashes of similar and different photos."""
+
+    def test_recompressed_brighter_shot_is_near(self):
+        original = _scene(1)
+        retake = ImageEnhance.Brightness(original).enhance(1.1)
+
+        distance = hamming_distance(
+            perceptual_hash(_jpeg(original)), perceptual_hash(_jpeg(retake, quality=60))
+        )
+
+        assert distance <= 6
+
+    def test_different_scene_is_far(self):
+        distance = hamming_distance(
+            perceptual_hash(_jpeg(_scene(1))), perceptual_hash(_jpeg(_scene(4)))
+        )
+
+        assert distance > 12
+
+    def test_hash_fits_signed_bigint(self):
+        value = perceptual_hash(_jpeg(_scene(2)))
+
+        assert -(2**63) <= value < 2**63
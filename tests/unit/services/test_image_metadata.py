@@ -0,0 +1,88 @@
+"""Unit tests for image_metadata - header-only dimensions and GPS parsing.
+
+This module tests:
+- Dimensions/format read without decoding pixels
+- EXIF GPS IFD → signed decimal degrees (N/S, E/W)
+- Photos without GPS
+- Stream position restored for the subsequent S3 upload
+
+Architecture:
+    - Layer: Service Layer (pure image utilities)
+    - Dependencies: Pillow (no S3/database required)
+"""
+
+import io
+
+import pytest
+from PIL import Image
+
+# =============================================================================
+# Test Classes
+# =============================================================================
+
+
+class TestReadImageHeader:
+    """Test read_image_header()."""
+
+    def test_reads_dimensions_and_gps(self):
+        """Santiago de Chile coordinates (S/W) come back negative."""
+        from app.services.photo.image_metadata import read_image_header
+
+        stream = io.BytesIO(_jpeg_with_gps((33, 26, 56.94), "S", (70, 38, 51.0), "W"))
+
+        header = read_image_header(stream)
+
+        assert (header.width, header.height, header.format) == (640, 480, "JPEG")
+        longitude, latitude = header.gps
+        assert latitude == pytest.approx(-33.449150, abs=1e-6)
+        assert longitude == pytest.approx(-70.647500, abs=1e-6)
+
+    def test_missing_gps(self):
+        """Photos without GPS EXIF have gps None but valid dimensions."""
+        from app.services.photo.image_metadata import read_image_header
+
+        buffer = io.BytesIO()
+        Image.new("RGB", (64, 32)).save(buffer, format="PNG")
+
+        header = read_image_header(buffer)
+
+        assert header.gps is None
+        assert (header.width, header.height) == (64, 32)
+
+    def test_stream_position_is_reset(self):
+        """The stream is left at offset 0 for the S3 upload."""
+        from app.services.photo.image_metadata import read_image_header
+
+        stream = io.BytesIO(_jpeg_with_gps((10, 0, 0), "N", (20, 0, 0), "E"))
+        stream.seek(100)
+
+        header = read_image_header(stream)
+
+        assert stream.tell() == 0
+        assert header.gps == pytest.approx((20.0, 10.0))
+
+    def test_not_an_image_raises(self):
+        """Unsupported bytes raise (caller maps it to missing GPS)."""
+        from PIL import UnidentifiedImageError
+
+        from app.services.photo.image_metadata import read_image_header
+
+        with pytest.raises(UnidentifiedImageError):
+            read_image_header(io.BytesIO(b"not an image"))
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _jpeg_with_gps(lat_dms, lat_ref, lon_dms, lon_ref) -> bytes:
+    """640x480 JPEG with an EXIF GPS IFD."""
+    from PIL import ExifTags
+
+    exif = Image.Exif()
+    exif[ExifTags.IFD.GPSInfo] = {1: lat_ref, 2: lat_dms, 3: lon_ref, 4: lon_dms}
+
+    buffer = io.BytesIO()
+    Image.new("RGB", (640, 480)).save(buffer, format="JPEG", exif=exif)
+    return buffer.getvalue()
@@ -0,0 +1,60 @@
+"""Unit tests for LocationHierarchyCache - versioned per-warehouse trees.
+
+This module tests:
+- Keys include the current version (bumped on every hierarchy write)
+- Redis failures degrade to cache misses
+
+Architecture:
+    - Layer: Service Layer (cache helper)
+    - Dependencies: Redis (mocked)
+"""
+
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.services.location_hierarchy_cache import HIERARCHY_VERSION_KEY, LocationHierarchyCache
+
+
+@pytest.fixture
+def mock_redis():
+    redis = AsyncMock()
+    redis.get.return_value = None
+    return redis
+
+
+@pytest.mark.asyncio
+async def test_set_and_get_use_current_version(mock_redis):
+    cache = LocationHierarchyCache(redis=mock_redis, ttl_seconds=60)
+    mock_redis.get.side_effect = ["3", json.dumps({"areas": []})]
+
+    tree = await cache.get(7)
+
+    assert tree == {"areas": []}
+    assert mock_redis.get.call_args_list[0].args == (HIERARCHY_VERSION_KEY,)
+    assert mock_redis.get.call_args_list[1].args == ("location_hierarchy:3:7",)
+
+    mock_redis.get.side_effect = None
+    mock_redis.get.return_value = "4"
+    await cache.set(7, {"areas": []})
+
+    mock_redis.setex.assert_called_once_with("location_hierarchy:4:7", 60, '{"areas": []}')
+
+
+@pytest.mark.asyncio
+async def test_invalidate_bumps_version(mock_redis):
+    await LocationHierarchyCache(redis=mock_redis).invalidate()
+
+    mock_redis.incr.assert_called_once_with(HIERARCHY_VERSION_KEY)
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_are_cache_misses(mock_redis):
+    mock_redis.get.side_effect = ConnectionError("redis down")
+    mock_redis.incr.side_effect = ConnectionError("redis down")
+    cache = LocationHierarchyCache(redis=mock_redis)
+
+    assert await cache.get(7) is None
+    await cache.set(7, {})
+    await cache.invalidate()
@@ -128,8 +128,8 @@ async def test_get_full_hierarchy_success(
     # Arrange
     mock_warehouse_service.get_warehouse_by_id.return_value = mock_warehouse
     mock_area_service.get_areas_by_warehouse.return_value = [mock_area]
-    mock_location_service.get_locations_by_area.return_value = [mock_location]
-    mock_bin_service.get_bins_by_location.return_value = [mock_bin]
+    mock_location_service.get_locations_by_areas.return_value = {1: [mock_location]}
+    mock_bin_service.get_bins_by_locations.return_value = {1: [mock_bin]}
 
     # Act
     result = await hierarchy_service.get_full_hierarchy(1)
@@ -145,8 +145,8 @@ async def test_get_full_hierarchy_success(
 
     mock_warehouse_service.get_warehouse_by_id.assert_called_once_with(1)
     mock_area_service.get_areas_by_warehouse.assert_called_once_with(1)
-    mock_location_service.get_locations_by_area.assert_called_once_with(1)
-    mock_bin_service.get_bins_by_location.assert_called_once_with(1)
+    mock_location_service.get_locations_by_areas.assert_called_once_with({1})
+    mock_bin_service.get_bins_by_locations.assert_called_once_with({1})
 
 
 @pytest.mark.asyncio
@@ -179,14 +179,14 @@ async def test_get_full_hierarchy_multiple_areas(
 
     mock_warehouse_service.get_warehouse_by_id.return_value = mock_warehouse
     mock_area_service.get_areas_by_warehouse.return_value = [area1, area2]
-    mock_location_service.get_locations_by_area.side_effect = [
-        [location1],  # area1 locations
-        [location2],  # area2 locations
-    ]
-    mock_bin_service.get_bins_by_location.side_effect = [
-        [bin1],  # location1 bins
-        [bin2],  # location2 bins
-    ]
+    mock_location_service.get_locations_by_areas.return_value = {
+        1: [location1],  # area1 locations
+        2: [location2],  # area2 locations
+    }
+    mock_bin_service.get_bins_by_locations.return_value = {
+        1: [bin1],  # location1 bins
+        2: [bin2],  # location2 bins
+    }
 
     # Act
     result = await hierarchy_service.get_full_hierarchy(1)
@@ -195,6 +195,10 @@ async def test_get_full_hierarchy_multiple_areas(
     assert len(result["areas"]) == 2
     assert result["areas"][0]["area"].name == "North"
     assert result["areas"][1]["area"].name == "South"
+    assert result["areas"][1]["locations"][0]["bins"] == [bin2]
+    # One query per level, not one per area / per location
+    mock_location_service.get_locations_by_areas.assert_called_once_with({1, 2})
+    mock_bin_service.get_bins_by_locations.assert_called_once_with({1, 2})
 
 
 @pytest.mark.asyncio
@@ -270,3 +274,231 @@ async def test_lookup_gps_full_chain_no_bins(
     assert result is not None
     assert result["location"] == mock_location
     assert result["bins"] == []
+
+
+@pytest.mark.asyncio
+async def test_lookup_gps_batch_loads_each_entity_once(
+    hierarchy_service,
+    mock_warehouse_service,
+    mock_area_service,
+    mock_location_service,
+    mock_bin_service,
+    mock_location,
+    mock_bin,
+):
+    """Test batch GPS lookup: one load per entity type, shared by repeated points."""
+    from app.services.location_resolver import ResolvedLocation
+
+    # Arrange
+    match = ResolvedLocation(storage_location_id=1, storage_area_id=5, warehouse_id=2)
+    mock_location_service.resolve_locations.return_value = [match, None, match]
+    mock_location_service.get_locations_by_ids.return_value = {1: mock_location}
+    mock_area_service.get_storage_areas_by_ids.return_value = {5: "area"}
+    mock_warehouse_service.get_warehouses_by_ids.return_value = {2: "warehouse"}
+    mock_bin_service.get_bins_by_locations.return_value = {1: [mock_bin]}
+    points = [(-70.6482, -33.4492), (-75.0, -35.0), (-70.6482, -33.4492)]
+
+    # Act
+    results = await hierarchy_service.lookup_gps_batch(points)
+
+    # Assert
+    assert results[1] is None
+    assert results[0] == results[2]
+    assert results[0]["location"] == mock_location
+    assert results[0]["area"] == "area"
+    assert results[0]["warehouse"] == "warehouse"
+    assert results[0]["bins"] == [mock_bin]
+    mock_location_service.resolve_locations.assert_called_once_with(points)
+    mock_location_service.get_locations_by_ids.assert_called_once_with({1})
+    mock_bin_service.get_bins_by_locations.assert_called_once_with({1})
+    mock_bin_service.get_bins_by_location.assert_not_called()
+
+
+# ============================================================================
+# Cached hierarchy tests
+# ============================================================================
+
+
+@pytest.fixture
+def hierarchy_payload():
+    """JSON tree as stored in the hierarchy cache (1 area, 1 location, 1 bin)."""
+    polygon = {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 0]]]}
+    created_at = "2025-01-01T00:00:00Z"
+    return {
+        "warehouse": {
+            "warehouse_id": 1,
+            "code": "GH-001",
+            "name": "Main Greenhouse",
+            "warehouse_type": "greenhouse",
+            "geojson_coordinates": polygon,
+            "active": True,
+            "created_at": created_at,
+        },
+        "areas": [
+            {
+                "area": {
+                    "storage_area_id": 5,
+                    "warehouse_id": 1,
+                    "code": "GH-001-NORTH",
+                    "name": "North Wing",
+                    "geojson_coordinates": polygon,
+                    "active": True,
+                    "created_at": created_at,
+                },
+                "locations": [
+                    {
+                        "location": {
+                            "storage_location_id": 10,
+                            "storage_area_id": 5,
+                            "code": "GH-001-NORTH-LOC01",
+                            "name": "Location 01",
+                            "qr_code": None,
+                            "coordinates": polygon,
+                            "centroid": None,
+                            "area_m2": None,
+                            "position_metadata": None,
+                            "active": True,
+                            "created_at": created_at,
+                            "updated_at": None,
+                        },
+                        "bins": [
+                            {
+                                "bin_id": 15,
+                                "storage_location_id": 10,
+                                "storage_bin_type_id": 1,
+                                "code": "GH-001-NORTH-LOC01-BIN01",
+                                "label": "Bin 1",
+                                "position_metadata": None,
+                                "status": "active",
+                                "created_at": created_at,
+                                "updated_at": None,
+                            }
+                        ],
+                    }
+                ],
+            }
+        ],
+    }
+
+
+@pytest.fixture
+def mock_cache():
+    """Create mock LocationHierarchyCache (empty)."""
+    cache = AsyncMock()
+    cache.get.return_value = None
+    return cache
+
+
+@pytest.fixture
+def cached_hierarchy_service(
+    mock_warehouse_service, mock_area_service, mock_location_service, mock_bin_service, mock_cache
+):
+    """Create LocationHierarchyService with a hierarchy cache."""
+    return LocationHierarchyService(
+        warehouse_service=mock_warehouse_service,
+        area_service=mock_area_service,
+        location_service=mock_location_service,
+        bin_service=mock_bin_service,
+        cache=mock_cache,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_full_hierarchy_cache_hit_skips_database(
+    cached_hierarchy_service, mock_cache, mock_warehouse_service, hierarchy_payload
+):
+    """Test cached tree is returned as response schemas without any service call."""
+    # Arrange
+    mock_cache.get.return_value = hierarchy_payload
+
+    # Act
+    result = await cached_hierarchy_service.get_full_hierarchy(1)
+
+    # Assert
+    assert result["warehouse"].warehouse_id == 1
+    assert result["areas"][0]["locations"][0]["bins"][0].bin_id == 15
+    mock_warehouse_service.get_warehouse_by_id.assert_not_called()
+    assert LocationHierarchyService._hierarchy_to_payload(result) == (
+        LocationHierarchyService._hierarchy_to_payload(
+            LocationHierarchyService._hierarchy_from_payload(hierarchy_payload)
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_full_hierarchy_cache_miss_stores_tree(
+    cached_hierarchy_service,
+    mock_cache,
+    mock_warehouse_service,
+    mock_area_service,
+    mock_location_service,
+    mock_bin_service,
+    hierarchy_payload,
+):
+    """Test tree loaded from the database is written to the cache."""
+    # Arrange
+    tree = LocationHierarchyService._hierarchy_from_payload(hierarchy_payload)
+    area_data = tree["areas"][0]
+    location_data = area_data["locations"][0]
+    mock_warehouse_service.get_warehouse_by_id.return_value = tree["warehouse"]
+    mock_area_service.get_areas_by_warehouse.return_value = [area_data["area"]]
+    mock_location_service.get_locations_by_areas.return_value = {5: [location_data["location"]]}
+    mock_bin_service.get_bins_by_locations.return_value = {10: location_data["bins"]}
+
+    # Act
+    await cached_hierarchy_service.get_full_hierarchy(1)
+
+    # Assert
+    warehouse_id, payload = mock_cache.set.call_args.args
+    assert warehouse_id == 1
+    assert payload == LocationHierarchyService._hierarchy_to_payload(tree)
+
+
+@pytest.mark.asyncio
+async def test_validate_hierarchy_uses_cached_tree(
+    cached_hierarchy_service,
+    mock_cache,
+    mock_area_service,
+    mock_location_service,
+    mock_bin_service,
+    hierarchy_payload,
+):
+    """Test valid ids are checked against the tree (no per-entity lookups)."""
+    # Arrange
+    mock_cache.get.return_value = hierarchy_payload
+
+    # Act
+    result = await cached_hierarchy_service.validate_hierarchy(
+        warehouse_id=1, area_id=5, location_id=10, bin_id=15
+    )
+
+    # Assert
+    assert result["valid"] is True
+    assert result["validated"]["bin"].bin_id == 15
+    mock_area_service.get_storage_area_by_id.assert_not_called()
+    mock_location_service.get_storage_location_by_id.assert_not_called()
+    mock_bin_service.get_storage_bin_by_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_validate_hierarchy_reports_wrong_parent(
+    cached_hierarchy_service, mock_cache, mock_area_service, hierarchy_payload
+):
+    """Test an area outside the warehouse tree is looked up for the error message."""
+    # Arrange
+    mock_cache.get.return_value = hierarchy_payload
+    other_area = Mock()
+    other_area.warehouse_id = 2
+    mock_area_service.get_storage_area_by_id.return_value = other_area
+
+    # Act
+    result = await cached_hierarchy_service.validate_hierarchy(
+        warehouse_id=1, area_id=6, location_id=10
+    )
+
+    # Assert
+    assert result["valid"] is False
+    assert result["errors"] == [
+        "Area 6 belongs to warehouse 2, not warehouse 1",
+        "Location 10 belongs to area 5, not area 6",
+    ]
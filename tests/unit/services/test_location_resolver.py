@@ -0,0 +1,143 @@
+"""Unit tests for LocationResolver - GPS → storage location spatial index.
+
+This module tests:
+- Point-in-polygon lookup (smallest polygon wins on overlap)
+- Nearest location within the GPS tolerance
+- Index rebuild only when the table fingerprint changes
+- PostGIS fallback when the index cannot be built
+
+Architecture:
+    - Layer: Service Layer (process-wide cache)
+    - Dependencies: Shapely (repository mocked, no database required)
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from shapely.geometry import box
+
+from app.services.location_resolver import (
+    METERS_PER_DEGREE,
+    LocationResolver,
+    LocationSpatialIndex,
+    ResolvedLocation,
+)
+
+# Geometries are stored as (lat, lon): x = latitude, y = longitude
+GREENHOUSE = box(-33.4500, -70.6500, -33.4400, -70.6400)
+BENCH = box(-33.4460, -70.6460, -33.4440, -70.6440)  # Inside GREENHOUSE
+OTHER = box(-33.5000, -70.7000, -33.4990, -70.6990)
+
+
+@pytest.fixture
+def rows():
+    return [(1, 10, 100, GREENHOUSE), (2, 10, 100, BENCH), (3, 11, 100, OTHER)]
+
+
+@pytest.fixture
+def location_repo(rows):
+    repo = AsyncMock()
+    repo.get_spatial_index_fingerprint.return_value = (3, "2026-01-01", 2, "2026-01-01")
+    repo.get_spatial_index_rows.return_value = rows
+    return repo
+
+
+# =============================================================================
+# Test Classes - Spatial index
+# =============================================================================
+
+
+class TestLocationSpatialIndex:
+    """Test LocationSpatialIndex.lookup()."""
+
+    def test_point_inside_polygon(self, rows):
+        index = LocationSpatialIndex(rows)
+
+        location = index.lookup(longitude=-70.6420, latitude=-33.4420, tolerance_m=0)
+
+        assert location == ResolvedLocation(1, 10, 100, 0.0)
+
+    def test_smallest_polygon_wins_on_overlap(self, rows):
+        index = LocationSpatialIndex(rows)
+
+        location = index.lookup(longitude=-70.6450, latitude=-33.4450, tolerance_m=0)
+
+        assert location is not None
+        assert location.storage_location_id == 2
+
+    def test_nearest_location_within_tolerance(self, rows):
+        index = LocationSpatialIndex(rows)
+        # ~11m west of OTHER's edge (longitude -70.7000)
+        longitude = -70.7000 - 10 / METERS_PER_DEGREE
+
+        assert index.lookup(longitude, -33.4995, tolerance_m=5) is None
+        location = index.lookup(longitude, -33.4995, tolerance_m=15)
+
+        assert location is not None
+        assert location.storage_location_id == 3
+        assert location.distance_m == pytest.approx(10, abs=0.5)
+
+    def test_rows_without_geometry_are_skipped(self):
+        index = LocationSpatialIndex([(1, 10, 100, None), (2, 10, 100, BENCH)])
+
+        assert len(index) == 1
+
+
+# =============================================================================
+# Test Classes - Resolver (refresh + fallback)
+# =============================================================================
+
+
+class TestLocationResolver:
+    """Test LocationResolver refresh and PostGIS fallback."""
+
+    @pytest.mark.asyncio
+    async def test_index_is_built_once_while_fresh(self, location_repo):
+        resolver = LocationResolver(refresh_interval_seconds=60, tolerance_m=15)
+
+        for _ in range(3):
+            location = await resolver.resolve(location_repo, -70.6420, -33.4420)
+
+        assert location is not None
+        assert location.storage_location_id == 1
+        location_repo.get_spatial_index_fingerprint.assert_called_once()
+        location_repo.get_spatial_index_rows.assert_called_once()
+        location_repo.find_by_gps_batch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_index_is_rebuilt_only_when_fingerprint_changes(self, location_repo, rows):
+        resolver = LocationResolver(refresh_interval_seconds=0, tolerance_m=15)
+
+        await resolver.resolve(location_repo, -70.6420, -33.4420)
+        await resolver.resolve(location_repo, -70.6420, -33.4420)
+        assert location_repo.get_spatial_index_rows.call_count == 1
+
+        location_repo.get_spatial_index_fingerprint.return_value = (2, "2026-02-01", 2, None)
+        location_repo.get_spatial_index_rows.return_value = rows[1:]
+        location = await resolver.resolve(location_repo, -70.6420, -33.4420)
+
+        assert location_repo.get_spatial_index_rows.call_count == 2
+        assert location is None  # GREENHOUSE was removed
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_postgis_without_index(self, location_repo):
+        location_repo.get_spatial_index_rows.side_effect = RuntimeError("db down")
+        location_repo.find_by_gps_batch.return_value = {0: (7, 70, 700, 0.0)}
+        resolver = LocationResolver(refresh_interval_seconds=60, tolerance_m=15)
+
+        location = await resolver.resolve(location_repo, -70.6420, -33.4420)
+
+        assert location == ResolvedLocation(7, 70, 700, 0.0)
+        points, max_distance_deg = location_repo.find_by_gps_batch.call_args.args
+        assert points == [(-70.6420, -33.4420)]
+        assert max_distance_deg == pytest.approx(15 / METERS_PER_DEGREE)
+
+    @pytest.mark.asyncio
+    async def test_resolve_many_keeps_input_order(self, location_repo):
+        resolver = LocationResolver(refresh_interval_seconds=60, tolerance_m=0)
+
+        locations = await resolver.resolve_many(
+            location_repo, [(-70.6450, -33.4450), (0.0, 0.0), (-70.6995, -33.4995)]
+        )
+
+        assert [loc.storage_location_id if loc else None for loc in locations] == [2, None, 3]
@@ -0,0 +1,52 @@
+"""Unit tests for PhotoJobService - per-tenant in-flight quota."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.core.config import settings
+from app.core.exceptions import TooManyRequestsException
+from app.services.photo.photo_job_service import RELEASE_SLOTS_SCRIPT, PhotoJobService
+
+
+@pytest.fixture
+def mock_redis():
+    return AsyncMock()
+
+
+@pytest.mark.asyncio
+async def test_reserve_tenant_slots_returns_in_flight_count(mock_redis):
+    mock_redis.eval.return_value = 42
+
+    in_flight = await PhotoJobService().reserve_tenant_slots(mock_redis, 7, 10)
+
+    assert in_flight == 42
+    args = mock_redis.eval.call_args.args
+    assert args[1:] == (
+        1,
+        "upload_inflight:7",
+        10,
+        settings.UPLOAD_MAX_INFLIGHT_PHOTOS_PER_TENANT,
+        settings.REDIS_UPLOAD_SESSION_TTL,
+    )
+
+
+@pytest.mark.asyncio
+async def test_reserve_tenant_slots_over_quota_raises(mock_redis):
+    mock_redis.eval.return_value = -1
+
+    with pytest.raises(TooManyRequestsException) as exc_info:
+        await PhotoJobService().reserve_tenant_slots(mock_redis, 7, 10)
+
+    assert exc_info.value.code == 429
+    assert exc_info.value.retry_after_seconds == 60
+
+
+@pytest.mark.asyncio
+async def test_release_tenant_slots_is_atomic(mock_redis):
+    await PhotoJobService().release_tenant_slots(mock_redis, 7, 10)
+
+    # DECRBY and the DEL of a drained counter run in one script
+    mock_redis.eval.assert_called_once_with(RELEASE_SLOTS_SCRIPT, 1, "upload_inflight:7", 10)
+    mock_redis.decrby.assert_not_called()
+    mock_redis.delete.assert_not_called()
@@ -0,0 +1,296 @@
+"""Unit tests for duplicate detection of single photo uploads.
+
+This module tests:
+- PhotoProcessingSessionService.find_duplicate: exact (SHA-256) before near
+  (perceptual hash within the window), closest match, threshold, scoped to
+  the uploading user and storage location
+- PhotoUploadService.upload_photo: completed duplicates return their results
+  without S3 upload or ML dispatch; other duplicates are processed and flagged
+"""
+
+import io
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import UploadFile
+
+from app.models.photo_processing_session import ProcessingSessionStatusEnum
+from app.schemas.photo_processing_session_schema import PhotoProcessingSessionResponse
+from app.services.location_resolver import ResolvedLocation
+from app.services.photo.image_fingerprint import ImageFingerprint
+from app.services.photo.photo_job_service import PhotoJobService
+from app.services.photo.photo_processing_session_service import (
+    PhotoProcessingSessionService,
+    SessionDuplicate,
+)
+from app.services.photo.photo_upload_service import PhotoUploadService
+
+PHASH = 0x0F0F_0F0F_0F0F_0F0F
+
+
+def _session(
+    session_id: int, status=ProcessingSessionStatusEnum.COMPLETED
+) -> PhotoProcessingSessionResponse:
+    return PhotoProcessingSessionResponse(
+        id=session_id,
+        session_id=uuid.uuid4(),
+        storage_location_id=5,
+        original_image_id=uuid.uuid4(),
+        total_detected=120,
+        total_estimated=30,
+        total_empty_containers=0,
+        status=status,
+        validated=False,
+        created_at=datetime.now(UTC),
+    )
+
+
+# =============================================================================
+# PhotoProcessingSessionService.find_duplicate
+# =============================================================================
+
+
+class TestFindDuplicate:
+    """Test duplicate lookup against the repository."""
+
+    @pytest.fixture
+    def repo(self):
+        repo = AsyncMock()
+        repo.get_latest_by_original_sha256.return_value = None
+        repo.get_recent_with_perceptual_hash.return_value = []
+        return repo
+
+    @pytest.fixture
+    def service(self, repo):
+        return PhotoProcessingSessionService(repo)
+
+    @pytest.mark.asyncio
+    async def test_exact_match_skips_near_lookup(self, service, repo):
+        repo.get_latest_by_original_sha256.return_value = _session(7)
+
+        duplicate = await service.find_duplicate(ImageFingerprint("ab" * 32, PHASH), 5, 9)
+
+        assert (duplicate.kind, duplicate.session.id, duplicate.distance) == ("exact", 7, 0)
+        repo.get_recent_with_perceptual_hash.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_closest_near_match_within_threshold(self, service, repo):
+        repo.get_recent_with_perceptual_hash.return_value = [
+            (_session(1), PHASH ^ 0b111),  # 3 bits
+            (_session(2), PHASH ^ 0b1),  # 1 bit
+            (_session(3), ~PHASH),  # 64 bits
+        ]
+
+        duplicate = await service.find_duplicate(ImageFingerprint("ab" * 32, PHASH), 5, 9)
+
+        assert (duplicate.kind, duplicate.session.id, duplicate.distance) == ("near", 2, 1)
+        assert repo.get_recent_with_perceptual_hash.call_args.args[:2] == (5, 9)
+
+    @pytest.mark.asyncio
+    async def test_exact_lookup_is_scoped_to_user_and_location(self, service, repo):
+        await service.find_duplicate(ImageFingerprint("ab" * 32, PHASH), 5, 9)
+
+        assert repo.get_latest_by_original_sha256.call_args.args[:3] == ("ab" * 32, 5, 9)
+
+    @pytest.mark.asyncio
+    async def test_same_bytes_from_another_user_is_not_a_duplicate(self):
+        from sqlalchemy.dialects import postgresql
+
+        from app.repositories.photo_processing_session_repository import (
+            PhotoProcessingSessionRepository,
+        )
+
+        db_session = AsyncMock()
+        db_session.execute.return_value = MagicMock()
+        db_session.execute.return_value.scalar_one_or_none.return_value = None
+        db_session.execute.return_value.all.return_value = []
+        service = PhotoProcessingSessionService(PhotoProcessingSessionRepository(db_session))
+
+        duplicate = await service.find_duplicate(ImageFingerprint("ab" * 32, PHASH), 5, 9)
+
+        assert duplicate is None
+        for call in db_session.execute.call_args_list:
+            compiled = call.args[0].compile(dialect=postgresql.dialect())
+            sql = str(compiled)
+            assert "s3_images.uploaded_by_user_id = " in sql
+            assert "photo_processing_sessions.storage_location_id = " in sql
+            params = list(compiled.params.values())
+            assert 5 in params and 9 in params
+
+    @pytest.mark.asyncio
+    async def test_completed_session_wins_a_tie(self, service, repo):
+        repo.get_recent_with_perceptual_hash.return_value = [
+            (_session(1, ProcessingSessionStatusEnum.PROCESSING), PHASH ^ 0b1),
+            (_session(2), PHASH ^ 0b10),
+        ]
+
+        duplicate = await service.find_duplicate(ImageFingerprint("ab" * 32, PHASH), 5, 9)
+
+        assert duplicate.session.id == 2
+        assert duplicate.has_results
+
+    @pytest.mark.asyncio
+    async def test_no_match_beyond_threshold(self, service, repo):
+        from app.core.config import settings
+
+        repo.get_recent_with_perceptual_hash.return_value = [(_session(1), PHASH ^ 0b1111)]
+
+        with patch.object(settings, "UPLOAD_NEAR_DUPLICATE_MAX_DISTANCE", 3):
+            duplicate = await service.find_duplicate(ImageFingerprint("ab" * 32, PHASH), 5, 9)
+
+        assert duplicate is None
+
+
+# =============================================================================
+# PhotoUploadService.upload_photo
+# =============================================================================
+
+
+@pytest.fixture
+def mock_session_service():
+    service = AsyncMock()
+    service.find_duplicate.return_value = None
+    service.create_session.return_value = _session(42, ProcessingSessionStatusEnum.PENDING)
+    service.update_session.return_value = service.create_session.return_value
+    return service
+
+
+@pytest.fixture
+def mock_s3_service():
+    service = AsyncMock()
+    original = MagicMock()
+    original.image_id = uuid.uuid4()
+    original.s3_key_original = "s42/original.jpg"
+    service.upload_original_stream.return_value = original
+    return service
+
+
+@pytest.fixture
+def mock_location_service():
+    service = AsyncMock()
+    service.resolve_location.return_value = ResolvedLocation(
+        storage_location_id=5, storage_area_id=2, warehouse_id=1
+    )
+    return service
+
+
+@pytest.fixture
+def mock_job_service():
+    return AsyncMock(spec=PhotoJobService)
+
+
+@pytest.fixture
+def photo_upload_service(
+    mock_session_service, mock_s3_service, mock_location_service, mock_job_service
+):
+    return PhotoUploadService(
+        session_service=mock_session_service,
+        s3_service=mock_s3_service,
+        location_service=mock_location_service,
+        job_service=mock_job_service,
+    )
+
+
+def _gps_jpeg_upload() -> UploadFile:
+    from PIL import ExifTags, Image
+    from starlette.datastructures import Headers
+
+    exif = Image.Exif()
+    exif[ExifTags.IFD.GPSInfo] = {1: "S", 2: (33, 26, 0), 3: "W", 4: (70, 38, 0)}
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 48)).save(buffer, format="JPEG", exif=exif)
+    buffer.seek(0)
+    return UploadFile(
+        filename="bench.jpg", file=buffer, headers=Headers({"content-type": "image/jpeg"})
+    )
+
+
+async def _upload(service: PhotoUploadService, **kwargs):
+    with (
+        patch("app.tasks.ml_tasks.ml_parent_task") as mock_task,
+        patch("app.tasks.upload_tasks.upload_original_derivatives"),
+    ):
+        mock_task.delay.return_value = MagicMock(id=str(uuid.uuid4()))
+        response = await service.upload_photo(
+            _gps_jpeg_upload(), user_id=9, redis=AsyncMock(), **kwargs
+        )
+    return response, mock_task
+
+
+@pytest.mark.asyncio
+async def test_exact_duplicate_reuses_completed_results(
+    photo_upload_service, mock_session_service, mock_s3_service, mock_job_service
+):
+    mock_session_service.find_duplicate.return_value = SessionDuplicate(_session(7), "exact")
+
+    response, mock_task = await _upload(photo_upload_service)
+
+    assert response.status == "completed"
+    assert response.session_id == 7
+    assert response.jobs[0].duplicate_of_session_id == 7
+    assert response.jobs[0].duplicate_type == "exact"
+    mock_session_service.create_session.assert_not_called()
+    mock_s3_service.upload_original_stream.assert_not_called()
+    mock_task.delay.assert_not_called()
+    status_call = mock_job_service.update_job_status.call_args
+    assert status_call.args[2] == "completed"
+    assert status_call.kwargs["total_detected"] == 120
+
+
+@pytest.mark.asyncio
+async def test_near_duplicate_is_processed_and_flagged(
+    photo_upload_service, mock_session_service, mock_s3_service
+):
+    mock_session_service.find_duplicate.return_value = SessionDuplicate(
+        _session(7), "near", distance=3
+    )
+
+    response, mock_task = await _upload(photo_upload_service)
+
+    mock_task.delay.assert_called_once()
+    assert response.session_id == 42
+    assert response.jobs[0].duplicate_of_session_id == 7
+    assert response.jobs[0].duplicate_type == "near"
+    upload_kwargs = mock_s3_service.upload_original_stream.call_args.kwargs
+    assert upload_kwargs["upload_request"].perceptual_hash is not None
+    # The fingerprint digest is reused, the stream is not hashed twice
+    assert len(upload_kwargs["content_sha256"]) == 64
+    assert mock_session_service.find_duplicate.call_args.args[1:] == (5, 9)
+
+
+@pytest.mark.asyncio
+async def test_near_duplicate_reused_on_request(photo_upload_service, mock_session_service):
+    mock_session_service.find_duplicate.return_value = SessionDuplicate(
+        _session(7), "near", distance=3
+    )
+
+    response, mock_task = await _upload(photo_upload_service, reuse_near_duplicate=True)
+
+    assert (response.status, response.session_id) == ("completed", 7)
+    mock_task.delay.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_duplicate_of_unfinished_session_is_processed(
+    photo_upload_service, mock_session_service
+):
+    mock_session_service.find_duplicate.return_value = SessionDuplicate(
+        _session(7, ProcessingSessionStatusEnum.PROCESSING), "exact"
+    )
+
+    response, mock_task = await _upload(photo_upload_service)
+
+    mock_task.delay.assert_called_once()
+    assert response.jobs[0].duplicate_of_session_id == 7
+
+
+@pytest.mark.asyncio
+async def test_failed_check_does_not_block_upload(photo_upload_service, mock_session_service):
+    mock_session_service.find_duplicate.side_effect = RuntimeError("db down")
+
+    response, mock_task = await _upload(photo_upload_service)
+
+    mock_task.delay.assert_called_once()
+    assert response.jobs[0].duplicate_of_session_id is None
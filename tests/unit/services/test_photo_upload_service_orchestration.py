@@ -11,6 +11,7 @@ from fastapi import UploadFile
 from app.models.photo_processing_session import ProcessingSessionStatusEnum
 from app.models.s3_image import ContentTypeEnum, UploadSourceEnum
 from app.schemas.s3_image_schema import S3ImageResponse
+from app.services.location_resolver import ResolvedLocation
 from app.services.photo.photo_job_service import PhotoJobService
 from app.services.photo.photo_upload_service import PhotoUploadService
 
@@ -26,6 +27,7 @@ def mock_session_service():
     session.total_detected = 0
     session.total_estimated = 0
     service.create_session.return_value = session
+    service.find_duplicate.return_value = None
     return service
 
 
@@ -57,6 +59,9 @@ def mock_s3_service():
 def mock_location_service():
     service = AsyncMock()
     service.get_location_by_gps.return_value = None
+    service.resolve_location.return_value = ResolvedLocation(
+        storage_location_id=5, storage_area_id=2, warehouse_id=1
+    )
     return service
 
 
@@ -131,3 +136,335 @@ async def test_upload_photo_stores_job_in_redis(
         await photo_upload_service.upload_photo(jpeg_file, user_id=42, redis=mock_redis)
 
     mock_job_service.create_upload_session.assert_called_once()
+
+
+# =============================================================================
+# Direct-to-S3 uploads
+# =============================================================================
+
+
+@pytest.mark.asyncio
+async def test_initiate_direct_upload_presigns_parts_and_stores_state(
+    photo_upload_service,
+    mock_s3_service,
+    mock_redis,
+):
+    from app.core.config import settings
+    from app.schemas.photo_schema import DirectUploadInitRequest
+
+    mock_s3_service.create_presigned_multipart_upload.return_value = ("up-1", ["u1", "u2"])
+    request = DirectUploadInitRequest(
+        filename="greenhouse.jpg",
+        content_type="image/jpeg",
+        file_size_bytes=settings.S3_MULTIPART_CHUNK_BYTES + 1,
+        user_id=7,
+    )
+
+    result = await photo_upload_service.initiate_direct_upload(request, mock_redis)
+
+    assert result.s3_key == f"{result.upload_id}/original.jpg"
+    assert [part.part_number for part in result.parts] == [1, 2]
+    assert mock_s3_service.create_presigned_multipart_upload.call_args.kwargs["part_count"] == 2
+    key, _, payload = mock_redis.setex.call_args.args
+    assert key == f"direct_upload:{result.upload_id}"
+    assert '"s3_upload_id": "up-1"' in payload
+
+
+@pytest.mark.asyncio
+async def test_initiate_direct_upload_rejects_oversized_file(photo_upload_service, mock_redis):
+    from app.core.exceptions import ValidationException
+    from app.schemas.photo_schema import DirectUploadInitRequest
+
+    request = DirectUploadInitRequest(
+        filename="huge.jpg", content_type="image/jpeg", file_size_bytes=50 * 1024 * 1024
+    )
+
+    with pytest.raises(ValidationException):
+        await photo_upload_service.initiate_direct_upload(request, mock_redis)
+
+    mock_redis.setex.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_complete_direct_upload_unknown_upload(photo_upload_service, mock_redis):
+    from app.core.exceptions import ResourceNotFoundException
+    from app.schemas.photo_schema import CompletedPart, DirectUploadCompleteRequest
+
+    mock_redis.get.return_value = None
+    request = DirectUploadCompleteRequest(parts=[CompletedPart(part_number=1, etag='"a"')])
+
+    with pytest.raises(ResourceNotFoundException):
+        await photo_upload_service.complete_direct_upload(uuid.uuid4(), request, mock_redis)
+
+
+@pytest.mark.asyncio
+async def test_complete_direct_upload_without_gps_deletes_object(
+    photo_upload_service,
+    mock_s3_service,
+    mock_session_service,
+    mock_redis,
+):
+    import json
+
+    from app.core.exceptions import ValidationException
+    from app.schemas.photo_schema import CompletedPart, DirectUploadCompleteRequest
+
+    upload_id = uuid.uuid4()
+    mock_redis.get.return_value = json.dumps(
+        {
+            "s3_key": f"{upload_id}/original.jpg",
+            "s3_upload_id": "up-1",
+            "filename": "photo.jpg",
+            "content_type": "image/jpeg",
+            "file_size_bytes": 4,
+            "user_id": 1,
+        }
+    )
+    mock_s3_service.head_object.return_value = {"ContentLength": 4}
+    mock_s3_service.read_object_prefix.return_value = b"\xff\xd8\xff\xd9"
+    request = DirectUploadCompleteRequest(parts=[CompletedPart(part_number=1, etag='"a"')])
+
+    with pytest.raises(ValidationException):
+        await photo_upload_service.complete_direct_upload(upload_id, request, mock_redis)
+
+    mock_s3_service.complete_multipart_upload.assert_called_once()
+    mock_s3_service.delete_object.assert_called_once_with(f"{upload_id}/original.jpg")
+    mock_s3_service.download_original.assert_not_called()  # whole object already read
+    mock_session_service.create_session.assert_not_called()
+
+
+# =============================================================================
+# Batch uploads
+# =============================================================================
+
+
+def _gps_jpeg_upload(filename: str, with_gps: bool = True) -> UploadFile:
+    from PIL import ExifTags, Image
+    from starlette.datastructures import Headers
+
+    exif = Image.Exif()
+    if with_gps:
+        exif[ExifTags.IFD.GPSInfo] = {1: "S", 2: (33, 26, 0), 3: "W", 4: (70, 38, 0)}
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 48)).save(buffer, format="JPEG", exif=exif)
+    buffer.seek(0)
+    return UploadFile(
+        filename=filename, file=buffer, headers=Headers({"content-type": "image/jpeg"})
+    )
+
+
+@pytest.mark.asyncio
+async def test_upload_photo_batch_dispatches_one_chord_and_reports_rejections(
+    photo_upload_service,
+    mock_s3_service,
+    mock_session_service,
+    mock_job_service,
+    mock_redis,
+):
+    image = mock_s3_service.upload_original.return_value
+    session = mock_session_service.create_session.return_value
+    mock_s3_service.store_original_stream.return_value = ("s/original.jpg", 2048, "ab" * 32)
+    mock_s3_service.register_originals.return_value = [image]
+    mock_session_service.create_sessions.return_value = [session]
+    files = [_gps_jpeg_upload("a.jpg"), _gps_jpeg_upload("no_gps.jpg", with_gps=False)]
+
+    with (
+        patch("app.tasks.ml_tasks.ml_batch_parent_task") as mock_task,
+        patch("app.tasks.upload_tasks.upload_original_derivatives"),
+    ):
+        mock_task.delay.return_value = MagicMock(id=str(uuid.uuid4()))
+        result = await photo_upload_service.upload_photo_batch(files, user_id=9, redis=mock_redis)
+
+    assert result.total_photos == 1
+    assert [r.filename for r in result.rejected] == ["no_gps.jpg"]
+    assert result.jobs[0].session_id == session.id
+    batch = mock_task.delay.call_args.kwargs["batch"]
+    assert [item["session_id"] for item in batch] == [session.id]
+    assert batch[0]["job_id"] == result.jobs[0].job_id
+    assert batch[0]["storage_location_id"] == 5
+    assert mock_task.delay.call_args.kwargs["tenant_id"] == 9
+    mock_s3_service.store_original_stream.assert_called_once()
+    mock_job_service.reserve_tenant_slots.assert_called_once_with(mock_redis, 9, 2)
+    # The rejected photo's slot is released now; the dispatched one by the callback
+    mock_job_service.release_tenant_slots.assert_called_once_with(mock_redis, 9, 1)
+
+
+@pytest.mark.asyncio
+async def test_upload_photo_batch_releases_all_slots_on_s3_failure(
+    photo_upload_service,
+    mock_s3_service,
+    mock_job_service,
+    mock_redis,
+):
+    from app.core.exceptions import S3UploadException
+
+    mock_s3_service.store_original_stream.side_effect = S3UploadException(
+        file_name="a.jpg", bucket="bucket", error="boom"
+    )
+
+    with pytest.raises(S3UploadException):
+        await photo_upload_service.upload_photo_batch(
+            [_gps_jpeg_upload("a.jpg"), _gps_jpeg_upload("b.jpg")], user_id=9, redis=mock_redis
+        )
+
+    mock_job_service.release_tenant_slots.assert_called_once_with(mock_redis, 9, 2)
+    mock_s3_service.register_originals.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_upload_photo_batch_rejects_oversized_batch(
+    photo_upload_service, mock_job_service, mock_redis
+):
+    from app.core.config import settings
+    from app.core.exceptions import ValidationException
+
+    with (
+        patch.object(settings, "UPLOAD_BATCH_MAX_PHOTOS", 1),
+        pytest.raises(ValidationException),
+    ):
+        await photo_upload_service.upload_photo_batch(
+            [_gps_jpeg_upload("a.jpg"), _gps_jpeg_upload("b.jpg")], user_id=9, redis=mock_redis
+        )
+
+    mock_job_service.reserve_tenant_slots.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_upload_photo_batch_rejects_photos_outside_every_location(
+    photo_upload_service,
+    mock_s3_service,
+    mock_session_service,
+    mock_location_service,
+    mock_redis,
+):
+    located = ResolvedLocation(storage_location_id=5, storage_area_id=2, warehouse_id=1)
+    mock_location_service.resolve_location.side_effect = [located, None]
+    mock_s3_service.store_original_stream.return_value = ("s/original.jpg", 2048, "ab" * 32)
+    mock_s3_service.register_originals.return_value = [mock_s3_service.upload_original.return_value]
+    mock_session_service.create_sessions.return_value = [
+        mock_session_service.create_session.return_value
+    ]
+
+    with (
+        patch("app.tasks.ml_tasks.ml_batch_parent_task") as mock_task,
+        patch("app.tasks.upload_tasks.upload_original_derivatives"),
+    ):
+        mock_task.delay.return_value = MagicMock(id=str(uuid.uuid4()))
+        result = await photo_upload_service.upload_photo_batch(
+            [_gps_jpeg_upload("inside.jpg"), _gps_jpeg_upload("outside.jpg")],
+            user_id=9,
+            redis=mock_redis,
+        )
+
+    assert [r.filename for r in result.rejected] == ["outside.jpg"]
+    created = mock_session_service.create_sessions.call_args.args[0]
+    assert [c.storage_location_id for c in created] == [5]
+
+
+def _direct_upload_state(upload_id: uuid.UUID, **extra) -> str:
+    import json
+
+    return json.dumps(
+        {
+            "s3_key": f"{upload_id}/original.jpg",
+            "s3_upload_id": f"up-{upload_id}",
+            "filename": f"{upload_id}.jpg",
+            "content_type": "image/jpeg",
+            "file_size_bytes": 2048,
+            "user_id": 9,
+            **extra,
+        }
+    )
+
+
+def _batch_request(upload_ids):
+    from app.schemas.photo_schema import (
+        CompletedPart,
+        DirectUploadBatchCompleteRequest,
+        DirectUploadBatchItem,
+    )
+
+    return DirectUploadBatchCompleteRequest(
+        uploads=[
+            DirectUploadBatchItem(
+                upload_id=upload_id, parts=[CompletedPart(part_number=1, etag='"a"')]
+            )
+            for upload_id in upload_ids
+        ]
+    )
+
+
+@pytest.mark.asyncio
+async def test_complete_direct_upload_batch_failure_keeps_uploads_retryable(
+    photo_upload_service,
+    mock_s3_service,
+    mock_job_service,
+    mock_redis,
+):
+    import json
+
+    from app.core.exceptions import S3UploadException
+
+    ok_id, failing_id = uuid.uuid4(), uuid.uuid4()
+    mock_redis.mget.return_value = [_direct_upload_state(ok_id), _direct_upload_state(failing_id)]
+
+    async def complete(s3_key, upload_id, parts):
+        if upload_id == f"up-{failing_id}":
+            raise S3UploadException(file_name=s3_key, bucket="bucket", error="boom")
+
+    mock_s3_service.complete_multipart_upload.side_effect = complete
+    mock_s3_service.head_object.return_value = {"ContentLength": 2048}
+    mock_s3_service.read_object_prefix.return_value = _gps_jpeg_upload("a.jpg").file.getvalue()
+
+    with pytest.raises(S3UploadException):
+        await photo_upload_service.complete_direct_upload_batch(
+            _batch_request([ok_id, failing_id]), mock_redis
+        )
+
+    # The completed upload is marked, not forgotten: the batch can be retried
+    mock_redis.delete.assert_not_called()
+    key, payload = mock_redis.set.call_args.args
+    assert key == f"direct_upload:{ok_id}"
+    assert json.loads(payload)["completed"] is True
+    assert mock_redis.set.call_args.kwargs == {"keepttl": True}
+    mock_s3_service.register_originals.assert_not_called()
+    mock_job_service.release_tenant_slots.assert_called_once_with(mock_redis, 9, 2)
+
+
+@pytest.mark.asyncio
+async def test_complete_direct_upload_batch_retry_skips_completed_uploads(
+    photo_upload_service,
+    mock_s3_service,
+    mock_session_service,
+    mock_redis,
+):
+    done_id, pending_id = uuid.uuid4(), uuid.uuid4()
+    mock_redis.mget.return_value = [
+        _direct_upload_state(done_id, completed=True),
+        _direct_upload_state(pending_id),
+    ]
+    image = mock_s3_service.upload_original.return_value
+    session = mock_session_service.create_session.return_value
+    mock_s3_service.head_object.return_value = {"ContentLength": 2048}
+    mock_s3_service.read_object_prefix.return_value = _gps_jpeg_upload("a.jpg").file.getvalue()
+    mock_s3_service.register_originals.return_value = [image, image]
+    mock_session_service.create_sessions.return_value = [session, session]
+
+    with (
+        patch("app.tasks.ml_tasks.ml_batch_parent_task") as mock_task,
+        patch("app.tasks.upload_tasks.upload_original_derivatives"),
+    ):
+        mock_task.delay.return_value = MagicMock(id=str(uuid.uuid4()))
+        result = await photo_upload_service.complete_direct_upload_batch(
+            _batch_request([done_id, pending_id]), mock_redis
+        )
+
+    assert result.total_photos == 2
+    mock_s3_service.complete_multipart_upload.assert_called_once()
+    assert mock_s3_service.complete_multipart_upload.call_args.kwargs["upload_id"] == (
+        f"up-{pending_id}"
+    )
+    # State dropped only once the whole batch is dispatched
+    mock_redis.delete.assert_called_once_with(
+        f"direct_upload:{done_id}", f"direct_upload:{pending_id}"
+    )
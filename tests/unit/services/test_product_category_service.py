@@ -11,6 +11,7 @@ Test categories:
 - get_all_categories: empty, multiple categories
 - update_category: success, not found
 - delete_category: success, not found
+- read-through cache: reads served from cache, writes invalidate
 
 See:
     - Service: app/services/product_category_service.py
@@ -22,6 +23,7 @@ from unittest.mock import AsyncMock, Mock
 
 import pytest
 
+from app.core.read_through_cache import ReadThroughCache
 from app.models.product_category import ProductCategory
 from app.schemas.product_category_schema import (
     ProductCategoryCreateRequest,
@@ -313,3 +315,34 @@ async def test_delete_category_not_found(category_service, mock_category_repo):
     # Act & Assert
     with pytest.raises(ValueError, match="ProductCategory 999 not found"):
         await category_service.delete_category(999)
+
+
+# ============================================================================
+# Test Read-Through Cache
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_cached_reads_until_write(mock_category_repo, mock_category, sample_create_request):
+    """Test repeated reads hit the cache and a write invalidates it."""
+    # Arrange
+    redis = AsyncMock()
+    redis.hget.return_value = None
+    cache = ReadThroughCache(
+        "product_categories", ttl_seconds=60, l1_ttl_seconds=30, l1_max_entries=10, redis=redis
+    )
+    mock_category_repo.session = None
+    mock_category_repo.get_multi.return_value = [mock_category]
+    mock_category_repo.create.return_value = mock_category
+    service = ProductCategoryService(category_repo=mock_category_repo, cache=cache)
+
+    # Act
+    await service.get_all_categories()
+    await service.get_all_categories()
+    await service.create_category(sample_create_request)
+    response = await service.get_all_categories()
+
+    # Assert
+    assert response[0].code == "CACTUS"
+    assert mock_category_repo.get_multi.call_count == 2
+    redis.delete.assert_called_once_with("read_cache:product_categories")
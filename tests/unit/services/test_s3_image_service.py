@@ -677,3 +677,178 @@ async def test_generate_presigned_url_validates_expiry(s3_image_service):
             expiry_hours=200,  # > 7 days
         )
     assert "1-168 hours" in str(exc_info.value)
+
+
+# =============================================================================
+# Test Streaming Upload (multipart + SHA-256)
+# =============================================================================
+
+
+class _ChunkedStream:
+    """Minimal async stream (UploadFile-like) over in-memory bytes."""
+
+    def __init__(self, data: bytes) -> None:
+        self._buffer = io.BytesIO(data)
+
+    async def read(self, size: int = -1) -> bytes:
+        return self._buffer.read(size)
+
+
+@pytest.mark.asyncio
+async def test_stream_upload_small_body_uses_single_put(mock_s3_client):
+    """Body that fits in one chunk → put_object, no multipart upload."""
+    import hashlib
+
+    service = S3ImageService(MagicMock())
+    service.s3_client = mock_s3_client
+    data = b"x" * 1000
+
+    size, digest = await service._upload_stream_to_s3(
+        s3_key="s/original.jpg",
+        first_chunk=data,
+        stream=_ChunkedStream(b""),
+        bucket="bucket",
+        content_type="image/jpeg",
+    )
+
+    assert size == 1000
+    assert digest == hashlib.sha256(data).hexdigest()
+    mock_s3_client.put_object.assert_called_once()
+    mock_s3_client.create_multipart_upload.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_stream_upload_known_digest_is_not_recomputed(mock_s3_client):
+    """A digest computed by the caller (duplicate check) is returned as is."""
+    service = S3ImageService(MagicMock())
+    service.s3_client = mock_s3_client
+
+    with patch("app.services.photo.s3_image_service.run_cpu_bound") as mock_cpu:
+        size, digest = await service._upload_stream_to_s3(
+            s3_key="s/original.jpg",
+            first_chunk=b"x" * 1000,
+            stream=_ChunkedStream(b""),
+            bucket="bucket",
+            content_type="image/jpeg",
+            content_sha256="ab" * 32,
+        )
+
+    assert (size, digest) == (1000, "ab" * 32)
+    mock_cpu.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_stream_upload_large_body_uses_multipart(mock_s3_client):
+    """Body larger than one chunk → ordered parts, completed, hashed end to end."""
+    import hashlib
+
+    service = S3ImageService(MagicMock())
+    service.s3_client = mock_s3_client
+    mock_s3_client.create_multipart_upload.return_value = {"UploadId": "up-1"}
+    mock_s3_client.upload_part.side_effect = lambda **kw: {"ETag": f'"{kw["PartNumber"]}"'}
+    data = bytes(range(256)) * 100  # 25,600 bytes
+    stream = _ChunkedStream(data)
+
+    with patch.object(settings, "S3_MULTIPART_CHUNK_BYTES", 10_000):
+        first_chunk = await stream.read(10_000)
+        size, digest = await service._upload_stream_to_s3(
+            s3_key="s/original.jpg",
+            first_chunk=first_chunk,
+            stream=stream,
+            bucket="bucket",
+            content_type="image/jpeg",
+        )
+
+    assert size == len(data)
+    assert digest == hashlib.sha256(data).hexdigest()
+    bodies = [c.kwargs["Body"] for c in mock_s3_client.upload_part.call_args_list]
+    assert b"".join(bodies) == data
+    assert [len(b) for b in bodies] == [10_000, 10_000, 5_600]
+    parts = mock_s3_client.complete_multipart_upload.call_args.kwargs["MultipartUpload"]["Parts"]
+    assert [p["PartNumber"] for p in parts] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_stream_upload_failure_aborts_multipart(mock_s3_client):
+    """A failed part aborts the multipart upload and raises S3UploadException."""
+    service = S3ImageService(MagicMock())
+    service.s3_client = mock_s3_client
+    mock_s3_client.create_multipart_upload.return_value = {"UploadId": "up-1"}
+    mock_s3_client.upload_part.side_effect = RuntimeError("connection reset")
+
+    with (
+        patch.object(settings, "S3_MULTIPART_CHUNK_BYTES", 10),
+        pytest.raises(S3UploadException),
+    ):
+        await service._upload_stream_to_s3(
+            s3_key="s/original.jpg",
+            first_chunk=b"a" * 10,
+            stream=_ChunkedStream(b"b" * 10),
+            bucket="bucket",
+            content_type="image/jpeg",
+        )
+
+    mock_s3_client.abort_multipart_upload.assert_called_once_with(
+        Bucket="bucket", Key="s/original.jpg", UploadId="up-1"
+    )
+
+
+# =============================================================================
+# Test Direct-to-S3 Uploads (presigned multipart)
+# =============================================================================
+
+
+@pytest.mark.asyncio
+async def test_presigned_multipart_upload_signs_every_part(mock_s3_client):
+    """One presigned upload_part URL per part, bound to the S3 UploadId."""
+    service = S3ImageService(MagicMock())
+    service.s3_client = mock_s3_client
+    mock_s3_client.create_multipart_upload.return_value = {"UploadId": "up-1"}
+    mock_s3_client.generate_presigned_url.side_effect = lambda **kw: (
+        f"https://s3/{kw['Params']['PartNumber']}"
+    )
+
+    upload_id, urls = await service.create_presigned_multipart_upload(
+        s3_key="s/original.jpg", content_type="image/jpeg", part_count=3, expiry_seconds=600
+    )
+
+    assert upload_id == "up-1"
+    assert urls == ["https://s3/1", "https://s3/2", "https://s3/3"]
+    for call in mock_s3_client.generate_presigned_url.call_args_list:
+        assert call.kwargs["ClientMethod"] == "upload_part"
+        assert call.kwargs["Params"]["UploadId"] == "up-1"
+        assert call.kwargs["ExpiresIn"] == 600
+
+
+@pytest.mark.asyncio
+async def test_presigned_multipart_upload_rejects_invalid_part_count(mock_s3_client):
+    """S3 allows 1-10,000 parts."""
+    service = S3ImageService(MagicMock())
+    service.s3_client = mock_s3_client
+
+    with pytest.raises(ValidationException):
+        await service.create_presigned_multipart_upload(
+            s3_key="s/original.jpg", content_type="image/jpeg", part_count=0, expiry_seconds=600
+        )
+
+    mock_s3_client.create_multipart_upload.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_complete_multipart_upload_sorts_parts_and_wraps_errors(mock_s3_client):
+    """Parts are sent in part-number order; S3 errors become S3UploadException."""
+    service = S3ImageService(MagicMock())
+    service.s3_client = mock_s3_client
+
+    await service.complete_multipart_upload(
+        s3_key="s/original.jpg", upload_id="up-1", parts=[(2, '"b"'), (1, '"a"')]
+    )
+
+    parts = mock_s3_client.complete_multipart_upload.call_args.kwargs["MultipartUpload"]["Parts"]
+    assert parts == [{"PartNumber": 1, "ETag": '"a"'}, {"PartNumber": 2, "ETag": '"b"'}]
+
+    mock_s3_client.complete_multipart_upload.side_effect = RuntimeError("InvalidPart")
+    with pytest.raises(S3UploadException):
+        await service.complete_multipart_upload(
+            s3_key="s/original.jpg", upload_id="up-1", parts=[(1, '"a"')]
+        )
@@ -0,0 +1,260 @@
+"""Unit tests for SessionExportService (CSV/GeoJSON/PDF session exports).
+
+Tests business logic with mocked service dependencies.
+No database or S3 access - uses AsyncMock for the services.
+
+Test categories:
+- generation: CSV rows, GeoJSON validity, PDF rendering
+- S3 cache: hits are streamed from S3, complete exports are uploaded,
+  aborted ones are not
+
+See:
+    - Service: app/services/photo/session_export_service.py
+    - Repositories: DetectionRepository / EstimationRepository.stream_by_session
+"""
+
+import csv
+import io
+import json
+from datetime import UTC, datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from PIL import Image
+
+from app.core.exceptions import S3UploadException
+from app.models.estimation import CalculationMethodEnum
+from app.services.photo.session_export_service import SessionExportService, _SpooledExport
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+def detection_row(id: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=id,
+        classification_id=7,
+        center_x_px=Decimal("10.50"),
+        center_y_px=Decimal("20.25"),
+        width_px=30,
+        height_px=40,
+        detection_confidence=Decimal("0.9100"),
+        is_empty_container=False,
+        is_alive=True,
+    )
+
+
+def estimation_row(id: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=id,
+        classification_id=7,
+        vegetation_polygon={"type": "Polygon", "coordinates": [[0, 0], [9, 0], [9, 5], [0, 0]]},
+        detected_area_cm2=Decimal("12.50"),
+        estimated_count=42,
+        calculation_method=CalculationMethodEnum.BAND_ESTIMATION,
+        estimation_confidence=Decimal("0.7000"),
+    )
+
+
+def batches(*batches_):
+    async def stream(session_id, batch_size):
+        for batch in batches_:
+            yield batch
+
+    return stream
+
+
+async def read(body) -> bytes:
+    return b"".join([chunk async for chunk in body])
+
+
+@pytest.fixture
+def session():
+    return SimpleNamespace(
+        id=1,
+        session_id=uuid4(),
+        processed_image_id=None,
+        status="completed",
+        total_detected=3,
+        total_estimated=42,
+        total_empty_containers=0,
+        avg_confidence=0.91,
+        category_counts={"cactus": 3},
+        validated=False,
+        created_at=datetime(2025, 1, 2, tzinfo=UTC),
+        updated_at=datetime(2025, 1, 3, tzinfo=UTC),
+    )
+
+
+@pytest.fixture
+def services(session):
+    session_service = AsyncMock()
+    session_service.get_session_by_uuid.return_value = session
+    detection_service = MagicMock()
+    detection_service.stream_detections_by_session = batches(
+        [detection_row(1), detection_row(2)], [detection_row(3)]
+    )
+    estimation_service = MagicMock()
+    estimation_service.stream_estimations_by_session = batches([estimation_row(1)])
+    s3_service = AsyncMock()
+    s3_service.object_exists.return_value = False
+    return SimpleNamespace(
+        session=session_service,
+        detection=detection_service,
+        estimation=estimation_service,
+        s3=s3_service,
+    )
+
+
+@pytest.fixture
+def export_service(services):
+    return SessionExportService(
+        session_service=services.session,
+        detection_service=services.detection,
+        estimation_service=services.estimation,
+        s3_service=services.s3,
+    )
+
+
+# ============================================================================
+# Generation
+# ============================================================================
+
+
+class TestGeneration:
+    """Test the generated files."""
+
+    @pytest.mark.asyncio
+    async def test_csv_has_one_row_per_detection_and_estimation(self, export_service, session):
+        export = await export_service.open_export(session.session_id, "csv")
+
+        rows = list(csv.DictReader(io.StringIO((await read(export.body)).decode())))
+
+        assert export.filename == f"session_{session.session_id}.csv"
+        assert export.media_type == "text/csv"
+        assert [r["record_type"] for r in rows] == ["detection"] * 3 + ["estimation"]
+        assert rows[0]["center_x_px"] == "10.50"
+        assert rows[3]["estimated_count"] == "42"
+        assert rows[3]["calculation_method"] == "band_estimation"
+
+    @pytest.mark.asyncio
+    async def test_geojson_is_a_feature_collection_of_points_and_polygons(
+        self, export_service, session
+    ):
+        export = await export_service.open_export(session.session_id, "geojson")
+
+        geojson = json.loads(await read(export.body))
+
+        assert geojson["type"] == "FeatureCollection"
+        geometries = [f["geometry"] for f in geojson["features"]]
+        assert [g["type"] for g in geometries] == ["Point"] * 3 + ["Polygon"]
+        assert geometries[0]["coordinates"] == [10.5, 20.25]
+        assert geometries[3]["coordinates"] == [[[0, 0], [9, 0], [9, 5], [0, 0]]]
+        assert geojson["features"][3]["properties"]["calculation_method"] == "band_estimation"
+
+    @pytest.mark.asyncio
+    async def test_empty_session_geojson(self, export_service, services, session):
+        services.detection.stream_detections_by_session = batches()
+        services.estimation.stream_estimations_by_session = batches([])
+
+        export = await export_service.open_export(session.session_id, "geojson")
+
+        assert json.loads(await read(export.body))["features"] == []
+
+    @pytest.mark.asyncio
+    async def test_pdf_includes_processed_thumbnail(self, export_service, services, session):
+        thumbnail = io.BytesIO()
+        Image.new("RGB", (300, 200), "green").save(thumbnail, "JPEG")
+        session.processed_image_id = uuid4()
+        services.s3.repo = AsyncMock()
+        services.s3.repo.get.return_value = SimpleNamespace(s3_key_thumbnail="thumb.jpg")
+        services.s3.download_original.return_value = thumbnail.getvalue()
+
+        export = await export_service.open_export(session.session_id, "pdf")
+        body = await read(export.body)
+
+        assert body.startswith(b"%PDF")
+        services.s3.download_original.assert_awaited_once_with("thumb.jpg")
+
+    @pytest.mark.asyncio
+    async def test_unknown_session(self, export_service, services):
+        services.session.get_session_by_uuid.return_value = None
+
+        assert await export_service.open_export(uuid4(), "csv") is None
+
+
+# ============================================================================
+# S3 cache
+# ============================================================================
+
+
+class TestExportCache:
+    """Test caching of generated exports in S3."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_streams_from_s3(self, export_service, services, session):
+        async def cached(key, chunk_size):
+            yield b"cached"
+
+        services.s3.object_exists.return_value = True
+        services.s3.iter_object = cached
+        services.detection.stream_detections_by_session = MagicMock()
+
+        export = await export_service.open_export(session.session_id, "csv")
+
+        assert await read(export.body) == b"cached"
+        assert export.finalize is None
+        services.detection.stream_detections_by_session.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_complete_export_is_uploaded(self, export_service, services, session):
+        uploaded = {}
+
+        async def upload(key, fileobj, content_type):
+            uploaded[key] = fileobj.read()
+
+        services.s3.upload_fileobj.side_effect = upload
+
+        export = await export_service.open_export(session.session_id, "geojson")
+        body = await read(export.body)
+        await export.finalize()
+
+        key = f"exports/{session.session_id}/{int(session.updated_at.timestamp())}/"
+        assert uploaded == {f"{key}session_{session.session_id}.geojson": body}
+
+    @pytest.mark.asyncio
+    async def test_aborted_export_is_not_uploaded(self, export_service, services, session):
+        export = await export_service.open_export(session.session_id, "csv")
+        await anext(export.body)  # Client disconnects after the first chunk
+        await export.finalize()
+
+        services.s3.upload_fileobj.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_closes_spool_without_finalize(self):
+        async def chunks():
+            yield b"a"
+            yield b"b"
+
+        spooled = _SpooledExport(chunks())
+        body = spooled.body()
+        await anext(body)
+        await body.aclose()  # Client disconnects: the background task never runs
+
+        assert spooled.file.closed
+        assert not spooled.complete
+
+    @pytest.mark.asyncio
+    async def test_s3_outage_does_not_fail_the_download(self, export_service, services, session):
+        error = S3UploadException(file_name="k", bucket="b", error="down")
+        services.s3.object_exists.side_effect = error
+        services.s3.upload_fileobj.side_effect = error
+
+        export = await export_service.open_export(session.session_id, "csv")
+
+        assert (await read(export.body)).startswith(b"record_type,")
+        await export.finalize()
@@ -0,0 +1,122 @@
+"""Unit tests for batch ML tasks - one child → session callback chain per photo.
+
+This module tests:
+- ml_batch_parent_task: one group of chains (job-aware children) for every photo
+- ml_batch_session_callback: per-session aggregation, job completion, slot release
+- Circuit breaker: every session/job of the batch marked failed
+
+Architecture:
+    - Layer: Task Layer
+    - Dependencies: Celery task functions called directly (no broker/worker)
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.core.exceptions import CircuitBreakerException
+from app.tasks import ml_tasks
+
+
+@pytest.fixture
+def batch():
+    return [
+        {
+            "session_id": session_id,
+            "job_id": f"job-{session_id}",
+            "image_id": f"img-{session_id}",
+            "image_path": f"s{session_id}/original.jpg",
+            "storage_location_id": 1,
+        }
+        for session_id in (11, 12, 13)
+    ]
+
+
+def test_batch_parent_dispatches_one_chain_per_session(batch):
+    with (
+        patch.object(ml_tasks, "check_circuit_breaker"),
+        patch.object(ml_tasks, "_mark_sessions_processing") as mock_mark,
+        patch.object(ml_tasks, "group") as mock_group,
+    ):
+        result = ml_tasks.ml_batch_parent_task(batch=batch, tenant_id=7)
+
+    mock_group.return_value.apply_async.assert_called_once()
+    chains = mock_group.call_args.args[0]
+    assert [chain.tasks[0].kwargs["job_id"] for chain in chains] == ["job-11", "job-12", "job-13"]
+    assert [chain.tasks[1].kwargs for chain in chains] == [
+        {"session_id": session_id, "job_id": f"job-{session_id}", "tenant_id": 7}
+        for session_id in (11, 12, 13)
+    ]
+    assert mock_mark.call_args.args[0] == [11, 12, 13]
+    assert result["num_images"] == 3
+
+
+def test_batch_parent_fails_whole_batch_when_circuit_open(batch):
+    with (
+        patch.object(
+            ml_tasks, "check_circuit_breaker", side_effect=CircuitBreakerException("open")
+        ),
+        patch.object(ml_tasks, "_mark_sessions_failed") as mock_failed,
+        patch.object(ml_tasks, "_report_job_status") as mock_report,
+        patch.object(ml_tasks, "_release_tenant_slots") as mock_release,
+        pytest.raises(CircuitBreakerException),
+    ):
+        ml_tasks.ml_batch_parent_task(batch=batch, tenant_id=7)
+
+    assert mock_failed.call_args.args[0] == [11, 12, 13]
+    assert mock_report.call_count == 3
+    mock_release.assert_called_once_with(7, 3)
+
+
+def test_session_callback_reports_completion_after_persistence():
+    summary = {"session_id": 11, "status": "completed", "total_detected": 5, "total_estimated": 2}
+
+    with (
+        patch.object(ml_tasks, "ml_aggregation_callback", return_value=summary) as mock_agg,
+        patch.object(ml_tasks, "_report_job_status") as mock_report,
+        patch.object(ml_tasks, "_release_tenant_slots") as mock_release,
+    ):
+        result = ml_tasks.ml_batch_session_callback(
+            {"image_id": "a"}, session_id=11, job_id="job-11", tenant_id=7
+        )
+
+    assert result == summary
+    mock_agg.assert_called_once_with([{"image_id": "a"}], session_id=11)
+    mock_report.assert_called_once_with(
+        "job-11",
+        "completed",
+        session_id=11,
+        progress_percent=100,
+        total_detected=5,
+        total_estimated=2,
+    )
+    mock_release.assert_called_once_with(7, 1)
+
+
+def test_session_callback_reports_failure_and_releases_slot_when_aggregation_fails():
+    with (
+        patch.object(ml_tasks, "ml_aggregation_callback", side_effect=RuntimeError("db down")),
+        patch.object(ml_tasks, "_report_job_status") as mock_report,
+        patch.object(ml_tasks, "_release_tenant_slots") as mock_release,
+    ):
+        result = ml_tasks.ml_batch_session_callback(
+            {"image_id": "a"}, session_id=12, job_id="job-12", tenant_id=7
+        )
+
+    assert result["status"] == "failed"
+    mock_report.assert_called_once_with("job-12", "failed", session_id=12, error="db down")
+    mock_release.assert_called_once_with(7, 1)
+
+
+def test_session_callback_keeps_child_failure_report():
+    summary = {"session_id": 13, "status": "failed", "error": "All child tasks failed"}
+
+    with (
+        patch.object(ml_tasks, "ml_aggregation_callback", return_value=summary),
+        patch.object(ml_tasks, "_report_job_status") as mock_report,
+        patch.object(ml_tasks, "_release_tenant_slots") as mock_release,
+    ):
+        ml_tasks.ml_batch_session_callback(None, session_id=13, job_id="job-13", tenant_id=7)
+
+    mock_report.assert_not_called()
+    mock_release.assert_called_once_with(7, 1)
@@ -0,0 +1,48 @@
+"""Unit tests for the ML child task (one image through the pipeline).
+
+This module tests:
+- ml_child_task: a photo without containers completes with zero counts and
+  an empty columnar detections payload
+
+Architecture:
+    - Layer: Task Layer
+    - Dependencies: Real MLPipelineCoordinator with mocked ML services,
+      local image file (no database/S3)
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from PIL import Image
+
+from app.services.ml_processing.detection_array import DetectionArray
+from app.tasks import ml_tasks
+
+
+def test_photo_without_containers_completes_with_zero_counts(tmp_path, isolated_circuit_breakers):
+    image_path = tmp_path / "original.jpg"
+    Image.new("RGB", (64, 48)).save(image_path)
+    segmentation = MagicMock()
+    segmentation.segment_image = AsyncMock(return_value=[])
+
+    with (
+        patch.object(ml_tasks, "SegmentationService", return_value=segmentation),
+        patch.object(ml_tasks, "SAHIDetectionService") as mock_sahi,
+        patch.object(ml_tasks, "BandEstimationService"),
+        patch.object(ml_tasks, "_load_plant_area_profile", return_value=None),
+        patch.object(ml_tasks, "_load_recount_prior", return_value=None),
+        patch.object(ml_tasks, "_report_job_status") as mock_report,
+    ):
+        result = ml_tasks.ml_child_task(
+            session_id=1,
+            image_id="img-1",
+            image_path=str(image_path),
+            storage_location_id=1,
+            job_id="job-1",
+        )
+
+    assert result["total_detected"] == 0
+    assert result["total_estimated"] == 0
+    assert result["detections"] == DetectionArray.empty().to_json()
+    assert result["segments"] == []
+    mock_sahi.return_value.detect_in_segmento.assert_not_called()
+    assert mock_report.call_args.args[1] == "processing"
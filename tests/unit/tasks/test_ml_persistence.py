@@ -0,0 +1,106 @@
+"""Unit tests for set-based persistence of ML results.
+
+This module tests:
+- _create_storage_bins: bin types resolved in one query, missing types created
+  in one flush, all bins written with one INSERT ... RETURNING regardless of
+  the number of segments; generated bin codes pass StorageBin.validate_code
+
+Architecture:
+    - Layer: Task Layer
+    - Dependencies: Mocked synchronous SQLAlchemy session (no database)
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.storage_bin import StorageBin
+from app.models.storage_bin_type import BinCategoryEnum
+from app.tasks import ml_tasks
+
+
+def _segments(count: int, container_type: str = "segment") -> list[dict]:
+    return [
+        {
+            "container_type": container_type,
+            "bbox": [0.1, 0.1, 0.4, 0.4],
+            "polygon": [[0.1, 0.1], [0.4, 0.1], [0.4, 0.4]],
+            "confidence": 0.9,
+            "area_pixels": 1000,
+        }
+        for _ in range(count)
+    ]
+
+
+def _db_session(existing_types: list[tuple[int, BinCategoryEnum]]) -> MagicMock:
+    db_session = MagicMock()
+    db_session.execute.return_value.all.return_value = existing_types
+    db_session.scalars.side_effect = lambda stmt, rows: iter(range(100, 100 + len(rows)))
+    return db_session
+
+
+@pytest.mark.parametrize("num_segments", [1, 40])
+def test_round_trips_do_not_grow_with_segments(num_segments):
+    db_session = _db_session([(7, BinCategoryEnum.SEGMENT), (9, BinCategoryEnum.SEGMENT)])
+
+    bin_ids = ml_tasks._create_storage_bins(
+        db_session, 5, 3, "inv01-north-a1", _segments(num_segments)
+    )
+
+    assert bin_ids == list(range(100, 100 + num_segments))
+    db_session.execute.assert_called_once()
+    db_session.scalars.assert_called_once()
+    db_session.add_all.assert_not_called()
+    db_session.flush.assert_not_called()
+
+    stmt, rows = db_session.scalars.call_args.args
+    assert "RETURNING" in str(stmt.compile(dialect=postgresql.dialect()))
+    assert {row["storage_bin_type_id"] for row in rows} == {7}  # Lowest id per category
+    assert rows[0]["code"].startswith("INV01-NORTH-A1-ML-SEGMENT001-")
+    assert rows[0]["position_metadata"]["session_id"] == 5
+
+
+def test_missing_bin_types_created_in_one_flush():
+    db_session = _db_session([(7, BinCategoryEnum.SEGMENT)])
+
+    def assign_ids():
+        for offset, bin_type in enumerate(db_session.add_all.call_args.args[0]):
+            bin_type.bin_type_id = 20 + offset
+
+    db_session.flush.side_effect = assign_ids
+    segments = _segments(2) + _segments(2, "cajon") + _segments(1, "plug")
+
+    ml_tasks._create_storage_bins(db_session, 5, 3, "INV01-NORTH-A1", segments)
+
+    new_types = db_session.add_all.call_args.args[0]
+    assert [bin_type.code for bin_type in new_types] == ["ML_BOX_DEFAULT", "ML_PLUG_DEFAULT"]
+    db_session.flush.assert_called_once()
+    rows = db_session.scalars.call_args.args[1]
+    assert [row["storage_bin_type_id"] for row in rows] == [7, 7, 20, 20, 21]
+
+
+@pytest.mark.parametrize(
+    ("location_code", "container_type"),
+    [
+        ("INV01-NORTH-" + "A" * 48, "seedling tray (large)"),
+        ("inv 01/north", "x" * 60),
+        ("--", "segment"),
+    ],
+)
+def test_bin_codes_pass_model_validation(location_code, container_type):
+    db_session = _db_session([(7, BinCategoryEnum.SEGMENT)])
+
+    ml_tasks._create_storage_bins(db_session, 5, 3, location_code, _segments(2, container_type))
+
+    codes = [row["code"] for row in db_session.scalars.call_args.args[1]]
+    assert len(set(codes)) == 2
+    for code in codes:
+        assert StorageBin.validate_code(StorageBin(), "code", code) == code
+
+
+def test_no_segments_no_queries():
+    db_session = _db_session([])
+
+    assert ml_tasks._create_storage_bins(db_session, 5, 3, "INV01-NORTH-A1", []) == []
+    db_session.execute.assert_not_called()
@@ -0,0 +1,156 @@
+"""Unit tests for GPU queue priority classes and fair share.
+
+This module tests:
+- fair_share_priorities: tenants drop one level per in-flight block
+- Parent tasks: children carry class priority, class and dispatch time
+- refresh_ml_queue_metrics: depth/oldest wait per class from the broker lists
+
+Architecture:
+    - Layer: Task Layer
+    - Dependencies: Celery task functions called directly (no broker/worker)
+"""
+
+import base64
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.celery_app import GPU_WORKER_CMD, app
+from app.tasks import ml_priority, ml_tasks
+from app.tasks.ml_priority import MLPriorityClass, fair_share_priorities
+
+
+@pytest.fixture(autouse=True)
+def level_photos():
+    with patch.object(ml_priority.settings, "ML_FAIR_SHARE_LEVEL_PHOTOS", 10):
+        yield
+
+
+def test_broker_drains_priorities_in_order():
+    options = app.conf.broker_transport_options
+
+    assert options["queue_order_strategy"] == "priority"
+    assert options["priority_steps"] == list(range(10))
+    assert "--prefetch-multiplier=1" in GPU_WORKER_CMD
+
+
+class TestFairShare:
+    """Test per-tenant demotion of batch images."""
+
+    def test_small_batch_of_idle_tenant_gets_top_batch_level(self):
+        assert fair_share_priorities(3, queued_ahead=0) == [3, 3, 3]
+
+    def test_images_are_demoted_per_level_block(self):
+        priorities = fair_share_priorities(25, queued_ahead=0)
+
+        assert priorities[:10] == [3] * 10
+        assert priorities[10:20] == [4] * 10
+        assert priorities[20:] == [5] * 5
+
+    def test_backlog_of_the_tenant_counts(self):
+        assert fair_share_priorities(2, queued_ahead=19) == [4, 5]
+
+    def test_lowest_batch_level_is_above_reprocess(self):
+        assert fair_share_priorities(1, queued_ahead=10_000) == [8]
+
+
+class TestDispatchPriorities:
+    """Test the priority of dispatched children."""
+
+    def test_batch_children_follow_tenant_backlog(self):
+        batch = [
+            {
+                "session_id": session_id,
+                "job_id": f"job-{session_id}",
+                "image_id": f"img-{session_id}",
+                "image_path": f"s{session_id}/original.jpg",
+                "storage_location_id": 1,
+            }
+            for session_id in (11, 12)
+        ]
+        redis = MagicMock()
+        redis.get.return_value = b"31"  # 29 in flight + this batch
+
+        with (
+            patch.object(ml_tasks, "check_circuit_breaker"),
+            patch.object(ml_tasks, "_mark_sessions_processing"),
+            patch.object(ml_tasks, "_get_redis_client", return_value=redis),
+            patch.object(ml_tasks, "group") as mock_group,
+        ):
+            ml_tasks.ml_batch_parent_task(batch=batch, tenant_id=7)
+
+        children = [chain.tasks[0] for chain in mock_group.call_args.args[0]]
+        assert [child.options["priority"] for child in children] == [5, 6]
+        assert {child.kwargs["priority_class"] for child in children} == {"batch"}
+        assert all(child.kwargs["queued_at"] > 0 for child in children)
+
+    @pytest.mark.parametrize(
+        ("priority_class", "priority"),
+        [(MLPriorityClass.INTERACTIVE, 0), (MLPriorityClass.REPROCESS, 9)],
+    )
+    def test_parent_children_use_class_priority(self, priority_class, priority):
+        image_data = [{"image_id": "img-1", "image_path": "a.jpg", "storage_location_id": 1}]
+
+        with (
+            patch.object(ml_tasks, "check_circuit_breaker"),
+            patch.object(ml_tasks, "_mark_session_processing"),
+            patch.object(ml_tasks, "chord") as mock_chord,
+        ):
+            ml_tasks.ml_parent_task(
+                session_id=1, image_data=image_data, priority_class=priority_class
+            )
+
+        (child,) = mock_chord.call_args.args[0]
+        assert child.options["priority"] == priority
+        assert child.kwargs["priority_class"] == priority_class
+
+
+class TestQueueMetrics:
+    """Test sampling of the broker's priority lists."""
+
+    @staticmethod
+    def message(queued_at: float) -> str:
+        body = json.dumps([[], {"queued_at": queued_at}, {}]).encode()
+        return json.dumps(
+            {
+                "body": base64.b64encode(body).decode(),
+                "headers": {"task": "app.tasks.ml_tasks.ml_child_task"},
+                "properties": {"body_encoding": "base64"},
+            }
+        )
+
+    @pytest.mark.asyncio
+    async def test_depth_and_oldest_wait_per_class(self):
+        now = 1_000_000.0
+        lists = {
+            "gpu_queue": (1, self.message(now - 5)),
+            "gpu_queue:3": (40, self.message(now - 600)),
+            "gpu_queue:5": (200, self.message(now - 900)),
+            "gpu_queue:9": (2, "not a celery message"),
+        }
+        replies = []
+        for key in ml_priority.priority_queue_keys().values():
+            replies.extend(lists.get(key, (0, None)))
+
+        pipe = MagicMock()
+        pipe.execute = MagicMock(return_value=_awaitable(replies))
+        redis = MagicMock()
+        redis.pipeline.return_value.__aenter__.return_value = pipe
+
+        with (
+            patch.object(ml_priority, "get_metrics_collector", return_value=MagicMock()),
+            patch.object(ml_priority, "update_ml_queue_metrics") as mock_update,
+            patch.object(ml_priority.time, "time", return_value=now),
+        ):
+            await ml_priority.refresh_ml_queue_metrics(redis)
+
+        assert {call.args for call in mock_update.call_args_list} == {
+            ("interactive", 1, 5.0),
+            ("batch", 240, 900.0),
+            ("reprocess", 2, 0.0),
+        }
+
+
+async def _awaitable(value):
+    return value